@@ -0,0 +1,186 @@
+"""Benchmark applying select, metadata and schema rules to a large catalog.
+
+Generates a synthetic catalog, then applies the rules `meltano` derives from a
+typical extractor configuration, either with the per-rule-type catalog visitors
+(`SchemaExecutor` then `MetadataExecutor`) or with the single-pass
+`CatalogRulesExecutor`, optionally streaming the catalog from and to disk.
+
+Usage:
+
+    python benchmarks/catalog_rules.py [--streams 10000] [--properties 20]
+        [--mode {visitor,fused,streaming}]
+
+Peak memory is the maximum resident set size of the process, so run one mode per
+process to compare them.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from meltano.core.plugin.singer.catalog import (
+    CatalogRulesExecutor,
+    MetadataExecutor,
+    SchemaExecutor,
+    dump_catalog,
+    select_filter_metadata_rules,
+    select_metadata_rules,
+)
+from meltano.core.plugin.singer.tap import (
+    SingerTap,
+    config_metadata_rules,
+    config_schema_rules,
+)
+
+
+def make_stream(idx: int, properties: int) -> dict:
+    """Generate a stream with flat and nested properties.
+
+    Args:
+        idx: the index of the stream.
+        properties: the number of top-level properties.
+
+    Returns:
+        The stream.
+    """
+    props = {f"column_{col}": {"type": ["string", "null"]} for col in range(properties)}
+    props["payload"] = {
+        "type": "object",
+        "properties": {"content": {"type": "string"}, "hash": {"type": "string"}},
+    }
+    return {
+        "tap_stream_id": f"schema_{idx % 10}-table_{idx}",
+        "stream": f"table_{idx}",
+        "schema": {"type": "object", "properties": props},
+        "metadata": [
+            {"breadcrumb": [], "metadata": {"inclusion": "available"}},
+            *(
+                {
+                    "breadcrumb": ["properties", name],
+                    "metadata": {"inclusion": "available"},
+                }
+                for name in props
+            ),
+        ],
+    }
+
+
+def make_rules() -> tuple[list, list]:
+    """Build the rules for a typical extractor configuration.
+
+    Returns:
+        The schema rules and metadata rules.
+    """
+    schema_rules = config_schema_rules(
+        {
+            "schema_1-*": {"column_1": {"type": "integer"}},
+            "schema_2-table_2": {"payload": {"type": "object"}},
+        }
+    )
+    metadata_rules = [
+        *select_metadata_rules(["!*.*"]),
+        *select_metadata_rules(
+            ["schema_1-*.*", "schema_2-*.column_*", "!schema_2-*.column_3", "*.id"]
+        ),
+        *config_metadata_rules(
+            {
+                "schema_1-*": {"replication-method": "INCREMENTAL"},
+                "schema_1-table_1": {"replication-key": "column_0"},
+            }
+        ),
+        *select_filter_metadata_rules(["schema_*", "!schema_9-*"]),
+    ]
+    return schema_rules, metadata_rules
+
+
+def apply_visitor(catalog_path: Path) -> None:
+    """Apply the rules with one catalog visitor per rule type.
+
+    Args:
+        catalog_path: the catalog to update.
+    """
+    schema_rules, metadata_rules = make_rules()
+    with catalog_path.open() as catalog_file:
+        catalog = json.load(catalog_file)
+
+    SchemaExecutor(schema_rules).visit(catalog)
+    MetadataExecutor(metadata_rules).visit(catalog)
+
+    with catalog_path.open("w") as catalog_file:
+        json.dump(catalog, catalog_file, indent=2)
+
+
+def apply_fused(catalog_path: Path) -> None:
+    """Apply the rules in a single pass over the catalog loaded in memory.
+
+    Args:
+        catalog_path: the catalog to update.
+    """
+    executor = CatalogRulesExecutor(*make_rules())
+    with catalog_path.open() as catalog_file:
+        catalog = json.load(catalog_file)
+
+    executor.visit(catalog)
+
+    with catalog_path.open("w") as catalog_file:
+        json.dump(catalog, catalog_file, indent=2)
+
+
+def apply_streaming(catalog_path: Path) -> None:
+    """Apply the rules in a single pass, one stream at a time.
+
+    Args:
+        catalog_path: the catalog to update.
+    """
+    executor = CatalogRulesExecutor(*make_rules())
+    SingerTap._apply_catalog_rules_streaming(executor, catalog_path)  # noqa: WPS437
+
+
+MODES = {
+    "visitor": apply_visitor,
+    "fused": apply_fused,
+    "streaming": apply_streaming,
+}
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--streams", type=int, default=10000)
+    parser.add_argument("--properties", type=int, default=20)
+    parser.add_argument("--mode", choices=MODES, default="fused")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        catalog_path = Path(tmp_dir, "tap.properties.json")
+        # Generate the catalog one stream at a time, so that it doesn't count
+        # towards the peak memory usage.
+        streams = (make_stream(idx, args.properties) for idx in range(args.streams))
+        with catalog_path.open("w") as catalog_file:
+            dump_catalog([("streams", streams)], catalog_file)
+        size_mb = catalog_path.stat().st_size / 2**20
+        rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+        start = time.perf_counter()
+        MODES[args.mode](catalog_path)
+        elapsed = time.perf_counter() - start
+
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux, bytes on macOS
+    unit = 2**20 if sys.platform == "darwin" else 2**10
+
+    print(f"mode:                {args.mode}")
+    print(f"catalog:             {args.streams} streams, {size_mb:.1f} MB")
+    print(f"elapsed:             {elapsed:.2f} s")
+    print(f"peak RSS:            {rss_after / unit:.0f} MB")
+    print(f"peak RSS growth:     {(rss_after - rss_before) / unit:.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Benchmark the startup time of the Meltano CLI.
+
+Measures, with `python -X importtime` in fresh interpreters, the time it takes to
+import `meltano.cli` and the module of a subcommand, which is what a command like
+`meltano --version` or `meltano invoke` pays before doing anything. Exits with a
+non-zero status if the best time is over the budget, so it can be used to catch
+startup regressions.
+
+Usage:
+
+    python benchmarks/cli_startup.py [--command invoke] [--rounds 5]
+        [--budget-ms 1000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import subprocess
+import sys
+
+from meltano.cli.cli import SUBCOMMAND_MODULES
+
+IMPORT_TIME_RE = re.compile(r"^import time:\s+\d+ \|\s+(\d+) \| (\s*)(\S+)$")
+
+
+def import_time(modules: list[str]) -> tuple[float, int]:
+    """Import modules in a fresh interpreter and time it.
+
+    Args:
+        modules: the modules to import.
+
+    Returns:
+        The cumulative import time in milliseconds, and the number of modules
+        imported.
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {', '.join(modules)}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total_us = 0
+    imported = 0
+    for line in process.stderr.splitlines():
+        match = IMPORT_TIME_RE.match(line)
+        if not match:
+            continue
+        imported += 1
+        # Only top-level imports count, as nested ones are part of their time
+        if not match.group(2):
+            total_us += int(match.group(1))
+    return total_us / 1000, imported
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--command", choices=sorted(SUBCOMMAND_MODULES))
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=1000)
+    args = parser.parse_args()
+
+    modules = ["meltano.cli"]
+    if args.command:
+        modules.append(SUBCOMMAND_MODULES[args.command])
+
+    timings = []
+    for _ in range(args.rounds):
+        elapsed_ms, imported = import_time(modules)
+        timings.append(elapsed_ms)
+
+    best = min(timings)
+    print(f"imports:             {', '.join(modules)}")
+    print(f"modules imported:    {imported}")
+    print(f"best:                {best:.0f} ms")
+    print(f"mean:                {sum(timings) / len(timings):.0f} ms")
+    print(f"budget:              {args.budget_ms:.0f} ms")
+
+    if best > args.budget_ms:
+        print("over budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
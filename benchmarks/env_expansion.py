@@ -0,0 +1,68 @@
+"""Benchmark expanding env var references in plugin environments.
+
+Expands a synthetic environment the way `PluginInvoker.env` does: the terminal
+environment, then project, environment and plugin `env` mappings that each
+reference the variables of the previous one. Only some values reference other
+variables, like in a typical terminal environment.
+
+Usage:
+
+    python benchmarks/env_expansion.py [--vars 200] [--rounds 1000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from meltano.core.utils import expand_env_vars
+
+
+def make_env(prefix: str, size: int, previous: str | None) -> dict[str, str]:
+    """Generate an environment, with every tenth value referencing others.
+
+    Args:
+        prefix: the prefix of the variable names.
+        size: the number of variables.
+        previous: the prefix of the variables of the previous environment.
+
+    Returns:
+        The environment.
+    """
+    env = {}
+    for idx in range(size):
+        if previous and idx % 10 == 0:
+            env[f"{prefix}_{idx}"] = f"${{{previous}_{idx}}}:${previous}_{idx + 1}/bin"
+        else:
+            env[f"{prefix}_{idx}"] = f"/usr/local/{prefix.lower()}/{idx}"
+    return env
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--vars", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=1000)
+    args = parser.parse_args()
+
+    stages = ["TERMINAL", "PROJECT", "ENVIRONMENT", "PLUGIN", "ENVIRONMENT_PLUGIN"]
+    envs = [
+        make_env(stage, args.vars, stages[idx - 1] if idx else None)
+        for idx, stage in enumerate(stages)
+    ]
+
+    start = time.perf_counter()
+    for _ in range(args.rounds):
+        expanded = expand_env_vars(envs[0], envs[0])
+        for env in envs[1:]:
+            expanded = {**expanded, **expand_env_vars(env, expanded)}
+    elapsed = time.perf_counter() - start
+
+    print(f"environments:        {len(stages)} x {args.vars} vars")
+    print(f"rounds:              {args.rounds}")
+    print(f"per round:           {elapsed / args.rounds * 1000:.2f} ms")
+    print(f"total:               {elapsed:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""Benchmark looking up plugin definitions on Meltano Hub.
+
+Serves a plugin index and definition from a local server that adds latency to
+each response, like a remote Hub, and looks up the definition the way
+`meltano add` and `meltano install` do, from new invocations sharing the Hub
+cache of the project.
+
+Usage:
+
+    python benchmarks/hub_cache.py [--latency-ms 200] [--rounds 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from http import server as server_lib
+from pathlib import Path
+
+from meltano.core.hub import MeltanoHubService
+from meltano.core.plugin import PluginType
+from meltano.core.project import Project
+
+
+def make_handler(api_url: str, latency: float) -> type:
+    """Create a request handler serving a single extractor.
+
+    Args:
+        api_url: the base URL of the plugin API.
+        latency: how long to wait before responding, in seconds.
+
+    Returns:
+        The request handler class.
+    """
+    responses = {
+        "/meltano/api/v1/plugins/extractors/index": {
+            "tap-benchmark": {
+                "default_variant": "meltano",
+                "logo_url": None,
+                "variants": {
+                    "meltano": {
+                        "ref": f"{api_url}/extractors/tap-benchmark--meltano",
+                    },
+                },
+            },
+        },
+        "/meltano/api/v1/plugins/extractors/tap-benchmark--meltano": {
+            "name": "tap-benchmark",
+            "namespace": "tap_benchmark",
+            "variant": "meltano",
+            "pip_url": "tap-benchmark",
+            "settings": [{"name": f"setting_{idx}"} for idx in range(50)],
+        },
+    }
+
+    class HubRequestHandler(server_lib.BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802
+            time.sleep(latency)
+            body = json.dumps(responses[self.path.split("?")[0]]).encode()
+            etag = f'"{hashlib.sha256(body).hexdigest()}"'
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.end_headers()
+                return
+
+            self.send_response(200)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args) -> None:
+            """Silence request logs."""
+
+    return HubRequestHandler
+
+
+def lookup(project: Project) -> float:
+    """Look up the definition of the extractor from a new invocation.
+
+    Args:
+        project: the Meltano project.
+
+    Returns:
+        The time it took, in seconds.
+    """
+    start = time.perf_counter()
+    MeltanoHubService(project).find_definition(PluginType.EXTRACTORS, "tap-benchmark")
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--latency-ms", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    server = server_lib.ThreadingHTTPServer(
+        ("localhost", 0), server_lib.BaseHTTPRequestHandler
+    )
+    hub_url = f"http://localhost:{server.server_port}"
+    server.RequestHandlerClass = make_handler(
+        f"{hub_url}/meltano/api/v1/plugins", args.latency_ms / 1000
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        project_root = Path(tmp_dir, "project")
+        project_root.mkdir()
+        project_root.joinpath("meltano.yml").write_text("version: 1\n")
+        os.environ["MELTANO_SEND_ANONYMOUS_USAGE_STATS"] = "false"
+        os.environ["MELTANO_HUB_URL"] = hub_url
+        project = Project(project_root)
+
+        cold = lookup(project)
+        cached = [lookup(project) for _ in range(args.rounds)]
+
+        os.environ["MELTANO_HUB_CACHE_TTL"] = "0"
+        os.environ["MELTANO_HUB_CACHE_STALE_WHILE_REVALIDATE"] = "0"
+        revalidated = [lookup(project) for _ in range(args.rounds)]
+
+    server.shutdown()
+
+    print(f"hub latency:         {args.latency_ms} ms")
+    print(f"uncached:            {cold * 1000:.0f} ms")
+    print(f"cached:              {min(cached) * 1000:.1f} ms")
+    print(f"revalidated (304):   {min(revalidated) * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Benchmark logging the output of a plugin.
+
+Logs synthetic plugin output lines through an `Out`, with the logging
+configuration `setup_logging` installs and a plugin run log file, the way
+`meltano run` logs the stderr of its plugins. Console output is discarded.
+
+Usage:
+
+    python benchmarks/plugin_log_throughput.py [--lines 50000] [--batch 100]
+        [--per-line] [--lines-per-second 0]
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import structlog
+
+from meltano.core.logging.output_logger import OutputLogger
+from meltano.core.logging.utils import setup_logging
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=50000)
+    parser.add_argument("--batch", type=int, default=100)
+    parser.add_argument("--per-line", action="store_true")
+    parser.add_argument("--lines-per-second", type=int, default=0)
+    args = parser.parse_args()
+
+    setup_logging(log_level="info")
+    with open(os.devnull, "w") as devnull, tempfile.TemporaryDirectory() as tmp_dir:
+        for handler in logging.getLogger().handlers:
+            if isinstance(handler, logging.StreamHandler):
+                handler.setStream(devnull)
+
+        log_file = Path(tmp_dir, "elt.log")
+        output_logger = OutputLogger(
+            str(log_file), lines_per_second=args.lines_per_second
+        )
+        meltano_out = output_logger.out("meltano", structlog.stdlib.get_logger("bench"))
+        plugin_out = output_logger.out(
+            "tap-benchmark",
+            structlog.stdlib.get_logger("meltano.core.block.extract_load").bind(
+                consumer=False,
+                producer=True,
+                string_id="tap-benchmark",
+                cmd_type="elb",
+                stdio="stderr",
+            ),
+        )
+        lines = [
+            f"INFO Synced record {idx} of stream benchmark with a typical payload\n"
+            for idx in range(args.lines)
+        ]
+
+        with meltano_out.redirect_logging():
+            start = time.perf_counter()
+            if args.per_line:
+                for line in lines:
+                    plugin_out.logger.log(
+                        logging.INFO, line.rstrip(), name=plugin_out.name
+                    )
+            else:
+                for idx in range(0, args.lines, args.batch):
+                    plugin_out.writelines(lines[idx : idx + args.batch])
+                plugin_out.flush()
+            elapsed = time.perf_counter() - start
+
+        log_size_mb = log_file.stat().st_size / 2**20
+
+    print(f"mode:                {'per-line' if args.per_line else 'batched'}")
+    print(f"lines:               {args.lines}")
+    print(f"elapsed:             {elapsed:.2f} s")
+    print(f"throughput:          {args.lines / elapsed:.0f} lines/s")
+    print(f"log file:            {log_size_mb:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
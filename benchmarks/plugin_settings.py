@@ -0,0 +1,109 @@
+"""Benchmark listing the settings of a deeply inherited plugin.
+
+Generates a project with a custom extractor with many settings, and a chain of
+extractors that each inherit from the previous one and set some config of their
+own, then runs `meltano config <extractor> list` in-process for the last one.
+Later runs share the process, and so the in-memory caches, of the first one.
+
+Usage:
+
+    python benchmarks/plugin_settings.py [--settings 500] [--depth 10]
+        [--rounds 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+from click.testing import CliRunner
+
+from meltano.cli import cli
+
+
+def make_project(project_root: Path, settings: int, depth: int) -> str:
+    """Generate a project with a chain of inheriting extractors.
+
+    Args:
+        project_root: the directory to generate the project in.
+        settings: the number of settings of the custom extractor.
+        depth: the number of extractors inheriting from it.
+
+    Returns:
+        The name of the last extractor of the chain.
+    """
+    extractors = [
+        {
+            "name": "tap-benchmark",
+            "namespace": "tap_benchmark",
+            "pip_url": "tap-benchmark",
+            "executable": "tap-benchmark",
+            "settings": [
+                {"name": f"setting_{idx}", "aliases": [f"alias_{idx}"]}
+                for idx in range(settings)
+            ],
+        }
+    ]
+    for level in range(depth):
+        extractors.append(
+            {
+                "name": f"tap-benchmark-{level}",
+                "inherit_from": extractors[-1]["name"],
+                "config": {
+                    f"setting_{level}": f"value_{level}",
+                    f"custom_{level}": {"nested": level},
+                },
+            }
+        )
+
+    project_root.mkdir(parents=True)
+    with open(project_root / "meltano.yml", "w") as meltano_yml:
+        yaml.safe_dump(
+            {
+                "version": 1,
+                "project_id": "benchmark",
+                "send_anonymous_usage_stats": False,
+                "plugins": {"extractors": extractors},
+            },
+            meltano_yml,
+        )
+
+    return extractors[-1]["name"]
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--settings", type=int, default=500)
+    parser.add_argument("--depth", type=int, default=10)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        project_root = Path(tmp_dir, "project")
+        plugin_name = make_project(project_root, args.settings, args.depth)
+        os.environ["MELTANO_PROJECT_ROOT"] = str(project_root)
+        os.environ["MELTANO_SEND_ANONYMOUS_USAGE_STATS"] = "false"
+
+        runner = CliRunner(mix_stderr=False)
+        timings = []
+        for _ in range(args.rounds):
+            start = time.perf_counter()
+            result = runner.invoke(
+                cli, ["config", plugin_name, "list"], catch_exceptions=False
+            )
+            timings.append(time.perf_counter() - start)
+            assert result.exit_code == 0, result.stderr
+
+    print(f"plugin:              {args.settings} settings, {args.depth} levels deep")
+    print(f"first run:           {timings[0] * 1000:.0f} ms")
+    print(f"best:                {min(timings) * 1000:.0f} ms")
+    print(f"mean:                {sum(timings) / len(timings) * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""Benchmark loading the configuration of a project with many plugins and includes.
+
+Generates a project with custom extractors spread over included files, then runs
+`meltano config <extractor> list` in-process, counting how many times project
+files are read and how many times the project configuration is parsed. Later
+runs share the process, and so the in-memory caches, of the first one.
+
+Usage:
+
+    python benchmarks/project_config.py [--plugins 200] [--includes 20]
+        [--rounds 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+from unittest import mock
+
+import yaml
+from click.testing import CliRunner
+
+from meltano.cli import cli
+from meltano.core import yaml as meltano_yaml
+from meltano.core.meltano_file import MeltanoFile
+
+
+def make_plugin(idx: int) -> dict:
+    """Generate a custom extractor with a few settings.
+
+    Args:
+        idx: the index of the extractor.
+
+    Returns:
+        The extractor definition.
+    """
+    return {
+        "name": f"tap-benchmark-{idx}",
+        "namespace": f"tap_benchmark_{idx}",
+        "pip_url": f"tap-benchmark-{idx}",
+        "executable": f"tap-benchmark-{idx}",
+        "capabilities": ["catalog", "discover", "state"],
+        "settings": [
+            {"name": "username"},
+            {"name": "password", "kind": "password"},
+            {"name": "start_date", "kind": "date_iso8601"},
+            {"name": "streams", "kind": "array"},
+        ],
+        "config": {"username": f"user_{idx}", "streams": ["one", "two", "three"]},
+        "select": ["one.*", "two.*"],
+    }
+
+
+def make_project(project_root: Path, plugins: int, includes: int) -> None:
+    """Generate a project with its extractors spread over included files.
+
+    Args:
+        project_root: the directory to generate the project in.
+        plugins: the number of extractors.
+        includes: the number of included files.
+    """
+    include_dir = project_root / "plugins"
+    include_dir.mkdir(parents=True)
+    for include in range(includes):
+        extractors = [
+            make_plugin(idx) for idx in range(include, plugins, max(includes, 1))
+        ]
+        with open(include_dir / f"extractors_{include}.yml", "w") as include_file:
+            yaml.safe_dump({"plugins": {"extractors": extractors}}, include_file)
+
+    with open(project_root / "meltano.yml", "w") as meltano_yml:
+        yaml.safe_dump(
+            {
+                "version": 1,
+                "project_id": "benchmark",
+                "send_anonymous_usage_stats": False,
+                "include_paths": ["./plugins/*.yml"],
+                "environments": [{"name": "dev"}],
+            },
+            meltano_yml,
+        )
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--plugins", type=int, default=200)
+    parser.add_argument("--includes", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    counts = {"open": 0, "parse": 0}
+    original_open = open
+    original_parse = MeltanoFile.parse.__func__
+
+    def counting_open(file, *open_args, **open_kwargs):  # noqa: WPS430
+        if str(file).endswith(".yml"):
+            counts["open"] += 1
+        return original_open(file, *open_args, **open_kwargs)
+
+    def counting_parse(cls, *parse_args, **parse_kwargs):  # noqa: WPS430
+        counts["parse"] += 1
+        return original_parse(cls, *parse_args, **parse_kwargs)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        project_root = Path(tmp_dir, "project")
+        make_project(project_root, args.plugins, args.includes)
+        os.environ["MELTANO_PROJECT_ROOT"] = str(project_root)
+        os.environ["MELTANO_SEND_ANONYMOUS_USAGE_STATS"] = "false"
+
+        runner = CliRunner(mix_stderr=False)
+        timings = []
+        round_counts = []
+        with mock.patch.object(meltano_yaml, "open", counting_open, create=True):
+            with mock.patch.object(MeltanoFile, "parse", classmethod(counting_parse)):
+                for _ in range(args.rounds):
+                    counts.update(open=0, parse=0)
+                    start = time.perf_counter()
+                    result = runner.invoke(
+                        cli,
+                        ["config", "tap-benchmark-0", "list"],
+                        catch_exceptions=False,
+                    )
+                    timings.append(time.perf_counter() - start)
+                    round_counts.append(dict(counts))
+                    assert result.exit_code == 0, result.stderr
+
+    print(f"project:             {args.plugins} plugins, {args.includes} includes")
+    print(f"first run:           {timings[0] * 1000:.0f} ms")
+    print(f"best:                {min(timings) * 1000:.0f} ms")
+    print(f"mean:                {sum(timings) / len(timings) * 1000:.0f} ms")
+    print(f"YAML file reads:     {round_counts[0]['open']} (first run)")
+    print(f"                     {round_counts[-1]['open']} (last run)")
+    print(f"MeltanoFile parses:  {round_counts[0]['parse']} (first run)")
+    print(f"                     {round_counts[-1]['parse']} (last run)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Benchmark the meltano overhead of relaying extractor output to a loader.
+
+Spawns a producer and a consumer subprocess, relays the producer's stdout to the
+consumer's stdin through `capture_subprocess_output`, and reports the CPU time
+spent by the meltano (parent) process as MB/s of relayed Singer messages.
+
+Usage:
+
+    python benchmarks/relay_throughput.py [--size-mb 200] [--line-writer]
+
+`--line-writer` attaches a no-op per-line consumer (like `extractor_out` or a
+debug log tee does), which forces the line-by-line relay path.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+
+from meltano.core.logging.utils import capture_subprocess_output
+
+PRODUCER = """
+import sys
+line = b'{"type": "RECORD", "stream": "bench", "record": {"id": 1, "name": "%s"}}\\n' % (b"x" * 100)
+chunk = line * 1000
+for _ in range(int(sys.argv[1]) * 2**20 // len(chunk)):
+    sys.stdout.buffer.write(chunk)
+"""
+
+CONSUMER = """
+import sys
+while sys.stdin.buffer.read(2**20):
+    pass
+"""
+
+
+class NullLineWriter:
+    """A per-line consumer that discards everything."""
+
+    def writeline(self, line: str) -> None:
+        """Discard a line.
+
+        Args:
+            line: the line to discard.
+        """
+
+
+async def relay(size_mb: int, line_writer: bool) -> tuple[float, float]:
+    """Relay `size_mb` MB of Singer messages between two subprocesses.
+
+    Args:
+        size_mb: the amount of data the producer should write.
+        line_writer: whether to attach a per-line consumer.
+
+    Returns:
+        The wall clock and parent process CPU seconds spent relaying.
+    """
+    producer = await asyncio.create_subprocess_exec(
+        sys.executable,
+        "-c",
+        PRODUCER,
+        str(size_mb),
+        stdout=asyncio.subprocess.PIPE,
+        limit=2**20,
+    )
+    consumer = await asyncio.create_subprocess_exec(
+        sys.executable, "-c", CONSUMER, stdin=asyncio.subprocess.PIPE
+    )
+    writers = [NullLineWriter()] if line_writer else []
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    await capture_subprocess_output(producer.stdout, *writers, consumer.stdin)
+    cpu = time.process_time() - cpu_start
+    wall = time.perf_counter() - wall_start
+
+    await producer.wait()
+    consumer.stdin.close()
+    await consumer.wait()
+    return wall, cpu
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=int, default=200)
+    parser.add_argument("--line-writer", action="store_true")
+    args = parser.parse_args()
+
+    wall, cpu = asyncio.run(relay(args.size_mb, args.line_writer))
+    mode = "line" if args.line_writer else "chunk"
+    print(f"mode:                {mode}")
+    print(f"relayed:             {args.size_mb} MB")
+    print(f"wall clock:          {wall:.2f} s ({args.size_mb / wall:.1f} MB/s)")
+    print(f"meltano CPU time:    {cpu:.2f} s")
+    print(f"meltano overhead:    {args.size_mb / max(cpu, 1e-9):.1f} MB/s of CPU")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""Benchmark resolving the configuration of a plugin with many settings.
+
+Copies the `tests/fixtures/large_config_project` project, adds synthetic setting
+definitions to its extractor (plain, extra, object and env var referencing
+settings), then resolves the configuration of the extractor the way
+`PluginInvoker.prepare` does: as a dict, processed, extras only, and as env vars.
+
+Usage:
+
+    python benchmarks/settings_resolution.py [--settings 150] [--rounds 5]
+        [--no-snapshot]
+"""
+
+from __future__ import annotations
+
+import argparse
+import shutil
+import tempfile
+import time
+from contextlib import nullcontext
+from pathlib import Path
+
+import yaml
+
+from meltano.core.plugin import PluginType
+from meltano.core.plugin.settings_service import PluginSettingsService
+from meltano.core.project import Project
+from meltano.core.project_plugins_service import ProjectPluginsService
+
+FIXTURE = Path(__file__).parent.parent / "tests" / "fixtures" / "large_config_project"
+EXTRACTOR = "tap-with-large-config"
+
+
+def make_settings(count: int) -> tuple[list[dict], dict]:
+    """Generate setting definitions and their configured values.
+
+    Args:
+        count: the number of settings to generate.
+
+    Returns:
+        The setting definitions and the config of the extractor.
+    """
+    settings = []
+    config = {}
+    for idx in range(count):
+        kind = idx % 4
+        if kind == 0:
+            settings.append({"name": f"setting_{idx}", "value": f"default_{idx}"})
+        elif kind == 1:
+            settings.append({"name": f"setting_{idx}", "kind": "password"})
+            config[f"setting_{idx}"] = f"$BENCHMARK_ENV_{idx}"
+        elif kind == 2:
+            settings.append({"name": f"setting_{idx}", "kind": "object"})
+            config[f"setting_{idx}"] = {"nested": idx, "other": f"value_{idx}"}
+        else:
+            settings.append(
+                {
+                    "name": f"_extra_{idx}",
+                    "value": f"$TAP_WITH_LARGE_CONFIG_SETTING_{idx - 3}",
+                }
+            )
+    return settings, config
+
+
+def make_project(project_root: Path, settings_count: int) -> Project:
+    """Copy the large config project and add settings to its extractor.
+
+    Args:
+        project_root: where to copy the project to.
+        settings_count: the number of settings to add to the extractor.
+
+    Returns:
+        The project.
+    """
+    shutil.copytree(FIXTURE, project_root)
+    meltano_yml = project_root / "meltano.yml"
+    with meltano_yml.open() as meltano_yml_file:
+        manifest = yaml.safe_load(meltano_yml_file)
+
+    settings, config = make_settings(settings_count)
+    (extractor,) = manifest["plugins"]["extractors"]
+    extractor["settings"] = settings
+    extractor["config"].update(config)
+
+    with meltano_yml.open("w") as meltano_yml_file:
+        yaml.safe_dump(manifest, meltano_yml_file)
+
+    return Project(project_root)
+
+
+def resolve(settings_service: PluginSettingsService, snapshot: bool) -> None:
+    """Resolve the configuration of a plugin like `PluginInvoker.prepare` does.
+
+    Args:
+        settings_service: the settings service of the plugin.
+        snapshot: whether to resolve settings within a single snapshot.
+    """
+    with settings_service.snapshot() if snapshot else nullcontext():
+        settings_service.as_dict(extras=False)
+        settings_service.as_dict(extras=False, process=True)
+        settings_service.as_dict(extras=True)
+        settings_service.as_env()
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--settings", type=int, default=150)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--no-snapshot", action="store_true")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        project = make_project(Path(tmp_dir, "project"), args.settings)
+        plugins_service = ProjectPluginsService(project)
+        plugin = plugins_service.find_plugin(EXTRACTOR, PluginType.EXTRACTORS)
+        settings_service = PluginSettingsService(
+            project, plugin, plugins_service=plugins_service
+        )
+        setting_count = len(settings_service.definitions())
+
+        timings = []
+        for _ in range(args.rounds):
+            start = time.perf_counter()
+            resolve(settings_service, snapshot=not args.no_snapshot)
+            timings.append(time.perf_counter() - start)
+
+    print(f"snapshot:            {not args.no_snapshot}")
+    print(f"settings:            {setting_count}")
+    print(f"best:                {min(timings) * 1000:.0f} ms")
+    print(f"mean:                {sum(timings) / len(timings) * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Benchmark the telemetry overhead of a command against a blackholed collector.
+
+Tracks the events of a typical command, then flushes them like the exit event
+does, against a collector that accepts connections but never responds, like a
+firewalled collector on an air-gapped worker.
+
+Usage:
+
+    python benchmarks/telemetry_exit.py [--events 3] [--rounds 3]
+        [--flush-timeout-ms 500]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import socket
+import tempfile
+import time
+from pathlib import Path
+
+from meltano.core.project import Project
+from meltano.core.tracking import CliEvent
+from meltano.core.tracking.tracker import Tracker
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=3)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--flush-timeout-ms", type=int, default=500)
+    args = parser.parse_args()
+
+    # Accepts connections into its backlog, but never reads requests
+    collector = socket.socket()
+    collector.bind(("localhost", 0))
+    collector.listen(64)
+    port = collector.getsockname()[1]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        project_root = Path(tmp_dir, "project")
+        project_root.mkdir()
+        project_root.joinpath("meltano.yml").write_text("version: 1\n")
+        os.environ["MELTANO_SEND_ANONYMOUS_USAGE_STATS"] = "true"
+        os.environ[
+            "MELTANO_SNOWPLOW_COLLECTOR_ENDPOINTS"
+        ] = f'["http://localhost:{port}"]'
+        os.environ["MELTANO_SNOWPLOW_FLUSH_TIMEOUT_MS"] = str(args.flush_timeout_ms)
+        project = Project(project_root)
+
+        timings = []
+        for _ in range(args.rounds):
+            start = time.perf_counter()
+            tracker = Tracker(project)
+            for _ in range(args.events):
+                tracker.track_command_event(CliEvent.inflight)
+            tracker.flush(tracker.flush_timeout)
+            timings.append(time.perf_counter() - start)
+
+        # Including the events claimed by flushes still waiting on the collector
+        spool = tracker.snowplow_tracker.emitters[0].spool
+        spooled = sum(
+            len(path.read_text().splitlines())
+            for path in spool.spool_dir.glob(f"{spool.name}*")
+        )
+
+    collector.close()
+
+    print(f"events per command:  {args.events}")
+    print(f"flush timeout:       {args.flush_timeout_ms} ms")
+    print(f"best:                {min(timings) * 1000:.0f} ms")
+    print(f"mean:                {sum(timings) / len(timings) * 1000:.0f} ms")
+    print(f"left spooled:        {spooled} events")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Benchmark creating plugin virtual environments.
+
+Creates virtual environments the way `meltano install` does for a clean install
+of a plugin, either bootstrapping and upgrading pip in each of them, or cloning
+the pip packages of a venv template. With `--package`, the package is then
+installed into each of them too. The template is created before timing, as it is
+only created once a day.
+
+Usage:
+
+    python benchmarks/venv_bootstrap.py [--plugins 5] [--package example]
+        [--template]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from meltano.core.project import Project
+from meltano.core.venv_service import VenvService, VenvTemplate
+
+
+async def install(venv_service: VenvService, package: str | None) -> float:
+    """Create a virtual environment, and install a package into it.
+
+    Args:
+        venv_service: the service of the virtual environment.
+        package: the package to install, if any.
+
+    Returns:
+        The time it took, in seconds.
+    """
+    start = time.perf_counter()
+    venv_service.clean()
+    await venv_service.create()
+    await venv_service.upgrade_pip()
+    if package:
+        await venv_service._pip_install([package])  # noqa: WPS437
+    return time.perf_counter() - start
+
+
+async def run(project: Project, plugins: int, package: str | None) -> list[float]:
+    """Create the virtual environments of plugins one after the other.
+
+    Args:
+        project: the Meltano project.
+        plugins: the number of plugins.
+        package: the package to install, if any.
+
+    Returns:
+        The time it took for each plugin, in seconds.
+    """
+    template = VenvTemplate.from_project(project)
+    if template:
+        await template.ensure()
+
+    timings = []
+    for idx in range(plugins):
+        venv_service = VenvService(project, "extractors", f"tap-benchmark-{idx}")
+        venv_service.template = template
+        timings.append(await install(venv_service, package))
+    return timings
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--plugins", type=int, default=5)
+    parser.add_argument("--package")
+    parser.add_argument("--template", action="store_true")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        project_root = Path(tmp_dir, "project")
+        project_root.mkdir()
+        project_root.joinpath("meltano.yml").write_text("version: 1\n")
+        os.environ["MELTANO_SEND_ANONYMOUS_USAGE_STATS"] = "false"
+        os.environ["MELTANO_VENV_TEMPLATE"] = str(args.template).lower()
+        project = Project(project_root)
+        timings = asyncio.run(run(project, args.plugins, args.package))
+
+    print(f"bootstrap:           {'template' if args.template else 'pip'}")
+    print(f"plugins:             {args.plugins}")
+    print(f"package:             {args.package or '-'}")
+    print(f"best:                {min(timings) * 1000:.0f} ms")
+    print(f"mean:                {sum(timings) / len(timings) * 1000:.0f} ms")
+    print(f"total:               {sum(timings):.1f} s")
+
+
+if __name__ == "__main__":
+    main()
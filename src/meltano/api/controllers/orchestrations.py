@@ -208,14 +208,16 @@ def job_state() -> Response:
     poll_payload = request.get_json()
     state_ids = poll_payload["state_ids"]
 
+    latest_jobs = JobFinder.latest_by_state_id(db.session, state_ids)
+    latest_success_jobs = JobFinder.latest_success_by_state_id(db.session, state_ids)
+
     jobs = []
     for state_id in state_ids:
-        finder = JobFinder(state_id)
-        state_job = finder.latest(db.session)
+        state_job = latest_jobs.get(state_id)
         # Validate existence first as a job may not be queued yet as a result of
         # another prerequisite async process (dbt installation for example)
         if state_job:
-            state_job_success = finder.latest_success(db.session)
+            state_job_success = latest_success_jobs.get(state_id)
             jobs.append(
                 {
                     "state_id": state_id,
@@ -236,6 +238,11 @@ def job_state() -> Response:
 def job_log(state_id) -> Response:
     """Endpoint for getting the most recent log generated by a job with state_id.
 
+    The whole log is returned, unless the `offset` (in bytes) to read the log
+    from or the size of its `tail` (in bytes) is given. Only part of the log is
+    then returned, with the `next_offset` to read the rest of the log from as it
+    is being written.
+
     Args:
         state_id: id of the job you want to see logs of.
 
@@ -243,22 +250,41 @@ def job_log(state_id) -> Response:
         JSON containing the jobs log entries
     """
     project = Project.find()
-    try:
-        log_service = JobLoggingService(project)
-        log = log_service.get_latest_log(state_id)
-        has_log_exceeded_max_size = False
-    except SizeThresholdJobLogException:
-        log = None
-        has_log_exceeded_max_size = True
+    log_service = JobLoggingService(project)
+    offset = request.args.get("offset", type=int)
+    tail = request.args.get("tail", type=int)
+    log_range = {}
+    has_log_exceeded_max_size = False
 
     finder = JobFinder(state_id)
     state_job = finder.latest(db.session)
     state_job_success = finder.latest_success(db.session)
 
+    if offset is None and tail is None:
+        try:
+            log = log_service.get_latest_log(state_id)
+        except SizeThresholdJobLogException:
+            log = None
+            has_log_exceeded_max_size = True
+    else:
+        log_chunk = log_service.read_latest_log(
+            state_id,
+            offset=offset or 0,
+            tail=tail,
+            finished=not (state_job and state_job.is_running()),
+        )
+        log = log_chunk.content
+        log_range = {
+            "offset": log_chunk.offset,
+            "next_offset": log_chunk.next_offset,
+            "size": log_chunk.size,
+        }
+
     return jsonify(
         {
             "state_id": state_id,
             "log": log,
+            **log_range,
             "has_log_exceeded_max_size": has_log_exceeded_max_size,
             "has_error": state_job.has_error() if state_job else False,
             "started_at": state_job.started_at if state_job else None,
@@ -271,6 +297,26 @@ def job_log(state_id) -> Response:
     )
 
 
+@orchestrations_bp.route("/jobs/<state_id>/log/stream", methods=["GET"])
+def stream_job_log(state_id) -> Response:
+    """Endpoint for streaming the most recent log generated by a job with state_id.
+
+    The log is streamed from the byte `offset` given as query parameter, if any.
+
+    Args:
+        state_id: id of the job you want to see logs of.
+
+    Returns:
+        A chunked plain text response of the job log.
+    """
+    project = Project.find()
+    log_service = JobLoggingService(project)
+    offset = request.args.get("offset", default=0, type=int)
+    return Response(
+        log_service.stream_latest_log(state_id, offset=offset), mimetype="text/plain"
+    )
+
+
 @orchestrations_bp.route("/jobs/<state_id>/download", methods=["GET"])
 def download_job_log(state_id) -> Response:
     """Endpoint for downloading a job log with state_id.
@@ -492,6 +538,14 @@ def get_pipeline_schedules():
         if allow:
             jobs_in_list = True
 
+    elt_state_ids = [
+        schedule["name"] for schedule in schedules if not schedule.get("job")
+    ]
+    latest_jobs = JobFinder.latest_by_state_id(db.session, elt_state_ids)
+    latest_success_jobs = JobFinder.latest_success_by_state_id(
+        db.session, elt_state_ids
+    )
+
     formatted_schedules = []
 
     for schedule in schedules:
@@ -500,8 +554,7 @@ def get_pipeline_schedules():
             # as the UI is not job aware yet.
             formatted_schedules.append(schedule)
         elif not schedule.get("job"):  # a legacy elt task
-            finder = JobFinder(schedule["name"])
-            state_job = finder.latest(db.session)
+            state_job = latest_jobs.get(schedule["name"])
             schedule["has_error"] = state_job.has_error() if state_job else False
             schedule["is_running"] = state_job.is_running() if state_job else False
             schedule["state_id"] = schedule["name"]
@@ -509,7 +562,7 @@ def get_pipeline_schedules():
             schedule["ended_at"] = state_job.ended_at if state_job else None
             schedule["trigger"] = state_job.trigger if state_job else None
 
-            state_job_success = finder.latest_success(db.session)
+            state_job_success = latest_success_jobs.get(schedule["name"])
             schedule["has_ever_succeeded"] = (
                 state_job_success.is_success() if state_job_success else None
             )
@@ -16,35 +16,12 @@ from meltano.core.project import ProjectReadonly
 # This suggests a cyclic dependency or a poorly structured interface.
 # This should be investigated and resolved to avoid implicit behavior
 # based solely on import order.
+# Subcommand modules are imported by the `cli` group when they are used.
 from meltano.cli.cli import (  # isort:skip
     activate_environment,
     activate_explicitly_provided_environment,
     cli,
 )
-from meltano.cli import (  # isort:skip # noqa: WPS235
-    add,
-    config,
-    discovery,
-    dragon,
-    elt,
-    environment,
-    initialize,
-    install,
-    invoke,
-    lock,
-    remove,
-    repl,
-    schedule,
-    schema,
-    select,
-    state,
-    ui,
-    upgrade,
-    user,
-    run,
-    validate,
-    job,
-)
 
 if TYPE_CHECKING:
     from meltano.core.tracking.tracker import Tracker
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import importlib
 import logging
 import os
 import sys
@@ -23,8 +24,79 @@ from meltano.core.utils import get_no_color_flag
 logger = logging.getLogger(__name__)
 
 
-class NoWindowsGlobbingGroup(InstrumentedGroup):
-    """A instrumented Click group that does not perform glob expansion on Windows.
+# The module defining each subcommand, imported only once the subcommand is used
+SUBCOMMAND_MODULES = {
+    "add": "meltano.cli.add",
+    "config": "meltano.cli.config",
+    "discover": "meltano.cli.discovery",
+    "dragon": "meltano.cli.dragon",
+    "elt": "meltano.cli.elt",
+    "environment": "meltano.cli.environment",
+    "init": "meltano.cli.initialize",
+    "install": "meltano.cli.install",
+    "invoke": "meltano.cli.invoke",
+    "job": "meltano.cli.job",
+    "lock": "meltano.cli.lock",
+    "remove": "meltano.cli.remove",
+    "repl": "meltano.cli.repl",
+    "run": "meltano.cli.run",
+    "schedule": "meltano.cli.schedule",
+    "schema": "meltano.cli.schema",
+    "select": "meltano.cli.select",
+    "state": "meltano.cli.state",
+    "test": "meltano.cli.validate",
+    "ui": "meltano.cli.ui",
+    "upgrade": "meltano.cli.upgrade",
+    "user": "meltano.cli.user",
+}
+
+
+class LazyGroup(InstrumentedGroup):
+    """An instrumented Click group that imports the modules of its subcommands lazily.
+
+    Subcommand modules register their commands with the group when imported, so
+    only the module of the subcommand being run needs to be imported.
+    """
+
+    def __init__(self, *args, lazy_subcommands: dict[str, str] | None = None, **kwargs):
+        """Instantiate the group.
+
+        Args:
+            args: Positional arguments for the Click group.
+            lazy_subcommands: The module defining each subcommand, by name.
+            kwargs: Keyword arguments for the Click group.
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """List the names of all subcommands, without importing them.
+
+        Args:
+            ctx: The Click context.
+
+        Returns:
+            The sorted names of the subcommands.
+        """
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Get a subcommand, importing its module if needed.
+
+        Args:
+            ctx: The Click context.
+            cmd_name: The name of the subcommand.
+
+        Returns:
+            The subcommand, or `None` if there is no such subcommand.
+        """
+        if cmd_name not in self.commands and cmd_name in self.lazy_subcommands:
+            importlib.import_module(self.lazy_subcommands[cmd_name])
+        return super().get_command(ctx, cmd_name)
+
+
+class NoWindowsGlobbingGroup(LazyGroup):
+    """A lazy instrumented Click group that does not perform glob expansion on Windows.
 
     This restores the behaviour of Click's globbing to how it was before v8.
     Click (as of version 8.1.3) ignores quotes around an asterisk, which makes
@@ -43,7 +115,10 @@ class NoWindowsGlobbingGroup(InstrumentedGroup):
 
 
 @click.group(
-    cls=NoWindowsGlobbingGroup, invoke_without_command=True, no_args_is_help=True
+    cls=NoWindowsGlobbingGroup,
+    invoke_without_command=True,
+    no_args_is_help=True,
+    lazy_subcommands=SUBCOMMAND_MODULES,
 )
 @click.option("--log-level", type=click.Choice(LEVELS.keys()))
 @click.option(
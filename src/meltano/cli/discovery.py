@@ -2,15 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
+from contextlib import closing
+
 import click
 
+from meltano.core.db import project_engine
 from meltano.core.hub import MeltanoHubService
 from meltano.core.plugin import PluginType
+from meltano.core.plugin.error import PluginExecutionError, PluginLacksCapabilityError
+from meltano.core.plugin_invoker import InvokerError, invoker_factory
 from meltano.core.project import Project
+from meltano.core.project_plugins_service import ProjectPluginsService
 
-from . import cli
-from .params import pass_project
-from .utils import InstrumentedCmd
+from . import activate_explicitly_provided_environment, cli
+from .params import migrate_database, pass_project
+from .utils import CliError, InstrumentedCmd
 
 
 @cli.command(
@@ -20,14 +27,40 @@ from .utils import InstrumentedCmd
 @click.argument(
     "plugin_type", type=click.Choice([*list(PluginType), "all"]), default="all"
 )
+@click.option(
+    "--warm",
+    is_flag=True,
+    help="Run discovery for the project's extractors to prefill the catalog cache.",
+)
+@click.option(
+    "--refresh",
+    is_flag=True,
+    help="With --warm, run discovery again for catalogs that are already cached.",
+)
 @pass_project()
 @click.pass_context
-def discover(ctx: click.Context, project: Project, plugin_type: str):
+def discover(
+    ctx: click.Context,
+    project: Project,
+    plugin_type: str,
+    warm: bool,
+    refresh: bool,
+):
     """
     List the available discoverable plugins and their variants.
 
     \b\nRead more at https://docs.meltano.com/reference/command-line-interface#discover
     """
+    if refresh and not warm:
+        raise CliError("--refresh can only be used with --warm")
+    if warm and plugin_type not in {"all", PluginType.EXTRACTORS}:
+        raise CliError("--warm can only be used with extractors")
+
+    if warm:
+        activate_explicitly_provided_environment(ctx, project)
+        asyncio.run(warm_catalog_cache(project, refresh=refresh))
+        return
+
     hub_service = MeltanoHubService(project)
     if plugin_type == "all":
         plugin_types = [
@@ -59,3 +92,54 @@ def discover(ctx: click.Context, project: Project, plugin_type: str):
                 click.echo(f", variants: {', '.join(plugin.variant_labels)}")
             else:
                 click.echo()
+
+
+async def warm_catalog_cache(project: Project, refresh: bool = False):
+    """Prefill the catalog cache with the catalogs of the project's extractors.
+
+    The system database is only needed here, to read extractor settings that
+    are stored in it, so listing plugins doesn't have to migrate it.
+
+    Args:
+        project: The Meltano project.
+        refresh: Whether to run discovery again for catalogs already cached.
+
+    Raises:
+        CliError: if discovery failed for any extractor.
+    """
+    plugins_service = ProjectPluginsService(project)
+    extractors = [
+        extractor
+        for extractor in plugins_service.get_plugins_of_type(PluginType.EXTRACTORS)
+        if "discover" in extractor.capabilities
+    ]
+
+    engine, Session = project_engine(project)  # noqa: N806
+    migrate_database(engine, project)
+
+    failed = []
+    with closing(Session()) as session:
+        for extractor in extractors:
+            invoker = invoker_factory(
+                project, extractor, plugins_service=plugins_service
+            )
+            try:
+                async with invoker.prepared(session):
+                    discovered = await extractor.warm_catalog_cache(
+                        invoker, refresh=refresh
+                    )
+            except PluginLacksCapabilityError:
+                click.echo(f"Skipped {extractor.name}: catalog cannot be cached")
+                continue
+            except (PluginExecutionError, InvokerError) as err:
+                click.secho(f"Failed {extractor.name}: {err}", fg="red", err=True)
+                failed.append(extractor.name)
+                continue
+
+            if discovered:
+                click.secho(f"Cached catalog of {extractor.name}", fg="green")
+            else:
+                click.echo(f"Catalog of {extractor.name} is already cached")
+
+    if failed:
+        raise CliError(f"Catalog discovery failed for: {', '.join(failed)}")
@@ -23,6 +23,7 @@ from meltano.core.plugin import PluginType
 from meltano.core.plugin.error import PluginNotFoundError
 from meltano.core.project import Project
 from meltano.core.project_plugins_service import ProjectPluginsService
+from meltano.core.project_settings_service import ProjectSettingsService
 from meltano.core.runner import RunnerError
 from meltano.core.runner.dbt import DbtRunner
 from meltano.core.runner.singer import SingerRunner
@@ -219,7 +220,9 @@ async def dump_file(context_builder, dumpable):
 
 
 async def _run_job(tracker, project, job, session, context_builder, force=False):
-    fail_stale_jobs(session, job.job_name)
+    settings_service = ProjectSettingsService(project)
+    heartbeat_interval = settings_service.get("elt.heartbeat_interval")
+    fail_stale_jobs(session, job.job_name, heartbeat_interval)
 
     if not force:
         existing = JobFinder(job.job_name).latest_running(session)
@@ -229,11 +232,15 @@ async def _run_job(tracker, project, job, session, context_builder, force=False)
                 + "To ignore this check use the '--force' option."
             )
 
-    async with job.run(session):
+    async with job.run(session, heartbeat_interval):
         job_logging_service = JobLoggingService(project)
         log_file = job_logging_service.generate_log_name(job.job_name, job.run_id)
 
-        output_logger = OutputLogger(log_file)
+        output_logger = OutputLogger(
+            log_file,
+            lines_per_second=settings_service.get("elt.plugin_log_lines_per_second"),
+            bytes_per_second=settings_service.get("elt.plugin_log_bytes_per_second"),
+        )
         context_builder.set_base_output_logger(output_logger)
 
         log = logger.bind(name="meltano", run_id=str(job.run_id), state_id=job.job_name)
@@ -109,6 +109,8 @@ def job(project, ctx):
     \t# The list of tasks must be yaml formatted and consist of a list of strings, list of string lists, or mix of both.
     \tmeltano job add NAME --tasks '["tap mapper target", "tap2 target2", ...]'
     \tmeltano job add NAME --tasks '[["tap target dbt:run", "tap2 target2", ...], ...]'
+    \t# Tasks of a "parallel" group run concurrently, once the tasks before it completed.
+    \tmeltano job add NAME --tasks '[{parallel: ["tap target", "tap2 target2", ...]}, "dbt:run"]'
     \b
     \t# Remove a named job
     \tmeltano job remove <job_name>
@@ -168,6 +170,8 @@ def add(ctx, job_name: str, raw_tasks: str):
     \t# The list of tasks must be yaml formatted and consist of a list of strings, list of string lists, or mix of both.
     \tmeltano job add NAME --tasks '["tap mapper target", "tap2 target2", ...]'
     \tmeltano job add NAME --tasks '[["tap target dbt:run", "tap2 target2", ...], ...]'
+    \t# Tasks of a "parallel" group run concurrently, once the tasks before it completed.
+    \tmeltano job add NAME --tasks '[{parallel: ["tap target", "tap2 target2", ...]}, "dbt:run"]'
     """
     task_sets_service: TaskSetsService = ctx.obj["task_sets_service"]
     tracker: Tracker = ctx.obj["tracker"]
@@ -225,6 +229,8 @@ def set_cmd(ctx, job_name: str, raw_tasks: str):
     \t# The list of tasks must be yaml formatted and consist of a list of strings, list string lists, or mix of both.
     \tmeltano job set NAME --tasks '["tap mapper target", "tap2 target2", ...]'
     \tmeltano job set NAME --tasks '[["tap target dbt:run", "tap2 target2", ...], ...]'
+    \t# Tasks of a "parallel" group run concurrently, once the tasks before it completed.
+    \tmeltano job set NAME --tasks '[{parallel: ["tap target", "tap2 target2", ...]}, "dbt:run"]'
     """
     tracker: Tracker = ctx.obj["tracker"]
     project: Project = ctx.obj["project"]
@@ -59,6 +59,9 @@ def lock(
 
     lock_service = PluginLockService(project)
     plugins_service = ProjectPluginsService(project)
+    if update:
+        # Lock the latest definitions, not the ones cached from the Hub
+        plugins_service.hub_service.cache.revalidate = True
 
     if (all_plugins and plugin_name) or not (all_plugins or plugin_name):
         tracker.track_command_event(CliEvent.aborted)
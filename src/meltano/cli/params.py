@@ -8,7 +8,6 @@ import click
 from click.globals import get_current_context as get_current_click_context
 
 from meltano.core.db import project_engine
-from meltano.core.migration_service import MigrationError
 from meltano.core.project_settings_service import ProjectSettingsService
 
 from .utils import CliError
@@ -31,6 +30,26 @@ def database_uri_option(func):
     return functools.update_wrapper(decorate, func)
 
 
+def migrate_database(engine, project):
+    """Upgrade the system database to the latest schema, and seed it.
+
+    args:
+        engine: The engine of the system database.
+        project: The project the system database belongs to.
+
+    raises:
+        CliError: if the migration failed.
+    """
+    from meltano.core.migration_service import MigrationError, MigrationService
+
+    try:
+        migration_service = MigrationService(engine)
+        migration_service.upgrade(silent=True)
+        migration_service.seed(project)
+    except MigrationError as err:
+        raise CliError(str(err))
+
+
 class pass_project:  # noqa: N801
     """Pass current project to decorated CLI command function."""
 
@@ -66,14 +85,7 @@ class pass_project:  # noqa: N801
             engine, _ = project_engine(project, default=True)
 
             if self.migrate:
-                from meltano.core.migration_service import MigrationService
-
-                try:
-                    migration_service = MigrationService(engine)
-                    migration_service.upgrade(silent=True)
-                    migration_service.seed(project)
-                except MigrationError as err:
-                    raise CliError(str(err))
+                migrate_database(engine, project)
 
             func(project, *args, **kwargs)
 
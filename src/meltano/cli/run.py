@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections import Counter
+
 import click
 import structlog
 
@@ -9,6 +12,7 @@ from meltano.cli import CliError, activate_environment, cli
 from meltano.cli.params import pass_project
 from meltano.cli.utils import PartialInstrumentedCmd
 from meltano.core.block.blockset import BlockSet
+from meltano.core.block.extract_load import ExtractLoadBlocks
 from meltano.core.block.parser import BlockParser, validate_block_sets
 from meltano.core.block.plugin_command import PluginCommandBlock
 from meltano.core.logging.utils import change_console_log_level
@@ -48,6 +52,11 @@ logger = structlog.getLogger(__name__)
     "--state-id-suffix",
     help="Define a custom suffix to autogenerate state IDs with.",
 )
+@click.option(
+    "--parallelism",
+    type=click.IntRange(min=1),
+    help="Maximum number of consecutive extract/load block sets, or tasks of a parallel group of a job, to run concurrently. Defaults to the lowest `parallelism` of the jobs run, or 1.",
+)
 @click.argument(
     "blocks",
     nargs=-1,
@@ -63,6 +72,7 @@ async def run(
     no_state_update: bool,
     force: bool,
     state_id_suffix: str,
+    parallelism: int | None,
     blocks: list[str],
 ):
     """
@@ -85,6 +95,11 @@ async def run(
 
     The above command will create two jobs with state IDs `prod:tap-gitlab-to-target-postgres` and `prod:tap-salesforce-to-target-mysql`.
 
+    With `--parallelism`, consecutive extract/load block sets run concurrently, while command blocks wait for all the
+    blocks before them to complete:
+
+        `meltano run --parallelism 2 tap-gitlab target-postgres tap-salesforce target-postgres dbt:run`\n
+
     \b\nRead more at https://docs.meltano.com/reference/command-line-interface#run
     """
     activate_environment(ctx, project, required=True)
@@ -121,65 +136,250 @@ async def run(
         tracker.track_command_event(CliEvent.aborted)
         raise CliError("Some ExtractLoadBlocks set failed validation.")
     try:
-        await _run_blocks(tracker, parsed_blocks, dry_run=dry_run)
+        await _run_blocks(
+            tracker,
+            parsed_blocks,
+            dry_run=dry_run,
+            parallelism=parallelism or parser.parallelism,
+            block_parallel_tasks=parser.block_parallel_tasks,
+            group_parallelism={
+                group: parallelism or group_parallelism
+                for group, group_parallelism in parser.group_parallelism.items()
+            },
+        )
     except Exception as err:
         tracker.track_command_event(CliEvent.failed)
         raise err
     tracker.track_command_event(CliEvent.completed)
 
 
+def _stages(
+    parsed_blocks: list[BlockSet | PluginCommandBlock],
+    parallelism: int,
+    block_parallel_tasks: list[tuple[int, int] | None],
+) -> list[list[list[tuple[int, BlockSet | PluginCommandBlock]]]]:
+    """Split blocks into stages to run one after the other.
+
+    The tasks of a stage can run concurrently, and are made of blocks to run one
+    after the other. The tasks of a parallel group of a job make up a stage.
+    Otherwise, when the parallelism allows it, consecutive extract/load block
+    sets make up a stage of one block tasks, as long as they don't share a state
+    ID. Any other block is a stage of its own, so that it only runs once all the
+    blocks before it completed.
+
+    Args:
+        parsed_blocks: The blocks to run.
+        parallelism: The maximum number of block sets outside of parallel groups
+            to run concurrently.
+        block_parallel_tasks: The parallel group and task of each block, if any.
+
+    Returns:
+        The stages, as lists of tasks of blocks along with their index.
+    """
+    stages: list[list[list[tuple[int, BlockSet | PluginCommandBlock]]]] = []
+    concurrent = False
+    state_ids: set[str] = set()
+    parallel_task = None
+    for idx, blk in enumerate(parsed_blocks):
+        previous_parallel_task = parallel_task
+        parallel_task = block_parallel_tasks[idx]
+        if parallel_task:
+            concurrent = False
+            if (
+                not previous_parallel_task
+                or previous_parallel_task[0] != parallel_task[0]
+            ):
+                stages.append([[(idx, blk)]])
+            elif previous_parallel_task != parallel_task:
+                stages[-1].append([(idx, blk)])
+            else:
+                stages[-1][-1].append((idx, blk))
+            continue
+
+        can_run_concurrently = parallelism > 1 and isinstance(blk, ExtractLoadBlocks)
+        state_id = (
+            blk.context.job.job_name
+            if can_run_concurrently and blk.context.job
+            else None
+        )
+        if can_run_concurrently and concurrent and state_id not in state_ids:
+            stages[-1].append([(idx, blk)])
+        else:
+            stages.append([[(idx, blk)]])
+            state_ids.clear()
+        if state_id:
+            state_ids.add(state_id)
+        concurrent = can_run_concurrently
+    return stages
+
+
+def _isolate_shared_plugins(
+    stage: list[list[tuple[int, BlockSet | PluginCommandBlock]]]
+) -> None:
+    """Give plugins used by several tasks of a stage a run directory per block set.
+
+    Args:
+        stage: The tasks of the stage, as blocks along with their index.
+    """
+    block_sets = [
+        [(idx, blk) for idx, blk in task if isinstance(blk, ExtractLoadBlocks)]
+        for task in stage
+    ]
+    plugin_counts = Counter(
+        name
+        for task in block_sets
+        for name in {
+            block.invoker.plugin.name for _, blk in task for block in blk.blocks
+        }
+    )
+    shared = {name for name, count in plugin_counts.items() if count > 1}
+    if not shared:
+        return
+
+    for task in block_sets:
+        for idx, blk in task:
+            blk.isolate_run_dirs(shared, f"set-{idx}")
+
+
 async def _run_blocks(
     tracker: Tracker,
     parsed_blocks: list[BlockSet | PluginCommandBlock],
     dry_run: bool,
+    parallelism: int = 1,
+    block_parallel_tasks: list[tuple[int, int] | None] | None = None,
+    group_parallelism: dict[int, int] | None = None,
 ) -> None:
-    for idx, blk in enumerate(parsed_blocks):
-        blk_name = blk.__class__.__name__
-        tracking_ctx = PluginsTrackingContext.from_block(blk)
-        with tracker.with_contexts(tracking_ctx):
-            tracker.track_block_event(blk_name, BlockEvents.initialized)
-        if dry_run:
-            if isinstance(blk, BlockSet):
-                logger.info(
-                    f"Dry run, but would have run block {idx + 1}/{len(parsed_blocks)}.",
-                    block_type=blk_name,
-                    comprised_of=[plugin.string_id for plugin in blk.blocks],
-                )
-            elif isinstance(blk, PluginCommandBlock):
-                logger.info(
-                    f"Dry run, but would have run block {idx + 1}/{len(parsed_blocks)}.",
-                    block_type=blk_name,
-                    comprised_of=f"{blk.string_id}:{blk.command}",
-                )
+    block_parallel_tasks = block_parallel_tasks or [None] * len(parsed_blocks)
+    stages = _stages(parsed_blocks, parallelism, block_parallel_tasks)
+    for stage in stages:
+        if len(stage) == 1:
+            for idx, blk in stage[0]:
+                await _run_block(tracker, idx, blk, len(parsed_blocks), dry_run)
             continue
 
-        try:
-            await blk.run()
-        except RunnerError as err:
-            logger.error(
-                "Block run completed.",
-                set_number=idx,
+        parallel_task = block_parallel_tasks[stage[0][0][0]]
+        await _run_concurrently(
+            tracker,
+            stage,
+            len(parsed_blocks),
+            dry_run,
+            (group_parallelism or {}).get(parallel_task[0], parallelism)
+            if parallel_task
+            else parallelism,
+        )
+
+
+async def _run_concurrently(
+    tracker: Tracker,
+    stage: list[list[tuple[int, BlockSet | PluginCommandBlock]]],
+    total: int,
+    dry_run: bool,
+    parallelism: int,
+) -> None:
+    """Run the tasks of a stage concurrently.
+
+    Once a block failed, the blocks that did not start yet are skipped, and the
+    error of the first one that failed is raised once the others completed.
+
+    Args:
+        tracker: The tracker to send block events to.
+        stage: The tasks of the stage, as blocks along with their index.
+        total: The number of blocks of the invocation.
+        dry_run: Whether to only explain what would be run.
+        parallelism: The maximum number of tasks to run concurrently.
+
+    Raises:
+        Exception: The error of the first block that failed.
+    """
+    logger.debug(
+        "Running tasks concurrently.",
+        set_numbers=[[idx for idx, _ in task] for task in stage],
+        parallelism=parallelism,
+    )
+    if not dry_run:
+        _isolate_shared_plugins(stage)
+
+    semaphore = asyncio.Semaphore(parallelism)
+    errors: list[Exception] = []
+
+    async def run_task(  # noqa: WPS430
+        task: list[tuple[int, BlockSet | PluginCommandBlock]]
+    ) -> None:
+        async with semaphore:
+            for idx, blk in task:
+                if errors:
+                    logger.info(
+                        "Block skipped as another block failed.",
+                        set_number=idx,
+                        block_type=blk.__class__.__name__,
+                    )
+                    continue
+
+                if isinstance(blk, ExtractLoadBlocks):
+                    blk.log_context["set_number"] = idx
+                try:
+                    await _run_block(tracker, idx, blk, total, dry_run)
+                except Exception as err:
+                    errors.append(err)
+
+    await asyncio.gather(*(run_task(task) for task in stage))
+    if errors:
+        raise errors[0]
+
+
+async def _run_block(
+    tracker: Tracker,
+    idx: int,
+    blk: BlockSet | PluginCommandBlock,
+    total: int,
+    dry_run: bool,
+) -> None:
+    blk_name = blk.__class__.__name__
+    tracking_ctx = PluginsTrackingContext.from_block(blk)
+    with tracker.with_contexts(tracking_ctx):
+        tracker.track_block_event(blk_name, BlockEvents.initialized)
+    if dry_run:
+        if isinstance(blk, BlockSet):
+            logger.info(
+                f"Dry run, but would have run block {idx + 1}/{total}.",
                 block_type=blk_name,
-                success=False,
-                err=err,
-                exit_codes=err.exitcodes,
+                comprised_of=[plugin.string_id for plugin in blk.blocks],
             )
-            with tracker.with_contexts(tracking_ctx):
-                tracker.track_block_event(blk_name, BlockEvents.failed)
-            raise CliError(
-                f"Run invocation could not be completed as block failed: {err}"
-            ) from err
-        except Exception as bare_err:  # make sure we also fire block failed events for all other exceptions
-            with tracker.with_contexts(tracking_ctx):
-                tracker.track_block_event(blk_name, BlockEvents.failed)
-            raise bare_err
-
-        logger.info(
+        elif isinstance(blk, PluginCommandBlock):
+            logger.info(
+                f"Dry run, but would have run block {idx + 1}/{total}.",
+                block_type=blk_name,
+                comprised_of=f"{blk.string_id}:{blk.command}",
+            )
+        return
+
+    try:
+        await blk.run()
+    except RunnerError as err:
+        logger.error(
             "Block run completed.",
             set_number=idx,
-            block_type=blk.__class__.__name__,
-            success=True,
-            err=None,
+            block_type=blk_name,
+            success=False,
+            err=err,
+            exit_codes=err.exitcodes,
         )
         with tracker.with_contexts(tracking_ctx):
-            tracker.track_block_event(blk_name, BlockEvents.completed)
+            tracker.track_block_event(blk_name, BlockEvents.failed)
+        raise CliError(
+            f"Run invocation could not be completed as block failed: {err}"
+        ) from err
+    except Exception as bare_err:  # make sure we also fire block failed events for all other exceptions
+        with tracker.with_contexts(tracking_ctx):
+            tracker.track_block_event(blk_name, BlockEvents.failed)
+        raise bare_err
+
+    logger.info(
+        "Block run completed.",
+        set_number=idx,
+        block_type=blk.__class__.__name__,
+        success=True,
+        err=None,
+    )
+    with tracker.with_contexts(tracking_ctx):
+        tracker.track_block_event(blk_name, BlockEvents.completed)
@@ -6,14 +6,15 @@ import json
 import sys
 
 import click
-from sqlalchemy.orm import Session
 
 from meltano.cli import activate_explicitly_provided_environment, cli
 from meltano.cli.params import pass_project
 from meltano.cli.utils import InstrumentedDefaultGroup, PartialInstrumentedCmd
 from meltano.core.db import project_engine
+from meltano.core.job import Job, JobFinder
 from meltano.core.job.stale_job_failer import fail_stale_jobs
 from meltano.core.project import Project
+from meltano.core.project_settings_service import ProjectSettingsService
 from meltano.core.schedule import Schedule
 from meltano.core.schedule_service import ScheduleAlreadyExistsError, ScheduleService
 from meltano.core.task_sets import TaskSets
@@ -145,12 +146,11 @@ def _format_job_list_output(entry: Schedule, job: TaskSets) -> dict:
     }
 
 
-def _format_elt_list_output(entry: Schedule, session: Session) -> dict:
+def _format_elt_list_output(entry: Schedule, last_successful_run: Job | None) -> dict:
     start_date = coerce_datetime(entry.start_date)
     if start_date:
         start_date = start_date.date().isoformat()
 
-    last_successful_run = entry.last_successful_run(session)
     last_successful_run_ended_at = (
         last_successful_run.ended_at.isoformat() if last_successful_run else None
     )
@@ -183,7 +183,12 @@ def list(ctx, format):  # noqa: WPS125
     _, sessionMaker = project_engine(project)  # noqa: N806
     session = sessionMaker()
     try:
-        fail_stale_jobs(session)
+        fail_stale_jobs(
+            session,
+            heartbeat_interval=ProjectSettingsService(project).get(
+                "elt.heartbeat_interval"
+            ),
+        )
 
         if format == "text":
             transform_elt_markers = {
@@ -204,9 +209,18 @@ def list(ctx, format):  # noqa: WPS125
                     )
 
         elif format == "json":
+            json_schedules = schedule_service.schedules()
+            last_successful_runs = JobFinder.latest_success_by_state_id(
+                session,
+                [
+                    json_schedule.name
+                    for json_schedule in json_schedules
+                    if not json_schedule.job
+                ],
+            )
             job_schedules = []
             elt_schedules = []
-            for json_schedule in schedule_service.schedules():
+            for json_schedule in json_schedules:
                 if json_schedule.job:
                     job_schedules.append(
                         _format_job_list_output(
@@ -215,7 +229,9 @@ def list(ctx, format):  # noqa: WPS125
                     )
                 else:
                     elt_schedules.append(
-                        _format_elt_list_output(json_schedule, session)
+                        _format_elt_list_output(
+                            json_schedule, last_successful_runs.get(json_schedule.name)
+                        )
                     )
             click.echo(
                 json.dumps(
@@ -297,12 +297,40 @@ def get_state(ctx: click.Context, project: Project, state_id: str):  # noqa: WPS
 
 @meltano_state.command(cls=InstrumentedCmd, name="clear")
 @prompt_for_confirmation(prompt="This will clear state for the job. Continue?")
-@click.argument("state-id")
+@click.argument("state-ids", nargs=-1, required=True)
 @pass_project(migrate=True)
 @click.pass_context
-def clear_state(ctx: click.Context, project: Project, state_id: str, force: bool):
-    """Clear state."""
+def clear_state(
+    ctx: click.Context, project: Project, state_ids: tuple[str, ...], force: bool
+):
+    """Clear state for one or more state IDs."""
+    # Each state_id is validated like a single one, before clearing them at once
+    state_services = [
+        state_service_from_state_id(project, state_id) for state_id in state_ids
+    ]
     state_service: StateService = (
-        state_service_from_state_id(project, state_id) or ctx.obj[STATE_SERVICE_KEY]
-    )
-    state_service.clear_state(state_id)
+        state_services[0] if len(state_ids) == 1 else None
+    ) or ctx.obj[STATE_SERVICE_KEY]
+    state_service.clear_states(state_ids)
+
+
+@meltano_state.command(cls=InstrumentedCmd, name="compact")
+@prompt_for_confirmation(
+    prompt="This will remove the state history of past runs. Continue?"
+)
+@click.option("--pattern", type=str, help="Filter state IDs by pattern.")
+@click.pass_context
+def compact_state(ctx: click.Context, pattern: str | None, force: bool):
+    """Replace the state history of past runs with the current state.
+
+    Optionally pass a glob-style pattern to filter state_ids by.
+    """
+    state_service: StateService = ctx.obj[STATE_SERVICE_KEY]
+    state_ids = state_service.compactable_state_ids(pattern)
+    if not state_ids:
+        logger.info("No state history to compact.")
+        return
+
+    for state_id, pruned in state_service.compact_states(state_ids).items():
+        if pruned:
+            logger.info(f"Compacted the state history of {pruned} runs of {state_id}.")
@@ -6,7 +6,7 @@ import asyncio
 import logging
 from contextlib import asynccontextmanager, closing
 from pathlib import Path
-from typing import AsyncIterator
+from typing import Any, AsyncIterator, Callable, Iterable
 
 import structlog
 from sqlalchemy.orm import Session
@@ -39,6 +39,50 @@ class BlockSetHasNoStateError(Exception):
     """Occurs when state_service is accessed for ExtractLoadBlocks instance for which no block has state."""
 
 
+class LazySession:
+    """A session of the system database, only created when it is first used.
+
+    Attributes are looked up on the session, creating it if needed. Closing a
+    session that was never created does nothing.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session]):
+        """Initialize a new lazy session.
+
+        Args:
+            session_factory: A callable returning the session.
+        """
+        self._session_factory = session_factory
+        self._session: Session | None = None
+
+    @property
+    def created(self) -> bool:
+        """Check whether the session was created.
+
+        Returns:
+            True if the session was created.
+        """
+        return self._session is not None
+
+    def close(self) -> None:
+        """Close the session, if it was created."""
+        if self._session is not None:
+            self._session.close()
+
+    def __getattr__(self, name: str) -> Any:
+        """Look up an attribute of the session, creating it if needed.
+
+        Args:
+            name: The name of the attribute.
+
+        Returns:
+            The attribute of the session.
+        """
+        if self._session is None:
+            self._session = self._session_factory()
+        return getattr(self._session, name)
+
+
 class ELBContext:  # noqa: WPS230
     """ELBContext holds the context for ELB BlockSets."""
 
@@ -116,9 +160,7 @@ class ELBContextBuilder:  # noqa: WPS214
         self.project = project
         self.plugins_service = plugins_service or ProjectPluginsService(project)
 
-        _, session_maker = project_engine(project)
-        self.session = session_maker()
-
+        self._session = None
         self._job = None
         self._full_refresh = False
         self._state_update = True
@@ -129,6 +171,34 @@ class ELBContextBuilder:  # noqa: WPS214
 
         self._base_output_logger = None
 
+    @property
+    def session(self) -> Session:
+        """Get the session to use for the context.
+
+        Unless a session was set, this is a `LazySession` that only creates the
+        engine and session of the system database the first time it is used, so
+        block sets that never touch the database never connect to it.
+
+        Returns:
+            A session of the system database.
+        """
+        if self._session is None:
+            self._session = LazySession(self._create_session)
+        return self._session
+
+    @session.setter
+    def session(self, session: Session) -> None:
+        """Set the session to use for the context.
+
+        Args:
+            session: A session of the system database.
+        """
+        self._session = session
+
+    def _create_session(self) -> Session:
+        _, session_maker = project_engine(self.project)
+        return session_maker()
+
     def with_job(self, job: Job):
         """Set the associated job for the context.
 
@@ -315,7 +385,15 @@ class ExtractLoadBlocks(BlockSet):  # noqa: WPS214
             config_service=self.context.plugins_service.config_service,
         )
 
-        self.output_logger = OutputLogger(None)
+        log_budget = {
+            "lines_per_second": self.project_settings_service.get(
+                "elt.plugin_log_lines_per_second"
+            ),
+            "bytes_per_second": self.project_settings_service.get(
+                "elt.plugin_log_bytes_per_second"
+            ),
+        }
+        self.output_logger = OutputLogger(None, **log_budget)
 
         if not self.context.project.active_environment:
             self.context.job = None
@@ -329,7 +407,10 @@ class ExtractLoadBlocks(BlockSet):  # noqa: WPS214
             log_file = job_logging_service.generate_log_name(
                 self.context.job.job_name, self.context.job.run_id
             )
-            self.output_logger = OutputLogger(log_file)
+            self.output_logger = OutputLogger(log_file, **log_budget)
+
+        # Extra fields to log the output of the plugins of the block set with
+        self.log_context: dict = {}
 
         self._process_futures = None
         self._stdout_futures = None
@@ -464,7 +545,8 @@ class ExtractLoadBlocks(BlockSet):  # noqa: WPS214
             logger.warning(
                 "No active environment, proceeding with stateless run! See https://docs.meltano.com/reference/command-line-interface#run for details."
             )
-        await self.execute()
+        with closing(self.context.session):
+            await self.execute()
 
     async def run_with_job(self) -> None:
         """Run the ELT task within the context of a job.
@@ -473,7 +555,8 @@ class ExtractLoadBlocks(BlockSet):  # noqa: WPS214
             RunnerError: if failures are encountered during execution or if the underlying pipeline/job is already running.
         """
         job = self.context.job
-        fail_stale_jobs(self.context.session, job.job_name)
+        heartbeat_interval = self.project_settings_service.get("elt.heartbeat_interval")
+        fail_stale_jobs(self.context.session, job.job_name, heartbeat_interval)
         if not self.context.force:
             existing = JobFinder(job.job_name).latest_running(self.context.session)
             if existing:
@@ -483,9 +566,25 @@ class ExtractLoadBlocks(BlockSet):  # noqa: WPS214
                 )
 
         with closing(self.context.session) as session:
-            async with job.run(session):
+            async with job.run(session, heartbeat_interval):
                 await self.execute()
 
+    def isolate_run_dirs(self, plugin_names: Iterable[str], name: str) -> None:
+        """Give plugins a run directory of their own, within their usual one.
+
+        Plugins write their configuration and state to their run directory, so
+        block sets running the same plugin concurrently can't share it.
+
+        Args:
+            plugin_names: The names of the plugins to isolate.
+            name: The name of the run directories, within the usual ones.
+        """
+        for block in self.blocks:
+            if block.invoker.plugin.name in plugin_names:
+                config_service = block.invoker.plugin_config_service
+                config_service.run_dir = config_service.run_dir.joinpath(name)
+                config_service.run_dir.mkdir(parents=True, exist_ok=True)
+
     async def terminate(self, graceful: bool = False) -> None:
         """Terminate an in flight ExtractLoad execution, potentially disruptive.
 
@@ -596,6 +695,7 @@ class ExtractLoadBlocks(BlockSet):  # noqa: WPS214
                 producer=block.producer,
                 string_id=block.string_id,
                 cmd_type="elb",
+                **self.log_context,
             )
             if logger.isEnabledFor(logging.DEBUG):
                 block.stdout_link(
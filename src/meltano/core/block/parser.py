@@ -11,6 +11,7 @@ from meltano.core.plugin import PluginType
 from meltano.core.plugin.error import PluginNotFoundError
 from meltano.core.plugin.project_plugin import ProjectPlugin
 from meltano.core.project_plugins_service import ProjectPluginsService
+from meltano.core.task_sets import DEFAULT_PARALLEL_GROUP_PARALLELISM
 from meltano.core.task_sets_service import TaskSetsService
 
 from .blockset import BlockSet, BlockSetValidationError
@@ -98,6 +99,16 @@ class BlockParser:  # noqa: D101
         self._commands: dict[int, str] = {}
         self._mappings_ref: dict[int, str] = {}
 
+        # How many block sets the jobs of the invocation allow to run concurrently
+        self.parallelism = 1
+
+        # How many tasks of each parallel group of the jobs can run concurrently
+        self.group_parallelism: dict[int, int] = {}
+        # The parallel group and task of the block names that are part of one
+        self._parallel_tasks: dict[int, tuple[int, int]] = {}
+        # The parallel group and task of the blocks found by `find_blocks`
+        self.block_parallel_tasks: list[tuple[int, int] | None] = []
+
         task_sets_service: TaskSetsService = TaskSetsService(project)
 
         blocks = self._expand_jobs(blocks, task_sets_service)
@@ -141,6 +152,11 @@ class BlockParser:  # noqa: D101
             Given a job named "somejob" which consists of a single task of "tap target":
             ["somejob", "dbt:run"] -> ["tap", "target", "dbt:run"]
 
+        Also sets the parallelism of the invocation to the lowest one of the jobs,
+        and keeps track of the parallelism of the jobs' parallel groups, and of
+        the parallel group and task of their block names. Jobs without an explicit
+        parallelism only run the tasks of their parallel groups concurrently.
+
         Args:
             blocks: List of block names to parse.
             task_sets: TaskSetsService to use.
@@ -149,16 +165,39 @@ class BlockParser:  # noqa: D101
             List of block names with jobs expanded.
         """
         expanded_blocks: list[str] = []
+        parallelism: list[int] = []
+        parallel_groups = 0
         for name in blocks:
             if task_sets.exists(name):
+                job = task_sets.get(name)
                 self.log.debug(
                     "expanding job to tasks",
                     job_name=name,
-                    tasks=task_sets.get(name).flat_args,
+                    tasks=job.flat_args,
                 )
-                expanded_blocks.extend(task_sets.get(name).flat_args)
+                for stage in job.stages:
+                    is_parallel_group = len(stage) > 1
+                    if is_parallel_group:
+                        self.group_parallelism[parallel_groups] = (
+                            job.parallelism or DEFAULT_PARALLEL_GROUP_PARALLELISM
+                        )
+                    for task_idx, task in enumerate(stage):
+                        for block_name in task:
+                            if is_parallel_group:
+                                self._parallel_tasks[len(expanded_blocks)] = (
+                                    parallel_groups,
+                                    task_idx,
+                                )
+                            expanded_blocks.append(block_name)
+                    parallel_groups += is_parallel_group
+
+                parallelism.append(job.parallelism or 1)
             else:
                 expanded_blocks.append(name)
+
+        # The most restrictive job wins, as its block sets may be run with others'
+        if parallelism:
+            self.parallelism = min(parallelism)
         return expanded_blocks
 
     def find_blocks(
@@ -176,12 +215,29 @@ class BlockParser:  # noqa: D101
         Raises:
             BlockSetValidationError: If unknown command is found or if a unexpected block sequence is found.
         """
+        self.block_parallel_tasks = []
+        # The parallel task running the block sets of each state ID of a group
+        group_state_ids: dict[tuple[int, str], tuple[int, int]] = {}
         cur = offset
         while cur < len(self._plugins):
             plugin = self._plugins[cur]
+            parallel_task = self._parallel_tasks.get(cur)
             elb, idx = self._find_next_elb_set(cur)
             if elb:
                 self.log.debug("found ExtractLoadBlocks set", offset=cur)
+                if self._parallel_tasks.get(cur + idx - 1) != parallel_task:
+                    raise BlockSetValidationError(
+                        f"Block set starting with block '{plugin.name}' at index {cur + 1} spans several tasks of a parallel group"  # noqa: WPS237
+                    )
+                if parallel_task and elb.context.job:
+                    task = group_state_ids.setdefault(
+                        (parallel_task[0], elb.context.job.job_name), parallel_task
+                    )
+                    if task != parallel_task:
+                        raise BlockSetValidationError(
+                            f"Block set starting with block '{plugin.name}' at index {cur + 1} shares its state ID with another task of its parallel group"  # noqa: WPS237
+                        )
+                self.block_parallel_tasks.append(parallel_task)
                 yield elb
                 cur += idx
             elif is_command_block(plugin):
@@ -190,6 +246,7 @@ class BlockParser:  # noqa: D101
                     offset=cur,
                     plugin_type=plugin.type,
                 )
+                self.block_parallel_tasks.append(parallel_task)
                 yield plugin_command_invoker(
                     self._plugins[cur],
                     self.project,
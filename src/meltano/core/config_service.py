@@ -4,6 +4,7 @@ from __future__ import annotations
 import logging
 import os
 from contextlib import contextmanager
+from functools import lru_cache
 
 import yaml
 
@@ -14,6 +15,18 @@ from meltano.core.setting_definition import SettingDefinition
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _bundled_settings() -> tuple[SettingDefinition, ...]:
+    """Parse the settings bundled with Meltano, once per process.
+
+    Returns:
+        The definitions of the project settings.
+    """
+    with open(bundle.root / "settings.yml") as settings_yaml:
+        settings = yaml.safe_load(settings_yaml)
+    return tuple(map(SettingDefinition.parse, settings["settings"]))
+
+
 class ConfigService:
     """Service to manage meltano.yml."""
 
@@ -38,9 +51,7 @@ class ConfigService:
             The project settings.
         """
         if self._settings is None:
-            with open(bundle.root / "settings.yml") as settings_yaml:
-                settings = yaml.safe_load(settings_yaml)
-            self._settings = list(map(SettingDefinition.parse, settings["settings"]))
+            self._settings = list(_bundled_settings())
 
         return self._settings
 
@@ -51,9 +62,11 @@ class ConfigService:
         Returns:
             The contents of meltano.yml.
         """
-        if self._current_meltano_yml is None or not self._use_cache:
+        if not self._use_cache:
             self.project.clear_cache()
             self._current_meltano_yml = self.project.meltano
+        elif self._current_meltano_yml is None:
+            self._current_meltano_yml = self.project.meltano
         return self._current_meltano_yml
 
     @contextmanager
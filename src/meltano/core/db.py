@@ -6,10 +6,10 @@ import logging
 import time
 
 from sqlalchemy import create_engine
-from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.engine import Connection, Engine, make_url
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import NullPool, QueuePool
 from sqlalchemy.sql import text
 
 from meltano.core.project import Project
@@ -44,14 +44,15 @@ def project_engine(
     engine_uri = settings.get("database_uri")
     logging.debug(f"Creating engine '{project}@{engine_uri}'")
 
-    engine = create_engine(engine_uri, poolclass=NullPool)
+    engine = create_engine(engine_uri, **engine_options(engine_uri, settings))
 
     # Connect to the database to ensure it is available.
-    connect(
+    connection = connect(
         engine,
         max_retries=settings.get("database_max_retries"),
         retry_timeout=settings.get("database_retry_timeout"),
     )
+    connection.close()
 
     init_hook(engine)
 
@@ -64,6 +65,33 @@ def project_engine(
     return engine_session
 
 
+def engine_options(engine_uri: str, settings: ProjectSettingsService) -> dict:
+    """Get the connection pool options for a system database engine.
+
+    Connections to database servers are kept in a pool of `database_pool_size`
+    connections, so that sessions don't have to open (and authenticate) a new
+    connection each time. Connections to SQLite databases are cheap to open and
+    are never pooled.
+
+    Args:
+        engine_uri: The URI of the system database.
+        settings: The project settings service.
+
+    Returns:
+        Keyword arguments for `sqlalchemy.create_engine`.
+    """
+    pool_size = settings.get("database_pool_size")
+    if not pool_size or make_url(engine_uri).get_backend_name() == "sqlite":
+        return {"poolclass": NullPool}
+
+    return {
+        "poolclass": QueuePool,
+        "pool_size": pool_size,
+        "pool_pre_ping": settings.get("database_pool_pre_ping"),
+        "pool_recycle": settings.get("database_pool_recycle"),
+    }
+
+
 def connect(
     engine: Engine,
     max_retries: int,
@@ -0,0 +1,248 @@
+"""On-disk cache of Meltano Hub API responses."""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from meltano.core.project import Project
+from meltano.core.project_settings_service import ProjectSettingsService
+from meltano.core.utils import hash_sha256
+
+logger = structlog.stdlib.get_logger(__name__)
+
+DEFAULT_TTL = 3600
+DEFAULT_STALE_WHILE_REVALIDATE = 86400
+
+
+class HubCacheEntry:
+    """A cached Hub API response."""
+
+    def __init__(
+        self, url: str, body: Any, etag: str | None = None, fetched_at: float = 0
+    ):
+        """Create a new cache entry.
+
+        Args:
+            url: The URL of the response.
+            body: The parsed JSON body of the response.
+            etag: The `ETag` header of the response.
+            fetched_at: When the response was last fetched or revalidated.
+        """
+        self.url = url
+        self.body = body
+        self.etag = etag
+        self.fetched_at = fetched_at
+
+    @property
+    def age(self) -> float:
+        """Return the time since the response was fetched or revalidated.
+
+        Returns:
+            The age of the entry, in seconds.
+        """
+        return time.time() - self.fetched_at
+
+
+class HubCache:
+    """Store Hub API responses by URL, along with their `ETag`.
+
+    Responses are served from the cache for `ttl` seconds after they are fetched.
+    For `stale_while_revalidate` more seconds, they are still served, while they
+    are revalidated in the background. After that, they are revalidated with
+    `If-None-Match` before being served. In offline mode, cached responses are
+    always served and the Hub is never requested.
+
+    Entries are plain files named after the hash of their URL, written with
+    atomic renames, so the cache can be shared between projects and workers.
+    """
+
+    suffix = ".json"
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        ttl: int = DEFAULT_TTL,
+        stale_while_revalidate: int = DEFAULT_STALE_WHILE_REVALIDATE,
+        offline: bool = False,
+    ):
+        """Create a new Hub cache.
+
+        Args:
+            cache_dir: The directory in which responses are stored.
+            ttl: How long responses are fresh, in seconds.
+            stale_while_revalidate: How long stale responses are still served while
+                they are revalidated, in seconds.
+            offline: Whether to only serve cached responses.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+        self.stale_while_revalidate = stale_while_revalidate
+        self.offline = offline
+        # Whether to revalidate fresh responses too, e.g. to update lockfiles
+        self.revalidate = False
+        self._entries: dict[str, HubCacheEntry] = {}
+
+    @classmethod
+    def from_project(
+        cls,
+        project: Project,
+        settings_service: ProjectSettingsService | None = None,
+    ) -> HubCache:
+        """Create the Hub cache configured for a project.
+
+        Args:
+            project: The Meltano project.
+            settings_service: The project settings service to read settings from.
+
+        Returns:
+            The Hub cache to use for the project.
+        """
+        settings_service = settings_service or ProjectSettingsService(project)
+        cache_dir = settings_service.get("hub_cache.dir")
+        ttl = settings_service.get("hub_cache.ttl")
+        stale_while_revalidate = settings_service.get(
+            "hub_cache.stale_while_revalidate"
+        )
+
+        return cls(
+            Path(cache_dir).expanduser() if cache_dir else project.cache_dir("hub"),
+            ttl=DEFAULT_TTL if ttl is None else ttl,
+            stale_while_revalidate=(
+                DEFAULT_STALE_WHILE_REVALIDATE
+                if stale_while_revalidate is None
+                else stale_while_revalidate
+            ),
+            offline=bool(settings_service.get("hub_cache.offline")),
+        )
+
+    def path(self, url: str) -> Path:
+        """Get the path of the cached response for a URL.
+
+        Args:
+            url: The URL of the response.
+
+        Returns:
+            The path of the cache entry, which may not exist.
+        """
+        return self.cache_dir.joinpath(f"{hash_sha256(url)}{self.suffix}")
+
+    def is_fresh(self, entry: HubCacheEntry) -> bool:
+        """Check whether a cached response can be served without revalidating it.
+
+        Args:
+            entry: The cache entry.
+
+        Returns:
+            True if the response is fresh, or the cache is offline.
+        """
+        return self.offline or (not self.revalidate and entry.age < self.ttl)
+
+    def is_usable_stale(self, entry: HubCacheEntry) -> bool:
+        """Check whether a stale response can be served while it is revalidated.
+
+        Args:
+            entry: The cache entry.
+
+        Returns:
+            True if the response can be served while it is revalidated.
+        """
+        return not self.revalidate and (
+            entry.age < self.ttl + self.stale_while_revalidate
+        )
+
+    def load(self, url: str) -> HubCacheEntry | None:
+        """Load the cached response for a URL, if there is one.
+
+        Args:
+            url: The URL of the response.
+
+        Returns:
+            The cache entry, or None if the response isn't cached.
+        """
+        try:
+            return self._entries[url]
+        except KeyError:
+            pass
+
+        try:
+            with self.path(url).open() as entry_file:
+                record = json.load(entry_file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as err:
+            logger.debug("Ignoring unreadable Hub cache entry", url=url, error=err)
+            return None
+
+        entry = self._entries[url] = HubCacheEntry(
+            url,
+            record["body"],
+            etag=record.get("etag"),
+            fetched_at=record.get("fetched_at", 0),
+        )
+        return entry
+
+    def store(self, url: str, body: Any, etag: str | None = None) -> HubCacheEntry:
+        """Add a response to the cache.
+
+        Args:
+            url: The URL of the response.
+            body: The parsed JSON body of the response.
+            etag: The `ETag` header of the response.
+
+        Returns:
+            The new cache entry.
+        """
+        entry = self._entries[url] = HubCacheEntry(
+            url, body, etag=etag, fetched_at=time.time()
+        )
+        self._write(entry)
+        return entry
+
+    def touch(self, entry: HubCacheEntry) -> None:
+        """Mark a cached response as revalidated.
+
+        Args:
+            entry: The cache entry.
+        """
+        entry.fetched_at = time.time()
+        self._write(entry)
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        self._entries.clear()
+        for entry_path in self.cache_dir.glob(f"*{self.suffix}"):
+            try:
+                entry_path.unlink()
+            except FileNotFoundError:
+                # Already removed by another process
+                continue
+
+    def _write(self, entry: HubCacheEntry) -> None:
+        record = {
+            "url": entry.url,
+            "etag": entry.etag,
+            "fetched_at": entry.fetched_at,
+            "body": entry.body,
+        }
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        except OSError as err:
+            # The cache is an optimization, so a read-only project still works
+            logger.debug("Could not write Hub cache entry", url=entry.url, error=err)
+            return
+
+        try:
+            with os.fdopen(fd, "w") as tmp_file:
+                json.dump(record, tmp_file)
+            os.replace(tmp_name, self.path(entry.url))
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
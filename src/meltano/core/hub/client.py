@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import threading
+from http import HTTPStatus
 from typing import Any
 
 import requests
 from structlog.stdlib import get_logger
 
 import meltano
+from meltano.core import bundle
 from meltano.core.plugin import (
     BasePlugin,
     PluginDefinition,
@@ -17,10 +20,15 @@ from meltano.core.plugin import (
 )
 from meltano.core.plugin.error import PluginNotFoundError
 from meltano.core.plugin.factory import base_plugin_factory
-from meltano.core.plugin_discovery_service import PluginRepository
+from meltano.core.plugin_discovery_service import (
+    PluginDiscoveryService,
+    PluginRepository,
+)
 from meltano.core.project import Project
 from meltano.core.project_settings_service import ProjectSettingsService
+from meltano.core.utils import NotFound, find_named
 
+from .cache import HubCache, HubCacheEntry
 from .schema import IndexedPlugin, VariantRef
 
 logger = get_logger(__name__)
@@ -111,6 +119,10 @@ class MeltanoHubService(PluginRepository):
         if self.hub_url_auth:
             self.session.headers.update({"Authorization": self.hub_url_auth})
 
+        self.cache = HubCache.from_project(self.project, self.settings_service)
+        self._revalidating: set[str] = set()
+        self._bundled_discovery = None
+
     @property
     def hub_api_url(self):
         """Return the URL of the Hub API.
@@ -207,10 +219,8 @@ class MeltanoHubService(PluginRepository):
                 plugin_type, plugin, variant_name
             ) from variant_key_err
 
-        response = self.session.get(url)
-
         try:
-            response.raise_for_status()
+            definition = self.fetch(url)
         except requests.HTTPError as http_err:
             logger.error(
                 "Can not retrieve plugin",
@@ -219,7 +229,10 @@ class MeltanoHubService(PluginRepository):
             )
             raise PluginNotFoundError(PluginRef(plugin_type, plugin_name)) from http_err
 
-        return PluginDefinition(**response.json(), plugin_type=plugin_type)
+        if definition is None:
+            return self._find_bundled_definition(plugin_type, plugin_name, variant_name)
+
+        return PluginDefinition(**definition, plugin_type=plugin_type)
 
     def find_base_plugin(
         self,
@@ -261,10 +274,9 @@ class MeltanoHubService(PluginRepository):
             return {}
 
         url = self.plugin_type_endpoint(plugin_type)
-        response = self.session.get(url)
 
         try:
-            response.raise_for_status()
+            plugins: dict[str, dict[str, Any]] | None = self.fetch(url)
         except requests.HTTPError as err:
             logger.error(
                 "Can not retrieve plugin type",
@@ -273,7 +285,9 @@ class MeltanoHubService(PluginRepository):
             )
             raise HubPluginTypeNotFoundError(plugin_type) from err
 
-        plugins: dict[str, dict[str, Any]] = response.json()
+        if plugins is None:
+            return self._get_bundled_plugins_of_type(plugin_type)
+
         return {
             name: IndexedPlugin(
                 name,
@@ -286,3 +300,125 @@ class MeltanoHubService(PluginRepository):
             )
             for name, plugin in plugins.items()
         }
+
+    def fetch(self, url: str) -> Any:
+        """Get the parsed JSON response of a Hub API endpoint, using the cache.
+
+        Args:
+            url: The URL of the endpoint.
+
+        Returns:
+            The parsed response, or None if it isn't cached in offline mode.
+
+        Raises:
+            RequestException: If the Hub can't be reached and the response isn't
+                cached.
+        """
+        entry = self.cache.load(url)
+        if entry and self.cache.is_fresh(entry):
+            return entry.body
+
+        if self.cache.offline:
+            logger.debug("Hub response not cached in offline mode", url=url)
+            return None
+
+        if entry and self.cache.is_usable_stale(entry):
+            self._revalidate_in_background(entry)
+            return entry.body
+
+        try:
+            return self._request(url, entry).body
+        except requests.HTTPError:
+            raise
+        except requests.RequestException as err:
+            if not entry:
+                raise
+            logger.warning(
+                "Could not reach Meltano Hub, using a cached response",
+                url=url,
+                error=err,
+            )
+            return entry.body
+
+    def _request(self, url: str, entry: HubCacheEntry | None) -> HubCacheEntry:
+        headers = {"If-None-Match": entry.etag} if entry and entry.etag else {}
+        response = self.session.get(url, headers=headers)
+        if entry and response.status_code == HTTPStatus.NOT_MODIFIED:
+            self.cache.touch(entry)
+            return entry
+
+        response.raise_for_status()
+        return self.cache.store(url, response.json(), etag=response.headers.get("ETag"))
+
+    def _revalidate_in_background(self, entry: HubCacheEntry) -> None:
+        if entry.url in self._revalidating:
+            return
+        self._revalidating.add(entry.url)
+
+        def revalidate():  # noqa: WPS430
+            try:
+                self._request(entry.url, entry)
+            except Exception as err:
+                logger.debug(
+                    "Could not revalidate cached Hub response",
+                    url=entry.url,
+                    error=err,
+                )
+            finally:
+                self._revalidating.discard(entry.url)
+
+        threading.Thread(target=revalidate, daemon=True).start()
+
+    def _get_bundled_definitions(self, plugin_type: PluginType) -> list:
+        if self._bundled_discovery is None:
+            discovery_service = PluginDiscoveryService(self.project)
+            with open(bundle.root / "discovery.yml") as bundled_discovery:
+                self._bundled_discovery = discovery_service.load_discovery(
+                    bundled_discovery
+                )
+        return self._bundled_discovery[plugin_type]
+
+    def _get_bundled_plugins_of_type(
+        self, plugin_type: PluginType
+    ) -> dict[str, IndexedPlugin]:
+        logger.info(
+            "Using the bundled plugin index in offline mode",
+            plugin_type=plugin_type.value,
+        )
+        plugins = {}
+        for definition in self._get_bundled_definitions(plugin_type):
+            variant_names = [
+                variant.name or Variant.ORIGINAL_NAME for variant in definition.variants
+            ]
+            plugins[definition.name] = IndexedPlugin(
+                definition.name,
+                logo_url=definition.logo_url,
+                default_variant=variant_names[0],
+                variants={
+                    variant_name: VariantRef(
+                        variant_name,
+                        ref=self.plugin_endpoint(
+                            plugin_type, definition.name, variant_name
+                        ),
+                    )
+                    for variant_name in variant_names
+                },
+            )
+        return plugins
+
+    def _find_bundled_definition(
+        self,
+        plugin_type: PluginType,
+        plugin_name: str,
+        variant_name: str,
+    ) -> PluginDefinition:
+        try:
+            definition = find_named(
+                self._get_bundled_definitions(plugin_type), plugin_name
+            )
+        except NotFound as err:
+            raise PluginNotFoundError(PluginRef(plugin_type, plugin_name)) from err
+
+        attrs = definition.canonical()
+        attrs["variants"] = [definition.find_variant(variant_name).canonical()]
+        return PluginDefinition(**attrs, plugin_type=plugin_type)
@@ -3,8 +3,20 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
+from typing import Iterable
 
-from .job import HEARTBEAT_VALID_MINUTES, HEARTBEATLESS_JOB_VALID_HOURS, Job, State
+from sqlalchemy import func
+
+from .job import (
+    HEARTBEAT_INTERVAL_SECONDS,
+    HEARTBEATLESS_JOB_VALID_HOURS,
+    Job,
+    State,
+    heartbeat_valid_for,
+)
+
+# Keeps the number of bound parameters of a query below the limit of SQLite
+STATE_IDS_PER_QUERY = 500
 
 
 class JobFinder:
@@ -85,6 +97,39 @@ class JobFinder:
         """
         return self.running(session).order_by(Job.started_at.desc()).first()
 
+    @classmethod
+    def latest_by_state_id(cls, session, state_ids: Iterable[str]) -> dict[str, Job]:
+        """Get the latest state for each of the given state IDs at once.
+
+        Args:
+            session: the session to use in querying the db
+            state_ids: the state IDs to get the latest state for
+
+        Returns:
+            The latest state of each state ID that has any, by state ID
+        """
+        return cls._first_by_state_id(
+            session, session.query(Job), state_ids, Job.started_at.desc()
+        )
+
+    @classmethod
+    def latest_success_by_state_id(
+        cls, session, state_ids: Iterable[str]
+    ) -> dict[str, Job]:
+        """Get the latest successful state for each of the given state IDs at once.
+
+        Args:
+            session: the session to use in querying the db
+            state_ids: the state IDs to get the latest successful state for
+
+        Returns:
+            The latest successful state of each state ID that has any, by state ID
+        """
+        query = session.query(Job).filter(
+            (Job.state == State.SUCCESS) & Job.ended_at.isnot(None)  # noqa: WPS465
+        )
+        return cls._first_by_state_id(session, query, state_ids, Job.ended_at.desc())
+
     def with_payload(self, session, flags=0, since=None, state=None):
         """Get all states for this instance's state ID matching the given args.
 
@@ -131,18 +176,55 @@ class JobFinder:
             .first()
         )
 
+    @staticmethod
+    def _first_by_state_id(session, query, state_ids, order_by) -> dict[str, Job]:
+        """Get the first state of each state ID, with a single windowed query.
+
+        Args:
+            session: the session to use in querying the db
+            query: the query for the states to consider
+            state_ids: the state IDs to get the first state for
+            order_by: the order of the states of each state ID
+
+        Returns:
+            The first state of each state ID that has any, by state ID
+        """
+        state_ids = list(dict.fromkeys(state_ids))
+        first_by_state_id = {}
+        for start in range(0, len(state_ids), STATE_IDS_PER_QUERY):
+            ranked = (
+                query.filter(
+                    Job.job_name.in_(state_ids[start : start + STATE_IDS_PER_QUERY])
+                )
+                .with_entities(
+                    Job.id,
+                    func.row_number()
+                    .over(partition_by=Job.job_name, order_by=order_by)
+                    .label("row_number"),
+                )
+                .subquery()
+            )
+            jobs = (
+                session.query(Job)
+                .join(ranked, Job.id == ranked.c.id)
+                .filter(ranked.c.row_number == 1)
+            )
+            first_by_state_id.update((job.job_name, job) for job in jobs)
+        return first_by_state_id
+
     @classmethod
-    def all_stale(cls, session):
+    def all_stale(cls, session, heartbeat_interval: float = HEARTBEAT_INTERVAL_SECONDS):
         """Return all stale states.
 
         Args:
             session: the session to use to query the db
+            heartbeat_interval: the number of seconds between two heartbeats
 
         Returns:
             All stale states with any state ID
         """
         now = datetime.utcnow()
-        last_valid_heartbeat_at = now - timedelta(minutes=HEARTBEAT_VALID_MINUTES)
+        last_valid_heartbeat_at = now - heartbeat_valid_for(heartbeat_interval)
         last_valid_started_at = now - timedelta(hours=HEARTBEATLESS_JOB_VALID_HOURS)
 
         return session.query(Job).filter(
@@ -159,16 +241,19 @@ class JobFinder:
             )
         )
 
-    def stale(self, session):
+    def stale(self, session, heartbeat_interval: float = HEARTBEAT_INTERVAL_SECONDS):
         """Return stale states with the instance's state ID.
 
         Args:
             session: the session to use in querying the db
+            heartbeat_interval: the number of seconds between two heartbeats
 
         Returns:
             All stale states with instance's state ID
         """
-        return self.all_stale(session).filter(Job.job_name == self.state_id)
+        return self.all_stale(session, heartbeat_interval).filter(
+            Job.job_name == self.state_id
+        )
 
     def get_all(self, session: object, since=None):
         """Return all state with the instance's state ID.
@@ -0,0 +1,134 @@
+"""Defines `HeartbeatWriter`."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import suppress
+from datetime import datetime
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import update
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+
+from .job import Job, State
+
+logger = logging.getLogger(__name__)
+
+
+class HeartbeatWriter:
+    """Record the heartbeats of all the jobs running in an event loop at once.
+
+    Rather than each job committing its own heartbeat, a single task per event
+    loop, database and interval updates `last_heartbeat_at` for all of its
+    running jobs with one UPDATE, on a connection of its own.
+    """
+
+    # Writers are never shared between event loops
+    _writers: WeakKeyDictionary[
+        asyncio.AbstractEventLoop, dict[tuple[Engine, float], HeartbeatWriter]
+    ] = WeakKeyDictionary()
+
+    def __init__(self, engine: Engine, interval: float):
+        """Create a new heartbeat writer.
+
+        Args:
+            engine: The engine of the system database.
+            interval: The number of seconds between two heartbeats.
+        """
+        self.engine = engine
+        self.interval = interval
+        self._jobs: dict[int, Job] = {}
+        self._connection: Connection | None = None
+        self._task: asyncio.Future | None = None
+
+    @classmethod
+    def for_session(cls, session: Session, interval: float) -> HeartbeatWriter:
+        """Get the heartbeat writer for the running event loop.
+
+        Args:
+            session: The session jobs are saved with.
+            interval: The number of seconds between two heartbeats.
+
+        Returns:
+            The heartbeat writer for the database of the session.
+        """
+        writers = cls._writers.setdefault(asyncio.get_running_loop(), {})
+        key = (session.get_bind(), interval)
+
+        try:
+            return writers[key]
+        except KeyError:
+            writer = writers[key] = cls(*key)
+            return writer
+
+    def add(self, job: Job) -> None:
+        """Start recording heartbeats for a job.
+
+        Args:
+            job: A running job, already saved to the database.
+        """
+        self._jobs[job.id] = job
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._heartbeater())
+
+    async def discard(self, job: Job) -> None:
+        """Stop recording heartbeats for a job.
+
+        The writer stops once it has no jobs left.
+
+        Args:
+            job: The job to stop recording heartbeats for.
+        """
+        self._jobs.pop(job.id, None)
+        if self._jobs or self._task is None:
+            return
+
+        heartbeat_future, self._task = self._task, None
+        heartbeat_future.cancel()
+        with suppress(asyncio.CancelledError):
+            await heartbeat_future
+
+    def beat(self) -> None:
+        """Record a heartbeat for all jobs with a single UPDATE."""
+        if not self._jobs:
+            return
+
+        now = datetime.utcnow()
+        if self._connection is None:
+            self._connection = self.engine.connect()
+
+        try:
+            with self._connection.begin():
+                self._connection.execute(
+                    update(Job.__table__)
+                    .where(Job.id.in_(list(self._jobs)))
+                    .where(Job.state == State.RUNNING)
+                    .values(last_heartbeat_at=now)
+                )
+        except SQLAlchemyError as err:
+            # Try again with a new connection on the next heartbeat
+            logger.warning(f"Could not record job heartbeats: {err}")
+            self._close()
+            return
+
+        # Keep the jobs up-to-date without marking them as modified
+        for job in self._jobs.values():
+            set_committed_value(job, "last_heartbeat_at", now)
+
+    async def _heartbeater(self) -> None:
+        try:
+            while True:  # noqa: WPS457
+                await asyncio.sleep(self.interval)
+                self.beat()
+        finally:
+            self._close()
+
+    def _close(self) -> None:
+        if self._connection is not None:
+            connection, self._connection = self._connection, None
+            with suppress(SQLAlchemyError):
+                connection.close()
@@ -5,11 +5,11 @@ import asyncio
 import os
 import signal
 import uuid
-from contextlib import asynccontextmanager, contextmanager, suppress
+from contextlib import asynccontextmanager, contextmanager
 from datetime import datetime, timedelta
 from enum import Enum
 
-from sqlalchemy import Column, literal, types
+from sqlalchemy import Column, Index, literal, types
 from sqlalchemy.ext.hybrid import Comparator, hybrid_property
 from sqlalchemy.ext.mutable import MutableDict
 
@@ -19,6 +19,26 @@ from meltano.core.sqlalchemy import GUID, IntFlag, JSONEncodedDict
 
 HEARTBEATLESS_JOB_VALID_HOURS = 24
 HEARTBEAT_VALID_MINUTES = 5
+HEARTBEAT_INTERVAL_SECONDS = 1
+# Number of heartbeats in a row a job can miss before it's considered stale
+HEARTBEAT_VALID_BEATS = 10
+
+
+def heartbeat_valid_for(
+    heartbeat_interval: float = HEARTBEAT_INTERVAL_SECONDS,
+) -> timedelta:
+    """Get how long after its last heartbeat a running job is considered stale.
+
+    Args:
+        heartbeat_interval: the number of seconds between two heartbeats
+
+    Returns:
+        5 minutes, or the duration of `HEARTBEAT_VALID_BEATS` heartbeats if longer
+    """
+    return max(
+        timedelta(minutes=HEARTBEAT_VALID_MINUTES),
+        timedelta(seconds=heartbeat_interval * HEARTBEAT_VALID_BEATS),
+    )
 
 
 class InconsistentStateError(Error):
@@ -97,6 +117,28 @@ class Job(SystemModel):  # noqa: WPS214
     """
 
     __tablename__ = "runs"
+    __table_args__ = (
+        Index(
+            "ix_runs_job_name_started_at",
+            "job_name",
+            "started_at",
+            mysql_length={"job_name": 255},
+        ),
+        Index(
+            "ix_runs_job_name_state_ended_at",
+            "job_name",
+            "state",
+            "ended_at",
+            mysql_length={"job_name": 255},
+        ),
+        Index(
+            "ix_runs_job_name_payload_flags_ended_at",
+            "job_name",
+            "payload_flags",
+            "ended_at",
+            mysql_length={"job_name": 255},
+        ),
+    )
 
     id = Column(types.Integer, primary_key=True)
     job_name = Column(types.String)
@@ -158,12 +200,16 @@ class Job(SystemModel):  # noqa: WPS214
         """
         return self.state is State.RUNNING
 
-    def is_stale(self):
+    def is_stale(self, heartbeat_interval: float = HEARTBEAT_INTERVAL_SECONDS):
         """Return whether Job has gone stale.
 
-        Running jobs with a heartbeat are considered stale after no heartbeat is recorded for 5 minutes.
+        Running jobs with a heartbeat are considered stale after no heartbeat is recorded
+        for 5 minutes, or for 10 heartbeat intervals if that is longer.
         Legacy jobs without a heartbeat are considered stale after being in the running state for 24 hours.
 
+        Args:
+            heartbeat_interval: the number of seconds between two heartbeats
+
         Returns:
             bool indicating whether this Job is stale
         """
@@ -172,7 +218,7 @@ class Job(SystemModel):  # noqa: WPS214
 
         if self.last_heartbeat_at:
             timestamp = self.last_heartbeat_at
-            valid_for = timedelta(minutes=HEARTBEAT_VALID_MINUTES)
+            valid_for = heartbeat_valid_for(heartbeat_interval)
         else:
             timestamp = self.started_at
             valid_for = timedelta(hours=HEARTBEATLESS_JOB_VALID_HOURS)
@@ -242,13 +288,17 @@ class Job(SystemModel):  # noqa: WPS214
         return transition
 
     @asynccontextmanager
-    async def run(self, session):
+    async def run(
+        self, session, heartbeat_interval: float = HEARTBEAT_INTERVAL_SECONDS
+    ):
         """Run wrapped code in context of a job.
 
-        Transitions state to RUNNING and SUCCESS/FAIL as appropriate and records heartbeat every second.
+        Transitions state to RUNNING and SUCCESS/FAIL as appropriate and records
+        a heartbeat every `heartbeat_interval` seconds.
 
         Args:
             session: the session to use for writing to the db
+            heartbeat_interval: the number of seconds between two heartbeats
 
         Raises:
             BaseException: re-raises an exception occurring in the job running in this context
@@ -258,7 +308,7 @@ class Job(SystemModel):  # noqa: WPS214
             self.save(session)
 
             with self._handling_sigterm(session):
-                async with self._heartbeating(session):
+                async with self._heartbeating(session, heartbeat_interval):
                     yield
 
             self.success()
@@ -293,17 +343,23 @@ class Job(SystemModel):  # noqa: WPS214
         self.ended_at = datetime.utcnow()
         self.transit(State.SUCCESS)
 
-    def fail_stale(self):
+    def fail_stale(self, heartbeat_interval: float = HEARTBEAT_INTERVAL_SECONDS):
         """Mark job as failed if it's gone stale.
 
+        Args:
+            heartbeat_interval: the number of seconds between two heartbeats
+
         Returns:
             False if job is not stale, else True
         """
-        if not self.is_stale():
+        if not self.is_stale(heartbeat_interval):
             return False
 
         if self.last_heartbeat_at:
-            reason = f"No heartbeat recorded for {HEARTBEAT_VALID_MINUTES} minutes."
+            valid_minutes = heartbeat_valid_for(heartbeat_interval) / timedelta(
+                minutes=1
+            )
+            reason = f"No heartbeat recorded for {valid_minutes:g} minutes."
         else:
             reason = f"Still running after {HEARTBEATLESS_JOB_VALID_HOURS} hours."
 
@@ -337,34 +393,28 @@ class Job(SystemModel):  # noqa: WPS214
         """Update last_heartbeat_at for this job in the db."""
         self.last_heartbeat_at = datetime.utcnow()
 
-    async def _heartbeater(self, session):
-        """Heartbeat to the db every second.
-
-        Args:
-            session: the session to use for writing to the db
-        """
-        while True:  # noqa: WPS457
-            self._heartbeat()
-            self.save(session)
-
-            await asyncio.sleep(1)
-
     @asynccontextmanager
-    async def _heartbeating(self, session):
+    async def _heartbeating(self, session, heartbeat_interval: float):
         """Provide a context for heartbeating jobs.
 
+        Heartbeats of all jobs running in the event loop are recorded together,
+        see `HeartbeatWriter`.
+
         Args:
             session: the session to use for writing to the db
+            heartbeat_interval: the number of seconds between two heartbeats
         """  # noqa: DAR301
-        heartbeat_future = asyncio.ensure_future(self._heartbeater(session))
+        from .heartbeat import HeartbeatWriter  # noqa: WPS433
+
+        self._heartbeat()
+        self.save(session)
+
+        writer = HeartbeatWriter.for_session(session, heartbeat_interval)
+        writer.add(self)
         try:
             yield
         finally:
-            if not heartbeat_future.cancelled():
-                heartbeat_future.cancel()
-
-            with suppress(asyncio.CancelledError):
-                await heartbeat_future
+            await writer.discard(self)
 
     @contextmanager
     def _handling_sigterm(self, session):
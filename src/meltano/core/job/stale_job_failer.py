@@ -7,20 +7,26 @@ import logging
 from sqlalchemy.orm import Session
 
 from .finder import JobFinder
+from .job import HEARTBEAT_INTERVAL_SECONDS
 
 logger = logging.getLogger(__name__)
 
 
-def fail_stale_jobs(session: Session, state_id: str | None = None) -> None:
+def fail_stale_jobs(
+    session: Session,
+    state_id: str | None = None,
+    heartbeat_interval: float = HEARTBEAT_INTERVAL_SECONDS,
+) -> None:
     """Mark stale jobs as failed.
 
     Args:
         session: An ORM DB session.
         state_id: If provided, only jobs with this state ID will be failed if stale.
+        heartbeat_interval: The number of seconds between two heartbeats of a job.
     """
     finder = JobFinder.all_stale if state_id is None else JobFinder(state_id).stale
-    for job in finder(session):
-        if not job.fail_stale():
+    for job in finder(session, heartbeat_interval):
+        if not job.fail_stale(heartbeat_interval):
             continue
 
         job.save(session)
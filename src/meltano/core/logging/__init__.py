@@ -4,6 +4,7 @@ from __future__ import annotations
 from .formatters import console_log_formatter, json_formatter, key_value_formatter
 from .job_logging_service import (
     JobLoggingService,
+    LogChunk,
     MissingJobLogException,
     SizeThresholdJobLogException,
 )
@@ -3,11 +3,16 @@ from __future__ import annotations
 import logging
 import os
 from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, NamedTuple
 
 from meltano.core.project import Project
 from meltano.core.utils import makedirs, slugify
 
 MAX_FILE_SIZE = 2097152  # 2MB max
+LOG_CHUNK_SIZE = 65536
+# Name of the file pointing to the log of the most recent run of a state ID
+LATEST_LOG_INDEX = "latest"
 
 
 class MissingJobLogException(Exception):
@@ -18,6 +23,15 @@ class SizeThresholdJobLogException(Exception):
     """Occurs when a Job log exceeds the `MAX_FILE_SIZE`."""
 
 
+class LogChunk(NamedTuple):
+    """A range of a log file."""
+
+    content: str
+    offset: int
+    next_offset: int
+    size: int
+
+
 class JobLoggingService:
     def __init__(self, project: Project):
         self.project = project
@@ -29,8 +43,13 @@ class JobLoggingService:
     def generate_log_name(
         self, state_id: str, run_id: str, file_name: str = "elt.log"
     ) -> str:
-        """Generate an internal etl log path and name."""
-        return self.logs_dir(state_id, str(run_id), file_name)
+        """Generate an internal etl log path and name.
+
+        The log becomes the most recent log of the `state_id`.
+        """
+        log_file_name = self.logs_dir(state_id, str(run_id), file_name)
+        self._index_latest_log(state_id, log_file_name)
+        return log_file_name
 
     @contextmanager
     def create_log(self, state_id, run_id, file_name="elt.log"):
@@ -54,9 +73,8 @@ class JobLoggingService:
 
     def get_latest_log(self, state_id):
         """Get the contents of the most recent log for any ELT job that ran with the provided `state_id`."""
+        latest_log = self.get_latest_log_path(state_id)
         try:
-            latest_log = next(iter(self.get_all_logs(state_id)))
-
             if latest_log.stat().st_size > MAX_FILE_SIZE:
                 raise SizeThresholdJobLogException(
                     f"The log file size exceeds '{MAX_FILE_SIZE}'"
@@ -64,28 +82,99 @@ class JobLoggingService:
 
             with latest_log.open() as f:
                 return f.read()
-        except StopIteration:
+        except FileNotFoundError:
             raise MissingJobLogException(
-                f"Could not find any log for job with id '{state_id}'"
+                f"Cannot log for job with id '{state_id}': '{latest_log}' is missing."
             )
+
+    def read_latest_log(
+        self,
+        state_id: str,
+        offset: int = 0,
+        tail: int | None = None,
+        max_size: int = MAX_FILE_SIZE,
+        finished: bool = False,
+    ) -> LogChunk:
+        """Read part of the most recent log for any ELT job that ran with the provided `state_id`.
+
+        Reads from the byte `offset`, or the last `tail` bytes, up to `max_size`
+        bytes. Only complete lines are returned, unless a single line exceeds
+        `max_size`, so that the `next_offset` of the result can be used to follow
+        a log that is still being written. Once the job is `finished`, the last
+        line of the log is returned even if it doesn't end with a newline.
+        """
+        latest_log = self.get_latest_log_path(state_id)
+        try:
+            with latest_log.open("rb") as log_file:
+                size = os.fstat(log_file.fileno()).st_size
+                start = max(size - tail, 0) if tail is not None else min(offset, size)
+                log_file.seek(start)
+                if tail is not None and start > 0:
+                    # Skip the line the tail starts in the middle of
+                    log_file.readline()
+                    start = log_file.tell()
+
+                content = log_file.read(min(size - start, max_size))
         except FileNotFoundError:
             raise MissingJobLogException(
                 f"Cannot log for job with id '{state_id}': '{latest_log}' is missing."
             )
 
+        at_end = start + len(content) == size
+        last_line_end = content.rfind(b"\n") + 1
+        if not (finished and at_end) and (last_line_end or len(content) < max_size):
+            content = content[:last_line_end]
+
+        return LogChunk(
+            content=content.decode(errors="replace"),
+            offset=start,
+            next_offset=start + len(content),
+            size=size,
+        )
+
+    def stream_latest_log(
+        self, state_id: str, offset: int = 0, chunk_size: int = LOG_CHUNK_SIZE
+    ) -> Iterator[bytes]:
+        """Stream the most recent log for any ELT job that ran with the provided `state_id`.
+
+        The log is read from the byte `offset` until its current end, one chunk at a time.
+        """
+        latest_log = self.get_latest_log_path(state_id)
+        try:
+            log_file = latest_log.open("rb")
+        except FileNotFoundError:
+            raise MissingJobLogException(
+                f"Cannot log for job with id '{state_id}': '{latest_log}' is missing."
+            )
+
+        return self._read_chunks(log_file, offset, chunk_size)
+
     def get_downloadable_log(self, state_id):
         """Get the `*.log` file of the most recent log for any ELT job that ran with the provided `state_id`."""
+        return str(self.get_latest_log_path(state_id).resolve())
+
+    def get_latest_log_path(self, state_id) -> Path:
+        """Get the path of the most recent log for any ELT job that ran with the provided `state_id`.
+
+        Runs record their log in an index, so that finding it doesn't require
+        listing the logs of every past run. Logs of runs from before the index
+        existed are still found by listing them.
+        """
+        index = Path(self.logs_dir(state_id), LATEST_LOG_INDEX)
         try:
-            latest_log = next(iter(self.get_all_logs(state_id)))
-            return str(latest_log.resolve())
+            latest_log = index.parent.joinpath(index.read_text().strip())
+        except FileNotFoundError:
+            latest_log = None
+
+        if latest_log and latest_log.is_file():
+            return latest_log
+
+        try:
+            return next(iter(self.get_all_logs(state_id)))
         except StopIteration:
             raise MissingJobLogException(
                 f"Could not find any log for job with id '{state_id}'"
             )
-        except FileNotFoundError:
-            raise MissingJobLogException(
-                f"Cannot log for job with id '{state_id}': '{latest_log}' is missing."
-            )
 
     def get_all_logs(self, state_id):
         """Get all the log files for any ELT job that ran with the provided `state_id`.
@@ -105,6 +194,28 @@ class JobLoggingService:
         for log_path in self.get_all_logs(state_id):
             log_path.unlink()
 
+    def _index_latest_log(self, state_id, log_file_name):
+        index = Path(self.logs_dir(state_id), LATEST_LOG_INDEX)
+        index_tmp = index.with_name(f"{LATEST_LOG_INDEX}.{os.getpid()}.tmp")
+        try:
+            index_tmp.write_text(
+                Path(log_file_name).relative_to(index.parent).as_posix()
+            )
+            os.replace(index_tmp, index)
+        except OSError:
+            # Runs don't depend on the index: logs are found by listing them instead
+            logging.warning(f"Could not record {log_file_name!r} as the latest log")
+
+    @staticmethod
+    def _read_chunks(log_file, offset, chunk_size):
+        with log_file:
+            log_file.seek(offset)
+            while True:  # noqa: WPS457
+                chunk = log_file.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+
     def legacy_logs_dir(self, state_id, *joinpaths):
         job_dir = self.project.run_dir("elt").joinpath(slugify(state_id), *joinpaths)
         return job_dir if job_dir.exists() else None
@@ -5,6 +5,7 @@ import asyncio
 import logging
 import os
 import sys
+import time
 from contextlib import (
     asynccontextmanager,
     contextmanager,
@@ -12,25 +13,140 @@ from contextlib import (
     redirect_stdout,
     suppress,
 )
+from contextvars import ContextVar
+from io import StringIO
+from typing import Callable, Iterable, Iterator
 
 import structlog
 
 from .formatters import LEVELED_TIMESTAMPED_PRE_CHAIN
 from .utils import capture_subprocess_output
 
+# The `Out` logs of the current context are redirected to, if any
+_redirect_target: ContextVar[Out | None] = ContextVar("redirect_target", default=None)
+
+
+class RedirectFilter(logging.Filter):
+    """Only let through the log entries of contexts redirected to a given `Out`.
+
+    Log entries of contexts that aren't redirected to any `Out`, such as those of
+    threads, are let through as well.
+    """
+
+    def __init__(self, out: Out):
+        """Instantiate a redirect filter.
+
+        Args:
+            out: The `Out` log entries are redirected to.
+        """
+        super().__init__()
+        self.out = out
+
+    def filter(self, record: logging.LogRecord | None = None) -> bool:
+        """Check whether log entries of the current context are let through.
+
+        Args:
+            record: The log record, unused as only the current context matters.
+
+        Returns:
+            True if the current context isn't redirected to another `Out`.
+        """
+        target = _redirect_target.get()
+        return target is None or target is self.out
+
+
+class LogBudget:
+    """Limit the number of lines and bytes logged per second, counting dropped lines."""
+
+    def __init__(
+        self,
+        lines_per_second: int = 0,
+        bytes_per_second: int = 0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Instantiate a log budget.
+
+        Args:
+            lines_per_second: Number of lines admitted per second, 0 for no limit.
+            bytes_per_second: Number of bytes admitted per second, 0 for no limit.
+            clock: Function returning the current time in seconds.
+        """
+        self.lines_per_second = lines_per_second
+        self.bytes_per_second = bytes_per_second
+        self.clock = clock
+
+        self.dropped_lines = 0
+        self.dropped_bytes = 0
+
+        self._window_start = None
+        self._lines = 0
+        self._bytes = 0
+
+    def __bool__(self) -> bool:
+        """Check whether the budget limits anything.
+
+        Returns:
+            True if a line or byte limit is set.
+        """
+        return bool(self.lines_per_second or self.bytes_per_second)
+
+    def admit(self, line: str) -> bool:
+        """Check whether a line fits within the budget of the current second.
+
+        Lines that don't are counted as dropped.
+
+        Args:
+            line: The line to log.
+
+        Returns:
+            True if the line should be logged.
+        """
+        now = self.clock()
+        if self._window_start is None or now - self._window_start >= 1:
+            self._window_start = now
+            self._lines = 0
+            self._bytes = 0
+
+        size = len(line.encode())
+        if (self.lines_per_second and self._lines >= self.lines_per_second) or (
+            self.bytes_per_second and self._bytes + size > self.bytes_per_second
+        ):
+            self.dropped_lines += 1
+            self.dropped_bytes += size
+            return False
+
+        self._lines += 1
+        self._bytes += size
+        return True
+
+    def take_dropped(self) -> tuple[int, int]:
+        """Get and reset the number of dropped lines and bytes.
+
+        Returns:
+            The number of lines and bytes dropped since the last call.
+        """
+        dropped = (self.dropped_lines, self.dropped_bytes)
+        self.dropped_lines = 0
+        self.dropped_bytes = 0
+        return dropped
+
 
 class OutputLogger:
     """Output Logger."""
 
-    def __init__(self, file):
+    def __init__(self, file, lines_per_second: int = 0, bytes_per_second: int = 0):
         """Instantiate an Output Logger.
 
         Args:
             file: A file to output to.
+            lines_per_second: Log budget of each `Out`, in lines per second.
+            bytes_per_second: Log budget of each `Out`, in bytes per second.
         """
         self.file = file
         self.stdout = sys.stdout
         self.stderr = sys.stderr
+        self.lines_per_second = lines_per_second
+        self.bytes_per_second = bytes_per_second
 
         self.outs = {}
 
@@ -57,6 +173,7 @@ class OutputLogger:
             logger=logger,
             write_level=write_level,
             file=self.file,
+            budget=LogBudget(self.lines_per_second, self.bytes_per_second),
         )
         self.outs[name] = out
         return out
@@ -136,6 +253,7 @@ class Out:  # noqa: WPS230
         logger: structlog.stdlib.BoundLogger,
         write_level: int,
         file: str,
+        budget: LogBudget | None = None,
     ):
         """Log anything written in a stream.
 
@@ -145,12 +263,14 @@ class Out:  # noqa: WPS230
             logger: logger to temporarily add a handler too.
             write_level: log level passed to logger.log calls.
             file: file to associate with the FileHandler to log to.
+            budget: the number of lines and bytes that can be logged per second.
         """
         self.output_logger = output_logger
         self.logger = logger
         self.name = name
         self.write_level = write_level
         self.file = file
+        self.budget = budget or LogBudget()
 
         self.last_line = ""
 
@@ -178,7 +298,10 @@ class Out:  # noqa: WPS230
         Yields:
             A line writer instance
         """
-        yield LineWriter(self)
+        try:
+            yield LineWriter(self)
+        finally:
+            self.flush()
 
     @contextmanager
     def redirect_logging(self, ignore_errors=()):
@@ -191,7 +314,12 @@ class Out:  # noqa: WPS230
             With the side-effect of redirecting logging.
         """  # noqa: DAR401
         logger = logging.getLogger()
-        logger.addHandler(self.redirect_log_handler)
+        handler = self.redirect_log_handler
+        # Only the log entries of this context go to the file, so that block sets
+        # running concurrently each get their own log entries
+        handler.addFilter(RedirectFilter(self))
+        logger.addHandler(handler)
+        token = _redirect_target.set(self)
         ignored_errors = (
             KeyboardInterrupt,
             asyncio.CancelledError,
@@ -205,7 +333,9 @@ class Out:  # noqa: WPS230
             logger.error(str(err), exc_info=True)
             raise
         finally:
-            logger.removeHandler(self.redirect_log_handler)
+            _redirect_target.reset(token)
+            logger.removeHandler(handler)
+            handler.close()
 
     @asynccontextmanager
     async def writer(self):
@@ -226,6 +356,7 @@ class Out:  # noqa: WPS230
 
             with suppress(asyncio.CancelledError):
                 await reader
+            self.flush()
 
     @asynccontextmanager
     async def redirect_stdout(self):
@@ -255,8 +386,49 @@ class Out:  # noqa: WPS230
         Args:
             line: A line to write.
         """
-        self.last_line = line
-        self.logger.log(self.write_level, line.rstrip(), name=self.name)
+        self.writelines((line,))
+
+    def writelines(self, lines: Iterable[str]) -> None:
+        """Write lines to the underlying structured logger at once.
+
+        Lines beyond the log budget are dropped, and how many were is logged
+        once lines fit within the budget again.
+
+        Args:
+            lines: The lines to write.
+        """
+        admitted = []
+        for line in lines:
+            self.last_line = line
+            if self.budget and not self.budget.admit(line):
+                continue
+
+            if self.budget.dropped_lines:
+                self._log(admitted)
+                admitted = []
+                self.flush()
+
+            admitted.append(line.rstrip())
+
+        self._log(admitted)
+
+    def flush(self) -> None:
+        """Log how many lines were dropped to stay within the log budget, if any."""
+        dropped_lines, dropped_bytes = self.budget.take_dropped()
+        if dropped_lines:
+            self.logger.warning(
+                f"Dropped {dropped_lines} lines ({dropped_bytes} bytes) of output "
+                + "to stay within the plugin log budget",
+                name=self.name,
+            )
+
+    def _log(self, lines: list[str]) -> None:
+        handlers = (
+            _stream_handlers(self.logger, self.write_level) if len(lines) > 1 else []
+        )
+        with _buffered_streams(handlers):
+            for line in lines:
+                self.logger.log(self.write_level, line, name=self.name)
 
     async def _read_from_fd(self, read_fd):
         # Since we're redirecting our own stdout and stderr output,
@@ -270,3 +442,69 @@ class Out:  # noqa: WPS230
         await loop.connect_read_pipe(lambda: read_protocol, os.fdopen(read_fd))
 
         await capture_subprocess_output(reader, self)
+
+
+def _stream_handlers(bound_logger, level: int) -> list[logging.StreamHandler]:
+    """Get the stream handlers log entries of a structured logger are written by.
+
+    Args:
+        bound_logger: The structlog logger.
+        level: The log level.
+
+    Returns:
+        The stream handlers with an open stream, or none if the logger doesn't
+        log through `logging` at the given level.
+    """
+    bound_logger = bound_logger.bind()
+    if not isinstance(
+        bound_logger, structlog.stdlib.BoundLogger
+    ) or not bound_logger.isEnabledFor(level):
+        return []
+
+    handlers = []
+    logger = bound_logger
+    while logger:
+        handlers.extend(
+            handler
+            for handler in logger.handlers
+            if isinstance(handler, logging.StreamHandler)
+            and handler.stream is not None
+            and handler not in handlers
+        )
+        if not logger.propagate:
+            break
+        logger = logger.parent
+    return handlers
+
+
+@contextmanager
+def _buffered_streams(handlers: list[logging.StreamHandler]) -> Iterator[None]:
+    """Buffer what stream handlers write, to write it to their streams at once.
+
+    Log entries are still formatted one by one by the handlers, but each stream
+    is written to and flushed only once. The handlers are locked meanwhile, so
+    that log entries of other threads aren't written out of order.
+
+    Args:
+        handlers: The stream handlers.
+
+    Yields:
+        None
+    """
+    buffered = []
+    try:
+        for handler in handlers:
+            handler.acquire()
+            buffer = StringIO()
+            buffered.append((handler, buffer, handler.setStream(buffer)))
+        yield
+    finally:
+        for handler, buffer, stream in buffered:
+            handler.setStream(stream)
+            try:
+                stream.write(buffer.getvalue())
+                stream.flush()
+            except Exception:
+                handler.handleError(logging.makeLogRecord({"msg": buffer.getvalue()}))
+            finally:
+                handler.release()
@@ -34,6 +34,8 @@ LEVELS = {  # noqa: WPS407
     "critical": logging.CRITICAL,
 }
 DEFAULT_LEVEL = "info"
+# Maximum number of bytes moved per read when relaying raw subprocess output
+RELAY_CHUNK_SIZE = 2**20  # 1 MiB
 FORMAT = "[%(asctime)s] [%(process)d|%(threadName)10s|%(name)s] [%(levelname)s] %(message)s"  # noqa: WPS323
 
 
@@ -215,6 +217,102 @@ async def _write_line_writer(writer, line):
     return True
 
 
+def _is_raw_relay(line_writers: tuple[SubprocessOutputWriter, ...]) -> bool:
+    """Check whether output can be relayed in chunks rather than line by line.
+
+    Chunked relaying is only possible when every destination is a byte stream
+    (e.g. the stdin of a downstream process). Any per-line consumer, such as a
+    logger or a state handler, requires the output to be split into lines.
+
+    Args:
+        line_writers: the destinations output should be written to.
+
+    Returns:
+        True if the output can be relayed in raw chunks.
+    """
+    return bool(line_writers) and all(
+        isinstance(writer, asyncio.StreamWriter) for writer in line_writers
+    )
+
+
+def _is_batched(line_writers: tuple[SubprocessOutputWriter, ...]) -> bool:
+    """Check whether output lines can be written in batches rather than one by one.
+
+    This is the case when every destination is a logging `Out`, which accepts
+    several lines at once with `writelines`.
+
+    Args:
+        line_writers: the destinations output should be written to.
+
+    Returns:
+        True if the output lines can be written in batches.
+    """
+    return bool(line_writers) and all(
+        not isinstance(writer, asyncio.StreamWriter)
+        and callable(getattr(writer, "writelines", None))
+        for writer in line_writers
+    )
+
+
+async def _capture_subprocess_lines(
+    reader: asyncio.StreamReader, *line_writers: SubprocessOutputWriter
+) -> None:
+    """Write the output stream of a subprocess in batches of the lines read at once.
+
+    Args:
+        reader: asyncio.StreamReader object that is the output stream of the subprocess.
+        line_writers: the destinations with a `writelines` method.
+    """
+    pending = b""
+    while not reader.at_eof():
+        chunk = await reader.read(RELAY_CHUNK_SIZE)
+        if not chunk:
+            continue
+
+        *lines, pending = (pending + chunk).split(b"\n")
+        if lines:
+            decoded = [f"{line.decode()}\n" for line in lines]
+            for writer in line_writers:
+                writer.writelines(decoded)
+
+    for writer in line_writers:
+        if pending:
+            writer.writelines([pending.decode()])
+    _flush_line_writers(line_writers)
+
+
+def _flush_line_writers(line_writers: tuple[SubprocessOutputWriter, ...]) -> None:
+    """Flush the destinations that buffer or summarize output, like logging `Out`s.
+
+    Args:
+        line_writers: the destinations output was written to.
+    """
+    for writer in line_writers:
+        flush = getattr(writer, "flush", None)
+        if not isinstance(writer, asyncio.StreamWriter) and flush:
+            flush()
+
+
+async def _relay_subprocess_output(
+    reader: asyncio.StreamReader, *writers: asyncio.StreamWriter
+) -> None:
+    """Relay the output stream of a subprocess to byte streams in large chunks.
+
+    Args:
+        reader: asyncio.StreamReader object that is the output stream of the subprocess.
+        writers: the StreamWriters that the output should be forwarded to.
+    """
+    while not reader.at_eof():
+        chunk = await reader.read(RELAY_CHUNK_SIZE)
+        if not chunk:
+            continue
+
+        for writer in writers:
+            if not await _write_line_writer(writer, chunk):
+                # If the destination stream is closed, we can stop relaying output.
+                return
+
+
 async def capture_subprocess_output(
     reader: asyncio.StreamReader | None, *line_writers: SubprocessOutputWriter
 ) -> None:
@@ -227,16 +325,32 @@ async def capture_subprocess_output(
     This async function should be run with await asyncio.wait() while waiting
     for the subprocess to end.
 
+    When all of the `line_writers` are StreamWriters there is no line-level
+    consumer attached, so the output is relayed in large chunks instead of being
+    split into lines first. When they are all logging `Out`s, the lines read from
+    each chunk are written to them in a single batch.
+
     Args:
         reader: asyncio.StreamReader object that is the output stream of the subprocess.
         line_writers: any object thats a StreamWriter or has a writelines method accepting a string.
     """
-    while not reader.at_eof():
-        line = await reader.readline()
-        if not line:
-            continue
-
-        for writer in line_writers:
-            if not await _write_line_writer(writer, line):
-                # If the destination stream is closed, we can stop capturing output.
-                return
+    if _is_raw_relay(line_writers):
+        await _relay_subprocess_output(reader, *line_writers)
+        return
+
+    if isinstance(reader, asyncio.StreamReader) and _is_batched(line_writers):
+        await _capture_subprocess_lines(reader, *line_writers)
+        return
+
+    try:
+        while not reader.at_eof():
+            line = await reader.readline()
+            if not line:
+                continue
+
+            for writer in line_writers:
+                if not await _write_line_writer(writer, line):
+                    # If the destination stream is closed, we can stop capturing output.
+                    return
+    finally:
+        _flush_line_writers(line_writers)
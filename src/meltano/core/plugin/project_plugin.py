@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import copy
+import itertools
 import logging
 import sys
-from typing import Any, Iterable
+from typing import Any, Callable, Iterable
 
 from meltano.core.plugin.requirements import PluginRequirement
 from meltano.core.setting_definition import SettingDefinition
@@ -17,6 +18,25 @@ from .factory import base_plugin_factory
 
 logger = logging.getLogger(__name__)
 
+# Versions of cached setting definitions, so that plugins can tell when the cached
+# definitions of their parent have been rebuilt
+_settings_versions = itertools.count()
+
+# The attributes of a project plugin that its setting definitions derive from
+SETTINGS_SOURCE_ATTRS = frozenset(("settings", "config", "extras"))
+
+
+def _config_key(config: dict[str, Any]) -> tuple:
+    """Return the part of a config that setting definitions are derived from.
+
+    Args:
+        config: The config dictionary.
+
+    Returns:
+        The flattened keys of the config, along with the types of their values.
+    """
+    return tuple((key, type(value)) for key, value in flatten(config, "dot").items())
+
 
 class CyclicInheritanceError(Exception):
     """Exception raised when project plugin inherits from itself cyclicly."""
@@ -105,6 +125,8 @@ class ProjectPlugin(PluginRef):  # noqa: WPS230, WPS214 # too many attrs and met
         self._flattened.add("custom_definition")
 
         self._parent = None
+        self._settings_cache: dict[str, tuple[tuple, int, list]] = {}
+        self._settings_version = next(_settings_versions)
         if not self.inherit_from and namespace:
             # When not explicitly inheriting, a namespace indicates an embedded custom plugin definition
             self.custom_definition = PluginDefinition(
@@ -184,6 +206,20 @@ class ProjectPlugin(PluginRef):  # noqa: WPS230, WPS214 # too many attrs and met
                 + f"`profiles` in '{name}' {plugin_type.descriptor} definition."
             )
 
+    def __setattr__(self, attr: str, value: Any):
+        """Set the given attribute to the given value.
+
+        Setting an attribute that setting definitions derive from makes the cached
+        definitions stale.
+
+        Args:
+            attr: Attribute to set.
+            value: Value to set.
+        """
+        if attr in SETTINGS_SOURCE_ATTRS:
+            super().__setattr__("_settings_version", next(_settings_versions))
+        super().__setattr__(attr, value)
+
     @property
     def parent(self) -> ProjectPlugin:
         """Plugins parent.
@@ -204,6 +240,7 @@ class ProjectPlugin(PluginRef):  # noqa: WPS230, WPS214 # too many attrs and met
 
         self._parent = new_parent
         self._fallback_to = new_parent
+        self._settings_cache = {}
 
     @property
     def is_variant_set(self) -> bool:
@@ -309,6 +346,7 @@ class ProjectPlugin(PluginRef):  # noqa: WPS230, WPS214 # too many attrs and met
                 self.extras[key[1:]] = value
             else:
                 self.config[key] = value
+        self._settings_version = next(_settings_versions)
 
     @property
     def all_settings(self) -> list[SettingDefinition]:
@@ -317,11 +355,45 @@ class ProjectPlugin(PluginRef):  # noqa: WPS230, WPS214 # too many attrs and met
         Returns:
             List of settings, including those inherited from the parent plugin.
         """
+        return list(self._cached_settings("all_settings")[1])
+
+    @property
+    def extra_settings(self) -> list[SettingDefinition]:
+        """Return extra settings.
+
+        Returns:
+            A list of extra SettingDefinitions, including those defined by the parent.
+        """
+        return list(self._cached_settings("extra_settings")[1])
+
+    @property
+    def settings_with_extras(self) -> list[SettingDefinition]:
+        """Return all settings.
+
+        Returns:
+            A complete list of SettingDefinitions, including extras.
+        """
+        return [
+            *self._cached_settings("all_settings")[1],
+            *self._cached_settings("extra_settings")[1],
+        ]
+
+    def _build_all_settings(
+        self, parent_settings: list[SettingDefinition]
+    ) -> list[SettingDefinition]:
+        """Build all settings on top of the settings of the parent plugin.
+
+        Args:
+            parent_settings: All settings of the parent plugin.
+
+        Returns:
+            List of settings.
+        """
         # New setting definitions override old ones
         new_setting_names = {setting.name for setting in self.settings}
         existing_settings = [
             setting
-            for setting in self._parent.all_settings
+            for setting in parent_settings
             if setting.name not in new_setting_names
         ]
         existing_settings.extend(self.settings)
@@ -331,27 +403,65 @@ class ProjectPlugin(PluginRef):  # noqa: WPS230, WPS214 # too many attrs and met
             *SettingDefinition.from_missing(existing_settings, self.config),
         ]
 
-    @property
-    def extra_settings(self) -> list[SettingDefinition]:
-        """Return extra settings.
+    def _build_extra_settings(
+        self, parent_settings: list[SettingDefinition]
+    ) -> list[SettingDefinition]:
+        """Build extra settings on top of the extra settings of the parent plugin.
+
+        Args:
+            parent_settings: Extra settings of the parent plugin.
 
         Returns:
-            A list of extra SettingDefinitions, including those defined by the parent.
+            List of extra settings.
         """
-        existing_settings = self._parent.extra_settings
         return [
-            *existing_settings,
-            *SettingDefinition.from_missing(existing_settings, self.extra_config),
+            *parent_settings,
+            *SettingDefinition.from_missing(parent_settings, self.extra_config),
         ]
 
-    @property
-    def settings_with_extras(self) -> list[SettingDefinition]:
-        """Return all settings.
+    def _cached_settings(self, attr: str) -> tuple[int, list[SettingDefinition]]:
+        """Return setting definitions, only rebuilding them when they are stale.
+
+        The definitions are rebuilt when the parent or the parent's definitions
+        change, when the settings, config or extras of this plugin are set, or when
+        the keys of its config are changed in place.
+
+        Args:
+            attr: `all_settings` or `extra_settings`.
 
         Returns:
-            A complete list of SettingDefinitions, including extras.
+            The version of the definitions, and the definitions, which must not be
+            modified.
         """
-        return [*self.all_settings, *self.extra_settings]
+        parent = self._parent
+        if isinstance(parent, ProjectPlugin):
+            parent_version, parent_settings = parent._cached_settings(attr)
+        elif attr == "all_settings":
+            parent_settings = parent.all_settings
+            parent_version = (id(parent), id(parent_settings), len(parent_settings))
+        else:
+            # Extra settings of base plugins are rebuilt when their extras change
+            parent_settings = None
+            parent_version = (id(parent), parent.extras)
+
+        build: Callable[[list[SettingDefinition]], list[SettingDefinition]]
+        if attr == "all_settings":
+            build, config = self._build_all_settings, self.config
+        else:
+            build, config = self._build_extra_settings, self.extra_config
+
+        key = (parent_version, self._settings_version, _config_key(config))
+        cached = self._settings_cache.get(attr)
+        if cached and cached[0] == key:
+            return cached[1], cached[2]
+
+        if parent_settings is None:
+            parent_settings = getattr(parent, attr)
+
+        version = next(_settings_versions)
+        settings = build(parent_settings)
+        self._settings_cache[attr] = (key, version, settings)
+        return version, settings
 
     def is_custom(self) -> bool:
         """Return if plugin is custom.
@@ -1,18 +1,34 @@
 from __future__ import annotations
 
 import fnmatch
+import json
 import logging
+import os
 import re
-from collections import OrderedDict
+from collections import OrderedDict, abc
 from enum import Enum, auto
 from functools import singledispatch
-from typing import Any, Dict, Iterable, NamedTuple, TypeVar
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    TextIO,
+    TypeVar,
+)
 
 from meltano.core.behavior.visitor import visit_with
 
 Node = Dict[str, Any]
 T = TypeVar("T", bound="CatalogRule")
 
+GLOB_CHARACTERS = re.compile(r"[*?[]")
+PROPERTY_NAME = re.compile(r"\w*")
+JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
 
 class CatalogRule:
     def __init__(
@@ -95,6 +111,129 @@ class SchemaRule(CatalogRule):
         self.payload = payload
 
 
+def compile_patterns(patterns: Iterable[str]) -> Callable[[str], bool]:
+    """Compile `fnmatch` patterns into a single predicate.
+
+    Args:
+        patterns: Shell-style patterns.
+
+    Returns:
+        A function returning whether a name, normalized with `os.path.normcase`
+        like `fnmatch.fnmatch` does, matches any of the patterns.
+    """
+    literals = set()
+    wildcards = []
+    for pattern in patterns:
+        pattern = os.path.normcase(pattern)
+        if GLOB_CHARACTERS.search(pattern):
+            wildcards.append(fnmatch.translate(pattern))
+        else:
+            literals.add(pattern)
+
+    if not wildcards:
+        return literals.__contains__
+
+    match = re.compile("|".join(wildcards)).match
+    return lambda name: name in literals or match(name) is not None
+
+
+class _StreamRules(Generic[T]):
+    """Rules matching a stream, indexed by breadcrumb."""
+
+    def __init__(self, rules: list[T], breadcrumb_patterns: list[str]):
+        self.rules = rules
+        self._literals: dict[str, list[int]] = {}
+        self._wildcards: list[tuple[int, Callable[[str], bool]]] = []
+
+        for idx, pattern in enumerate(breadcrumb_patterns):
+            if GLOB_CHARACTERS.search(pattern):
+                self._wildcards.append((idx, compile_patterns([pattern])))
+            else:
+                self._literals.setdefault(pattern, []).append(idx)
+
+    def matching(self, breadcrumb: list[str]) -> list[T]:
+        name = os.path.normcase(".".join(breadcrumb))
+        indices = self._literals.get(name, [])
+        if self._wildcards:
+            indices = sorted(
+                [*indices, *(idx for idx, match in self._wildcards if match(name))]
+            )
+
+        return [self.rules[idx] for idx in indices]
+
+
+class CatalogRuleMatcher(Generic[T]):
+    """Find the rules matching a stream and breadcrumb.
+
+    Equivalent to `CatalogRule.matching`, but patterns are compiled once, and the
+    rules matching a stream are indexed by `tap_stream_id` so that matching a
+    breadcrumb only considers the rules for its stream.
+    """
+
+    def __init__(self, rules: list[T]):
+        """Create a matcher for a list of rules.
+
+        Args:
+            rules: The rules to match, in order of precedence.
+        """
+        self.rules = rules
+        self._stream_matchers = [
+            compile_patterns(
+                rule.tap_stream_id
+                if isinstance(rule.tap_stream_id, list)
+                else [rule.tap_stream_id]
+            )
+            for rule in rules
+        ]
+        self._breadcrumb_patterns = [
+            os.path.normcase(".".join(rule.breadcrumb)) for rule in rules
+        ]
+        self._streams: dict[str, _StreamRules[T]] = {}
+
+    def __bool__(self) -> bool:
+        """Check whether there are any rules to match.
+
+        Returns:
+            True if there is at least one rule.
+        """
+        return bool(self.rules)
+
+    def matching(
+        self, tap_stream_id: str, breadcrumb: list[str] | None = None
+    ) -> list[T]:
+        """Filter rules that match a given stream and breadcrumb.
+
+        Args:
+            tap_stream_id: Singer stream identifier.
+            breadcrumb: JSON property breadcrumb, None to only match the stream.
+
+        Returns:
+            The matching rules, in their original order.
+        """
+        try:
+            stream_rules = self._streams[tap_stream_id]
+        except KeyError:
+            stream_rules = self._streams[tap_stream_id] = self._index(tap_stream_id)
+
+        if breadcrumb is None:
+            return stream_rules.rules
+
+        return stream_rules.matching(breadcrumb)
+
+    def _index(self, tap_stream_id: str) -> _StreamRules[T]:
+        name = os.path.normcase(tap_stream_id)
+        indices = [
+            idx
+            for idx, (rule, match) in enumerate(zip(self.rules, self._stream_matchers))
+            if match(name) is not rule.negated
+        ]
+
+        return _StreamRules(
+            [self.rules[idx] for idx in indices],
+            [self._breadcrumb_patterns[idx] for idx in indices],
+        )
+
+
 class SelectPattern(NamedTuple):
     """A pattern for selecting streams and properties."""
 
@@ -453,35 +592,45 @@ class SelectExecutor(MetadataExecutor):
         super().__init__(select_metadata_rules(patterns))
 
 
-class SchemaExecutor(CatalogExecutor):
-    def __init__(self, rules: list[SchemaRule]):
-        self._stream = None
-        self._rules = rules
+def ensure_schema_property(schema: Node, breadcrumb: list[str]):  # noqa: WPS231
+    """Create nodes for a breadcrumb in a stream schema.
 
-    def ensure_property(self, breadcrumb: list[str]):  # noqa: WPS231
-        """Create nodes for the breadcrumb and schema extra that matches."""
-        next_node: dict[str, Any] = self._stream["schema"]
+    Args:
+        schema: The JSON schema of the stream.
+        breadcrumb: The breadcrumb of the property, which may contain wildcards.
+    """
+    next_node: dict[str, Any] = schema
 
-        for idx, key in enumerate(breadcrumb):
-            # If the key contains shell-style wildcards,
-            # ensure property nodes exist for matching breadcrumbs.
-            if re.match(r"[*?\[\]]", key):
-                node_keys = next_node.keys()
-                matching_keys = fnmatch.filter(node_keys, key)
+    for idx, key in enumerate(breadcrumb):
+        # If the key contains shell-style wildcards,
+        # ensure property nodes exist for matching breadcrumbs.
+        if re.match(r"[*?\[\]]", key):
+            node_keys = next_node.keys()
+            matching_keys = fnmatch.filter(node_keys, key)
 
-                if matching_keys:
-                    matching_breadcrumb = breadcrumb.copy()
-                    for key in matching_keys:
-                        matching_breadcrumb[idx] = key
-                        self.ensure_property(matching_breadcrumb)
+            if matching_keys:
+                matching_breadcrumb = breadcrumb.copy()
+                for key in matching_keys:
+                    matching_breadcrumb[idx] = key
+                    ensure_schema_property(schema, matching_breadcrumb)
 
-                break
+            break
+
+        # If a property node for this breadcrumb doesn't exist yet, create it.
+        if key not in next_node:
+            next_node[key] = {}
 
-            # If a property node for this breadcrumb doesn't exist yet, create it.
-            if key not in next_node:
-                next_node[key] = {}
+        next_node = next_node[key]
 
-            next_node = next_node[key]
+
+class SchemaExecutor(CatalogExecutor):
+    def __init__(self, rules: list[SchemaRule]):
+        self._stream = None
+        self._rules = rules
+
+    def ensure_property(self, breadcrumb: list[str]):
+        """Create nodes for the breadcrumb and schema extra that matches."""
+        ensure_schema_property(self._stream["schema"], breadcrumb)
 
     def stream_node(self, node: Node, path):
         """Process stream schema node."""
@@ -511,6 +660,349 @@ class SchemaExecutor(CatalogExecutor):
         logging.debug("Setting '%s' to %r", path, payload)  # noqa: WPS323
 
 
+def iter_schema_properties(schema: Node) -> Iterator[tuple[list[str], Node]]:
+    """Walk the property nodes of a stream schema, depth first.
+
+    Property nodes are visited before their children are looked up, so they
+    can be replaced in place while walking the schema.
+
+    Args:
+        schema: The JSON schema of the stream.
+
+    Yields:
+        The breadcrumb and node of each property.
+    """
+    stack: list[tuple[list[str], Node]] = [([], schema)]
+    while stack:
+        breadcrumb, node = stack.pop()
+        if breadcrumb:
+            yield breadcrumb, node
+
+        properties = node.get("properties")
+        if not isinstance(properties, dict):
+            continue
+
+        stack.extend(
+            reversed(
+                [
+                    ([*breadcrumb, "properties", name], child)
+                    for name, child in properties.items()
+                    if isinstance(child, dict) and PROPERTY_NAME.fullmatch(name)
+                ]
+            )
+        )
+
+
+class CatalogRulesExecutor:
+    """Apply schema and metadata rules to a catalog in a single pass.
+
+    This is equivalent to visiting the catalog with a `SchemaExecutor` and then
+    with a `MetadataExecutor`, but streams are processed one at a time by walking
+    their schema directly, so that catalogs can also be streamed from disk.
+    """
+
+    def __init__(
+        self,
+        schema_rules: list[SchemaRule],
+        metadata_rules: list[MetadataRule],
+    ):
+        """Create an executor for the given rules.
+
+        Args:
+            schema_rules: The schema rules to apply.
+            metadata_rules: The metadata rules to apply.
+        """
+        self.schema_rules = CatalogRuleMatcher(schema_rules)
+        self.metadata_rules = CatalogRuleMatcher(metadata_rules)
+
+    def visit(self, catalog: Node) -> Node:
+        """Apply the rules to every stream of a catalog.
+
+        Args:
+            catalog: The catalog to update in place.
+
+        Returns:
+            The updated catalog.
+        """
+        for stream in catalog.get("streams", []):
+            self.stream_node(stream)
+
+        return catalog
+
+    def stream_node(self, node: Node) -> Node:
+        """Apply the rules to a stream.
+
+        Args:
+            node: The stream to update in place.
+
+        Returns:
+            The updated stream.
+        """
+        if self.schema_rules:
+            self.apply_schema_rules(node)
+
+        if self.metadata_rules:
+            self.apply_metadata_rules(node)
+
+        return node
+
+    def apply_schema_rules(self, node: Node):
+        """Apply the schema rules to a stream.
+
+        Args:
+            node: The stream to update in place.
+        """
+        tap_stream_id: str = node["tap_stream_id"]
+
+        if "schema" not in node:
+            node["schema"] = {"type": "object"}
+
+        stream_rules = self.schema_rules.matching(tap_stream_id)
+        if not stream_rules:
+            return
+
+        for rule in stream_rules:
+            ensure_schema_property(node["schema"], rule.breadcrumb)
+
+        for breadcrumb, property_node in iter_schema_properties(node["schema"]):
+            for rule in self.schema_rules.matching(tap_stream_id, breadcrumb):
+                property_node.clear()
+                property_node.update(rule.payload)
+                logging.debug(
+                    "Setting '%s' of '%s' to %r",  # noqa: WPS323
+                    ".".join(breadcrumb),
+                    tap_stream_id,
+                    rule.payload,
+                )
+
+    def apply_metadata_rules(self, node: Node):  # noqa: WPS231
+        """Apply the metadata rules to a stream.
+
+        Args:
+            node: The stream to update in place.
+        """
+        tap_stream_id: str = node["tap_stream_id"]
+
+        if "metadata" not in node:
+            node["metadata"] = []
+
+        metadata_list: list[Node] = node["metadata"]
+        breadcrumbs = {tuple(metadata["breadcrumb"]) for metadata in metadata_list}
+
+        def ensure_metadata(breadcrumb: list[str]):  # noqa: WPS430
+            if tuple(breadcrumb) in breadcrumbs:
+                return
+
+            breadcrumbs.add(tuple(breadcrumb))
+            # Streams and top-level properties are included automatically,
+            # nested properties are excluded.
+            inclusion = "automatic" if len(breadcrumb) <= 2 else "available"
+            metadata_list.append(
+                {"breadcrumb": breadcrumb, "metadata": {"inclusion": inclusion}}
+            )
+
+        ensure_metadata([])
+
+        for rule in self.metadata_rules.matching(tap_stream_id, []):
+            # Legacy catalogs have underscorized keys on the streams themselves
+            self.set_metadata(node, rule.key.replace("-", "_"), rule.value)
+
+        # Follow the order of the stream keys, like the catalog visitor does, so
+        # that rules are applied to the same metadata entries.
+        for key in list(node):
+            if key == "schema" and isinstance(node["schema"], dict):
+                for breadcrumb, _ in iter_schema_properties(node["schema"]):
+                    ensure_metadata(breadcrumb)
+            elif key == "metadata":
+                for metadata in metadata_list:
+                    for rule in self.metadata_rules.matching(
+                        tap_stream_id, metadata["breadcrumb"]
+                    ):
+                        self.set_metadata(metadata["metadata"], rule.key, rule.value)
+
+    def set_metadata(self, node: Node, key: str, value: Any):
+        """Set selection and inclusion keys in a metadata node.
+
+        Args:
+            node: The metadata node.
+            key: The metadata key.
+            value: The metadata value.
+        """
+        # Unsupported fields cannot be selected
+        if (
+            key == "selected"
+            and value is True
+            and node.get("inclusion") == "unsupported"
+        ):
+            return
+
+        node[key] = value
+
+
+class _JSONReader:
+    """Decode consecutive JSON values from a text file, reading it in chunks."""
+
+    decoder = json.JSONDecoder()
+
+    def __init__(self, file: TextIO, chunk_size: int):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+
+    def read(self, size: int = 0) -> bool:
+        chunk = self.file.read(max(size, self.chunk_size))
+        if not chunk:
+            return False
+
+        self.buffer = self.buffer[self.pos :] + chunk  # noqa: E203
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        while True:
+            self.pos = JSON_WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+
+            if not self.read():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        char = self.peek()
+        if not char or char not in chars:
+            raise ValueError(
+                f"Expecting one of {chars!r}, got {char or 'end of file'!r}"
+            )
+
+        self.pos += 1
+        return char
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                # The value may be incomplete, read at least as much again
+                if not self.read(len(self.buffer) - self.pos):
+                    raise
+                continue
+
+            # A number at the end of the buffer may be incomplete too
+            if end == len(self.buffer) and self.read():
+                continue
+
+            self.pos = end
+            return value
+
+    def array(self) -> Iterator[Any]:
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+
+        while True:
+            yield self.value()
+            if self.expect(",]") == "]":
+                return
+
+
+def iter_catalog(
+    catalog_file: TextIO, chunk_size: int = 2**16
+) -> Iterator[tuple[str, Any]]:
+    """Iterate over the entries of a catalog file without loading it at once.
+
+    The value of the `streams` entry is an iterator over the streams, which are
+    decoded one at a time. It must be consumed before the next entry is read.
+
+    Args:
+        catalog_file: The catalog file.
+        chunk_size: The minimum number of characters to read from the file at once.
+
+    Yields:
+        The key and value of each top-level entry of the catalog.
+
+    Raises:
+        ValueError: if the file doesn't contain a valid JSON object.
+    """
+    reader = _JSONReader(catalog_file, chunk_size)
+
+    reader.expect("{")
+    if reader.peek() == "}":
+        reader.pos += 1
+    else:
+        while True:
+            key = reader.value()
+            if not isinstance(key, str):
+                raise ValueError(f"Expecting property name, got {key!r}")
+
+            reader.expect(":")
+            if key == "streams" and reader.peek() == "[":
+                streams = reader.array()
+                yield key, streams
+                # Skip the streams that were not consumed
+                for _ in streams:  # noqa: WPS328
+                    pass
+            else:
+                yield key, reader.value()
+
+            if reader.expect(",}") == "}":
+                break
+
+    if reader.peek():
+        raise ValueError("Extra data after the catalog")
+
+
+def dump_catalog(
+    entries: Iterable[tuple[str, Any]],
+    catalog_file: TextIO,
+    indent: int | None = 2,
+):
+    """Write catalog entries to a file, one stream at a time.
+
+    The output is the same as `json.dump(catalog, catalog_file, indent=indent)`.
+
+    Args:
+        entries: The key and value of each top-level entry of the catalog,
+            as yielded by `iter_catalog`.
+        catalog_file: The file to write the catalog to.
+        indent: The indentation level, None for the most compact and fastest
+            to encode representation.
+    """
+    separator = ", " if indent is None else ","
+
+    def newline(level: int) -> str:  # noqa: WPS430
+        return "" if indent is None else "\n" + " " * (indent * level)
+
+    def encode(value: Any, level: int) -> str:  # noqa: WPS430
+        return json.dumps(value, indent=indent).replace("\n", newline(level))
+
+    catalog_file.write("{")
+    empty = True
+    for key, value in entries:
+        catalog_file.write(
+            f"{'' if empty else separator}{newline(1)}{json.dumps(key)}: "
+        )
+        empty = False
+
+        if key != "streams" or not isinstance(value, (list, abc.Iterator)):
+            catalog_file.write(encode(value, 1))
+            continue
+
+        catalog_file.write("[")
+        no_streams = True
+        for stream in value:
+            catalog_file.write(
+                f"{'' if no_streams else separator}{newline(2)}{encode(stream, 2)}"
+            )
+            no_streams = False
+
+        catalog_file.write("]" if no_streams else f"{newline(1)}]")
+
+    catalog_file.write("}" if empty else f"{newline(0)}}}")
+
+
 class ListExecutor(CatalogExecutor):
     def __init__(self):
         # properties per stream
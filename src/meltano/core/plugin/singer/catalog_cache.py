@@ -0,0 +1,193 @@
+"""Content-addressed cache of discovered Singer catalogs."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+import structlog
+
+from meltano.core.project import Project
+from meltano.core.project_settings_service import ProjectSettingsService
+
+logger = structlog.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 50
+DEFAULT_MAX_AGE = 7 * 24 * 60 * 60
+
+
+class CatalogCache:
+    """Store discovered catalogs by content key, evicting least recently used ones.
+
+    Entries are plain files named after their key, so a cache directory can be
+    shared between projects and workers: writes are atomic renames, and reads
+    only ever see complete catalogs.
+
+    The modification time of an entry is when its catalog was discovered, and
+    its access time when it was last used.
+    """
+
+    suffix = ".json"
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_age: int = DEFAULT_MAX_AGE,
+    ):
+        """Create a new catalog cache.
+
+        Args:
+            cache_dir: The directory in which cached catalogs are stored.
+            max_entries: The number of catalogs to keep, 0 to disable eviction.
+            max_age: Seconds after which catalogs are discovered again, 0 to
+                keep using them until they are evicted.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+        self.max_age = max_age
+
+    @classmethod
+    def from_project(
+        cls,
+        project: Project,
+        settings_service: ProjectSettingsService | None = None,
+    ) -> CatalogCache:
+        """Create the catalog cache configured for a project.
+
+        Args:
+            project: The Meltano project.
+            settings_service: The project settings service to read settings from.
+
+        Returns:
+            The catalog cache to use for the project.
+        """
+        settings_service = settings_service or ProjectSettingsService(project)
+        cache_dir = settings_service.get("catalog_cache.dir")
+        max_entries = settings_service.get("catalog_cache.max_entries")
+        max_age = settings_service.get("catalog_cache.max_age")
+
+        return cls(
+            Path(cache_dir).expanduser()
+            if cache_dir
+            else project.cache_dir("catalogs"),
+            max_entries=DEFAULT_MAX_ENTRIES if max_entries is None else max_entries,
+            max_age=DEFAULT_MAX_AGE if max_age is None else max_age,
+        )
+
+    def path(self, key: str) -> Path:
+        """Get the path of the cached catalog for a key.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The path of the cache entry, which may not exist.
+        """
+        return self.cache_dir.joinpath(f"{key}{self.suffix}")
+
+    def has(self, key: str) -> bool:
+        """Check whether a catalog is cached for a key, and hasn't expired.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            True if the catalog can be restored from the cache.
+        """
+        try:
+            discovered_at = self.path(key).stat().st_mtime
+        except FileNotFoundError:
+            return False
+
+        if self.max_age and time.time() - discovered_at > self.max_age:
+            logger.debug("Cached catalog has expired", key=key)
+            return False
+        return True
+
+    def restore(self, key: str, catalog_path: Path) -> bool:
+        """Copy a cached catalog to the given path, if there is one.
+
+        Args:
+            key: The cache key.
+            catalog_path: Where the cached catalog should be copied to.
+
+        Returns:
+            True if the catalog was found in the cache, and hasn't expired.
+        """
+        if not self.has(key):
+            return False
+
+        entry_path = self.path(key)
+        try:
+            shutil.copyfile(entry_path, catalog_path)
+        except FileNotFoundError:
+            return False
+
+        # Mark the entry as recently used, keeping when it was discovered
+        try:
+            os.utime(entry_path, (time.time(), entry_path.stat().st_mtime))
+        except OSError:
+            pass
+
+        return True
+
+    def store(self, key: str, catalog_path: Path) -> Path:
+        """Add a catalog to the cache and evict the least recently used entries.
+
+        Args:
+            key: The cache key.
+            catalog_path: The catalog to store.
+
+        Returns:
+            The path of the new cache entry.
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        entry_path = self.path(key)
+
+        fd, tmp_name = tempfile.mkstemp(
+            dir=self.cache_dir, prefix=f".{key}.", suffix=".tmp"
+        )
+        os.close(fd)
+        try:
+            shutil.copyfile(catalog_path, tmp_name)
+            os.replace(tmp_name, entry_path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
+        self.evict()
+        return entry_path
+
+    def entries(self) -> list[Path]:
+        """List cached catalogs, most recently used first.
+
+        Returns:
+            The paths of the cache entries.
+        """
+        entries = []
+        for entry_path in self.cache_dir.glob(f"*{self.suffix}"):
+            try:
+                entries.append((entry_path.stat().st_atime, entry_path))
+            except FileNotFoundError:
+                # Evicted by another process in the meantime
+                continue
+
+        entries.sort(reverse=True)
+        return [entry_path for _, entry_path in entries]
+
+    def evict(self) -> None:
+        """Remove the least recently used entries beyond `max_entries`."""
+        if not self.max_entries:
+            return
+
+        for entry_path in self.entries()[self.max_entries :]:  # noqa: E203
+            logger.debug("Evicting cached catalog", path=str(entry_path))
+            try:
+                entry_path.unlink()
+            except FileNotFoundError:
+                # Already evicted by another process
+                continue
@@ -5,12 +5,15 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import os
 import shutil
 import sys
 from asyncio.streams import StreamReader
-from hashlib import sha1
+from contextlib import suppress
+from hashlib import sha1, sha256
 from io import StringIO
 from pathlib import Path
+from typing import Iterator
 
 import structlog
 from jsonschema import Draft4Validator
@@ -18,20 +21,23 @@ from jsonschema import Draft4Validator
 from meltano.core.behavior.hookable import hook
 from meltano.core.plugin.error import PluginExecutionError, PluginLacksCapabilityError
 from meltano.core.plugin_invoker import PluginInvoker
+from meltano.core.project_settings_service import ProjectSettingsService
 from meltano.core.setting_definition import SettingDefinition, SettingKind
 from meltano.core.state_service import SINGER_STATE_KEY, StateService
 from meltano.core.utils import file_has_data, flatten
 
 from . import PluginType, SingerPlugin
 from .catalog import (
-    MetadataExecutor,
+    CatalogRulesExecutor,
     MetadataRule,
-    SchemaExecutor,
     SchemaRule,
+    dump_catalog,
+    iter_catalog,
     property_breadcrumb,
     select_filter_metadata_rules,
     select_metadata_rules,
 )
+from .catalog_cache import CatalogCache
 
 logger = structlog.getLogger(__name__)
 
@@ -142,6 +148,9 @@ class SingerTap(SingerPlugin):  # noqa: WPS 214
 
     __plugin_type__ = PluginType.EXTRACTORS
 
+    # Catalogs at least this large (in bytes) are updated one stream at a time
+    STREAMING_CATALOG_SIZE = 16 * 2**20  # 16 MiB
+
     EXTRA_SETTINGS = [
         SettingDefinition(name="_catalog"),
         SettingDefinition(name="_state"),
@@ -324,12 +333,13 @@ class SingerTap(SingerPlugin):  # noqa: WPS 214
             pass
 
     async def discover_catalog(  # noqa: WPS231, WPS210,
-        self, plugin_invoker: PluginInvoker
+        self, plugin_invoker: PluginInvoker, refresh: bool = False
     ):
         """Perform catalog discovery.
 
         Args:
             plugin_invoker: The invocation handler of the plugin instance.
+            refresh: Whether to run discovery instead of using the catalog cache.
 
         Returns:
             None
@@ -358,6 +368,9 @@ class SingerTap(SingerPlugin):  # noqa: WPS 214
         except FileNotFoundError:
             pass
 
+        discovery_cache_key = self.discovery_cache_key(plugin_invoker)
+        catalog_cache = discovery_cache_key and self.catalog_cache(plugin_invoker)
+
         custom_catalog_filename = plugin_invoker.plugin_config_extras["_catalog"]
         if custom_catalog_filename:
             custom_catalog_path = plugin_invoker.project.root.joinpath(
@@ -371,6 +384,17 @@ class SingerTap(SingerPlugin):  # noqa: WPS 214
                 raise PluginExecutionError(
                     f"Could not find catalog file {custom_catalog_path}"
                 ) from err
+        elif (
+            catalog_cache
+            and not refresh
+            and catalog_cache.restore(discovery_cache_key, catalog_path)
+        ):
+            logger.debug(
+                "Using catalog from the catalog cache",
+                cache_dir=str(catalog_cache.cache_dir),
+            )
+            # No need to store the catalog again once validated
+            catalog_cache = None
         else:
             await self.run_discovery(plugin_invoker, catalog_path)
 
@@ -385,6 +409,42 @@ class SingerTap(SingerPlugin):  # noqa: WPS 214
                 f"Catalog discovery failed: invalid catalog: {err}"
             ) from err
 
+        if catalog_cache:
+            catalog_cache.store(discovery_cache_key, catalog_path)
+
+    async def warm_catalog_cache(
+        self, plugin_invoker: PluginInvoker, refresh: bool = False
+    ) -> bool:
+        """Run discovery to store the catalog in the catalog cache, if missing.
+
+        Args:
+            plugin_invoker: The invocation handler of the plugin instance.
+            refresh: Whether to run discovery even if the catalog is cached.
+
+        Returns:
+            True if discovery was run, False if the catalog was already cached.
+
+        Raises:
+            PluginLacksCapabilityError: if the catalog of this plugin can't be cached
+        """
+        discovery_cache_key = self.discovery_cache_key(plugin_invoker)
+        if not discovery_cache_key:
+            raise PluginLacksCapabilityError(
+                f"The catalog of extractor '{self.name}' cannot be cached"
+            )
+
+        if not refresh and self.catalog_cache(plugin_invoker).has(discovery_cache_key):
+            return False
+
+        # Bypass the catalog in the run directory, which may be up-to-date
+        try:
+            plugin_invoker.files["catalog_cache_key"].unlink()
+        except FileNotFoundError:
+            pass
+
+        await self.discover_catalog(plugin_invoker, refresh=refresh)
+        return True
+
     async def run_discovery(  # noqa: WPS238, WPS210
         self, plugin_invoker: PluginInvoker, catalog_path: Path
     ):  # noqa: DAR401
@@ -526,18 +586,19 @@ class SingerTap(SingerPlugin):  # noqa: WPS 214
         catalog_path = plugin_invoker.files["catalog"]
         catalog_cache_key_path = plugin_invoker.files["catalog_cache_key"]
 
-        try:
-            with catalog_path.open() as catalog_file:
-                catalog = json.load(catalog_file)
+        executor = CatalogRulesExecutor(schema_rules, metadata_rules)
 
-            if schema_rules:
-                SchemaExecutor(schema_rules).visit(catalog)
+        try:
+            if catalog_path.stat().st_size >= self.STREAMING_CATALOG_SIZE:
+                self._apply_catalog_rules_streaming(executor, catalog_path)
+            else:
+                with catalog_path.open() as catalog_file:
+                    catalog = json.load(catalog_file)
 
-            if metadata_rules:
-                MetadataExecutor(metadata_rules).visit(catalog)
+                executor.visit(catalog)
 
-            with catalog_path.open("w") as catalog_f:
-                json.dump(catalog, catalog_f, indent=2)
+                with catalog_path.open("w") as catalog_f:
+                    json.dump(catalog, catalog_f, indent=2)
 
             cache_key = self.catalog_cache_key(plugin_invoker)
             if cache_key:
@@ -557,6 +618,92 @@ class SingerTap(SingerPlugin):  # noqa: WPS 214
                 f"Applying catalog rules failed: catalog file is invalid: {err}"
             ) from err
 
+    @staticmethod
+    def _apply_catalog_rules_streaming(
+        executor: CatalogRulesExecutor, catalog_path: Path
+    ):
+        """Apply catalog rules one stream at a time, without loading the catalog.
+
+        The updated catalog is written without indentation.
+
+        Args:
+            executor: The executor applying the rules to each stream.
+            catalog_path: The catalog to update.
+        """
+        updated_path = catalog_path.with_name(f"{catalog_path.name}.tmp")
+        try:
+            with catalog_path.open() as catalog_file, updated_path.open(
+                "w"
+            ) as updated_file:
+                dump_catalog(
+                    (
+                        (key, map(executor.stream_node, value))
+                        if key == "streams" and isinstance(value, Iterator)
+                        else (key, value)
+                        for key, value in iter_catalog(catalog_file)
+                    ),
+                    updated_file,
+                    # Encoding without indentation is several times faster
+                    indent=None,
+                )
+            os.replace(updated_path, catalog_path)
+        except BaseException:
+            with suppress(FileNotFoundError):
+                updated_path.unlink()
+            raise
+
+    def catalog_cache(self, plugin_invoker: PluginInvoker) -> CatalogCache:
+        """Get the cache of discovered catalogs shared by all extractors.
+
+        Args:
+            plugin_invoker: the plugin invoker running
+
+        Returns:
+            the catalog cache configured for the project
+        """
+        return CatalogCache.from_project(
+            plugin_invoker.project,
+            ProjectSettingsService(
+                plugin_invoker.project,
+                config_service=plugin_invoker.plugins_service.config_service,
+            ),
+        )
+
+    def discovery_cache_key(self, plugin_invoker: PluginInvoker) -> str | None:
+        """Get a key identifying the result of discovery in the catalog cache.
+
+        Unlike `catalog_cache_key`, this key doesn't depend on schema or metadata
+        rules, since the catalog cache holds catalogs as they were discovered.
+
+        Args:
+            plugin_invoker: the plugin invoker running
+
+        Returns:
+            the key of the discovered catalog, if it can be cached
+        """
+        if "discover" not in plugin_invoker.capabilities:
+            return None
+
+        pip_url = plugin_invoker.plugin.pip_url
+
+        # Don't cache discovery for non-pip or editable plugins, since the
+        # result of discovery could change at any time.
+        if pip_url is None or pip_url.startswith("-e"):
+            return None
+
+        # Discovery isn't run when a custom catalog is provided
+        if plugin_invoker.plugin_config_extras["_catalog"]:
+            return None
+
+        key_dict = {
+            "pip_url": pip_url,
+            "executable": plugin_invoker.plugin.executable,
+            "config": plugin_invoker.plugin_config,
+        }
+        key_json = json.dumps(key_dict, sort_keys=True, default=str)
+
+        return sha256(key_json.encode()).hexdigest()
+
     def catalog_cache_key(self, plugin_invoker):
         """Get a cache key for the catalog.
 
@@ -6,11 +6,13 @@ from __future__ import annotations
 
 import json
 import logging
+import time
 from datetime import datetime
 
 from meltano.core.behavior.hookable import hook
 from meltano.core.job import Job, Payload
 from meltano.core.plugin_invoker import PluginInvoker
+from meltano.core.project_settings_service import ProjectSettingsService
 from meltano.core.setting_definition import SettingDefinition
 from meltano.core.state_service import SINGER_STATE_KEY, StateService
 
@@ -20,7 +22,19 @@ logger = logging.getLogger(__name__)
 
 
 class BookmarkWriter:
-    """A basic bookmark writer suitable for use as an output handler."""
+    """A basic bookmark writer suitable for use as an output handler.
+
+    State messages are coalesced in memory and persisted according to a flush
+    policy: after `flush_messages` messages have been received, or once
+    `flush_interval` seconds have passed since the last write. When neither is
+    set, every state message is persisted as soon as it is received. Pending
+    state must be persisted with `flush` once the target has exited, which
+    `PluginInvoker.cleanup` does for all of its output handlers.
+
+    The flush policy is only evaluated when a state message is received, so
+    the latest state of a target that stops emitting state for a while is
+    only persisted with its next state message, or when the target exits.
+    """
 
     def __init__(
         self,
@@ -28,6 +42,8 @@ class BookmarkWriter:
         session: object,
         payload_flag: int = Payload.STATE,
         state_service: StateService | None = None,
+        flush_interval: float = 0,
+        flush_messages: int = 0,
     ):
         """Bookmark writer with a writelines implementation to support ingesting and persisting state messages.
 
@@ -36,14 +52,22 @@ class BookmarkWriter:
             session: SQLAlchemy session/engine object to be used to update state.
             payload_flag: a valid payload flag, one of Payload.STATE or Payload.INCOMPLETE_STATE.
             state_service: StateService to use for bookmarking state.
+            flush_interval: minimum number of seconds between state writes, 0 to disable.
+            flush_messages: number of state messages after which state is written, 0 to disable.
         """
         self.job = job
         self.session = session
         self.state_service = state_service or StateService(session=self.session)
         self.payload_flag = payload_flag
+        self.flush_interval = flush_interval
+        self.flush_messages = flush_messages
+
+        self._pending_state: dict | None = None
+        self._pending_count = 0
+        self._last_flush = time.monotonic()
 
     def writeline(self, line: str):
-        """Persist a state entry.
+        """Record a state entry, persisting it if the flush policy requires it.
 
         Args:
             line: raw json state line to decode/store
@@ -62,6 +86,22 @@ class BookmarkWriter:
                 "Received state is invalid, incremental state has not been updated"
             )
 
+        self._pending_state = new_state
+        self._pending_count += 1
+
+        if self._should_flush():
+            self.flush()
+
+    def flush(self):
+        """Persist the latest pending state entry, if any."""
+        if self._pending_state is None:
+            return
+
+        new_state = self._pending_state
+        self._pending_state = None
+        self._pending_count = 0
+        self._last_flush = time.monotonic()
+
         job = self.job
         job.payload[SINGER_STATE_KEY] = new_state
         job.payload_flags |= self.payload_flag
@@ -78,6 +118,18 @@ class BookmarkWriter:
             logger.info(f"Incremental state has been updated at {datetime.utcnow()}.")
             logger.debug(f"Incremental state: {new_state}")
 
+    def _should_flush(self) -> bool:
+        if not self.flush_interval and not self.flush_messages:
+            return True
+
+        if self.flush_messages and self._pending_count >= self.flush_messages:
+            return True
+
+        return bool(
+            self.flush_interval
+            and time.monotonic() - self._last_flush >= self.flush_interval
+        )
+
 
 class SingerTarget(SingerPlugin):
     """A plugin for singer targets."""
@@ -154,7 +206,18 @@ class SingerTarget(SingerPlugin):
         incomplete_state = elt_context.full_refresh and elt_context.select_filter
         payload_flag = Payload.INCOMPLETE_STATE if incomplete_state else Payload.STATE
 
+        project_settings_service = ProjectSettingsService(
+            plugin_invoker.project,
+            config_service=plugin_invoker.plugins_service.config_service,
+        )
+
         plugin_invoker.add_output_handler(
             plugin_invoker.StdioSource.STDOUT,
-            BookmarkWriter(elt_context.job, elt_context.session, payload_flag),
+            BookmarkWriter(
+                elt_context.job,
+                elt_context.session,
+                payload_flag,
+                flush_interval=project_settings_service.get("elt.state_flush_interval"),
+                flush_messages=project_settings_service.get("elt.state_flush_messages"),
+            ),
         )
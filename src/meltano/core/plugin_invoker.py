@@ -213,22 +213,30 @@ class PluginInvoker:  # noqa: WPS214, WPS230
         Args:
             session: Database session.
         """
-        self.plugin_config = self.settings_service.as_dict(
-            extras=False, session=session
-        )
-        self.plugin_config_processed = self.settings_service.as_dict(
-            extras=False, process=True, session=session
-        )
-        self.plugin_config_extras = self.settings_service.as_dict(
-            extras=True, session=session
-        )
-        self.plugin_config_env = self.settings_service.as_env(session=session)
+        with self.settings_service.snapshot():
+            self.plugin_config = self.settings_service.as_dict(
+                extras=False, session=session
+            )
+            self.plugin_config_processed = self.settings_service.as_dict(
+                extras=False, process=True, session=session
+            )
+            self.plugin_config_extras = self.settings_service.as_dict(
+                extras=True, session=session
+            )
+            self.plugin_config_env = self.settings_service.as_env(session=session)
         async with self.plugin.trigger_hooks("configure", self, session):
             self.plugin_config_service.configure()
             self._prepared = True
 
     async def cleanup(self):
-        """Reset the plugin config."""
+        """Reset the plugin config.
+
+        Output handlers are flushed first, regardless of the cleanup hooks, so
+        that output they still buffer, like pending state, is never dropped
+        because a hook failed.
+        """
+        self.flush_output_handlers()
+
         self.plugin_config = {}
         self.plugin_config_processed = {}
         self.plugin_config_extras = {}
@@ -508,6 +516,17 @@ class PluginInvoker:  # noqa: WPS214, WPS230
             # Unwrap FileNotFoundError
             raise err.__cause__  # noqa: WPS609. Allow accessing magic attribute.
 
+    def flush_output_handlers(self):
+        """Flush the output handlers that buffer output, like `BookmarkWriter`."""
+        if not self.output_handlers:
+            return
+
+        for handlers in self.output_handlers.values():
+            for handler in handlers:
+                flush = getattr(handler, "flush", None)
+                if callable(flush):
+                    flush()
+
     def add_output_handler(self, src: str, handler: SubprocessOutputWriter):
         """Append an output handler for a given stdio stream.
 
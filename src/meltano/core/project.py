@@ -96,6 +96,7 @@ class Project(Versioned):  # noqa: WPS214
         ).resolve()
         self.readonly = False
         self.active_environment: Environment | None = None
+        self._meltano_file_cache: tuple[dict, MeltanoFileTypeHint] | None = None
 
     @cached_property
     def _meltano_interprocess_lock(self):
@@ -244,6 +245,7 @@ class Project(Versioned):  # noqa: WPS214
         modified in-place, but not updated on-disk, and you need the on-disk
         version.
         """
+        self._meltano_file_cache = None
         try:
             del self.__dict__["project_files"]
         except KeyError:
@@ -251,7 +253,10 @@ class Project(Versioned):  # noqa: WPS214
 
     @property
     def meltano(self) -> MeltanoFileTypeHint:
-        """Return a copy of the current meltano config.
+        """Return the current meltano config.
+
+        The parsed config is reused as long as `meltano.yml` and its included files
+        are unchanged on disk, and the cache wasn't cleared with `clear_cache`.
 
         Raises:
             EmptyMeltanoFileException: The `meltano.yml` file is empty.
@@ -272,7 +277,14 @@ class Project(Versioned):  # noqa: WPS214
             else self._meltano_rw_lock.read_lock
         )
         with lock():
-            return MeltanoFile.parse(self.project_files.load())
+            loaded = self.project_files.load()
+            # `ProjectFiles.load` returns the same object while no file has changed
+            if self._meltano_file_cache and self._meltano_file_cache[0] is loaded:
+                return self._meltano_file_cache[1]
+
+            meltano_file = MeltanoFile.parse(loaded)
+            self._meltano_file_cache = (loaded, meltano_file)
+            return meltano_file
 
     @contextmanager
     def meltano_update(self):
@@ -453,6 +465,19 @@ class Project(Versioned):  # noqa: WPS214
         """
         return self.meltano_dir("run", *joinpaths, make_dirs=make_dirs)
 
+    @makedirs
+    def cache_dir(self, *joinpaths, make_dirs: bool = True):
+        """Path to the `cache` directory in `.meltano`.
+
+        Args:
+            joinpaths: Paths to join to the `cache` directory in `.meltano`.
+            make_dirs: Flag to make directories if not exists.
+
+        Returns:
+            Resolved path to `cache` dir optionally joined to given paths.
+        """
+        return self.meltano_dir("cache", *joinpaths, make_dirs=make_dirs)
+
     @makedirs
     def logs_dir(self, *joinpaths, make_dirs: bool = True):
         """Path to the `logs` directory in `.meltano`.
@@ -33,6 +33,14 @@ MULTI_FILE_KEYS = {
 }
 
 
+def _copy_sequence(sequence: list) -> list:
+    copied = sequence.__class__(sequence)
+    if isinstance(sequence, CommentedSeq):
+        # keep the comments of the sequence
+        sequence.copy_attributes(copied)
+    return copied
+
+
 def deep_merge(parent: TMapping, children: list[TMapping]) -> TMapping:
     """Deep merge a list of child dicts with a given parent.
 
@@ -51,8 +59,10 @@ def deep_merge(parent: TMapping, children: list[TMapping]) -> TMapping:
                 node = base.setdefault(key, value.__class__())
                 base[key] = deep_merge(node, [value])
             elif isinstance(value, Sequence):
-                node = base.setdefault(key, value.__class__())
+                # copy the node so that the parent's sequence is left untouched
+                node = _copy_sequence(base.get(key, value.__class__()))
                 node.extend(value)
+                base[key] = node
             else:
                 base[key] = value
     return base
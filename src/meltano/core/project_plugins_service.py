@@ -47,6 +47,35 @@ class PluginAlreadyAddedException(Exception):
         super().__init__()
 
 
+class _PluginRegistry:
+    """Indexes of the plugins of one version of the project configuration."""
+
+    def __init__(self, plugins: dict[PluginType, list[ProjectPlugin]]):
+        """Index the plugins of the project.
+
+        Args:
+            plugins: The plugins of the project, by type.
+        """
+        self.plugins = plugins
+        self.by_ref: dict[tuple[PluginType, str], ProjectPlugin] = {}
+        self.by_name: dict[str, list[ProjectPlugin]] = {}
+        self.by_mapping_name: dict[str | None, list[ProjectPlugin]] = {}
+        # Namespaces can be inherited, so they are only indexed once needed
+        self.by_namespace: dict[tuple[PluginType, str], ProjectPlugin] | None = None
+        self.parents: dict[tuple, ProjectPlugin] = {}
+        self.plugin_ids: set[int] = set()
+
+        for plugin_type in PluginType:
+            for plugin in plugins[plugin_type]:
+                self.plugin_ids.add(id(plugin))
+                self.by_ref.setdefault((plugin.type, plugin.name), plugin)
+                self.by_name.setdefault(plugin.name, []).append(plugin)
+                if plugin.type == PluginType.MAPPERS:
+                    self.by_mapping_name.setdefault(
+                        plugin.extra_config.get("_mapping_name"), []
+                    ).append(plugin)
+
+
 class ProjectPluginsService:  # noqa: WPS214, WPS230 (too many methods, attributes)
     """Project Plugins Service."""
 
@@ -82,6 +111,7 @@ class ProjectPluginsService:  # noqa: WPS214, WPS230 (too many methods, attribut
         self.hub_service = hub_service or MeltanoHubService(project)
 
         self._current_plugins = None
+        self._registry: _PluginRegistry | None = None
         self._use_cache = use_cache
 
         self.settings_service = ProjectSettingsService(project)
@@ -125,6 +155,21 @@ class ProjectPluginsService:  # noqa: WPS214, WPS230 (too many methods, attribut
             yield meltano_yml.plugins
 
         self._current_plugins = None
+        self._registry = None
+
+    @property
+    def registry(self) -> _PluginRegistry:
+        """Return the indexes of the current plugins.
+
+        The indexes are built once for every version of the project configuration.
+
+        Returns:
+            The plugin registry.
+        """
+        plugins = self.current_plugins
+        if self._registry is None or self._registry.plugins is not plugins:
+            self._registry = _PluginRegistry(plugins)
+        return self._registry
 
     def add_to_file(self, plugin: ProjectPlugin):
         """Add plugin to `meltano.yml`.
@@ -215,29 +260,24 @@ class ProjectPluginsService:  # noqa: WPS214, WPS230 (too many methods, attribut
                 f"Plugin configuration profiles are no longer supported, ignoring `@{profile_name}` in plugin name."
             )
 
-        try:
-            plugin = next(
-                plugin
-                for plugin in self.plugins(ensure_parent=False)
-                if (
-                    plugin.name == plugin_name  # noqa: WPS222 (with too much logic)
-                    and (plugin_type is None or plugin.type == plugin_type)
-                    and (
-                        invokable is None
-                        or self.ensure_parent(plugin).is_invokable() == invokable
-                    )
-                    and (
-                        configurable is None
-                        or self.ensure_parent(plugin).is_configurable() == configurable
-                    )
-                )
-            )
-
+        for plugin in self.registry.by_name.get(plugin_name, []):
+            if plugin_type is not None and plugin.type != plugin_type:
+                continue
+            if (
+                invokable is not None
+                and self.ensure_parent(plugin).is_invokable() != invokable
+            ):
+                continue
+            if (
+                configurable is not None
+                and self.ensure_parent(plugin).is_configurable() != configurable
+            ):
+                continue
             return self.ensure_parent(plugin)
-        except StopIteration as stop:
-            raise PluginNotFoundError(
-                PluginRef(plugin_type, plugin_name) if plugin_type else plugin_name
-            ) from stop
+
+        raise PluginNotFoundError(
+            PluginRef(plugin_type, plugin_name) if plugin_type else plugin_name
+        )
 
     def find_plugin_by_namespace(
         self, plugin_type: PluginType, namespace: str
@@ -258,14 +298,17 @@ class ProjectPluginsService:  # noqa: WPS214, WPS230 (too many methods, attribut
         Raises:
             PluginNotFoundError: If no plugin is found.
         """
+        registry = self.registry
+        if registry.by_namespace is None:
+            by_namespace = {}
+            for plugin in self.plugins():
+                by_namespace.setdefault((plugin.type, plugin.namespace), plugin)
+            registry.by_namespace = by_namespace
+
         try:
-            return next(
-                plugin
-                for plugin in self.plugins()
-                if plugin.namespace == namespace and plugin_type == plugin.type
-            )
-        except StopIteration as stop:
-            raise PluginNotFoundError(namespace) from stop
+            return registry.by_namespace[(plugin_type, namespace)]
+        except KeyError as err:
+            raise PluginNotFoundError(namespace) from err
 
     def find_plugins_by_mapping_name(self, mapping_name: str) -> list[ProjectPlugin]:
         """Search for plugins with the specified mapping name present in  their mappings config.
@@ -279,13 +322,10 @@ class ProjectPluginsService:  # noqa: WPS214, WPS230 (too many methods, attribut
         Raises:
             PluginNotFoundError: If no mapper plugin with the specified mapping name is found.
         """
-        found: list[ProjectPlugin] = []
-        for plugin in self.get_plugins_of_type(plugin_type=PluginType.MAPPERS):
-            if plugin.extra_config.get("_mapping_name") == mapping_name:
-                found.append(plugin)
+        found = self.registry.by_mapping_name.get(mapping_name)
         if not found:
             raise PluginNotFoundError(mapping_name)
-        return found
+        return [self.ensure_parent(plugin) for plugin in found]
 
     def get_plugin(self, plugin_ref: PluginRef) -> ProjectPlugin:
         """Get a plugin using its PluginRef.
@@ -300,15 +340,11 @@ class ProjectPluginsService:  # noqa: WPS214, WPS230 (too many methods, attribut
             PluginNotFoundError: If the plugin is not found.
         """
         try:
-            plugin = next(
-                plugin
-                for plugin in self.plugins(ensure_parent=False)
-                if plugin == plugin_ref
-            )
+            plugin = self.registry.by_ref[(plugin_ref.type, plugin_ref.name)]
+        except KeyError as err:
+            raise PluginNotFoundError(plugin_ref) from err
 
-            return self.ensure_parent(plugin)
-        except StopIteration as stop:
-            raise PluginNotFoundError(plugin_ref) from stop
+        return self.ensure_parent(plugin)
 
     def get_plugins_of_type(
         self, plugin_type: PluginType, ensure_parent=True
@@ -539,9 +575,28 @@ class ProjectPluginsService:  # noqa: WPS214, WPS230 (too many methods, attribut
         Returns:
             The plugin (updated if necessary).
         """
-        if not plugin.parent:
+        if plugin.parent:
+            return plugin
+
+        registry = self._registry
+        if registry is None or id(plugin) not in registry.plugin_ids:
             plugin.parent = self.get_parent(plugin)
+            return plugin
+
+        # Plugins generated from the mappings of a mapper share its definition, so
+        # parents are resolved once per definition, rather than once per plugin
+        key = (
+            plugin.type,
+            plugin.name,
+            plugin.inherit_from,
+            plugin.variant,
+            self._prefer_source,
+            self._use_discovery_yaml,
+        )
+        if key not in registry.parents:
+            registry.parents[key] = self.get_parent(plugin)
 
+        plugin.parent = registry.parents[key]
         return plugin
 
     def get_transformer(self) -> ProjectPlugin:
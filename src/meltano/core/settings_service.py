@@ -103,6 +103,8 @@ class SettingsService(ABC):  # noqa: WPS214
         self.config_override = config_override or {}
 
         self._setting_defs = None
+        self._setting_index: tuple[list, dict[str, SettingDefinition]] | None = None
+        self._snapshot: dict | None = None
 
     @property
     @abstractmethod
@@ -188,7 +190,7 @@ class SettingsService(ABC):  # noqa: WPS214
         Returns:
             the environment as a dict.
         """
-        return {**os.environ, **self.env_override}
+        return self._snapshotted("env", lambda: {**os.environ, **self.env_override})
 
     @classmethod
     def unredact(cls, values: dict) -> dict:
@@ -202,6 +204,45 @@ class SettingsService(ABC):  # noqa: WPS214
         """
         return {key: val for key, val in values.items() if val != REDACTED_VALUE}
 
+    @contextmanager
+    def snapshot(self) -> Generator[None, None, None]:
+        """Resolve settings once for the duration of the context.
+
+        While in the context, the environment used to expand setting values
+        (including the values of non-extra settings, for extras) and the strict
+        env var mode feature flag are resolved once and reused by every setting.
+        Setting, unsetting or resetting a setting invalidates the snapshot.
+        Every `config_with_metadata` call is implicitly its own snapshot.
+
+        Yields:
+            None
+        """
+        if self._snapshot is not None:
+            # Nested snapshots share the outermost one
+            yield
+            return
+
+        self._snapshot = {}
+        try:
+            yield
+        finally:
+            self._snapshot = None
+
+    def invalidate_snapshot(self) -> None:
+        """Forget the settings resolved in the current snapshot, if any."""
+        if self._snapshot is not None:
+            self._snapshot.clear()
+
+    def _snapshotted(self, key, resolve):
+        if self._snapshot is None:
+            return resolve()
+
+        try:
+            return self._snapshot[key]
+        except KeyError:
+            value = self._snapshot[key] = resolve()
+            return value
+
     def config_with_metadata(
         self,
         prefix=None,
@@ -222,6 +263,14 @@ class SettingsService(ABC):  # noqa: WPS214
         Returns:
             dict of config with metadata
         """
+        with self.snapshot():
+            return self._config_with_metadata(
+                prefix, extras, source, source_manager, **kwargs
+            )
+
+    def _config_with_metadata(
+        self, prefix, extras, source, source_manager, **kwargs
+    ) -> dict:
         if source_manager:
             source_manager.bulk = True
         else:
@@ -336,30 +385,16 @@ class SettingsService(ABC):  # noqa: WPS214
 
         metadata = {"name": name, "source": source, "setting": setting_def}
 
-        expandable_env = {**self.project.dotenv_env, **self.env}
-        if setting_def and setting_def.is_extra:
-            expandable_env.update(
-                self.as_env(
-                    extras=False,
-                    redacted=redacted,
-                    source=source,
-                    source_manager=source_manager,
-                )
-            )
-
         manager = source_manager or source.manager(self, **kwargs)
         value, get_metadata = manager.get(name, setting_def=setting_def)
         metadata.update(get_metadata)
 
-        # Can't do conventional SettingsService.feature_flag call to check;
-        # it would result in circular dependency
-        env_var_strict_mode, _ = source.manager(self.project_settings_service).get(
-            f"{FEATURE_FLAG_PREFIX}.{FeatureFlags.STRICT_ENV_VAR_MODE}"
-        )
         if expand_env_vars and metadata.get("expandable", False):
             metadata["expandable"] = False
             expanded_value = do_expand_env_vars(
-                value, env=expandable_env, raise_if_missing=env_var_strict_mode
+                value,
+                env=self._expandable_env(setting_def, redacted, source, source_manager),
+                raise_if_missing=self._env_var_strict_mode(source),
             )
 
             if expanded_value != value:
@@ -422,6 +457,35 @@ class SettingsService(ABC):  # noqa: WPS214
 
         return value, metadata
 
+    def _expandable_env(self, setting_def, redacted, source, source_manager) -> dict:
+        expandable_env = self._snapshotted(
+            "expandable_env", lambda: {**self.project.dotenv_env, **self.env}
+        )
+        if not (setting_def and setting_def.is_extra):
+            return expandable_env
+
+        extras_env = self._snapshotted(
+            ("extras_env", redacted, source),
+            lambda: self.as_env(
+                extras=False,
+                redacted=redacted,
+                source=source,
+                source_manager=source_manager,
+            ),
+        )
+        return {**expandable_env, **extras_env}
+
+    def _env_var_strict_mode(self, source) -> bool:
+        # Can't do conventional SettingsService.feature_flag call to check;
+        # it would result in circular dependency
+        env_var_strict_mode, _ = self._snapshotted(
+            ("env_var_strict_mode", source),
+            lambda: source.manager(self.project_settings_service).get(
+                f"{FEATURE_FLAG_PREFIX}.{FeatureFlags.STRICT_ENV_VAR_MODE}"
+            ),
+        )
+        return env_var_strict_mode
+
     def get_with_source(self, *args, **kwargs):
         """Get a setting value along with its source.
 
@@ -492,6 +556,7 @@ class SettingsService(ABC):  # noqa: WPS214
                 name, path, value, setting_def=setting_def
             )
         )
+        self.invalidate_snapshot()
 
         self.log(f"Set setting {name!r} with metadata: {metadata}")
         return value, metadata
@@ -539,6 +604,7 @@ class SettingsService(ABC):  # noqa: WPS214
             "setting": setting_def,
             **store.manager(self, **kwargs).unset(name, path, setting_def=setting_def),
         }
+        self.invalidate_snapshot()
 
         self.log(f"Unset setting {name!r} with metadata: {metadata}")
         return metadata
@@ -558,6 +624,7 @@ class SettingsService(ABC):  # noqa: WPS214
         manager = store.manager(self, **kwargs)
         reset_metadata = manager.reset()
         metadata.update(reset_metadata)
+        self.invalidate_snapshot()
 
         self.log(f"Reset settings with metadata: {metadata}")
         return metadata
@@ -601,13 +668,20 @@ class SettingsService(ABC):  # noqa: WPS214
             SettingMissingError: if the setting is not found
 
         """
+        definitions = self.definitions()
+        # Stores reset the definitions when `meltano.yml` changes, so the index is
+        # rebuilt whenever the definitions are
+        if self._setting_index is None or self._setting_index[0] is not definitions:
+            index: dict[str, SettingDefinition] = {}
+            for setting in definitions:
+                index.setdefault(setting.name, setting)
+                for alias in setting.aliases:
+                    index.setdefault(alias, setting)
+            self._setting_index = (definitions, index)
+
         try:
-            return next(
-                setting
-                for setting in self.definitions()
-                if setting.name == name or name in setting.aliases
-            )
-        except StopIteration as err:
+            return self._setting_index[1][name]
+        except KeyError as err:
             raise SettingMissingError(name) from err
 
     def setting_env_vars(self, setting_def, for_writing=False):
@@ -323,10 +323,11 @@ class BaseEnvStoreManager(SettingsStoreManager):
         if not setting_def:
             raise StoreNotSupportedError
 
+        env = self.env
         vals_with_metadata = []
         for env_var in self.setting_env_vars(setting_def):
             try:
-                value = env_var.get(self.env)
+                value = env_var.get(env)
                 vals_with_metadata.append((value, {"env_var": env_var.key}))
             except KeyError:
                 pass
@@ -8,12 +8,14 @@ from __future__ import annotations
 
 import datetime
 import json
-from typing import Any
+from fnmatch import fnmatchcase
+from typing import Any, Iterable
 
 import structlog
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
-from meltano.core.job import Job, Payload, State
+from meltano.core.job import Job, JobFinder, Payload, State
 from meltano.core.job_state import SINGER_STATE_KEY, JobState
 from meltano.core.project import Project
 from meltano.core.project_settings_service import ProjectSettingsService
@@ -53,10 +55,7 @@ class StateService:  # noqa: WPS214
         Returns:
             A dict with state_ids as keys and state payloads as values.
         """
-        return {
-            state_id: self.get_state(state_id)
-            for state_id in self.state_store_manager.get_state_ids(state_id_pattern)
-        }
+        return self.get_states(self.state_store_manager.get_state_ids(state_id_pattern))
 
     def _get_or_create_job(self, job: Job | str) -> Job:
         """If Job is passed, return it. If state_id is passed, create new and return.
@@ -157,6 +156,20 @@ class StateService:  # noqa: WPS214
             return json.loads(state.json_merged())
         return {}
 
+    def get_states(self, state_ids: Iterable[str]) -> dict[str, dict]:
+        """Get state for each of the given state_ids in bulk.
+
+        Args:
+            state_ids: The state_ids to get state for
+
+        Returns:
+            A dict with state_ids as keys and state payloads as values.
+        """
+        return {
+            state_id: json.loads(state.json_merged()) if state else {}
+            for state_id, state in self.state_store_manager.get_many(state_ids).items()
+        }
+
     def set_state(self, state_id: str, new_state: str | None, validate: bool = True):
         """Set the state for the state_id.
 
@@ -181,6 +194,14 @@ class StateService:  # noqa: WPS214
         """
         self.state_store_manager.clear(state_id)
 
+    def clear_states(self, state_ids: Iterable[str]):
+        """Clear the state for each of the given state_ids in bulk.
+
+        Args:
+            state_ids: the state_ids to clear state for
+        """
+        self.state_store_manager.clear_many(state_ids)
+
     def merge_state(self, state_id_src: str, state_id_dst: str):
         """Merge state from state_id_src into state_id_dst.
 
@@ -214,3 +235,73 @@ class StateService:  # noqa: WPS214
         src_state = json.dumps(src_state_dict)
         self.set_state(state_id_dst, src_state)
         self.clear_state(state_id_src)
+
+    def compactable_state_ids(self, state_id_pattern: str | None = None) -> list[str]:
+        """List the state IDs with several finished runs holding state.
+
+        Args:
+            state_id_pattern: An optional glob-style pattern of state_ids to search for
+
+        Returns:
+            The state IDs whose state history can be compacted.
+        """
+        query = self.session.query(Job.job_name).filter(
+            (Job.payload_flags != 0) & Job.ended_at.isnot(None)  # noqa: WPS465
+        )
+        query = query.group_by(Job.job_name).having(func.count() > 1)
+        # Matched like state backends match state_ids when listing them
+        return [
+            state_id
+            for (state_id,) in query.order_by(Job.job_name)
+            if not state_id_pattern or fnmatchcase(state_id, state_id_pattern)
+        ]
+
+    def compact_state(self, state_id: str) -> int:
+        """Replace the state history of a state ID with its current state.
+
+        The state store holds the state of each state ID, updated whenever state
+        is written, so the state payloads of past runs are only needed to rebuild
+        it from the job history. They are removed, and the current state is
+        recorded as a single state edit instead.
+
+        Args:
+            state_id: the state_id to compact the state history of
+
+        Returns:
+            The number of runs whose state payload was removed.
+        """
+        state_jobs = JobFinder(state_id).with_payload(self.session).all()
+        if len(state_jobs) <= 1:
+            return 0
+
+        current_state = self.get_state(state_id)
+        for state_job in state_jobs:
+            payload = dict(state_job.payload)
+            payload.pop(SINGER_STATE_KEY, None)
+            state_job.payload = payload
+            state_job.payload_flags = 0
+
+        if current_state:
+            checkpoint = self._get_or_create_job(state_id)
+            checkpoint.payload = current_state
+            checkpoint.payload_flags = Payload.STATE
+            self.session.add(checkpoint)
+
+        self.session.commit()
+        logger.debug(
+            f"Compacted the state history of {state_id}, "
+            + f"removing the state of {len(state_jobs)} runs"
+        )
+        return len(state_jobs)
+
+    def compact_states(self, state_ids: Iterable[str]) -> dict[str, int]:
+        """Replace the state history of each of the given state_ids with its state.
+
+        Args:
+            state_ids: the state_ids to compact the state history of
+
+        Returns:
+            A dict with state_ids as keys and the number of runs whose state
+            payload was removed as values.
+        """
+        return {state_id: self.compact_state(state_id) for state_id in state_ids}
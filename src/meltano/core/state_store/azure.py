@@ -1,9 +1,13 @@
 """StateStoreManager for Azure Blob storage backend."""
 from __future__ import annotations
 
-import re
+from typing import Any, Iterator
 
-from meltano.core.state_store.filesystem import BaseFilesystemStateStoreManager
+from meltano.core.state_store.filesystem import (
+    BaseFilesystemStateStoreManager,
+    LockInfo,
+    naive_utc,
+)
 
 
 class AZStorageStateStoreManager(BaseFilesystemStateStoreManager):
@@ -73,29 +77,99 @@ class AZStorageStateStoreManager(BaseFilesystemStateStoreManager):
         """
         return self.prefix.lstrip(self.delimiter).rstrip(self.delimiter)
 
-    def get_state_ids(self, pattern: str | None = None):  # noqa: WPS210
-        """Get list of state_ids stored in the backend.
+    def create_lock(self, lock_path: str, content: str) -> Any | None:
+        """Atomically create the lock blob at the given path, if it doesn't exist.
+
+        Uses a write that fails if the blob already exists.
+
+        Args:
+            lock_path: the path of the lock blob
+            content: the timestamp and token to write to the lock blob
+
+        Returns:
+            The ETag of the created lock, or None if it already exists
+        """
+        from azure.core.exceptions import ResourceExistsError  # type: ignore
+
+        blob_client = self.client.get_blob_client(
+            container=self.container_name, blob=lock_path
+        )
+        try:
+            response = blob_client.upload_blob(content, overwrite=False)
+        except ResourceExistsError:
+            return None
+        return response["etag"]
+
+    def read_lock(self, lock_path: str) -> LockInfo | None:
+        """Read the lock blob at the given path.
+
+        Args:
+            lock_path: the path of the lock blob
+
+        Returns:
+            The lock, or None if it doesn't exist
+        """
+        from azure.core.exceptions import ResourceNotFoundError  # type: ignore
+
+        blob_client = self.client.get_blob_client(
+            container=self.container_name, blob=lock_path
+        )
+        try:
+            downloader = blob_client.download_blob()
+            content = downloader.readall()
+        except ResourceNotFoundError:
+            return None
+        return LockInfo(
+            content=content.decode(),
+            version=downloader.properties.etag,
+            modified_at=naive_utc(downloader.properties.last_modified),
+        )
+
+    def break_lock(self, lock_path: str, version: Any) -> bool:
+        """Delete the lock blob at the given path, if it hasn't changed.
+
+        Uses a delete conditional on the ETag of the lock.
+
+        Args:
+            lock_path: the path of the lock blob
+            version: the ETag of the lock, as read by `read_lock`
+
+        Returns:
+            True if the lock was deleted, False if it changed or doesn't exist
+        """
+        from azure.core import MatchConditions  # type: ignore
+        from azure.core.exceptions import (  # type: ignore
+            ResourceModifiedError,
+            ResourceNotFoundError,
+        )
+
+        blob_client = self.client.get_blob_client(
+            container=self.container_name, blob=lock_path
+        )
+        try:
+            blob_client.delete_blob(
+                etag=version, match_condition=MatchConditions.IfNotModified
+            )
+        except (ResourceModifiedError, ResourceNotFoundError):
+            return False
+        return True
+
+    def get_state_ids(self, pattern: str | None = None) -> Iterator[str]:
+        """Get state_ids stored in the backend.
+
+        Blobs are listed page by page under the literal prefix of pattern.
 
         Args:
             pattern: glob-style pattern to filter state_ids by
 
         Returns:
-            List of state_ids
+            Iterator of state_ids
         """
-        if pattern:
-            pattern_re = re.compile(pattern.replace("*", ".*"))
-        state_ids = set()
         container_client = self.client.get_container_client(self.container_name)
-        for blob in container_client.list_blobs(
-            name_starts_with=self.prefix.lstrip("/")
-        ):
-            (state_id, filename) = blob.name.split("/")[-2:]
-            if filename == "state.json":
-                if not pattern:
-                    state_ids.add(state_id)
-                elif pattern_re.match(state_id):
-                    state_ids.add(state_id)
-        return list(state_ids)
+        blobs = container_client.list_blobs(
+            name_starts_with=self.get_list_prefix(pattern)
+        )
+        return self.state_ids_from_paths((blob.name for blob in blobs), pattern)
 
     def delete(self, file_path: str):
         """Delete the file/blob at the given path.
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod, abstractproperty
+from typing import Iterable
 
 from meltano.core.job_state import JobState
 
@@ -68,6 +69,41 @@ class StateStoreManager(ABC):
         """
         ...
 
+    def set_many(self, states: Iterable[JobState]):
+        """Set the job state for each of the given states.
+
+        Backends should override this if they can write several states at once.
+
+        Args:
+            states: the states to set.
+        """
+        for state in states:
+            self.set(state)
+
+    def get_many(self, state_ids: Iterable[str]) -> dict[str, JobState | None]:
+        """Get the job state for each of the given state_ids.
+
+        Backends should override this if they can read several states at once.
+
+        Args:
+            state_ids: the state_ids to get state for.
+
+        Returns:
+            A dict mapping each state_id to its state, or None if it has no state.
+        """
+        return {state_id: self.get(state_id) for state_id in state_ids}
+
+    def clear_many(self, state_ids: Iterable[str]):
+        """Clear state for each of the given state_ids.
+
+        Backends should override this if they can clear several states at once.
+
+        Args:
+            state_ids: the state_ids to clear state for.
+        """
+        for state_id in state_ids:
+            self.clear(state_id)
+
     @abstractmethod
     def get_state_ids(self, pattern=None):
         """Get all state_ids available in this state store manager.
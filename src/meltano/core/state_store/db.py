@@ -1,6 +1,8 @@
 """StateStoreManager for systemdb state backend."""
 from __future__ import annotations
 
+from typing import Iterable
+
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
@@ -30,28 +32,26 @@ class DBStateStoreManager(StateStoreManager):
         Args:
             state: the state to set.
         """
-        existing_job_state = (
-            self.session.query(JobState)
-            .filter(JobState.state_id == state.state_id)
-            .first()
-        )
-        partial_state = state.partial_state
-        completed_state = state.completed_state
-        if existing_job_state:
-            if existing_job_state.partial_state and not state.is_complete():
-                partial_state = merge(
-                    state.partial_state, existing_job_state.partial_state
-                )
-            if not state.is_complete():
-                completed_state = existing_job_state.completed_state
-        new_job_state = JobState(
-            state_id=state.state_id,
-            partial_state=partial_state,
-            completed_state=completed_state,
-        )
-        if existing_job_state:
-            self.session.delete(existing_job_state)
-        self.session.add(new_job_state)
+        self.set_many([state])
+
+    def set_many(self, states: Iterable[JobState]) -> None:
+        """Set the job state for each of the given states in a single transaction.
+
+        Args:
+            states: the states to set.
+        """
+        states = list(states)
+        existing_job_states = self._query_many(state.state_id for state in states)
+        for state in states:
+            existing_job_state = existing_job_states.get(state.state_id)
+            new_job_state = self._merge(state, existing_job_state)
+            if existing_job_state in self.session.new:
+                # The same state_id was already set earlier in this batch
+                self.session.expunge(existing_job_state)
+            elif existing_job_state:
+                self.session.delete(existing_job_state)
+            self.session.add(new_job_state)
+            existing_job_states[state.state_id] = new_job_state
         self.session.commit()
 
     def get(self, state_id):
@@ -67,17 +67,42 @@ class DBStateStoreManager(StateStoreManager):
             self.session.query(JobState).filter(JobState.state_id == state_id).first()
         )
 
+    def get_many(self, state_ids: Iterable[str]) -> dict[str, JobState | None]:
+        """Get the job state for each of the given state_ids in a single query.
+
+        Args:
+            state_ids: the state_ids to get state for
+
+        Returns:
+            A dict mapping each state_id to its state, or None if it has no state.
+        """
+        state_ids = list(state_ids)
+        job_states = self._query_many(state_ids)
+        return {state_id: job_states.get(state_id) for state_id in state_ids}
+
     def clear(self, state_id):
         """Clear state for the given state_id.
 
         Args:
             state_id: the state_id to clear state for
         """
-        job_state: JobState | None = (
-            self.session.query(JobState).filter(JobState.state_id == state_id).first()
+        self.clear_many([state_id])
+
+    def clear_many(self, state_ids: Iterable[str]):
+        """Clear state for each of the given state_ids in a single statement.
+
+        Args:
+            state_ids: the state_ids to clear state for
+        """
+        state_ids = list(state_ids)
+        if not state_ids:
+            return
+        deleted = (
+            self.session.query(JobState)
+            .filter(JobState.state_id.in_(state_ids))
+            .delete(synchronize_session="fetch")
         )
-        if job_state:
-            self.session.delete(job_state)
+        if deleted:
             self.session.commit()
 
     def get_state_ids(self, pattern: str | None = None):
@@ -101,6 +126,34 @@ class DBStateStoreManager(StateStoreManager):
             for record in self.session.execute(select(JobState.state_id)).all()
         )
 
+    def _query_many(self, state_ids: Iterable[str]) -> dict[str, JobState]:
+        state_ids = list(state_ids)
+        if not state_ids:
+            return {}
+        return {
+            job_state.state_id: job_state
+            for job_state in self.session.query(JobState).filter(
+                JobState.state_id.in_(state_ids)
+            )
+        }
+
+    @staticmethod
+    def _merge(state: JobState, existing_job_state: JobState | None) -> JobState:
+        partial_state = state.partial_state
+        completed_state = state.completed_state
+        if existing_job_state:
+            if existing_job_state.partial_state and not state.is_complete():
+                partial_state = merge(
+                    state.partial_state, existing_job_state.partial_state
+                )
+            if not state.is_complete():
+                completed_state = existing_job_state.completed_state
+        return JobState(
+            state_id=state.state_id,
+            partial_state=partial_state,
+            completed_state=completed_state,
+        )
+
     def acquire_lock(self, state_id):
         """Acquire a naive lock for the given job's state.
 
@@ -4,20 +4,26 @@ from __future__ import annotations
 import glob
 import logging
 import os
+import random
 import re
 import shutil
+import uuid
 from abc import abstractmethod, abstractproperty
 from base64 import b64decode, b64encode
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from fnmatch import fnmatchcase
 from functools import reduce
 from io import TextIOWrapper
 from pathlib import Path
 from time import sleep
+from typing import Any, NamedTuple
 from urllib.parse import urlparse
 
-from smart_open import open  # type: ignore
+import fasteners
+from atomicwrites import atomic_write
 
 from meltano.core.job_state import JobState
 from meltano.core.state_store.base import StateStoreManager
@@ -25,14 +31,42 @@ from meltano.core.state_store.base import StateStoreManager
 logger = logging.getLogger(__name__)
 
 
+GLOB_SPECIAL_CHARACTERS = re.compile(r"[*?[]")
+
+
 class InvalidStateBackendConfigurationException:
     """Occurs when state backend configuration is invalid."""
 
 
+class LockInfo(NamedTuple):
+    """A lock file/blob, as read from the state backend."""
+
+    # The timestamp and token written to the lock, which may be empty or truncated
+    content: str
+    # The generation, ETag or equivalent, to only delete the lock that was read
+    version: Any
+    # When the lock was last modified, as a naive UTC datetime
+    modified_at: datetime
+
+
+def naive_utc(timestamp: datetime) -> datetime:
+    """Convert a timezone-aware datetime to a naive UTC datetime.
+
+    Args:
+        timestamp: the timezone-aware datetime
+
+    Returns:
+        The naive UTC datetime, comparable to `datetime.utcnow()`.
+    """
+    return timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+
+
 class BaseFilesystemStateStoreManager(StateStoreManager):  # noqa: WPS214
     """Base class for filesystem state backends."""
 
     delimiter = "/"
+    # Maximum number of concurrent reads/writes for bulk operations
+    max_workers = 16
 
     def __init__(self, uri: str, lock_timeout_seconds: int, **kwargs):
         """Initialize the BaseFilesystemStateStoreManager.
@@ -85,6 +119,9 @@ class BaseFilesystemStateStoreManager(StateStoreManager):  # noqa: WPS214
         Yields:
             A TextIOWrapper to read the file/blob.
         """
+        # smart_open imports the SDKs of all the storages it supports
+        from smart_open import open  # type: ignore
+
         if self.client:
             with open(
                 self.join_path(self.uri.rstrip(self.state_dir), path),
@@ -105,6 +142,9 @@ class BaseFilesystemStateStoreManager(StateStoreManager):  # noqa: WPS214
         Yields:
             A TextIOWrapper to read the file/blob.
         """
+        # smart_open imports the SDKs of all the storages it supports
+        from smart_open import open  # type: ignore
+
         try:
             with open(
                 self.join_path(self.uri.rstrip(self.state_dir), path),
@@ -185,29 +225,31 @@ class BaseFilesystemStateStoreManager(StateStoreManager):  # noqa: WPS214
     def is_locked(self, state_id: str) -> bool:
         """Indicate whether or not the given state_id is currently locked.
 
+        Expired locks are broken, but only if they haven't changed since they
+        were read, so that a lock just taken by another process is left alone.
+
         Args:
             state_id: the state_id to check
 
         Returns:
             True if locked, else False
-
-        Raises:
-            Exception: if error not indicating file is not found is thrown
         """
         lock_path = self.get_lock_path(state_id)
+        lock = self.read_lock(lock_path)
+        if lock is None:
+            return False
+
         try:
-            with self.get_reader(lock_path) as reader:
-                locked_at = datetime.fromtimestamp(float(reader.read()))
-                if locked_at and locked_at < datetime.utcnow() - timedelta(
-                    seconds=self.lock_timeout_seconds
-                ):
-                    self.delete(lock_path)
-                    return False
-                return True
-        except Exception as e:
-            if self.is_file_not_found_error(e):
-                return False
-            raise e
+            locked_at = datetime.fromtimestamp(float(lock.content.partition("\n")[0]))
+        except ValueError:
+            # The lock is being written, or was left empty or truncated by a
+            # process that was killed, so it expires based on its age instead
+            locked_at = lock.modified_at
+
+        if locked_at < datetime.utcnow() - timedelta(seconds=self.lock_timeout_seconds):
+            self.break_lock(lock_path, lock.version)
+            return False
+        return True
 
     def create_state_id_dir_if_not_exists(self, state_id: str):
         """Create the directory or prefix for a given state_id.
@@ -220,44 +262,144 @@ class BaseFilesystemStateStoreManager(StateStoreManager):  # noqa: WPS214
         """
         ...
 
+    @abstractmethod
+    def create_lock(self, lock_path: str, content: str) -> Any | None:
+        """Atomically create the lock file/blob at the given path, if it doesn't exist.
+
+        Args:
+            lock_path: the path of the lock file/blob
+            content: the timestamp and token to write to the lock file/blob
+
+        Returns:
+            The version of the created lock, or None if it already exists
+        """
+        ...
+
+    @abstractmethod
+    def read_lock(self, lock_path: str) -> LockInfo | None:
+        """Read the lock file/blob at the given path.
+
+        Args:
+            lock_path: the path of the lock file/blob
+
+        Returns:
+            The lock, or None if it doesn't exist
+        """
+        ...
+
+    @abstractmethod
+    def break_lock(self, lock_path: str, version: Any) -> bool:
+        """Delete the lock file/blob at the given path, if it hasn't changed.
+
+        Args:
+            lock_path: the path of the lock file/blob
+            version: the version of the lock, as read by `read_lock`
+
+        Returns:
+            True if the lock was deleted, False if it changed or doesn't exist
+        """
+        ...
+
     @contextmanager
-    def acquire_lock(self, state_id: str, retry_seconds: int = 1) -> Iterator[None]:
+    def acquire_lock(
+        self,
+        state_id: str,
+        retry_seconds: float = 0.1,
+        max_retry_seconds: float = 5,
+    ) -> Iterator[None]:
         """Context manager for locking state_id during reads and writes.
 
+        The lock is taken with an atomic create-if-absent write, so it is safe
+        to use from many concurrent pipelines. Waiters back off exponentially
+        while the lock is held, and expired locks are broken. The lock holds a
+        token of its own, and is released like expired locks are broken, so a
+        holder whose lock expired never deletes the lock of the next holder.
+
         Args:
             state_id: the state_id to lock.
-            retry_seconds: seconds to wait between retries
+            retry_seconds: seconds to wait before the first retry
+            max_retry_seconds: maximum seconds to wait between retries
 
         Yields:
             None
         """
         lock_path = self.get_lock_path(state_id)
+        self.create_state_id_dir_if_not_exists(state_id)
+
+        token = uuid.uuid4().hex
+        delay = retry_seconds
+        version = None
+        while version is None:
+            version = self.create_lock(
+                lock_path, f"{datetime.utcnow().timestamp()}\n{token}"
+            )
+            # `is_locked` deletes the lock if it has expired
+            if version is None and self.is_locked(state_id):
+                sleep(delay * random.uniform(0.5, 1))  # noqa: S311
+                delay = min(delay * 2, max_retry_seconds)
         try:
-            self.create_state_id_dir_if_not_exists(state_id)
-
-            while self.is_locked(state_id):
-                sleep(retry_seconds)
-            with self.get_writer(lock_path) as writer:
-                writer.write(str(datetime.utcnow().timestamp()))
             yield
         finally:
-            self.delete(lock_path)
+            if not self.break_lock(lock_path, version):
+                logger.warning(f"Lock for {state_id} expired before it was released")
 
     @abstractmethod
-    def get_state_ids(self, pattern: str | None = None) -> list[str]:
-        """Get list of state_ids stored in the backend.
+    def get_state_ids(self, pattern: str | None = None) -> Iterable[str]:
+        """Get state_ids stored in the backend.
 
         Args:
             pattern: glob-style pattern to filter state_ids by
 
         Returns:
-            List of state_ids
+            Iterable of state_ids
         """
         ...
 
+    def get_list_prefix(self, pattern: str | None = None) -> str:
+        """Get the prefix to list blobs under to find state_ids matching pattern.
+
+        The literal part of the pattern, up to its first wildcard, narrows the
+        listing so it can be done server-side.
+
+        Args:
+            pattern: glob-style pattern to filter state_ids by
+
+        Returns:
+            The prefix to list blobs under.
+        """
+        literal = GLOB_SPECIAL_CHARACTERS.split(pattern, 1)[0] if pattern else ""
+        if not self.state_dir:
+            return literal
+        return f"{self.state_dir}{self.delimiter}{literal}"
+
+    def state_ids_from_paths(
+        self, paths: Iterable[str], pattern: str | None = None
+    ) -> Iterator[str]:
+        """Extract the state_ids from an iterable of blob paths.
+
+        Only paths of state files are considered, and state_ids are lazily
+        filtered by pattern, so listings can be streamed page by page.
+
+        Args:
+            paths: the blob paths
+            pattern: glob-style pattern to filter state_ids by
+
+        Yields:
+            The state_ids whose state file is in paths.
+        """
+        for path in paths:
+            state_id, filename = path.split(self.delimiter)[-2:]
+            if filename != "state.json":
+                continue
+            if not pattern or fnmatchcase(state_id, pattern):
+                yield state_id
+
     def get(self, state_id: str) -> JobState | None:
         """Get current state for the given state_id.
 
+        Reads don't take the state_id lock, as writes never leave a partially
+        written state file/blob behind.
+
         Args:
             state_id: the state_id to get state fore.
 
@@ -268,15 +410,15 @@ class BaseFilesystemStateStoreManager(StateStoreManager):  # noqa: WPS214
             Exception: if error not indicating file is not found is thrown
         """
         logger.info(f"Reading state from {self.label}")
-        with self.acquire_lock(state_id):
-            try:
-                with self.get_reader(self.get_state_path(state_id)) as reader:
-                    return JobState.from_file(state_id, reader)
-            except Exception as e:
-                if self.is_file_not_found_error(e):
-                    logger.info(f"No state found for {state_id}.")
-                    return None
-                raise e
+        # No lock is needed: state files/blobs are always replaced atomically
+        try:
+            with self.get_reader(self.get_state_path(state_id)) as reader:
+                return JobState.from_file(state_id, reader)
+        except Exception as e:
+            if self.is_file_not_found_error(e):
+                logger.info(f"No state found for {state_id}.")
+                return None
+            raise e
 
     def set(self, state: JobState):
         """Set state for the given state_id.
@@ -306,6 +448,44 @@ class BaseFilesystemStateStoreManager(StateStoreManager):  # noqa: WPS214
             with self.get_writer(filepath) as writer:
                 writer.write(state_to_write.json())
 
+    def set_many(self, states: Iterable[JobState]):
+        """Set state for each of the given states concurrently.
+
+        Args:
+            states: the states to set
+        """
+        self._map_concurrently(self.set, states)
+
+    def get_many(self, state_ids: Iterable[str]) -> dict[str, JobState | None]:
+        """Get current state for each of the given state_ids concurrently.
+
+        Args:
+            state_ids: the state_ids to get state for.
+
+        Returns:
+            A dict mapping each state_id to its state, or None if it has no state.
+        """
+        state_ids = list(state_ids)
+        return dict(zip(state_ids, self._map_concurrently(self.get, state_ids)))
+
+    def clear_many(self, state_ids: Iterable[str]):
+        """Clear state for each of the given state_ids concurrently.
+
+        Args:
+            state_ids: the state_ids to clear state for.
+        """
+        self._map_concurrently(self.clear, state_ids)
+
+    def _map_concurrently(self, func, items: Iterable) -> list:
+        items = list(items)
+        if len(items) <= 1:
+            return [func(item) for item in items]
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(items))
+        ) as executor:
+            return list(executor.map(func, items))
+
     @abstractmethod
     def delete(self, file_or_dir_path: str):
         """Delete the file/blob/directory/prefix at the given path.
@@ -392,6 +572,99 @@ class LocalFilesystemStateStoreManager(BaseFilesystemStateStoreManager):  # noqa
         """
         Path(self.get_state_dir(state_id)).mkdir(parents=True, exist_ok=True)
 
+    @contextmanager
+    def get_writer(self, path: str) -> Iterator[TextIOWrapper]:
+        """Get an atomic writer for given path.
+
+        The file is only replaced once it has been written completely, so
+        readers never see a partially written file.
+
+        Args:
+            path: the path to get writer for.
+
+        Yields:
+            A TextIOWrapper to write the file.
+        """
+        with atomic_write(path, overwrite=True) as writer:
+            yield writer
+
+    def guard_lock(self, lock_path: str) -> fasteners.InterProcessLock:
+        """Get the inter-process lock guarding changes to the lock file.
+
+        Lock files are created and deleted while holding it, so that a lock file
+        can be deleted only if it has the content that was read.
+
+        Args:
+            lock_path: the path of the lock file
+
+        Returns:
+            The inter-process lock.
+        """
+        return fasteners.InterProcessLock(f"{lock_path}.guard")
+
+    def create_lock(self, lock_path: str, content: str) -> Any | None:
+        """Atomically create the lock file at the given path, if it doesn't exist.
+
+        Args:
+            lock_path: the path of the lock file
+            content: the timestamp and token to write to the lock file
+
+        Returns:
+            The content of the lock file, which is its version, or None if it
+            already exists
+        """
+        with self.guard_lock(lock_path):
+            try:
+                fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                return None
+            with os.fdopen(fd, "w") as lock_file:
+                lock_file.write(content)
+        return content
+
+    def read_lock(self, lock_path: str) -> LockInfo | None:
+        """Read the lock file at the given path.
+
+        Args:
+            lock_path: the path of the lock file
+
+        Returns:
+            The lock, or None if it doesn't exist
+        """
+        try:
+            with open(lock_path) as lock_file:
+                stat = os.fstat(lock_file.fileno())
+                content = lock_file.read()
+        except FileNotFoundError:
+            return None
+        # The token makes the content unique to each lock
+        return LockInfo(
+            content=content,
+            version=content,
+            modified_at=datetime.utcfromtimestamp(stat.st_mtime),
+        )
+
+    def break_lock(self, lock_path: str, version: Any) -> bool:
+        """Delete the lock file at the given path, if it hasn't changed.
+
+        Args:
+            lock_path: the path of the lock file
+            version: the version of the lock, as read by `read_lock`
+
+        Returns:
+            True if the lock was deleted, False if it changed or doesn't exist
+        """
+        with self.guard_lock(lock_path):
+            try:
+                with open(lock_path) as lock_file:
+                    if lock_file.read() != version:
+                        # Another process took the lock since it was read
+                        return False
+            except FileNotFoundError:
+                return False
+            os.remove(lock_path)
+        return True
+
     def get_state_ids(self, pattern: str | None = None):
         """Get list of state_ids stored in the backend.
 
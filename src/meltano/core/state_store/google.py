@@ -1,9 +1,13 @@
 """StateStoreManager for Google Cloud storage backend."""
 from __future__ import annotations
 
-import re
+from typing import Any, Iterator
 
-from meltano.core.state_store.filesystem import BaseFilesystemStateStoreManager
+from meltano.core.state_store.filesystem import (
+    BaseFilesystemStateStoreManager,
+    LockInfo,
+    naive_utc,
+)
 
 
 class GCSStateStoreManager(BaseFilesystemStateStoreManager):
@@ -76,26 +80,94 @@ class GCSStateStoreManager(BaseFilesystemStateStoreManager):
         """
         return self.prefix.lstrip(self.delimiter).rstrip(self.delimiter)
 
-    def get_state_ids(self, pattern: str | None = None):  # noqa: WPS210
-        """Get list of state_ids stored in the backend.
+    def create_lock(self, lock_path: str, content: str) -> Any | None:
+        """Atomically create the lock blob at the given path, if it doesn't exist.
+
+        Uses a write conditional on the blob having no live generation.
+
+        Args:
+            lock_path: the path of the lock blob
+            content: the timestamp and token to write to the lock blob
+
+        Returns:
+            The generation of the created lock, or None if it already exists
+        """
+        from google.api_core.exceptions import PreconditionFailed  # type: ignore
+
+        blob = self.client.bucket(self.bucket).blob(lock_path)
+        try:
+            blob.upload_from_string(content, if_generation_match=0)
+        except PreconditionFailed:
+            return None
+        return blob.generation
+
+    def read_lock(self, lock_path: str) -> LockInfo | None:
+        """Read the lock blob at the given path.
+
+        Args:
+            lock_path: the path of the lock blob
+
+        Returns:
+            The lock, or None if it doesn't exist
+        """
+        from google.api_core.exceptions import (  # type: ignore
+            NotFound,
+            PreconditionFailed,
+        )
+
+        blob = self.client.bucket(self.bucket).get_blob(lock_path)
+        if blob is None:
+            return None
+        try:
+            content = blob.download_as_bytes(if_generation_match=blob.generation)
+        except (NotFound, PreconditionFailed):
+            # The lock was released or replaced since its metadata was read
+            return None
+        return LockInfo(
+            content=content.decode(),
+            version=blob.generation,
+            modified_at=naive_utc(blob.updated),
+        )
+
+    def break_lock(self, lock_path: str, version: Any) -> bool:
+        """Delete the lock blob at the given path, if it hasn't changed.
+
+        Uses a delete conditional on the generation of the lock.
+
+        Args:
+            lock_path: the path of the lock blob
+            version: the generation of the lock, as read by `read_lock`
+
+        Returns:
+            True if the lock was deleted, False if it changed or doesn't exist
+        """
+        from google.api_core.exceptions import (  # type: ignore
+            NotFound,
+            PreconditionFailed,
+        )
+
+        blob = self.client.bucket(self.bucket).blob(lock_path)
+        try:
+            blob.delete(if_generation_match=version)
+        except (NotFound, PreconditionFailed):
+            return False
+        return True
+
+    def get_state_ids(self, pattern: str | None = None) -> Iterator[str]:
+        """Get state_ids stored in the backend.
+
+        Blobs are listed page by page under the literal prefix of pattern.
 
         Args:
             pattern: glob-style pattern to filter state_ids by
 
         Returns:
-            List of state_ids
+            Iterator of state_ids
         """
-        if pattern:
-            pattern_re = re.compile(pattern.replace("*", ".*"))
-        state_ids = set()
-        for blob in self.client.list_blobs(bucket_or_name=self.bucket):
-            (state_id, filename) = blob.name.split("/")[-2:]
-            if filename == "state.json":
-                if not pattern:
-                    state_ids.add(state_id)
-                elif pattern_re.match(state_id):
-                    state_ids.add(state_id)
-        return list(state_ids)
+        blobs = self.client.list_blobs(
+            bucket_or_name=self.bucket, prefix=self.get_list_prefix(pattern)
+        )
+        return self.state_ids_from_paths((blob.name for blob in blobs), pattern)
 
     def delete(self, file_path: str):
         """Delete the file/blob at the given path.
@@ -1,13 +1,50 @@
 """StateStoreManager for S3 cloud storage backend."""
 from __future__ import annotations
 
-import re
+from typing import Any, Iterator
 
 from meltano.core.state_store.filesystem import (
     BaseFilesystemStateStoreManager,
     InvalidStateBackendConfigurationException,
+    LockInfo,
+    naive_utc,
 )
 
+# Parameters of conditional requests, and the headers they are sent as
+CONDITIONAL_HEADERS = {"IfNoneMatch": "If-None-Match", "IfMatch": "If-Match"}
+
+
+def _pop_conditional_params(params: dict, context: dict, **kwargs) -> None:
+    context["conditional_headers"] = {
+        header: params.pop(param)
+        for param, header in CONDITIONAL_HEADERS.items()
+        if param in params
+    }
+
+
+def _add_conditional_headers(params: dict, context: dict, **kwargs) -> None:
+    params["headers"].update(context.get("conditional_headers", {}))
+
+
+def register_conditional_headers(client) -> None:
+    """Send `IfNoneMatch` and `IfMatch` parameters as request headers.
+
+    Only botocore 1.35 and later, which require Python 3.8, know about these
+    parameters of `put_object` and `delete_object`, so they are taken out of
+    the parameters before they are validated, and added to the headers of the
+    request.
+
+    Args:
+        client: the S3 client.
+    """
+    for operation in ("PutObject", "DeleteObject"):
+        client.meta.events.register(
+            f"provide-client-params.s3.{operation}", _pop_conditional_params
+        )
+        client.meta.events.register(
+            f"before-call.s3.{operation}", _add_conditional_headers
+        )
+
 
 class S3StateStoreManager(BaseFilesystemStateStoreManager):
     """State backend for S3."""
@@ -84,6 +121,12 @@ class S3StateStoreManager(BaseFilesystemStateStoreManager):
                 raise InvalidStateBackendConfigurationException(
                     "AWS access key ID configured, but no AWS secret access key."
                 )
+            else:
+                # Use default authentication in environment
+                from boto3 import client
+
+                self._client = client("s3", endpoint_url=self.endpoint_url)
+            register_conditional_headers(self._client)
         return self._client
 
     @property
@@ -95,30 +138,118 @@ class S3StateStoreManager(BaseFilesystemStateStoreManager):
         """
         return self.prefix.lstrip(self.delimiter).rstrip(self.delimiter)
 
-    def get_state_ids(self, pattern: str | None = None):
-        """Get list of state_ids stored in the backend.
+    def create_lock(self, lock_path: str, content: str) -> Any | None:
+        """Atomically create the lock blob at the given path, if it doesn't exist.
+
+        Uses a conditional `If-None-Match: *` write.
+
+        Args:
+            lock_path: the path of the lock blob
+            content: the timestamp and token to write to the lock blob
+
+        Returns:
+            The ETag of the created lock, or None if it already exists
+
+        Raises:
+            ClientError: if error not indicating the lock exists is thrown
+        """
+        from botocore.exceptions import ClientError  # type: ignore
+
+        try:
+            response = self.client.put_object(
+                Bucket=self.bucket,
+                Key=lock_path,
+                Body=content.encode(),
+                IfNoneMatch="*",
+            )
+        except ClientError as err:
+            if err.response["Error"]["Code"] in {
+                "PreconditionFailed",
+                "ConditionalRequestConflict",
+            }:
+                return None
+            raise err
+        return response["ETag"]
+
+    def read_lock(self, lock_path: str) -> LockInfo | None:
+        """Read the lock blob at the given path.
+
+        Args:
+            lock_path: the path of the lock blob
+
+        Returns:
+            The lock, or None if it doesn't exist
+
+        Raises:
+            ClientError: if error not indicating the lock doesn't exist is thrown
+        """
+        from botocore.exceptions import ClientError  # type: ignore
+
+        try:
+            response = self.client.get_object(Bucket=self.bucket, Key=lock_path)
+        except ClientError as err:
+            if err.response["Error"]["Code"] == "NoSuchKey":
+                return None
+            raise err
+        return LockInfo(
+            content=response["Body"].read().decode(),
+            version=response["ETag"],
+            modified_at=naive_utc(response["LastModified"]),
+        )
+
+    def break_lock(self, lock_path: str, version: Any) -> bool:
+        """Delete the lock blob at the given path, if it hasn't changed.
+
+        Uses a conditional `If-Match` delete on the ETag of the lock.
+
+        Args:
+            lock_path: the path of the lock blob
+            version: the ETag of the lock, as read by `read_lock`
+
+        Returns:
+            True if the lock was deleted, False if it changed or doesn't exist
+
+        Raises:
+            ClientError: if error not indicating the lock changed is thrown
+        """
+        from botocore.exceptions import ClientError  # type: ignore
+
+        try:
+            self.client.delete_object(
+                Bucket=self.bucket, Key=lock_path, IfMatch=version
+            )
+        except ClientError as err:
+            if err.response["Error"]["Code"] in {
+                "PreconditionFailed",
+                "ConditionalRequestConflict",
+                "NoSuchKey",
+            }:
+                return False
+            raise err
+        return True
+
+    def get_state_ids(self, pattern: str | None = None) -> Iterator[str]:
+        """Get state_ids stored in the backend.
+
+        Objects are listed page by page under the literal prefix of pattern.
 
         Args:
             pattern: glob-style pattern to filter state_ids by
 
         Returns:
-            List of state_ids
+            Iterator of state_ids
         """
-        if pattern:
-            pattern_re = re.compile(pattern.replace("*", ".*"))
-        state_ids = set()
-        for state_obj in self.client.list_objects_v2(
-            Bucket=self.bucket, Prefix=self.prefix
-        ).get("Contents", []):
-            (state_id, filename) = state_obj["Key"].split("/")[-2:]
-            if filename == "state.json":
-                if not pattern:
-                    state_ids.add(
-                        state_id.replace(self.prefix, "").replace("/state.json", "")
-                    )
-                elif pattern_re.match(state_id):
-                    state_ids.add(state_id)
-        return list(state_ids)
+        pages = self.client.get_paginator("list_objects_v2").paginate(
+            Bucket=self.bucket, Prefix=self.get_list_prefix(pattern)
+        )
+        return self.state_ids_from_paths(
+            (
+                state_obj["Key"]
+                for page in pages
+                for state_obj in page.get("Contents", [])
+            ),
+            pattern,
+        )
 
     def delete(self, file_path: str):
         """Delete the file/blob at the given path.
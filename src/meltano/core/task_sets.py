@@ -14,6 +14,18 @@ from meltano.core.behavior.canonical import Canonical
 logger = structlog.getLogger(__name__)
 
 
+PARALLEL_GROUP_KEY = "parallel"
+
+# How many tasks of a parallel group run at a time, unless the job sets it
+DEFAULT_PARALLEL_GROUP_PARALLELISM = 4
+
+TASK_JSON_SCHEMA = {
+    "oneOf": [
+        {"type": "string"},
+        {"type": "array", "items": {"type": "string"}},
+    ]
+}
+
 TASKS_JSON_SCHEMA = {
     "oneOf": [
         {"type": "string"},
@@ -21,8 +33,18 @@ TASKS_JSON_SCHEMA = {
             "type": "array",
             "items": {
                 "oneOf": [
-                    {"type": "string"},
-                    {"type": "array", "items": {"type": "string"}},
+                    *TASK_JSON_SCHEMA["oneOf"],
+                    {
+                        "type": "object",
+                        "properties": {
+                            PARALLEL_GROUP_KEY: {
+                                "type": "array",
+                                "items": TASK_JSON_SCHEMA,
+                            },
+                        },
+                        "required": [PARALLEL_GROUP_KEY],
+                        "additionalProperties": False,
+                    },
                 ]
             },
         },
@@ -46,7 +68,9 @@ class InvalidTasksError(Exception):
 
 def _flat_split(items):
     for el in items:
-        if isinstance(el, Iterable) and not isinstance(el, str):
+        if isinstance(el, dict):
+            yield from _flat_split(el[PARALLEL_GROUP_KEY])
+        elif isinstance(el, Iterable) and not isinstance(el, str):
             yield from _flat_split(el)
         else:
             if " " in el:
@@ -58,17 +82,25 @@ def _flat_split(items):
 class TaskSets(NameEq, Canonical):
     """A job is a named entity that holds one or more Task's that can be executed by meltano."""
 
-    def __init__(self, name: str, tasks: list[str] | list[list[str]]):
+    def __init__(
+        self,
+        name: str,
+        tasks: list[str] | list[list[str]],
+        parallelism: int | None = None,
+    ):
         """Initialize a TaskSets.
 
         Args:
             name: The name of the job.
             tasks: The tasks that associated with this job.
+            parallelism: The maximum number of extract/load block sets of this
+                job to run concurrently.
         """
         super().__init__()
 
         self.name = name
         self.tasks = tasks
+        self.parallelism = parallelism
 
     def _as_args(self, preserve_top_level: bool = False) -> list[str] | list[list[str]]:
         """Convert the job's tasks into invocable representations, suitable for passing as a cli args or block names.
@@ -83,12 +115,42 @@ class TaskSets(NameEq, Canonical):
             return list(_flat_split(self.tasks))
 
         flattened = []
+        for stage in self.stages:
+            flattened.extend(stage)
+        return flattened
+
+    @property
+    def stages(self) -> list[list[list[str]]]:
+        """Convert the job's tasks into stages to run one after the other.
+
+        A stage is made of the run arguments of each of its tasks. Parallel groups
+        are a stage of their own, whose tasks can run concurrently.
+
+        Example:
+            TaskSets(name="foo", tasks=["tap trgt", {"parallel": ["tap2 trgt", "tap3 trgt"]}]).stages
+            -> [[["tap", "trgt"]], [["tap2", "trgt"], ["tap3", "trgt"]]]
+
+        Returns:
+            The run arguments of the tasks of each stage.
+        """
+        stages = []
         for task in self.tasks:
-            if isinstance(task, str):
-                flattened.append(task.split(" "))
+            if isinstance(task, dict):
+                stages.append(
+                    [list(_flat_split([chain])) for chain in task[PARALLEL_GROUP_KEY]]
+                )
             else:
-                flattened.append(list(_flat_split(task)))
-        return flattened
+                stages.append([list(_flat_split([task]))])
+        return stages
+
+    @property
+    def has_parallel_groups(self) -> bool:
+        """Whether any of the job's tasks is a parallel group.
+
+        Returns:
+            True if the job has parallel groups.
+        """
+        return any(isinstance(task, dict) for task in self.tasks)
 
     @property
     def flat_args(self) -> list[str]:
@@ -106,6 +168,8 @@ class TaskSets(NameEq, Canonical):
     def flat_args_per_set(self) -> list[str] | list[list[str]]:
         """Convert the job's tasks into perk task representations (preserving top level list hierarchy).
 
+        Each task of a parallel group is a set of its own.
+
         Example:
             TaskSets(name="foo", tasks=[["tap trgt"], ["some:cmd"]).flat_args_per_set -> [["tap", "trgt"], ["some:cmd"]]
 
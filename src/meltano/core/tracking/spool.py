@@ -0,0 +1,284 @@
+"""On-disk spool of telemetry events waiting to be sent."""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Callable
+
+import psutil
+import structlog
+from snowplow_tracker import Emitter
+
+from meltano.core.utils import hash_sha256
+
+logger = structlog.stdlib.get_logger(__name__)
+
+DEFAULT_MAX_EVENTS = 1000
+
+
+class TelemetrySpool:
+    """Bounded queue of telemetry events for a collector, stored on disk.
+
+    Events are appended as JSON lines to a spool file. To send them, a process
+    first claims the spool file by renaming it, so that concurrent invocations
+    don't send the same events. The claim is only removed once the events are
+    sent, or the ones that couldn't be sent are returned to the spool, so claims
+    of processes that exited while sending, e.g. on a flush timeout, are adopted
+    by the next process to claim the spool.
+
+    Delivery is at-least-once: the events of an adopted claim are all sent
+    again, including the ones that were sent before its process exited.
+
+    Claims are named after the ID and the creation time of their process, so
+    that a claim isn't taken for a live one when its PID is reused, e.g. by
+    containers that run Meltano with the same PID every time.
+    """
+
+    suffix = ".jsonl"
+    claim_suffix = ".claimed"
+    returned_infix = ".returned."
+
+    def __init__(
+        self,
+        spool_dir: Path,
+        collector: str,
+        max_events: int = DEFAULT_MAX_EVENTS,
+    ):
+        """Create a new telemetry spool.
+
+        Args:
+            spool_dir: The directory in which events are stored.
+            collector: The URL of the collector the events are sent to.
+            max_events: How many events are kept at most, dropping the oldest.
+        """
+        self.spool_dir = Path(spool_dir)
+        self.name = hash_sha256(collector)[:16]
+        self.max_events = max_events
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        """Return the path of the spool file.
+
+        Returns:
+            The path of the spool file, which may not exist.
+        """
+        return self.spool_dir.joinpath(f"{self.name}{self.suffix}")
+
+    @property
+    def pending(self) -> bool:
+        """Check whether there may be events waiting to be sent.
+
+        Returns:
+            True if the spool file, returned events or claims of exited
+            processes exist.
+        """
+        return self.path.exists() or any(self._claimable())
+
+    def append(self, payloads: list[dict[str, Any]]) -> None:
+        """Add events to the spool.
+
+        Args:
+            payloads: The Snowplow payloads of the events.
+        """
+        if not payloads:
+            return
+
+        lines = "".join(f"{json.dumps(payload)}\n" for payload in payloads)
+        try:
+            with self._lock:
+                self.spool_dir.mkdir(parents=True, exist_ok=True)
+                with self.path.open("a") as spool_file:
+                    spool_file.write(lines)
+        except OSError as err:
+            # Telemetry must never get in the way, so the events are dropped
+            logger.debug("Could not spool telemetry events", error=err)
+
+    def claim(self) -> tuple[list[Path], list[dict[str, Any]]]:
+        """Take the events out of the spool, to send them.
+
+        The claimed events stay on disk until `release` is called with the
+        returned claims.
+
+        Returns:
+            The claims, and the newest `max_events` claimed events, oldest first.
+        """
+        claims = []
+        for source in [*self._claimable(), self.path]:
+            # Renaming is atomic, so only one process can claim each file
+            claim_path = self.spool_dir.joinpath(
+                f"{self.name}.{_process_identity()}.{uuid.uuid4().hex}"
+                f"{self.claim_suffix}"
+            )
+            try:
+                with self._lock:
+                    os.replace(source, claim_path)
+            except FileNotFoundError:
+                continue
+            except OSError as err:
+                logger.debug("Could not claim spooled telemetry events", error=err)
+                continue
+            claims.append(claim_path)
+
+        payloads = []
+        for path in claims:
+            try:
+                with path.open() as claim_file:
+                    payloads.extend(self._parse(claim_file))
+            except OSError as err:
+                logger.debug("Could not read spooled telemetry events", error=err)
+
+        dropped = len(payloads) - self.max_events
+        if dropped > 0:
+            logger.debug("Dropping oldest spooled telemetry events", count=dropped)
+            payloads = payloads[dropped:]
+        return claims, payloads
+
+    def release(
+        self, claims: list[Path], unsent: list[dict[str, Any]] | None = None
+    ) -> None:
+        """Remove claims once their events are sent, returning the unsent ones.
+
+        Args:
+            claims: The claims returned by `claim`.
+            unsent: The claimed events that weren't sent.
+        """
+        if unsent:
+            try:
+                self._write_returned(unsent)
+            except OSError as err:
+                # Keep the claims, for the next invocation to adopt them
+                logger.debug("Could not return unsent telemetry events", error=err)
+                return
+
+        for path in claims:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                continue
+            except OSError as err:
+                logger.debug("Could not remove claimed telemetry events", error=err)
+
+    def _write_returned(self, payloads: list[dict[str, Any]]) -> None:
+        fd, tmp_name = tempfile.mkstemp(dir=self.spool_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as tmp_file:
+                tmp_file.writelines(f"{json.dumps(payload)}\n" for payload in payloads)
+            os.replace(
+                tmp_name,
+                self.spool_dir.joinpath(
+                    f"{self.name}{self.returned_infix}"
+                    f"{time.time_ns()}.{uuid.uuid4().hex}{self.suffix}"
+                ),
+            )
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
+    def _claimable(self):
+        # Claims of processes that exited, and then events returned unsent
+        for path in self.spool_dir.glob(f"{self.name}.*{self.claim_suffix}"):
+            pid, _, created = path.name.split(".")[1].partition("-")
+            if not (pid.isdigit() and created.isdigit()):
+                continue
+            try:
+                identity = _process_identity(int(pid))
+            except psutil.NoSuchProcess:
+                # The process exited
+                yield path
+                continue
+            except psutil.Error:
+                continue
+            if identity != f"{pid}-{created}":
+                # The PID was reused by another process
+                yield path
+        # Returned files are named after when they were returned
+        yield from sorted(
+            self.spool_dir.glob(f"{self.name}{self.returned_infix}*{self.suffix}")
+        )
+
+    @staticmethod
+    def _parse(lines) -> list[dict[str, Any]]:
+        payloads = []
+        for line in lines:
+            try:
+                payloads.append(json.loads(line))
+            except ValueError:
+                # An event cut short by a process getting killed
+                continue
+        return payloads
+
+
+def _process_identity(pid: int | None = None) -> str:
+    """Identify a process, in a way that survives the reuse of its PID.
+
+    Args:
+        pid: The ID of the process, the current one by default.
+
+    Returns:
+        The ID of the process and its creation time, in clock ticks.
+    """
+    process = psutil.Process(pid)
+    return f"{process.pid}-{round(process.create_time() * 100)}"
+
+
+class SpoolEmitter(Emitter):
+    """Snowplow emitter that spools events on disk instead of sending them.
+
+    Spooled events are sent by `send_spooled`, typically from a background
+    thread, so that tracking an event never waits on the collector.
+    """
+
+    def __init__(self, *args, spool: TelemetrySpool, **kwargs):
+        """Create a new spooling emitter.
+
+        Args:
+            args: Positional arguments of `snowplow_tracker.Emitter`.
+            spool: The spool in which events are stored until they are sent.
+            kwargs: Keyword arguments of `snowplow_tracker.Emitter`.
+        """
+        super().__init__(*args, **kwargs)
+        self.spool = spool
+
+    def flush(self) -> None:
+        """Move buffered events to the spool."""
+        with self.lock:
+            self.spool.append(self.buffer)
+            self.buffer = []
+            if self.bytes_queued is not None:
+                self.bytes_queued = 0
+
+    def send_spooled(self) -> bool:
+        """Send the spooled events to the collector, in order.
+
+        Sending stops at the first event that couldn't be sent, so that an
+        unreachable collector costs a single request timeout. The events that
+        weren't sent are put back in the spool. If the process exits while
+        sending, the claimed events are sent again by the next invocation.
+
+        Returns:
+            True if all spooled events were sent.
+        """
+        claims, payloads = self.spool.claim()
+        for idx, payload in enumerate(payloads):
+            self.attach_sent_timestamp([payload])
+            if not self.http_get(payload):
+                self.spool.release(claims, payloads[idx:])
+                self._callback(self.on_success, payloads[:idx])
+                self._callback(self.on_failure, idx, payloads[idx:])
+                return False
+
+        self.spool.release(claims)
+        self._callback(self.on_success, payloads)
+        return True
+
+    @staticmethod
+    def _callback(callback: Callable | None, *args) -> None:
+        if callback is not None and args[-1]:
+            callback(*args)
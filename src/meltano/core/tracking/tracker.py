@@ -6,6 +6,7 @@ import atexit
 import json
 import locale
 import re
+import threading
 import uuid
 from contextlib import contextmanager
 from datetime import datetime
@@ -18,7 +19,7 @@ import structlog
 import tzlocal
 from cached_property import cached_property
 from psutil import Process
-from snowplow_tracker import Emitter, SelfDescribingJson
+from snowplow_tracker import SelfDescribingJson
 from snowplow_tracker import Tracker as SnowplowTracker
 
 from meltano.core.project import Project
@@ -36,6 +37,7 @@ from meltano.core.tracking.schemas import (
     ExitEventSchema,
     TelemetryStateChangeEventSchema,
 )
+from meltano.core.tracking.spool import SpoolEmitter, TelemetrySpool
 from meltano.core.utils import format_exception
 
 URL_REGEX = (
@@ -43,6 +45,7 @@ URL_REGEX = (
 )
 
 MICROSECONDS_PER_SECOND = 1000000
+MILLISECONDS_PER_SECOND = 1000
 
 logger = structlog.get_logger(__name__)
 
@@ -80,7 +83,13 @@ class TelemetrySettings(NamedTuple):
 
 
 class Tracker:  # noqa: WPS214 - too many methods
-    """Meltano tracker backed by Snowplow."""
+    """Meltano tracker backed by Snowplow.
+
+    Events are spooled on disk as they are tracked, and sent to the collectors
+    by a background thread. On exit, the thread is given a short deadline to
+    send the remaining events, and whatever it couldn't send is sent by a later
+    invocation instead.
+    """
 
     def __init__(  # noqa: WPS210 - too many local variables
         self,
@@ -103,20 +112,31 @@ class Tracker:  # noqa: WPS214 - too many methods
             not self.settings_service.get("disable_tracking", False),
         )
 
+        self.flush_timeout = (
+            self.settings_service.get("snowplow.flush_timeout_ms")
+            / MILLISECONDS_PER_SECOND
+        )
+        self._flush_thread: threading.Thread | None = None
+        self._flush_requested = False
+        self._flush_lock = threading.Lock()
+
         endpoints = self.settings_service.get("snowplow.collector_endpoints")
+        spool_dir = project.meltano_dir("telemetry", make_dirs=False)
+        spool_max_events = self.settings_service.get("snowplow.spool_max_events")
 
-        emitters: list[Emitter] = []
+        emitters: list[SpoolEmitter] = []
         for endpoint in endpoints:
             if not check_url(endpoint):
                 logger.warning("invalid_snowplow_endpoint", endpoint=endpoint)
                 continue
             parsed_url = urlparse(endpoint)
             emitters.append(
-                Emitter(
+                SpoolEmitter(
                     endpoint=parsed_url.hostname + parsed_url.path,
                     protocol=parsed_url.scheme or "http",
                     port=parsed_url.port,
                     request_timeout=request_timeout,
+                    spool=TelemetrySpool(spool_dir, endpoint, spool_max_events),
                 )
             )
 
@@ -143,6 +163,12 @@ class Tracker:  # noqa: WPS214 - too many methods
         else:
             self.telemetry_state_change_check(stored_telemetry_settings)
 
+        if self.snowplow_tracker and any(
+            emitter.spool.pending for emitter in self.snowplow_tracker.emitters
+        ):
+            # Send the events left over by previous invocations
+            self.flush_in_background()
+
     @property
     def contexts(self) -> tuple[SelfDescribingJson]:
         """Get the contexts that will accompany events fired by this tracker.
@@ -321,6 +347,60 @@ class Tracker:  # noqa: WPS214 - too many methods
                 err=format_exception(err),
             )
 
+    def flush_in_background(self) -> threading.Thread | None:
+        """Send the spooled events to the collectors from a background thread.
+
+        If the thread is already running, it sends the events spooled since it
+        started once it is done.
+
+        Returns:
+            The thread sending the events, or None if there are no collectors.
+        """
+        if self.snowplow_tracker is None:
+            return None
+
+        with self._flush_lock:
+            self._flush_requested = True
+            if self._flush_thread is None:
+                self._flush_thread = threading.Thread(
+                    target=self._send_spooled_events,
+                    name="meltano-telemetry",
+                    daemon=True,
+                )
+                self._flush_thread.start()
+            return self._flush_thread
+
+    def flush(self, timeout: float | None = None) -> None:
+        """Send the spooled events to the collectors, waiting at most `timeout`.
+
+        Events that aren't sent by the deadline remain spooled, and are sent by
+        the background thread if the process is still running, or by the next
+        invocation otherwise.
+
+        Args:
+            timeout: How long to wait for the events to be sent, in seconds.
+        """
+        thread = self.flush_in_background()
+        if thread is not None and timeout != 0:
+            thread.join(timeout)
+
+    def _send_spooled_events(self) -> None:
+        while True:
+            with self._flush_lock:
+                if not self._flush_requested:
+                    self._flush_thread = None
+                    return
+                self._flush_requested = False
+
+            for emitter in self.snowplow_tracker.emitters:
+                try:
+                    emitter.send_spooled()
+                except Exception as err:
+                    logger.debug(
+                        "Failed to send spooled events to Snowplow, error",
+                        err=format_exception(err),
+                    )
+
     @property
     def analytics_json_path(self) -> Path:
         """Return path to the 'analytics.json' file.
@@ -442,7 +522,7 @@ class Tracker:  # noqa: WPS214 - too many methods
         atexit.register(self.track_exit_event)
 
     def track_exit_event(self):
-        """Fire exit event."""
+        """Fire exit event, and send the spooled events within the flush timeout."""
         from meltano import cli
 
         if cli.exit_code_reported:
@@ -467,4 +547,5 @@ class Tracker:  # noqa: WPS214 - too many methods
                 },
             )
         )
+        self.flush(self.flush_timeout)
         atexit.unregister(self.track_exit_event)
@@ -466,51 +466,155 @@ class EnvironmentVariableNotSetError(MeltanoError):
         super().__init__(reason, instruction)
 
 
+ENV_VAR_PATTERN = re.compile(
+    r"""
+    \$  # starts with a '$'
+    (?:
+        {(\w+)} # ${VAR}
+        |
+        ([A-Z][A-Z0-9_]*) # $VAR
+    )
+    """,
+    re.VERBOSE,
+)
+
+# Unresolved env var references are only reported once per process
+_reported_env_vars: set[tuple[str, str]] = set()
+
+
+def _report_env_var(var: str, problem: str) -> None:
+    if (var, problem) not in _reported_env_vars:
+        _reported_env_vars.add((var, problem))
+        logger.debug(f"Variable '${var}' is {problem}.")
+
+
+class EnvVarTemplate:
+    """A string value compiled into its literal parts and env var references.
+
+    The last expansion is memoized, keyed on the values of the referenced env
+    vars, so expanding a value again with unchanged env vars skips assembling it.
+    """
+
+    __slots__ = ("raw_value", "literals", "variables", "_expanded")
+
+    def __init__(self, raw_value: str):
+        """Compile a string value.
+
+        Args:
+            raw_value: the string value, which may reference env vars.
+        """
+        self.raw_value = raw_value
+        self.literals: list[str] = []
+        self.variables: list[str] = []
+
+        position = 0
+        for match in ENV_VAR_PATTERN.finditer(raw_value):
+            self.literals.append(raw_value[position : match.start()])
+            # the variable can be in either group
+            self.variables.append(match.group(1) or match.group(2))
+            position = match.end()
+        self.literals.append(raw_value[position:])
+        self._expanded: tuple[tuple, str | None] | None = None
+
+    @property
+    def is_reference(self) -> bool:
+        """Return whether the entire value is a single env var reference.
+
+        Returns:
+            True if the value is a single env var reference, like `$VAR`.
+        """
+        return len(self.variables) == 1 and not any(self.literals)
+
+    def expand(self, env: dict, raise_if_missing: bool = False) -> str | None:
+        """Expand the env var references of the value.
+
+        Args:
+            env: the env vars to expand references with.
+            raise_if_missing: whether to raise if a referenced env var is not set,
+                or is empty.
+
+        Returns:
+            The expanded value. If the entire value is a single env var reference,
+            None if the env var isn't set.
+        """
+        if not self.variables:
+            return self.raw_value
+
+        key = tuple(env.get(var) for var in self.variables)
+        expanded = self._expanded
+        if expanded is not None and expanded[0] == key:
+            return expanded[1]
+
+        values = [self._lookup(var, env, raise_if_missing) for var in self.variables]
+        if self.is_reference:
+            result = values[0]
+        else:
+            parts = [self.literals[0]]
+            for value, literal in zip(values, self.literals[1:]):
+                parts.append(value or "")
+                parts.append(literal)
+            result = "".join(parts)
+
+        # Unset and empty env vars are reported on every expansion, not memoized
+        if all(values):
+            self._expanded = (key, result)
+        return result
+
+    @staticmethod
+    def _lookup(var: str, env: dict, raise_if_missing: bool) -> str | None:
+        try:
+            value = str(env[var])
+        except KeyError as err:
+            if raise_if_missing:
+                raise EnvironmentVariableNotSetError(var) from err
+            _report_env_var(var, "missing from the environment")
+            return None
+
+        if not value:
+            _report_env_var(var, "empty")
+            if raise_if_missing:
+                raise EnvironmentVariableNotSetError(var)
+        return value
+
+
+@functools.lru_cache(maxsize=4096)
+def compile_env_var_template(raw_value: str) -> EnvVarTemplate:
+    """Compile a string value, reusing the template of previously seen values.
+
+    Args:
+        raw_value: the string value, which may reference env vars.
+
+    Returns:
+        The compiled template.
+    """
+    return EnvVarTemplate(raw_value)
+
+
 def expand_env_vars(raw_value, env: dict, raise_if_missing: bool = False):
+    """Expand env var references in a value, and in the values of nested dicts.
+
+    Values are compiled once into templates that record the env vars they
+    reference, and are only expanded again when the values of those env vars
+    change. Strings without a `$` aren't compiled at all.
+
+    Args:
+        raw_value: the value, which may reference env vars like `$VAR` or `${VAR}`.
+        env: the env vars to expand references with.
+        raise_if_missing: whether to raise if a referenced env var is not set,
+            or is empty.
+
+    Returns:
+        The expanded value.
+    """
     if isinstance(raw_value, dict):
         return {
             key: expand_env_vars(val, env, raise_if_missing)
             for key, val in raw_value.items()
         }
-    elif not isinstance(raw_value, str):
+    elif not isinstance(raw_value, str) or "$" not in raw_value:
         return raw_value
 
-    # find viable substitutions
-    var_matcher = re.compile(
-        r"""
-        \$  # starts with a '$'
-        (?:
-            {(\w+)} # ${VAR}
-            |
-            ([A-Z][A-Z0-9_]*) # $VAR
-        )
-        """,
-        re.VERBOSE,
-    )
-
-    def subst(match) -> str:
-        try:
-            # the variable can be in either group
-            var = next(var for var in match.groups() if var)
-            val = str(env[var])
-
-            if not val:
-                logger.debug(f"Variable '${var}' is empty.")
-                if raise_if_missing:
-                    raise EnvironmentVariableNotSetError(var)
-            return val
-        except KeyError as e:
-            if raise_if_missing:
-                raise EnvironmentVariableNotSetError(e.args[0])
-            logger.debug(f"Variable '${var}' is missing from the environment.")
-            return None
-
-    fullmatch = re.fullmatch(var_matcher, raw_value)
-    if fullmatch:
-        # If the entire value is an env var reference, return None if it isn't set
-        return subst(fullmatch)
-
-    return re.sub(var_matcher, subst, raw_value)
+    return compile_env_var_template(raw_value).expand(env, raise_if_missing)
 
 
 def uniques_in(original):
@@ -10,13 +10,22 @@ import platform
 import shutil
 import subprocess
 import sys
+import sysconfig
+import tempfile
+import time
+import uuid
 from asyncio.subprocess import Process
 from collections import namedtuple
 from collections.abc import Iterable
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import AsyncIterator, Awaitable, Callable
+
+import fasteners
 
 from meltano.core.error import AsyncSubprocessError
 from meltano.core.project import Project
+from meltano.core.project_settings_service import ProjectSettingsService
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +68,122 @@ def venv_platform_specs():
 
 PIP_PACKAGES = ("pip", "setuptools", "wheel")
 
+# The `.meltano` directory in which venvs shared by plugins are installed
+SHARED_VENVS_DIR = "venvs"
+
+# How long a venv template is used for before its pip packages are upgraded
+TEMPLATE_MAX_AGE_SECONDS = 24 * 60 * 60
+
+# Installs of shared venvs and templates in progress, by venv root
+_pending_installs: dict[str, asyncio.Future] = {}
+
+
+async def _install_once(key: str, install: Callable[[], Awaitable[None]]) -> None:
+    """Run an install, or wait for the one with the same key already in progress.
+
+    Args:
+        key: The key identifying the install.
+        install: The function that starts the install.
+    """
+    pending = _pending_installs.get(key)
+    if pending is None:
+        pending = asyncio.ensure_future(install())
+        _pending_installs[key] = pending
+        pending.add_done_callback(lambda _: _pending_installs.pop(key, None))
+    await asyncio.shield(pending)
+
+
+# The last task waiting for or holding the lock of each venv, by venv root
+_venv_lock_holders: dict[str, asyncio.Future] = {}
+
+
+@asynccontextmanager
+async def venv_lock(root: Path) -> AsyncIterator[None]:
+    """Lock a venv against tasks of this and other processes.
+
+    Tasks of this process take the lock in turn, and the one holding it also holds
+    a lock file next to the venv, since lock files are held by whole processes.
+
+    Args:
+        root: The root directory of the venv.
+
+    Yields:
+        Once the lock is held.
+    """
+    key = str(root)
+    loop = asyncio.get_running_loop()
+    previous = _venv_lock_holders.get(key)
+    released = loop.create_future()
+    _venv_lock_holders[key] = released
+    try:
+        if previous is not None:
+            await asyncio.shield(previous)
+
+        lock = fasteners.InterProcessLock(f"{key}.lock")
+        # Wait for other processes without blocking the event loop
+        acquiring = loop.run_in_executor(None, lock.acquire)
+        try:
+            await asyncio.shield(acquiring)
+        except asyncio.CancelledError:
+            acquiring.add_done_callback(lambda _: lock.release())
+            raise
+
+        try:
+            yield
+        finally:
+            lock.release()
+    finally:
+        if previous is None or previous.done():
+            released.set_result(None)
+        else:
+            # Cancelled while waiting, so the next task waits for the previous one
+            previous.add_done_callback(lambda _: released.set_result(None))
+        if _venv_lock_holders.get(key) is released:
+            del _venv_lock_holders[key]
+
+
+def pip_versions(site_packages_dir: Path) -> dict[str, str]:
+    """Get the versions of the pip packages installed in a venv.
+
+    Args:
+        site_packages_dir: The site-packages directory of the venv.
+
+    Returns:
+        The version of each of the `PIP_PACKAGES` installed.
+    """
+    versions = {}
+    for dist_info in site_packages_dir.glob("*.dist-info"):
+        name, _, version = dist_info.stem.partition("-")
+        if name in PIP_PACKAGES:
+            versions[name] = version
+    return versions
+
+
+def _supports_symlinks(directory: Path) -> bool:
+    """Check whether symbolic links can be created in a directory.
+
+    Args:
+        directory: The directory, which is created if it doesn't exist.
+
+    Returns:
+        Whether a symbolic link could be created in the directory.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    probe = directory / f".symlink-{uuid.uuid4().hex}"
+    try:
+        probe.symlink_to(directory, target_is_directory=True)
+    except OSError:
+        return False
+    probe.unlink()
+    return True
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
 
 class VirtualEnv:
     """Info about a single virtual environment."""
@@ -122,6 +247,268 @@ async def exec_async(*args, **kwargs) -> Process:
     return run
 
 
+class WheelCache:
+    """Wheels and pinned requirements of past installs, to install them offline.
+
+    After installing packages, the requirements they resolved to are written to a
+    lock named after the fingerprint of the install, and their wheels are built
+    into a directory shared by all locks. Locks are kept per Python version and
+    platform, since requirements can resolve differently on each of them.
+    Installing with the same arguments again then installs the pinned wheels,
+    without resolving dependencies or using the package index.
+    """
+
+    def __init__(self, cache_dir: Path):
+        """Initialize the `WheelCache`.
+
+        Args:
+            cache_dir: The directory in which wheels and locks are stored.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.wheels_dir = self.cache_dir / "wheels"
+        self.locks_dir = self.cache_dir / "locks"
+
+    @classmethod
+    def from_project(
+        cls,
+        project: Project,
+        settings_service: ProjectSettingsService | None = None,
+    ) -> WheelCache | None:
+        """Create the wheel cache configured for a project.
+
+        Args:
+            project: The Meltano project.
+            settings_service: The project settings service to read settings from.
+
+        Returns:
+            The wheel cache to use for the project, if it is enabled.
+        """
+        settings_service = settings_service or ProjectSettingsService(project)
+        if not settings_service.get("venv.wheel_cache"):
+            return None
+
+        cache_dir = settings_service.get("venv.wheel_cache_dir")
+        return cls(
+            Path(cache_dir).expanduser() if cache_dir else project.cache_dir("wheels")
+        )
+
+    def lock_path(self, pip_install_args: Iterable[str]) -> Path:
+        """Get the path of the lock of an install.
+
+        Args:
+            pip_install_args: The arguments of the install.
+
+        Returns:
+            The path of the lock, which may not exist.
+        """
+        return (
+            self.locks_dir
+            / self.interpreter_tag
+            / f"{fingerprint(pip_install_args)}.txt"
+        )
+
+    @property
+    def interpreter_tag(self) -> str:
+        """Get a tag identifying the Python version and platform venvs are created for.
+
+        Returns:
+            The tag, like `py3.10-linux-x86_64`.
+        """
+        major, minor = sys.version_info[:2]
+        return f"py{major}.{minor}-{sysconfig.get_platform()}"
+
+    def install_args(self, pip_install_args: list[str]) -> list[str] | None:
+        """Get the arguments to install the locked requirements of an install.
+
+        Args:
+            pip_install_args: The arguments of the install.
+
+        Returns:
+            The arguments to pass to `pip install` instead, if the install is locked.
+        """
+        lock_path = self.lock_path(pip_install_args)
+        if not lock_path.exists():
+            return None
+
+        return [
+            *(arg for arg in pip_install_args if arg == "--ignore-requires-python"),
+            "--no-index",
+            "--find-links",
+            str(self.wheels_dir),
+            "--no-deps",
+            "--requirement",
+            str(lock_path),
+        ]
+
+    async def store(self, python_path: Path, pip_install_args: list[str]) -> bool:
+        """Lock the requirements of an install, and build their wheels.
+
+        Installs of editable or local packages are not locked, as their content can
+        change without their requirements changing.
+
+        Args:
+            python_path: The Python interpreter of the venv the install was done in.
+            pip_install_args: The arguments of the install.
+
+        Returns:
+            Whether the install was locked.
+        """
+        freeze = await exec_async(str(python_path), "-m", "pip", "freeze")
+        requirements = (await freeze.stdout.read()).decode()
+        if any(
+            line.startswith("-e ") or " @ file:" in line
+            for line in requirements.splitlines()
+        ):
+            logger.debug("Not locking an install of editable or local packages")
+            return False
+
+        lock_path = self.lock_path(pip_install_args)
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", dir=lock_path.parent, suffix=".tmp", delete=False
+        ) as tmp_lock:
+            tmp_lock.write(requirements)
+
+        try:
+            await exec_async(
+                str(python_path),
+                "-m",
+                "pip",
+                "wheel",
+                "--no-deps",
+                "--wheel-dir",
+                str(self.wheels_dir),
+                "--requirement",
+                tmp_lock.name,
+            )
+        except AsyncSubprocessError:
+            os.remove(tmp_lock.name)
+            raise
+
+        # Only publish the lock once all its wheels are there
+        os.replace(tmp_lock.name, lock_path)
+        return True
+
+
+class VenvTemplate:
+    """A venv with up to date pip packages, cloned into new venvs.
+
+    Creating a venv without pip and cloning the pip packages of the template
+    into it is much faster than bootstrapping pip and upgrading it in each venv.
+    The pip packages of the template are upgraded once they are a day old. The
+    template is locked while it is built or cloned, so that concurrent Meltano
+    processes never clone a template that is being upgraded. Only supported on
+    POSIX platforms, as Windows venvs use launchers that embed the path of their
+    interpreter.
+    """
+
+    def __init__(self, venv_service: VenvService):
+        """Initialize the `VenvTemplate`.
+
+        Args:
+            venv_service: The service managing the venv of the template.
+        """
+        self.venv_service = venv_service
+
+    @classmethod
+    def from_project(
+        cls,
+        project: Project,
+        settings_service: ProjectSettingsService | None = None,
+    ) -> VenvTemplate | None:
+        """Create the venv template configured for a project.
+
+        Args:
+            project: The Meltano project.
+            settings_service: The project settings service to read settings from.
+
+        Returns:
+            The venv template to use for the project, if it is enabled.
+        """
+        settings_service = settings_service or ProjectSettingsService(project)
+        if venv_platform_specs() is NT or not settings_service.get("venv.template"):
+            return None
+
+        python_version = "".join(str(part) for part in sys.version_info[:2])
+        return cls(
+            VenvService(project, SHARED_VENVS_DIR, f"template-py{python_version}")
+        )
+
+    @property
+    def venv(self) -> VirtualEnv:
+        """Get the venv of the template.
+
+        Returns:
+            The venv of the template.
+        """
+        return self.venv_service.venv
+
+    def is_fresh(self) -> bool:
+        """Check whether the template exists and its pip packages are recent.
+
+        Returns:
+            Whether the template can be cloned without upgrading it first.
+        """
+        try:
+            upgraded_at = self.venv_service.plugin_fingerprint_path.stat().st_mtime
+        except FileNotFoundError:
+            return False
+        return time.time() - upgraded_at < TEMPLATE_MAX_AGE_SECONDS
+
+    async def ensure(self) -> None:
+        """Create or upgrade the template, unless it is fresh."""
+        if not self.is_fresh():
+            await _install_once(str(self.venv.root), self._build)
+
+    async def clone_into(self, venv: VirtualEnv) -> None:
+        """Add the pip packages of the template to a venv created without pip.
+
+        Files are hard-linked when possible, and scripts are rewritten to use the
+        interpreter of the venv.
+
+        Args:
+            venv: The venv to clone the template into.
+        """
+        async with venv_lock(self.venv.root):
+            self._clone_into(venv)
+
+    def _clone_into(self, venv: VirtualEnv) -> None:
+        for entry in self.venv.site_packages_dir.iterdir():
+            target = venv.site_packages_dir / entry.name
+            if entry.is_dir():
+                shutil.copytree(entry, target, copy_function=_link_or_copy)
+            else:
+                _link_or_copy(str(entry), str(target))
+
+        template_shebang = f"#!{self.venv.bin_dir / 'python'}"
+        for script in self.venv.bin_dir.iterdir():
+            target = venv.bin_dir / script.name
+            if target.exists() or not script.is_file() or script.is_symlink():
+                continue
+            try:
+                content = script.read_text()
+            except UnicodeDecodeError:
+                continue
+            if content.startswith(template_shebang):
+                target.write_text(
+                    content.replace(template_shebang, f"#!{venv.bin_dir / 'python'}", 1)
+                )
+                shutil.copymode(script, target)
+
+    async def _build(self) -> None:
+        """Create the template, or upgrade its pip packages."""
+        async with venv_lock(self.venv.root):
+            # Another process may have built it while this one waited for the lock
+            if self.is_fresh():
+                return
+            if self.venv_service.read_fingerprint() is None:
+                # Never built, or left incomplete by an interrupted build
+                self.venv_service.clean()
+                await self.venv_service.create()
+            await self.venv_service.upgrade_pip()
+            self.venv_service.write_fingerprint(PIP_PACKAGES)
+
+
 def fingerprint(pip_install_args: Iterable[str]) -> str:
     """Generate a hash identifying pip install args.
 
@@ -153,9 +540,10 @@ class VenvService:  # noqa: WPS214
         self.project = project
         self.namespace = namespace
         self.name = name
-        self.venv = VirtualEnv(self.project.venvs_dir(namespace, name))
-        self.python_path = self.venv.bin_dir / "python"
-        self.plugin_fingerprint_path = self.venv.root / ".meltano_plugin_fingerprint"
+        self.venv_dir = self.project.venvs_dir(namespace, name, make_dirs=False)
+        self.wheel_cache: WheelCache | None = None
+        self.template: VenvTemplate | None = None
+        self._locate_venv()
 
     async def install(self, pip_install_args: list[str], clean: bool = False) -> None:
         """Configure a virtual environment, then run pip install with the given args.
@@ -164,14 +552,29 @@ class VenvService:  # noqa: WPS214
             pip_install_args: Arguments passed to `pip install`.
             clean: Whether to not attempt to use an existing virtual environment.
         """
-        if not clean and self.requires_clean_install(pip_install_args):
+        settings_service = ProjectSettingsService(self.project)
+        self.wheel_cache = WheelCache.from_project(self.project, settings_service)
+        self.template = VenvTemplate.from_project(self.project, settings_service)
+        self.clean_run_files()
+
+        if settings_service.get("venv.shared"):
+            if _supports_symlinks(self.venv_dir.parent):
+                await self._install_shared(pip_install_args, clean)
+                return
+            logger.debug("Symbolic links are not supported, not sharing the venv")
+
+        if self.venv_dir.is_symlink():
+            logger.debug(
+                f"'{self.namespace}/{self.name}' uses a shared virtual environment so performing a clean install."
+            )
+            clean = True
+        elif not clean and self.requires_clean_install(pip_install_args):
             logger.debug(
                 f"Packages for '{self.namespace}/{self.name}' have changed so performing a clean install."
             )
             clean = True
 
-        self.clean_run_files()
-        await self._pip_install(pip_install_args=pip_install_args, clean=clean)
+        await self._install_packages(pip_install_args, clean=clean)
         self.write_fingerprint(pip_install_args)
 
     def requires_clean_install(self, pip_install_args: list[str]) -> bool:
@@ -202,7 +605,20 @@ class VenvService:  # noqa: WPS214
             logger.debug("No cached configuration files to remove")
 
     def clean(self) -> None:
-        """Destroy the virtual environment, if it exists."""
+        """Destroy the virtual environment, if it exists.
+
+        Shared virtual environments are only unlinked.
+        """
+        if self.venv_dir.is_symlink():
+            self.venv_dir.unlink()
+            self._locate_venv()
+            logger.debug(
+                "Unlinked shared virtual environment for '%s/%s'",  # noqa: WPS323
+                self.namespace,
+                self.name,
+            )
+            return
+
         try:
             shutil.rmtree(self.venv.root)
             logger.debug(
@@ -225,6 +641,14 @@ class VenvService:  # noqa: WPS214
         """
         logger.debug(f"Creating virtual environment for '{self.namespace}/{self.name}'")
         try:
+            if self.template:
+                await self.template.ensure()
+                process = await exec_async(
+                    sys.executable, "-m", "venv", "--without-pip", str(self.venv)
+                )
+                await self.template.clone_into(self.venv)
+                return process
+
             return await exec_async(sys.executable, "-m", "venv", str(self.venv))
         except AsyncSubprocessError as err:
             raise AsyncSubprocessError(
@@ -232,15 +656,28 @@ class VenvService:  # noqa: WPS214
                 err.process,
             ) from err
 
-    async def upgrade_pip(self) -> Process:
+    async def upgrade_pip(self) -> Process | None:
         """Upgrade the `pip` package to the latest version in the virtual environment.
 
+        Skipped when the pip packages are the ones of the fresh venv template.
+
         Raises:
             AsyncSubprocessError: Failed to upgrade pip to the latest version.
 
         Returns:
-            The process running `pip install --upgrade ...`.
+            The process running `pip install --upgrade ...`, if pip was upgraded.
         """
+        if (
+            self.template
+            and self.template.is_fresh()
+            and pip_versions(self.venv.site_packages_dir)
+            == pip_versions(self.template.venv.site_packages_dir)
+        ):
+            logger.debug(
+                f"Pip for '{self.namespace}/{self.name}' is up to date with the venv template"
+            )
+            return None
+
         logger.debug(f"Upgrading pip for '{self.namespace}/{self.name}'")
         try:
             return await self._pip_install(["--upgrade", *PIP_PACKAGES])
@@ -281,6 +718,92 @@ class VenvService:  # noqa: WPS214
         """
         return self.venv.bin_dir / executable
 
+    def _locate_venv(self) -> None:
+        """Point to the virtual environment, following links to shared ones."""
+        self.venv = VirtualEnv(self.venv_dir)
+        self.python_path = self.venv.bin_dir / "python"
+        self.plugin_fingerprint_path = self.venv.root / ".meltano_plugin_fingerprint"
+
+    async def _install_shared(self, pip_install_args: list[str], clean: bool) -> None:
+        """Link to the virtual environment shared by installs with the same args.
+
+        The shared virtual environment is installed first if needed, once for all
+        the concurrent installs with the same args, including the ones of other
+        Meltano processes.
+
+        Args:
+            pip_install_args: Arguments passed to `pip install`.
+            clean: Whether to reinstall the shared virtual environment.
+        """
+        shared = VenvService(
+            self.project, SHARED_VENVS_DIR, fingerprint(pip_install_args)[:16]
+        )
+        shared.wheel_cache = self.wheel_cache
+        shared.template = self.template
+        await _install_once(
+            str(shared.venv.root),
+            lambda: shared._install_locked(pip_install_args, clean),
+        )
+
+        if self.venv_dir.is_symlink():
+            self.venv_dir.unlink()
+        elif self.venv_dir.exists():
+            self.clean()
+        self.venv_dir.symlink_to(shared.venv.root, target_is_directory=True)
+        self._locate_venv()
+        logger.debug(
+            f"Linked '{self.namespace}/{self.name}' to shared virtual environment {shared.venv}"
+        )
+
+    async def _install_locked(self, pip_install_args: list[str], clean: bool) -> None:
+        """Install packages, unless they were installed with the same args already.
+
+        The venv is locked during the install, so that other processes wait for it
+        and then find the packages installed.
+
+        Args:
+            pip_install_args: Arguments passed to `pip install`.
+            clean: Whether to reinstall the packages anyway.
+        """
+        async with venv_lock(self.venv.root):
+            if clean or self.requires_clean_install(pip_install_args):
+                await self._install_packages(pip_install_args, clean=True)
+                self.write_fingerprint(pip_install_args)
+
+    async def _install_packages(
+        self, pip_install_args: list[str], clean: bool = False
+    ) -> None:
+        """Install packages, from the wheel cache if they were locked.
+
+        Args:
+            pip_install_args: Arguments passed to `pip install`.
+            clean: Whether the installation should be done in a clean venv.
+        """
+        locked_args = self.wheel_cache and self.wheel_cache.install_args(
+            pip_install_args
+        )
+        if locked_args:
+            try:
+                if clean:
+                    self.clean()
+                    await self.create()
+                await self._pip_install(locked_args)
+                return
+            except AsyncSubprocessError:
+                logger.debug(
+                    f"Could not install '{self.namespace}/{self.name}' from the wheel cache"
+                )
+                clean = True
+
+        await self._pip_install(pip_install_args=pip_install_args, clean=clean)
+        if self.wheel_cache:
+            try:
+                await self.wheel_cache.store(self.python_path, pip_install_args)
+            except AsyncSubprocessError:
+                logger.debug(
+                    f"Could not add '{self.namespace}/{self.name}' to the wheel cache"
+                )
+
     async def _pip_install(
         self, pip_install_args: list[str], clean: bool = False
     ) -> Process:
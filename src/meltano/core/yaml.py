@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+import time
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -23,21 +24,34 @@ yaml.register_class(SettingKind)
 yaml.register_class(DiscoveryFile)
 
 
+# Files modified this recently may be modified again without their size or
+# modification time changing, so their content is compared as well.
+RACY_MODIFICATION_NS = 2_000_000_000
+
+
 @dataclass
 class CachedCommentedMap:
-    """The hash of the raw bytes of a YAML file, and its parsed content."""
+    """The stat and hash of the raw bytes of a YAML file, and its parsed content."""
 
     sha256: str
     data: CommentedMap
+    signature: tuple[int, int, int] | None = None
+    loaded_at_ns: int = 0
 
 
 cache: dict[os.PathLike, CachedCommentedMap] = {}
 
 
+def _signature(stat_result: os.stat_result) -> tuple[int, int, int]:
+    return (stat_result.st_mtime_ns, stat_result.st_size, stat_result.st_ino)
+
+
 def load(path: os.PathLike) -> CommentedMap:
     """Load the specified YAML file with caching.
 
-    The cache is used if both the file path and its content hash match what is stored.
+    The cache is used without reading the file if its modification time, size and
+    inode match what is stored, and the file wasn't modified shortly before it was
+    loaded. Otherwise, the cache is used if the content hash matches what is stored.
 
     Parameters:
         path: The path to the YAML file.
@@ -46,16 +60,27 @@ def load(path: os.PathLike) -> CommentedMap:
         The loaded YAML file.
     """
     path = Path(path).resolve()
+    signature = _signature(path.stat())
+    cached = cache.get(path)
+    if (
+        cached
+        and cached.signature == signature
+        and signature[0] + RACY_MODIFICATION_NS < cached.loaded_at_ns
+    ):
+        return cached.data
+
+    loaded_at_ns = time.time_ns()
     with open(path) as yaml_file:
-        hashed = hash_sha256(yaml_file.read())
-
-        if path in cache and cache[path].sha256 == hashed:
-            return cache[path].data
+        contents = yaml_file.read()
 
-        yaml_file.seek(0)
-        parsed = yaml.load(yaml_file)
+    hashed = hash_sha256(contents)
+    if cached and cached.sha256 == hashed:
+        cached.signature = signature
+        cached.loaded_at_ns = loaded_at_ns
+        return cached.data
 
-    cache[path] = CachedCommentedMap(hashed, parsed)
+    parsed = yaml.load(contents)
+    cache[path] = CachedCommentedMap(hashed, parsed, signature, loaded_at_ns)
     return parsed
 
 
@@ -0,0 +1,37 @@
+"""Add indexes to the `runs` table for the latest run lookups of state IDs.
+
+Revision ID: a55c044bce1f
+Revises: 6828cc5b1a4f
+Create Date: 2022-10-18 10:12:41.270815
+
+"""
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a55c044bce1f"
+down_revision = "6828cc5b1a4f"
+branch_labels = None
+depends_on = None
+
+INDEXES = {
+    "ix_runs_job_name_started_at": ["job_name", "started_at"],
+    "ix_runs_job_name_state_ended_at": ["job_name", "state", "ended_at"],
+    "ix_runs_job_name_payload_flags_ended_at": [
+        "job_name",
+        "payload_flags",
+        "ended_at",
+    ],
+}
+
+
+def upgrade():
+    for index_name, columns in INDEXES.items():
+        # MySQL can't index the full length of `job_name`
+        op.create_index(index_name, "runs", columns, mysql_length={"job_name": 255})
+
+
+def downgrade():
+    for index_name in INDEXES:
+        op.drop_index(index_name, table_name="runs")
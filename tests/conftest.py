@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import os
@@ -158,8 +159,16 @@ class MockAdapter(BaseAdapter):
             return response
 
         self.count[endpoint] += 1
+        content = json.dumps(data).encode()
+        etag = f'"{hashlib.sha256(content).hexdigest()}"'
+        response.headers["ETag"] = etag
+        if request.headers.get("If-None-Match") == etag:
+            response.status_code = HTTPStatus.NOT_MODIFIED
+            response._content = b""
+            return response
+
         response.status_code = HTTPStatus.OK
-        response._content = json.dumps(data).encode()
+        response._content = content
         return response
 
 
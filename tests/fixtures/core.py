@@ -466,7 +466,11 @@ def project_directory(test_dir, project_init_service):
     with project.meltano_update() as meltano:
         meltano.plugins = Canonical()
 
-    ProjectSettingsService(project).set("snowplow.collector_endpoints", "[]")
+    settings_service = ProjectSettingsService(project)
+    settings_service.set("snowplow.collector_endpoints", "[]")
+    # Always revalidate Hub responses, as tests mock and count Hub requests
+    settings_service.set("hub_cache.ttl", 0)
+    settings_service.set("hub_cache.stale_while_revalidate", 0)
 
     # cd into the new project root
     os.chdir(project.root)
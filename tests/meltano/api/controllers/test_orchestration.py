@@ -177,3 +177,41 @@ class TestOrchestration:
 
         assert res.status_code == 200
         assert not res.json["is_success"]
+
+    def test_job_log(self, app, api, job_logging_service):
+        state_id = "dev:tap-mock-to-target-mock"
+        log_file_name = job_logging_service.generate_log_name(state_id, "run")
+        with open(log_file_name, "w") as log_file:
+            log_file.write("line 1\nline 2\nline 3\n")
+
+        with app.test_request_context():
+            url = url_for("orchestrations.job_log", state_id=state_id)
+
+            res = api.get(url)
+            assert res.status_code == 200
+            assert res.json["log"] == "line 1\nline 2\nline 3\n"
+            assert "next_offset" not in res.json
+
+            res = api.get(url, query_string={"tail": 10})
+            assert res.status_code == 200
+            assert res.json["log"] == "line 3\n"
+            assert res.json["offset"] == 14
+            assert res.json["next_offset"] == res.json["size"] == 21
+
+            res = api.get(url, query_string={"offset": 7})
+            assert res.json["log"] == "line 2\nline 3\n"
+
+            # Without a running job, the last line is returned without a newline
+            with open(log_file_name, "a") as log_file:
+                log_file.write("line 4")
+            res = api.get(url, query_string={"offset": 21})
+            assert res.json["log"] == "line 4"
+            assert res.json["next_offset"] == res.json["size"] == 27
+
+            res = api.get(
+                url_for("orchestrations.stream_job_log", state_id=state_id),
+                query_string={"offset": 7},
+            )
+            assert res.status_code == 200
+            assert res.is_streamed
+            assert res.get_data(as_text=True) == "line 2\nline 3\nline 4"
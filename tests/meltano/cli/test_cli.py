@@ -3,6 +3,8 @@ from __future__ import annotations
 import platform
 import re
 import shutil
+import subprocess
+import sys
 from pathlib import Path
 from time import perf_counter_ns
 
@@ -15,6 +17,7 @@ import meltano
 from asserts import assert_cli_runner
 from fixtures.utils import cd
 from meltano.cli import cli, handle_meltano_error
+from meltano.cli.cli import SUBCOMMAND_MODULES
 from meltano.cli.utils import CliError
 from meltano.core.error import EmptyMeltanoFileException, MeltanoError
 from meltano.core.logging.utils import setup_logging
@@ -172,6 +175,27 @@ class TestCli:
         )
         assert Project._default.active_environment is None
 
+    def test_lazy_subcommands(self):
+        ctx = click.Context(cli)
+
+        assert cli.list_commands(ctx) == sorted(SUBCOMMAND_MODULES)
+        for name in cli.list_commands(ctx):
+            assert cli.get_command(ctx, name).name == name
+        assert cli.get_command(ctx, "not-a-command") is None
+
+    def test_lazy_imports(self):
+        modules = ("meltano.cli.add", "meltano.cli.invoke", "alembic", "smart_open")
+        script = (
+            "import sys, meltano.cli; "
+            + f"print(*(name for name in {modules!r} if name in sys.modules))"
+        )
+        process = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, check=True
+        )
+
+        # Subcommand modules and their dependencies are imported when needed
+        assert process.stdout.strip() == ""
+
     def test_handle_meltano_error(self):
         exception = MeltanoError(reason="This failed", instruction="Try again")
         with pytest.raises(CliError, match="This failed. Try again."):
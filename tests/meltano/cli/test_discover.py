@@ -8,6 +8,7 @@ from asserts import assert_cli_runner
 from meltano.cli import cli
 from meltano.core.hub import MeltanoHubService
 from meltano.core.plugin.base import PluginType
+from meltano.core.plugin.singer import SingerTap
 from meltano.core.project import Project
 
 
@@ -65,3 +66,53 @@ class TestCliDiscover:
         assert "tap-mock" in result.stdout
 
         assert "Loaders" not in result.stdout
+
+    def test_discover_warm(
+        self, project: Project, cli_runner, tap, monkeypatch, tmp_path
+    ):
+        monkeypatch.setenv("MELTANO_CATALOG_CACHE_DIR", str(tmp_path))
+
+        async def mock_discovery(plugin_invoker, catalog_path):  # noqa: WPS430
+            catalog_path.write_text('{"streams": []}')
+
+        with mock.patch.object(
+            SingerTap, "run_discovery", side_effect=mock_discovery
+        ) as mocked_run_discovery:
+            result = cli_runner.invoke(cli, ["discover", "--warm"])
+            assert_cli_runner(result)
+
+            assert mocked_run_discovery.called
+            assert f"Cached catalog of {tap.name}" in result.stdout
+            assert list(tmp_path.glob("*.json"))
+
+            # Already cached catalogs are not discovered again
+            mocked_run_discovery.reset_mock()
+            result = cli_runner.invoke(cli, ["discover", "--warm"])
+            assert_cli_runner(result)
+
+            mocked_run_discovery.assert_not_called()
+            assert f"Catalog of {tap.name} is already cached" in result.stdout
+
+            # Unless they are refreshed
+            result = cli_runner.invoke(cli, ["discover", "--warm", "--refresh"])
+            assert_cli_runner(result)
+
+            mocked_run_discovery.assert_called_once()
+            assert f"Cached catalog of {tap.name}" in result.stdout
+
+    def test_discover_refresh_requires_warm(self, project: Project, cli_runner):
+        result = cli_runner.invoke(cli, ["discover", "--refresh"])
+        assert result.exit_code == 1
+        assert "--refresh can only be used with --warm" in str(result.exception)
+
+    def test_discover_warm_requires_extractors(self, project: Project, cli_runner):
+        result = cli_runner.invoke(cli, ["discover", "loaders", "--warm"])
+        assert result.exit_code == 1
+        assert "--warm can only be used with extractors" in str(result.exception)
+
+        with mock.patch(
+            "meltano.cli.discovery.warm_catalog_cache", new=mock.AsyncMock()
+        ) as warm:
+            result = cli_runner.invoke(cli, ["discover", "extractors", "--warm"])
+        assert_cli_runner(result)
+        warm.assert_awaited_once()
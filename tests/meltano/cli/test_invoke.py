@@ -25,16 +25,13 @@ def project_tap_mock(project_add_service):
 @pytest.mark.usefixtures("project_tap_mock")
 class TestCliInvoke:
     @pytest.fixture
-    def mock_invoke(self, utility, plugin_invoker_factory):
+    def mock_invoke(self, utility):
 
         process_mock = Mock()
         process_mock.name = "utility-mock"
         process_mock.wait = AsyncMock(return_value=0)
 
-        with patch(
-            "meltano.core.plugin_invoker.invoker_factory",
-            return_value=plugin_invoker_factory,
-        ), patch.object(
+        with patch.object(
             ProjectPluginsService, "find_plugin", return_value=utility
         ), patch.object(
             asyncio,
@@ -44,11 +41,8 @@ class TestCliInvoke:
             yield invoke_async
 
     @pytest.fixture
-    def mock_invoke_containers(self, utility, plugin_invoker_factory):
-        with patch(
-            "meltano.core.plugin_invoker.invoker_factory",
-            return_value=plugin_invoker_factory,
-        ), patch.object(
+    def mock_invoke_containers(self, utility):
+        with patch.object(
             ProjectPluginsService, "find_plugin", return_value=utility
         ), mock.patch(
             "aiodocker.Docker",
@@ -161,17 +155,12 @@ class TestCliInvoke:
         assert args[0].endswith("utility-mock")
         assert args[1:] == ("--option", "arg", "--verbose")
 
-    def test_invoke_exit_code(
-        self, cli_runner, tap, project_plugins_service, plugin_invoker_factory, utility
-    ):
+    def test_invoke_exit_code(self, cli_runner, tap, project_plugins_service, utility):
         process_mock = Mock()
         process_mock.name = "utility-mock"
         process_mock.wait = AsyncMock(return_value=2)
 
-        with patch(
-            "meltano.core.plugin_invoker.invoker_factory",
-            return_value=plugin_invoker_factory,
-        ), patch.object(
+        with patch.object(
             ProjectPluginsService, "find_plugin", return_value=utility
         ), patch.object(
             asyncio,
@@ -9,6 +9,8 @@ import structlog
 from mock import AsyncMock, mock
 
 from meltano.cli import cli
+from meltano.cli.run import _stages
+from meltano.core.block.extract_load import ExtractLoadBlocks
 from meltano.core.block.ioblock import IOBlock
 from meltano.core.logging.formatters import LEVELED_TIMESTAMPED_PRE_CHAIN
 from meltano.core.logging.job_logging_service import JobLoggingService
@@ -18,6 +20,7 @@ from meltano.core.plugin.singer import SingerTap
 from meltano.core.plugin_invoker import PluginInvoker
 from meltano.core.project import Project
 from meltano.core.project_plugins_service import PluginAlreadyAddedException
+from meltano.core.task_sets import TaskSets
 
 
 class MockIOBlock(IOBlock):
@@ -75,37 +78,59 @@ def process_mock_factory():
 
 
 @pytest.fixture()
-def tap_process(process_mock_factory, tap):
-    tap = process_mock_factory(tap)
-    tap.stdout.at_eof.side_effect = (False, False, False, True)
-    tap.stdout.readline = AsyncMock(side_effect=(b"SCHEMA\n", b"RECORD\n", b"STATE\n"))
-    tap.stderr.at_eof.side_effect = (False, False, False, True)
-    tap.stderr.readline = AsyncMock(
-        side_effect=(b"tap starting\n", b"tap running\n", b"tap done\n")
-    )
-    return tap
+def tap_process_factory(process_mock_factory, tap):
+    def _factory():
+        tap_process = process_mock_factory(tap)
+        tap_process.stdout.at_eof.side_effect = (False, False, False, True)
+        tap_process.stdout.readline = AsyncMock(
+            side_effect=(b"SCHEMA\n", b"RECORD\n", b"STATE\n")
+        )
+        tap_process.stderr.at_eof.side_effect = (False, False, False, True)
+        tap_process.stderr.readline = AsyncMock(
+            side_effect=(b"tap starting\n", b"tap running\n", b"tap done\n")
+        )
+        return tap_process
+
+    return _factory
 
 
 @pytest.fixture()
-def target_process(process_mock_factory, target):
-    target = process_mock_factory(target)
+def tap_process(tap_process_factory):
+    return tap_process_factory()
 
-    # Have `target.wait` take 2s to make sure the tap always finishes before the target
-    async def wait_mock():
-        await asyncio.sleep(2)
-        return target.wait.return_value
 
-    target.wait.side_effect = wait_mock
+@pytest.fixture()
+def target_process_factory(process_mock_factory, target):
+    def _factory():
+        target_process = process_mock_factory(target)
 
-    target.stdout.at_eof.side_effect = (False, False, False, True)
-    target.stdout.readline = AsyncMock(
-        side_effect=(b'{"line": 1}\n', b'{"line": 2}\n', b'{"line": 3}\n')
-    )
-    target.stderr.at_eof.side_effect = (False, False, False, True)
-    target.stderr.readline = AsyncMock(
-        side_effect=(b"target starting\n", b"target running\n", b"target done\n")
-    )
-    return target
+        # Have `target.wait` take 2s to make sure the tap always finishes before the target
+        async def wait_mock():
+            await asyncio.sleep(2)
+            return target_process.wait.return_value
+
+        target_process.wait.side_effect = wait_mock
+
+        target_process.stdout.at_eof.side_effect = (False, False, False, True)
+        target_process.stdout.readline = AsyncMock(
+            side_effect=(b'{"line": 1}\n', b'{"line": 2}\n', b'{"line": 3}\n')
+        )
+        target_process.stderr.at_eof.side_effect = (False, False, False, True)
+        target_process.stderr.readline = AsyncMock(
+            side_effect=(
+                b"target starting\n",
+                b"target running\n",
+                b"target done\n",
+            )
+        )
+        return target_process
+
+    return _factory
+
+
+@pytest.fixture()
+def target_process(target_process_factory):
+    return target_process_factory()
 
 
 @pytest.fixture()
@@ -624,6 +649,154 @@ class TestCliRunScratchpadOne:
             assert dbt_done_event[0].get("cmd_type") == "command"
             assert dbt_done_event[0].get("stdio") == "stderr"
 
+    @pytest.mark.backend("sqlite")
+    @mock.patch(
+        "meltano.core.logging.utils.default_config", return_value=test_log_config
+    )
+    def test_run_parallelism(
+        self,
+        default_config,
+        cli_runner,
+        project,
+        tap,
+        inherited_tap,
+        target,
+        dbt,
+        tap_process_factory,
+        target_process_factory,
+        dbt_process,
+        project_plugins_service,
+        job_logging_service,
+    ):
+        process_factories = {
+            PluginType.EXTRACTORS: tap_process_factory,
+            PluginType.LOADERS: target_process_factory,
+            PluginType.TRANSFORMERS: lambda: dbt_process,
+        }
+
+        async def invoke_async(invoker, *args, **kwargs):  # noqa: WPS430
+            return process_factories[invoker.plugin.type]()
+
+        args = [
+            "run",
+            "--parallelism",
+            "2",
+            tap.name,
+            target.name,
+            inherited_tap.name,
+            target.name,
+            "dbt:run",
+        ]
+        with mock.patch.object(
+            PluginInvoker, "invoke_async", new=invoke_async
+        ), mock.patch(
+            "meltano.core.block.parser.ProjectPluginsService",
+            return_value=project_plugins_service,
+        ), mock.patch(
+            "meltano.core.transform_add_service.ProjectPluginsService",
+            return_value=project_plugins_service,
+        ):
+            result = cli_runner.invoke(cli, args, catch_exceptions=False)
+            assert result.exit_code == 0
+
+        matcher = EventMatcher(result.stderr)
+        events = [event.get("event") for event in matcher.seen_events]
+        completed_events = matcher.find_by_event("Block run completed.")
+        assert {event.get("set_number") for event in completed_events[:2]} == {0, 1}
+        assert completed_events[2].get("set_number") == 2
+
+        # Both block sets run before either of them completes
+        target_done_events = matcher.find_by_event("target done")
+        assert {event.get("set_number") for event in target_done_events} == {0, 1}
+        first_completed = events.index("Block run completed.")
+        assert (
+            max(idx for idx, event in enumerate(events) if event == "target done")
+            < first_completed
+        )
+
+        # The command block only runs once both block sets completed
+        last_set_completed = len(events) - 1 - events[::-1].index("target done")
+        assert events.index("dbt starting") > last_set_completed
+
+    @pytest.mark.backend("sqlite")
+    @mock.patch(
+        "meltano.core.logging.utils.default_config", return_value=test_log_config
+    )
+    def test_run_parallel_group(
+        self,
+        default_config,
+        cli_runner,
+        project,
+        tap,
+        inherited_tap,
+        target,
+        dbt,
+        tap_process_factory,
+        target_process_factory,
+        dbt_process,
+        project_plugins_service,
+        task_sets_service,
+        job_logging_service,
+    ):
+        process_factories = {
+            PluginType.EXTRACTORS: tap_process_factory,
+            PluginType.LOADERS: target_process_factory,
+            PluginType.TRANSFORMERS: lambda: dbt_process,
+        }
+
+        async def invoke_async(invoker, *args, **kwargs):  # noqa: WPS430
+            return process_factories[invoker.plugin.type]()
+
+        task_sets_service.add(
+            TaskSets(
+                "parallel-group-job",
+                [
+                    {
+                        "parallel": [
+                            f"{tap.name} {target.name}",
+                            [f"{inherited_tap.name} {target.name}", "dbt:run"],
+                        ]
+                    }
+                ],
+            )
+        )
+        with mock.patch.object(
+            PluginInvoker, "invoke_async", new=invoke_async
+        ), mock.patch(
+            "meltano.core.block.parser.ProjectPluginsService",
+            return_value=project_plugins_service,
+        ), mock.patch(
+            "meltano.core.transform_add_service.ProjectPluginsService",
+            return_value=project_plugins_service,
+        ):
+            result = cli_runner.invoke(
+                cli, ["run", "parallel-group-job"], catch_exceptions=False
+            )
+            assert result.exit_code == 0
+        task_sets_service.remove("parallel-group-job")
+
+        matcher = EventMatcher(result.stderr)
+        events = [event.get("event") for event in matcher.seen_events]
+        completed_events = matcher.find_by_event("Block run completed.")
+        assert {event.get("set_number") for event in completed_events} == {0, 1, 2}
+
+        # Both tasks of the group run concurrently
+        first_completed = events.index("Block run completed.")
+        assert {
+            event.get("set_number")
+            for event in matcher.seen_events[:first_completed]
+            if event.get("event") == "target done"
+        } == {0, 1}
+
+        # The command block of the second task only runs once its block set completed
+        set_completed = next(
+            idx
+            for idx, event in enumerate(matcher.seen_events)
+            if event.get("event") == "Block run completed."
+            and event.get("set_number") == 1
+        )
+        assert events.index("dbt starting") > set_completed
+
     @pytest.mark.backend("sqlite")
     @mock.patch(
         "meltano.core.logging.utils.default_config", return_value=test_log_config
@@ -1500,3 +1673,29 @@ class TestCliRunScratchpadOne:
                 assert match
             else:
                 assert not match
+
+
+class TestStages:
+    @pytest.fixture
+    def block_sets(self):
+        block_sets = [mock.Mock(spec=ExtractLoadBlocks) for _ in range(4)]
+        for idx, blk in enumerate(block_sets):
+            blk.context = mock.Mock()
+            blk.context.job.job_name = f"state-{idx}"
+        return block_sets
+
+    def test_parallel_group_only(self, block_sets):
+        """Only the tasks of parallel groups run concurrently by default."""
+        block_parallel_tasks = [None, None, (0, 0), (0, 1)]
+        stages = _stages(block_sets, 1, block_parallel_tasks)
+        assert [[[idx for idx, _ in task] for task in stage] for stage in stages] == [
+            [[0]],
+            [[1]],
+            [[2], [3]],
+        ]
+
+        stages = _stages(block_sets, 2, block_parallel_tasks)
+        assert [[[idx for idx, _ in task] for task in stage] for stage in stages] == [
+            [[0], [1]],
+            [[2], [3]],
+        ]
@@ -250,3 +250,27 @@ class TestCliState:
                 assert_cli_runner(result)
                 job_state = state_service.get_state(state_id)
                 assert (not job_state) or (not job_state.get("singer_state"))
+
+    def test_clear_many(self, state_service, cli_runner, state_ids):
+        with mock.patch(
+            "meltano.cli.state.StateService", return_value=state_service
+        ), mock.patch(
+            "meltano.cli.state.state_service_from_state_id", return_value=None
+        ) as from_state_id:
+            result = cli_runner.invoke(cli, ["state", "clear", "--force", *state_ids])
+            assert_cli_runner(result)
+            # Each state ID is validated
+            assert [call.args[1] for call in from_state_id.call_args_list] == list(
+                state_ids
+            )
+            for state_id in state_ids:
+                job_state = state_service.get_state(state_id)
+                assert (not job_state) or (not job_state.get("singer_state"))
+
+    def test_compact(self, state_service, cli_runner, state_ids_with_jobs):
+        states = state_service.get_states(state_ids_with_jobs)
+        with mock.patch("meltano.cli.state.StateService", return_value=state_service):
+            result = cli_runner.invoke(cli, ["state", "compact", "--force"])
+            assert_cli_runner(result)
+            assert not state_service.compactable_state_ids()
+            assert state_service.get_states(state_ids_with_jobs) == states
@@ -4,6 +4,7 @@ import json
 import logging
 import os
 import tempfile
+from contextlib import closing
 from pathlib import Path
 
 import mock
@@ -96,6 +97,40 @@ class TestELBContextBuilder:
         assert isinstance(builder.context(), ELBContext)
         assert isinstance(builder.make_block(tap).invoker.context, ELBContext)
 
+    def test_session_is_created_lazily(self, project, project_plugins_service, tap):
+        with mock.patch(
+            "meltano.core.block.extract_load.project_engine"
+        ) as project_engine:
+            project_engine.return_value = (None, mock.Mock())
+            builder = ELBContextBuilder(
+                project=project,
+                plugins_service=project_plugins_service,
+            )
+            assert not project_engine.called
+
+            session = builder.session
+            assert builder.context().session is session
+            assert builder.plugin_context(tap).session is session
+            assert not project_engine.called
+
+            # Closing a session that was never used doesn't create it
+            with closing(session):
+                pass
+            assert not session.created
+            assert not project_engine.called
+
+            # The session is only created once the system database is used
+            session.query(Job)
+            session.commit()
+            assert session.created
+            project_engine.assert_called_once_with(project)
+            session_maker = project_engine.return_value[1]
+            session_maker.assert_called_once_with()
+            session_maker.return_value.commit.assert_called_once_with()
+
+            session.close()
+            session_maker.return_value.close.assert_called_once_with()
+
     def test_make_block_returns_valid_singer_block(
         self, project, session, project_plugins_service, tap, target
     ):
@@ -1,6 +1,13 @@
 from __future__ import annotations
 
-from meltano.core.block.parser import is_command_block
+import pytest
+import structlog
+from mock import mock
+
+from meltano.core.block.blockset import BlockSetValidationError
+from meltano.core.block.parser import BlockParser, is_command_block
+from meltano.core.environment import Environment
+from meltano.core.task_sets import DEFAULT_PARALLEL_GROUP_PARALLELISM, TaskSets
 
 
 class TestParserUtils:
@@ -8,3 +15,135 @@ class TestParserUtils:
         """Verify that the is_command_block function returns True when the block is an IOBlock and has a command."""
         assert not is_command_block(tap)
         assert is_command_block(dbt)
+
+
+class TestBlockParser:
+    def test_jobs_parallelism(
+        self, project, tap, target, task_sets_service, project_plugins_service
+    ):
+        """Verify that the parallelism of an invocation is the lowest one of its jobs."""
+        tasks = [f"{tap.name} {target.name}"]
+        task_sets_service.add(TaskSets("parallel-job", tasks, parallelism=4))
+        task_sets_service.add(TaskSets("other-parallel-job", tasks, parallelism=2))
+        task_sets_service.add(TaskSets("serial-job", tasks))
+
+        log = structlog.get_logger()
+        with mock.patch(
+            "meltano.core.block.parser.ProjectPluginsService",
+            return_value=project_plugins_service,
+        ):
+            assert BlockParser(log, project, [tap.name, target.name]).parallelism == 1
+            assert BlockParser(log, project, ["parallel-job"]).parallelism == 4
+            assert (
+                BlockParser(
+                    log, project, ["parallel-job", "other-parallel-job"]
+                ).parallelism
+                == 2
+            )
+            assert (
+                BlockParser(log, project, ["parallel-job", "serial-job"]).parallelism
+                == 1
+            )
+
+    def test_jobs_parallel_groups(
+        self,
+        project,
+        tap,
+        inherited_tap,
+        target,
+        dbt,
+        task_sets_service,
+        project_plugins_service,
+    ):
+        """Verify that blocks are assigned to the parallel group and task of their job."""
+        task_sets_service.add(
+            TaskSets(
+                "grouped-job",
+                [
+                    f"{tap.name} {target.name}",
+                    {
+                        "parallel": [
+                            f"{tap.name} {target.name}",
+                            [f"{inherited_tap.name} {target.name}", "dbt:run"],
+                        ]
+                    },
+                    "dbt:test",
+                ],
+            )
+        )
+        task_sets_service.add(
+            TaskSets(
+                "limited-job",
+                [{"parallel": [f"{tap.name} {target.name}", "dbt:run"]}],
+                parallelism=2,
+            )
+        )
+        task_sets_service.add(
+            TaskSets("split-job", [{"parallel": [tap.name, target.name]}])
+        )
+        task_sets_service.add(
+            TaskSets(
+                "shared-state-job",
+                [
+                    {
+                        "parallel": [
+                            f"{tap.name} {target.name}",
+                            [f"{tap.name} {target.name}", "dbt:run"],
+                        ]
+                    }
+                ],
+            )
+        )
+
+        log = structlog.get_logger()
+        with mock.patch(
+            "meltano.core.block.parser.ProjectPluginsService",
+            return_value=project_plugins_service,
+        ):
+            parser = BlockParser(log, project, ["grouped-job", "grouped-job"])
+            assert len(list(parser.find_blocks())) == 10
+            # The default parallelism only applies to the tasks of parallel groups
+            assert parser.parallelism == 1
+            assert parser.group_parallelism == {
+                0: DEFAULT_PARALLEL_GROUP_PARALLELISM,
+                1: DEFAULT_PARALLEL_GROUP_PARALLELISM,
+            }
+            assert parser.block_parallel_tasks == [
+                None,
+                (0, 0),
+                (0, 1),
+                (0, 1),
+                None,
+                None,
+                (1, 0),
+                (1, 1),
+                (1, 1),
+                None,
+            ]
+
+            parser = BlockParser(log, project, ["grouped-job", "limited-job"])
+            assert parser.parallelism == 1
+            assert parser.group_parallelism == {
+                0: DEFAULT_PARALLEL_GROUP_PARALLELISM,
+                1: 2,
+            }
+
+            parser = BlockParser(log, project, ["split-job"])
+            with pytest.raises(BlockSetValidationError, match="spans several tasks"):
+                list(parser.find_blocks())
+
+            # Without an active environment, block sets have no state ID
+            assert (
+                len(list(BlockParser(log, project, ["shared-state-job"]).find_blocks()))
+                == 3
+            )
+
+            project.active_environment = Environment(name="test")
+            try:
+                parser = BlockParser(log, project, ["shared-state-job"])
+                with pytest.raises(
+                    BlockSetValidationError, match="shares its state ID"
+                ):
+                    list(parser.find_blocks())
+            finally:
+                project.active_environment = None
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import time
 from collections import Counter
+from unittest import mock
 
 import pytest
+import requests
 
 from meltano.core.hub import MeltanoHubService
+from meltano.core.hub.cache import HubCache
 from meltano.core.hub.client import HubPluginVariantNotFoundError
 from meltano.core.plugin.base import PluginType, Variant
 from meltano.core.plugin.error import PluginNotFoundError
@@ -100,3 +104,97 @@ class TestMeltanoHubService:
         ProjectSettingsService(project).set("hub_url_auth", "Bearer s3cr3t")
         hub = MeltanoHubService(project)
         assert hub.session.headers["Authorization"] == "Bearer s3cr3t"
+
+
+class TestMeltanoHubServiceCache:
+    @pytest.fixture
+    def make_subject(self, project, meltano_hub_service, hub_request_counter, tmp_path):
+        adapter = meltano_hub_service.session.get_adapter(
+            meltano_hub_service.hub_api_url
+        )
+
+        def _make_subject(**cache_options) -> MeltanoHubService:
+            hub = MeltanoHubService(project)
+            hub.session.mount(hub.hub_api_url, adapter)
+            hub.cache = HubCache(tmp_path / "hub", **cache_options)
+            return hub
+
+        return _make_subject
+
+    def test_fresh(self, make_subject, hub_request_counter: Counter):
+        subject = make_subject()
+        extractors = subject.get_plugins_of_type(PluginType.EXTRACTORS)
+        assert subject.get_plugins_of_type(PluginType.EXTRACTORS) == extractors
+        assert hub_request_counter["/extractors/index"] == 1
+
+        # The cache is shared with other invocations
+        other = make_subject()
+        assert other.get_plugins_of_type(PluginType.EXTRACTORS) == extractors
+        assert hub_request_counter["/extractors/index"] == 1
+
+    def test_revalidate(self, make_subject, hub_request_counter: Counter):
+        subject = make_subject(ttl=0, stale_while_revalidate=0)
+        definition = subject.find_definition(PluginType.EXTRACTORS, "tap-mock")
+
+        with mock.patch.object(
+            subject.cache, "store", wraps=subject.cache.store
+        ) as store, mock.patch.object(
+            subject.cache, "touch", wraps=subject.cache.touch
+        ) as touch:
+            assert subject.find_definition(PluginType.EXTRACTORS, "tap-mock") == (
+                definition
+            )
+
+        # Responses are revalidated with their ETag, and not downloaded again
+        assert hub_request_counter["/extractors/tap-mock--meltano"] == 2
+        assert touch.call_count == 2
+        store.assert_not_called()
+
+    def test_stale_while_revalidate(self, make_subject, hub_request_counter: Counter):
+        subject = make_subject(ttl=0, stale_while_revalidate=3600)
+        extractors = subject.get_plugins_of_type(PluginType.EXTRACTORS)
+        url = subject.plugin_type_endpoint(PluginType.EXTRACTORS)
+        fetched_at = subject.cache.load(url).fetched_at
+
+        assert subject.get_plugins_of_type(PluginType.EXTRACTORS) == extractors
+
+        deadline = time.monotonic() + 10
+        while subject._revalidating and time.monotonic() < deadline:  # noqa: WPS437
+            time.sleep(0.01)
+
+        assert hub_request_counter["/extractors/index"] == 2
+        assert subject.cache.load(url).fetched_at > fetched_at
+
+    def test_unreachable(self, make_subject, hub_request_counter: Counter):
+        subject = make_subject(ttl=0, stale_while_revalidate=0)
+        extractors = subject.get_plugins_of_type(PluginType.EXTRACTORS)
+
+        with mock.patch.object(
+            subject.session, "get", side_effect=requests.ConnectionError
+        ):
+            assert subject.get_plugins_of_type(PluginType.EXTRACTORS) == extractors
+
+            with pytest.raises(requests.ConnectionError):
+                subject.get_plugins_of_type(PluginType.LOADERS)
+
+    def test_offline(self, make_subject, hub_request_counter: Counter):
+        make_subject().get_plugins_of_type(PluginType.EXTRACTORS)
+        hub_request_counter.clear()
+
+        subject = make_subject(offline=True)
+        assert "tap-mock" in subject.get_plugins_of_type(PluginType.EXTRACTORS)
+
+        # Uncached responses fall back to the bundled discovery.yml
+        loaders = subject.get_plugins_of_type(PluginType.LOADERS)
+        assert loaders["target-csv"].default_variant == "hotgluexyz"
+
+        definition = subject.find_definition(
+            PluginType.LOADERS, "target-csv", variant_name="singer-io"
+        )
+        assert definition.name == "target-csv"
+        assert [variant.name for variant in definition.variants] == ["singer-io"]
+
+        with pytest.raises(PluginNotFoundError):
+            subject.find_definition(PluginType.LOADERS, "target-not-found")
+
+        assert not hub_request_counter
@@ -66,3 +66,41 @@ class TestJobFinder:
         assert job in JobFinder(state_id=job.job_name).stale(session)
 
         assert job not in JobFinder(state_id="other").stale(session)
+
+        # Jobs heartbeating every minute have 10 minutes to record one
+        assert job not in JobFinder(state_id=job.job_name).stale(
+            session, heartbeat_interval=61
+        )
+
+    @pytest.fixture
+    def state_jobs(self, session):
+        now = datetime.utcnow()
+        states = (State.SUCCESS, State.FAIL, State.SUCCESS, State.RUNNING)
+        for state_id in ("first", "second", "never_succeeded"):
+            for idx, state in enumerate(states):
+                if state_id == "never_succeeded" and state == State.SUCCESS:
+                    state = State.FAIL
+                Job(
+                    job_name=state_id,
+                    state=state,
+                    started_at=now + timedelta(minutes=idx),
+                    ended_at=None
+                    if state == State.RUNNING
+                    else now + timedelta(minutes=idx, seconds=30),
+                ).save(session)
+
+    @pytest.mark.usefixtures("state_jobs")
+    def test_latest_by_state_id(self, session, monkeypatch):
+        # Queries are batched by a number of state IDs
+        monkeypatch.setattr("meltano.core.job.finder.STATE_IDS_PER_QUERY", 2)
+        state_ids = ["first", "second", "never_succeeded", "missing"]
+
+        latest = JobFinder.latest_by_state_id(session, state_ids)
+        latest_success = JobFinder.latest_success_by_state_id(session, state_ids)
+
+        assert set(latest) == {"first", "second", "never_succeeded"}
+        assert set(latest_success) == {"first", "second"}
+        for state_id in state_ids:
+            finder = JobFinder(state_id)
+            assert latest.get(state_id) == finder.latest(session)
+            assert latest_success.get(state_id) == finder.latest_success(session)
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import AsyncExitStack
+from unittest import mock
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import OperationalError
+
+from meltano.core.job import Job, State
+from meltano.core.job.heartbeat import HeartbeatWriter
+
+
+class TestHeartbeatWriter:
+    @pytest.fixture
+    def updates(self, session):
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):  # noqa: WPS430
+            if statement.startswith("UPDATE runs"):
+                statements.append(statement)
+
+        engine = session.get_bind()
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        yield statements
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    @pytest.mark.asyncio
+    async def test_beat(self, session, updates):
+        jobs = [Job(job_name=f"job-{idx}") for idx in range(3)]
+
+        async with AsyncExitStack() as stack:
+            for job in jobs:
+                await stack.enter_async_context(job.run(session))
+
+            original_heartbeats = [job.last_heartbeat_at for job in jobs]
+            updates.clear()
+
+            writer = HeartbeatWriter.for_session(session, 1)
+            writer.beat()
+
+            # A single UPDATE records the heartbeats of all running jobs
+            assert len(updates) == 1
+            for job, original_heartbeat in zip(jobs, original_heartbeats):
+                assert job.last_heartbeat_at > original_heartbeat
+                assert job not in session.dirty
+
+            session.expire_all()
+            assert len({job.last_heartbeat_at for job in jobs}) == 1
+
+        assert all(job.state is State.SUCCESS for job in jobs)
+
+    @pytest.mark.asyncio
+    async def test_for_session(self, session):
+        writer = HeartbeatWriter.for_session(session, 1)
+
+        assert HeartbeatWriter.for_session(session, 1) is writer
+        assert HeartbeatWriter.for_session(session, 5) is not writer
+
+    def test_for_session_event_loop(self, session):
+        async def get_writer():  # noqa: WPS430
+            return HeartbeatWriter.for_session(session, 1)
+
+        # Writers are never shared between event loops
+        assert asyncio.run(get_writer()) is not asyncio.run(get_writer())
+
+    @pytest.mark.asyncio
+    async def test_discard(self, session):
+        first_job = Job(job_name="first")
+        second_job = Job(job_name="second")
+        writer = HeartbeatWriter.for_session(session, 1)
+
+        async with first_job.run(session):
+            async with second_job.run(session):
+                heartbeat_future = writer._task  # noqa: WPS437
+                assert heartbeat_future is not None
+
+            # The writer keeps recording heartbeats while a job is running
+            assert writer._task is heartbeat_future  # noqa: WPS437
+
+        assert writer._task is None  # noqa: WPS437
+        assert heartbeat_future.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_beat_error(self, session):
+        job = Job(job_name="test")
+
+        async with job.run(session):
+            writer = HeartbeatWriter.for_session(session, 1)
+            original_heartbeat = job.last_heartbeat_at
+            writer._connection = mock.MagicMock()  # noqa: WPS437
+            writer._connection.execute.side_effect = OperationalError(  # noqa: WPS437
+                "UPDATE runs", {}, Exception("database is locked")
+            )
+
+            # Failing to record heartbeats doesn't fail the job
+            writer.beat()
+            assert job.last_heartbeat_at == original_heartbeat
+
+            # The next heartbeat uses a new connection
+            writer.beat()
+            assert job.last_heartbeat_at > original_heartbeat
+
+        assert job.state is State.SUCCESS
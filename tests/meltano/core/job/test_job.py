@@ -159,6 +159,15 @@ class TestJob:
         job.last_heartbeat_at = datetime.utcnow() - offset
         assert job.is_stale()
 
+        # Jobs heartbeating less often are stale after 10 missed heartbeats
+        offset = timedelta(minutes=HEARTBEAT_VALID_MINUTES + 1)
+        job.last_heartbeat_at = datetime.utcnow() - offset
+        assert not job.is_stale(heartbeat_interval=60)
+
+        offset = timedelta(minutes=11)
+        job.last_heartbeat_at = datetime.utcnow() - offset
+        assert job.is_stale(heartbeat_interval=60)
+
         # Completed jobs are not stale
         job.success()
         assert not job.is_stale()
@@ -192,6 +201,14 @@ class TestJob:
         assert job.has_error()
         assert "5 minutes" in job.payload["error"]
 
+        # Fails a stale job based on its heartbeat interval
+        job = Job()
+        job.start()
+        job.last_heartbeat_at = datetime.utcnow() - timedelta(minutes=11)
+
+        assert job.fail_stale(heartbeat_interval=60)
+        assert "10 minutes" in job.payload["error"]
+
 
 def send_signal(signal: int):
     if platform.system() == "Windows":
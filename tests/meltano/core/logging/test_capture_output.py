@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+
+import mock
+import pytest
+
+from meltano.core.logging import utils
+from meltano.core.logging.utils import capture_subprocess_output
+
+
+class LineCollector:
+    def __init__(self):
+        self.lines = []
+
+    def writeline(self, line: str):
+        self.lines.append(line)
+
+
+class BatchCollector(LineCollector):
+    def __init__(self):
+        super().__init__()
+        self.batches = 0
+        self.flushed = False
+
+    def writelines(self, lines):
+        self.batches += 1
+        self.lines.extend(lines)
+
+    def flush(self):
+        self.flushed = True
+
+
+async def _run_capture(payload: bytes, *extra_writers):
+    producer = await asyncio.create_subprocess_exec(
+        sys.executable,
+        "-c",
+        "import sys; sys.stdout.buffer.write(sys.stdin.buffer.read())",
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+    )
+    consumer = await asyncio.create_subprocess_exec(
+        sys.executable,
+        "-c",
+        "import sys; sys.stdout.buffer.write(sys.stdin.buffer.read())",
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+    )
+
+    producer.stdin.write(payload)
+    producer.stdin.close()
+
+    await capture_subprocess_output(producer.stdout, *extra_writers, consumer.stdin)
+    await producer.wait()
+    consumer.stdin.close()
+    relayed, _ = await consumer.communicate()
+    return relayed
+
+
+class TestCaptureSubprocessOutput:
+    @pytest.fixture
+    def payload(self):
+        lines = (
+            f'{{"type": "RECORD", "record": {{"id": {idx}}}}}\n' for idx in range(20000)
+        )
+        return "".join(lines).encode()
+
+    @pytest.mark.asyncio
+    async def test_raw_relay(self, payload, monkeypatch):
+        monkeypatch.setattr(utils, "RELAY_CHUNK_SIZE", 4096)
+        assert await _run_capture(payload) == payload
+
+    @pytest.mark.asyncio
+    async def test_line_consumer_falls_back_to_lines(self, payload):
+        collector = LineCollector()
+        assert await _run_capture(payload, collector) == payload
+        assert len(collector.lines) == 20000
+        assert collector.lines[0] == '{"type": "RECORD", "record": {"id": 0}}\n'
+
+    def test_is_raw_relay(self):
+        writer = mock.Mock(spec=asyncio.StreamWriter)
+        assert utils._is_raw_relay((writer,))
+        assert utils._is_raw_relay((writer, writer))
+        assert not utils._is_raw_relay((writer, LineCollector()))
+        assert not utils._is_raw_relay(())
+
+    @pytest.mark.asyncio
+    async def test_batched_lines(self, payload, monkeypatch):
+        monkeypatch.setattr(utils, "RELAY_CHUNK_SIZE", 4096)
+        collector = BatchCollector()
+        payload += "no trailing newline".encode()
+
+        producer = await asyncio.create_subprocess_exec(
+            sys.executable,
+            "-c",
+            "import sys; sys.stdout.buffer.write(sys.stdin.buffer.read())",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+        )
+        producer.stdin.write(payload)
+        producer.stdin.close()
+        await capture_subprocess_output(producer.stdout, collector)
+        await producer.wait()
+
+        assert "".join(collector.lines).encode() == payload
+        assert len(collector.lines) == 20001
+        assert collector.lines[0] == '{"type": "RECORD", "record": {"id": 0}}\n'
+        assert collector.lines[-1] == "no trailing newline"
+        assert collector.batches < len(collector.lines) / 10
+        assert collector.flushed
+
+    def test_is_batched(self):
+        writer = mock.Mock(spec=asyncio.StreamWriter)
+        assert utils._is_batched((BatchCollector(),))
+        assert not utils._is_batched((BatchCollector(), LineCollector()))
+        assert not utils._is_batched((BatchCollector(), writer))
+        assert not utils._is_batched(())
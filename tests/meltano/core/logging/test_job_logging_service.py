@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import os
+import uuid
+from pathlib import Path
+
+import pytest
+
+from meltano.core.logging.job_logging_service import (
+    LATEST_LOG_INDEX,
+    MissingJobLogException,
+    SizeThresholdJobLogException,
+)
+
+STATE_ID = "dev:tap-mock-to-target-mock"
+
+
+class TestJobLoggingService:
+    @pytest.fixture
+    def write_log(self, job_logging_service):
+        def _write_log(content: str, run_id=None):  # noqa: WPS430
+            log_file_name = job_logging_service.generate_log_name(
+                STATE_ID, run_id or uuid.uuid4()
+            )
+            with open(log_file_name, "w") as log_file:
+                log_file.write(content)
+            return log_file_name
+
+        return _write_log
+
+    @pytest.fixture
+    def log_content(self):
+        return "".join(f"line {idx}\n" for idx in range(1000))
+
+    def test_get_latest_log_path(self, job_logging_service, write_log, monkeypatch):
+        with pytest.raises(MissingJobLogException):
+            job_logging_service.get_latest_log_path(STATE_ID)
+
+        first_log = write_log("first run\n")
+        latest_log = write_log("second run\n")
+
+        # Latest logs are found without listing the logs of all runs
+        monkeypatch.setattr(job_logging_service, "get_all_logs", None)
+        assert job_logging_service.get_latest_log_path(STATE_ID) == latest_log
+        assert job_logging_service.get_latest_log(STATE_ID) == "second run\n"
+        assert sorted(os.listdir(job_logging_service.logs_dir(STATE_ID))) == sorted(
+            [
+                *(Path(log).parent.name for log in (first_log, latest_log)),
+                LATEST_LOG_INDEX,
+            ]
+        )
+
+    def test_get_latest_log_path_without_index(self, job_logging_service, write_log):
+        latest_log = write_log("run\n")
+        Path(job_logging_service.logs_dir(STATE_ID), LATEST_LOG_INDEX).unlink()
+
+        assert job_logging_service.get_latest_log_path(STATE_ID) == latest_log
+
+    def test_get_latest_log_size_threshold(
+        self, job_logging_service, write_log, monkeypatch
+    ):
+        write_log("line\n" * 10)
+        monkeypatch.setattr(
+            "meltano.core.logging.job_logging_service.MAX_FILE_SIZE", 20
+        )
+
+        with pytest.raises(SizeThresholdJobLogException):
+            job_logging_service.get_latest_log(STATE_ID)
+
+    def test_read_latest_log(self, job_logging_service, write_log, log_content):
+        write_log(log_content)
+        size = len(log_content)
+
+        chunk = job_logging_service.read_latest_log(STATE_ID)
+        assert chunk.content == log_content
+        assert (chunk.offset, chunk.next_offset, chunk.size) == (0, size, size)
+
+        # Chunks end on a line boundary
+        chunk = job_logging_service.read_latest_log(STATE_ID, offset=7, max_size=20)
+        assert chunk.content == "line 1\nline 2\n"
+        assert (chunk.offset, chunk.next_offset) == (7, 21)
+
+        # Tails start on a line boundary
+        chunk = job_logging_service.read_latest_log(STATE_ID, tail=20)
+        assert chunk.content == "line 998\nline 999\n"
+        assert (chunk.offset, chunk.next_offset) == (size - 18, size)
+
+        chunk = job_logging_service.read_latest_log(STATE_ID, tail=size * 2)
+        assert chunk.content == log_content
+
+        chunk = job_logging_service.read_latest_log(STATE_ID, offset=size * 2)
+        assert chunk.content == ""
+        assert chunk.next_offset == size
+
+    def test_read_latest_log_follow(self, job_logging_service, write_log):
+        log_file_name = write_log("line 1\nline")
+
+        # Lines that are still being written are left for the next read
+        chunk = job_logging_service.read_latest_log(STATE_ID)
+        assert chunk.content == "line 1\n"
+
+        with open(log_file_name, "a") as log_file:
+            log_file.write(" 2\n")
+
+        chunk = job_logging_service.read_latest_log(STATE_ID, offset=chunk.next_offset)
+        assert chunk.content == "line 2\n"
+
+        # Once the job finished, the last line is returned even without a newline
+        with open(log_file_name, "a") as log_file:
+            log_file.write("line 3")
+        chunk = job_logging_service.read_latest_log(
+            STATE_ID, offset=chunk.next_offset, finished=True
+        )
+        assert chunk.content == "line 3"
+        assert chunk.next_offset == chunk.size
+
+        # Unless the chunk ends before the end of the log
+        chunk = job_logging_service.read_latest_log(
+            STATE_ID, max_size=10, finished=True
+        )
+        assert chunk.content == "line 1\n"
+
+        # Lines longer than the maximum size are split
+        write_log("x" * 30)
+        chunk = job_logging_service.read_latest_log(STATE_ID, max_size=20)
+        assert chunk.content == "x" * 20
+
+    def test_stream_latest_log(self, job_logging_service, write_log, log_content):
+        write_log(log_content)
+
+        chunks = list(
+            job_logging_service.stream_latest_log(STATE_ID, offset=7, chunk_size=1000)
+        )
+        assert len(chunks) == -(-(len(log_content) - 7) // 1000)
+        assert b"".join(chunks).decode() == log_content[7:]
@@ -5,13 +5,25 @@ import logging
 import platform
 import sys
 import tempfile
+from io import StringIO
 
 import mock
 import pytest
 import structlog
 from structlog.testing import LogCapture
 
-from meltano.core.logging.output_logger import Out, OutputLogger
+from meltano.core.logging.formatters import (
+    TIMESTAMPER,
+    console_log_formatter,
+    json_formatter,
+)
+from meltano.core.logging.output_logger import (
+    LogBudget,
+    Out,
+    OutputLogger,
+    _stream_handlers,
+)
+from meltano.core.logging.utils import setup_logging
 
 
 def assert_lines(output, *lines):
@@ -19,6 +31,51 @@ def assert_lines(output, *lines):
         assert line in output
 
 
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestLogBudget:
+    def test_unlimited(self):
+        budget = LogBudget()
+
+        assert not budget
+        assert all(budget.admit("line\n") for _ in range(1000))
+        assert budget.take_dropped() == (0, 0)
+
+    def test_lines_per_second(self):
+        clock = FakeClock()
+        budget = LogBudget(lines_per_second=2, clock=clock)
+
+        assert budget
+        assert [budget.admit("line\n") for _ in range(4)] == [
+            True,
+            True,
+            False,
+            False,
+        ]
+        assert budget.take_dropped() == (2, 10)
+        assert budget.take_dropped() == (0, 0)
+
+        # The budget is renewed every second
+        clock.now = 0.5
+        assert not budget.admit("line\n")
+        clock.now = 1.0
+        assert budget.admit("line\n")
+
+    def test_bytes_per_second(self):
+        budget = LogBudget(bytes_per_second=10, clock=FakeClock())
+
+        assert budget.admit("line\n")
+        assert not budget.admit("long line\n")
+        assert budget.admit("ok\n")
+        assert budget.take_dropped() == (1, 10)
+
+
 class TestOutputLogger:
     @pytest.fixture
     def log(self, tmp_path):
@@ -155,6 +212,52 @@ class TestOutputLogger:
             },
         )
 
+    def test_log_budget(self, log, log_output):
+        clock = FakeClock()
+        subject = OutputLogger(log.name, lines_per_second=2)
+        out = subject.out("budget")
+        out.budget.clock = clock
+
+        out.writelines(f"LINE {idx}\n" for idx in range(5))
+        assert [entry["event"] for entry in log_output.entries] == ["LINE 0", "LINE 1"]
+        assert out.last_line == "LINE 4\n"
+
+        # Dropped lines are reported once lines fit within the budget again
+        clock.now = 1.0
+        out.writeline("LINE 5\n")
+        out.flush()
+        assert_lines(
+            log_output.entries[2:],
+            {
+                "name": "budget",
+                "event": "Dropped 3 lines (21 bytes) of output to stay within "
+                + "the plugin log budget",
+                "log_level": "warning",
+            },
+            {"name": "budget", "event": "LINE 5", "log_level": "info"},
+        )
+        assert len(log_output.entries) == 4
+
+    def test_log_budget_line_writer(self, log, log_output):
+        subject = OutputLogger(log.name, lines_per_second=1)
+        out = subject.out("budget")
+        out.budget.clock = FakeClock()
+
+        # Lines dropped at the end of the output are reported once it's closed
+        with out.line_writer() as writer:
+            writer.write("LINE 0\n")
+            writer.write("LINE 1\n")
+        assert_lines(
+            log_output.entries,
+            {"name": "budget", "event": "LINE 0", "log_level": "info"},
+            {
+                "name": "budget",
+                "event": "Dropped 1 lines (6 bytes) of output to stay within "
+                + "the plugin log budget",
+                "log_level": "warning",
+            },
+        )
+
     @pytest.mark.asyncio
     async def test_set_custom_logger(self, log, subject, log_output):
         if platform.system() == "Windows":
@@ -234,3 +337,211 @@ class TestOutputLogger:
         # make sure the exception is logged
         assert log_content.get("event") == "exception"
         assert log_content.get("exc_info")
+
+
+class TestOutBatchedLogging:
+    @pytest.fixture
+    def streams(self):
+        return {"console": StringIO(), "json": StringIO(), "filtered": StringIO()}
+
+    @pytest.fixture
+    def stdlib_logger(self, streams):
+        console_handler = logging.StreamHandler(streams["console"])
+        console_handler.setFormatter(console_log_formatter())
+        json_handler = logging.StreamHandler(streams["json"])
+        json_handler.setFormatter(json_formatter())
+        # Handlers with filters are given a log record per line
+        filtered_handler = logging.StreamHandler(streams["filtered"])
+        filtered_handler.setFormatter(json_formatter())
+        filtered_handler.addFilter(lambda record: "skip" not in record.getMessage())
+        debug_handler = logging.StreamHandler(StringIO())
+        debug_handler.setLevel(logging.ERROR)
+
+        logger = logging.getLogger("meltano.test_batched_logging")
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        handlers = (console_handler, json_handler, filtered_handler, debug_handler)
+        for handler in handlers:
+            logger.addHandler(handler)
+        try:
+            yield logger
+        finally:
+            for handler in handlers:
+                logger.removeHandler(handler)
+
+    @pytest.fixture
+    def bound_logger(self, stdlib_logger):
+        def timestamper(logger, method_name, event_dict):  # noqa: WPS430
+            event_dict["timestamp"] = "2022-01-01T00:00:00Z"
+            return event_dict
+
+        return structlog.wrap_logger(
+            stdlib_logger,
+            processors=[
+                structlog.stdlib.add_log_level,
+                structlog.stdlib.PositionalArgumentsFormatter(),
+                timestamper,
+                structlog.processors.StackInfoRenderer(),
+                structlog.processors.format_exc_info,
+                structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
+            ],
+            wrapper_class=structlog.stdlib.BoundLogger,
+        ).bind(cmd_type="extractor")
+
+    def test_same_output_as_structlog(self, bound_logger, streams):
+        lines = ["LINE\n", '{"type": "RECORD"}\n', "skip this line\n"]
+        out = Out(None, "tap-test", bound_logger, logging.INFO, None)
+
+        for line in lines:
+            bound_logger.log(logging.INFO, line.rstrip(), name="tap-test")
+        expected = {name: stream.getvalue() for name, stream in streams.items()}
+        for stream in streams.values():
+            stream.seek(0)
+            stream.truncate()
+
+        out.writelines(lines)
+
+        assert {name: stream.getvalue() for name, stream in streams.items()} == (
+            expected
+        )
+        assert expected["console"].count("\n") == 3
+        assert expected["filtered"].count("\n") == 2
+
+    def test_single_write(self, bound_logger, streams):
+        lines = ["LINE\n", '{"type": "RECORD"}\n', "skip this line\n"]
+        out = Out(None, "tap-test", bound_logger, logging.INFO, None)
+
+        console_write = mock.patch.object(
+            streams["console"], "write", wraps=streams["console"].write
+        )
+        json_write = mock.patch.object(
+            streams["json"], "write", wraps=streams["json"].write
+        )
+        with console_write as console_write, json_write as json_write:
+            out.writelines(lines)
+
+        console_write.assert_called_once()
+        json_write.assert_called_once()
+        assert streams["console"].getvalue().count("\n") == 3
+
+    def test_level_not_enabled(self, bound_logger, streams):
+        out = Out(None, "tap-test", bound_logger, logging.DEBUG, None)
+        out.writelines(["LINE\n"])
+
+        assert not any(stream.getvalue() for stream in streams.values())
+
+
+class TestOutBatchedLoggingConfig:
+    """Batched output must match per-line output for `setup_logging` configs."""
+
+    lines = ["LINE\n", '{"type": "RECORD"}\n', "  indented \x1b[1mbold\x1b[0m\n"]
+
+    @pytest.fixture(autouse=True)
+    def restore_logging(self):
+        root = logging.getLogger()
+        handlers, level = root.handlers[:], root.level
+        structlog_config = structlog.get_config()
+        try:
+            yield
+        finally:
+            for handler in root.handlers[:]:
+                root.removeHandler(handler)
+                handler.close()
+            for handler in handlers:
+                root.addHandler(handler)
+            root.setLevel(level)
+            structlog.configure(**structlog_config)
+
+    @pytest.fixture
+    def log_config(self, tmp_path):
+        log_config = tmp_path / "logging.yaml"
+        log_config.write_text(
+            f"""
+version: 1
+disable_existing_loggers: false
+formatters:
+  structured_plain:
+    (): meltano.core.logging.console_log_formatter
+    colors: false
+  key_value:
+    (): meltano.core.logging.key_value_formatter
+    sort_keys: false
+  json:
+    (): meltano.core.logging.json_formatter
+handlers:
+  console:
+    class: logging.StreamHandler
+    formatter: structured_plain
+    stream: ext://sys.stderr
+  key_value_file:
+    class: logging.FileHandler
+    formatter: key_value
+    filename: {tmp_path / "key_value.log"}
+  json_file:
+    class: logging.FileHandler
+    formatter: json
+    filename: {tmp_path / "json.log"}
+root:
+  level: INFO
+  handlers: [console, key_value_file, json_file]
+"""
+        )
+        return log_config
+
+    def configure(self, log_config: str | None):
+        setup_logging(log_level="info", log_config=log_config)
+
+        def timestamper(logger, method_name, event_dict):  # noqa: WPS430
+            event_dict["timestamp"] = "2022-01-01T00:00:00Z"
+            return event_dict
+
+        processors = structlog.get_config()["processors"]
+        structlog.configure(
+            processors=[
+                timestamper if processor is TIMESTAMPER else processor
+                for processor in processors
+            ]
+        )
+
+        bound_logger = structlog.stdlib.get_logger(
+            "meltano.test_batched_logging_config"
+        ).bind(cmd_type="extractor")
+        # All the handlers write batches of lines at once
+        handlers = logging.getLogger().handlers
+        assert handlers
+        assert _stream_handlers(bound_logger, logging.INFO) == handlers
+        return bound_logger
+
+    def outputs(self, capsys, tmp_path) -> dict[str, bytes]:
+        outputs = {"console": capsys.readouterr().err.encode()}
+        for path in tmp_path.glob("*.log"):
+            outputs[path.name] = path.read_bytes()
+            path.write_bytes(b"")
+        return outputs
+
+    @pytest.mark.parametrize("no_color", [False, True])
+    def test_default_config(self, capsys, tmp_path, monkeypatch, no_color):
+        if no_color:
+            monkeypatch.setenv("NO_COLOR", "1")
+        else:
+            monkeypatch.delenv("NO_COLOR", raising=False)
+        bound_logger = self.configure(None)
+        self.assert_same_output(bound_logger, capsys, tmp_path)
+
+    def test_file_config(self, capsys, tmp_path, log_config):
+        bound_logger = self.configure(str(log_config))
+        expected = self.assert_same_output(bound_logger, capsys, tmp_path)
+        assert set(expected) == {"console", "key_value.log", "json.log"}
+
+    def assert_same_output(self, bound_logger, capsys, tmp_path):
+        for line in self.lines:
+            bound_logger.log(logging.INFO, line.rstrip(), name="tap-test")
+        expected = self.outputs(capsys, tmp_path)
+
+        out = Out(None, "tap-test", bound_logger, logging.INFO, None)
+        out.writelines(self.lines)
+
+        assert self.outputs(capsys, tmp_path) == expected
+        for output in expected.values():
+            assert output.count(b"\n") == len(self.lines)
+        return expected
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import copy
+import io
 import json
 
 import pytest
 
 from meltano.core.plugin.singer.catalog import (  # noqa: WPS235
     CatalogRule,
+    CatalogRuleMatcher,
+    CatalogRulesExecutor,
     ListExecutor,
     ListSelectedExecutor,
     MetadataExecutor,
@@ -14,7 +18,11 @@ from meltano.core.plugin.singer.catalog import (  # noqa: WPS235
     SchemaRule,
     SelectExecutor,
     SelectionType,
+    dump_catalog,
+    iter_catalog,
     path_property,
+    select_filter_metadata_rules,
+    select_metadata_rules,
     visit,
 )
 
@@ -957,3 +965,100 @@ class TestListExecutor:
                 "payload.timestamp",
             }
         }
+
+
+class TestCatalogRuleMatcher:
+    def test_matching(self):
+        rules = [
+            CatalogRule("tap_stream_id"),
+            CatalogRule("tap_stream*", ["properties", "*"]),
+            CatalogRule(["other", "tap_*"], ["properties", "name"]),
+            CatalogRule("tap_stream_id", ["properties", "name"], negated=True),
+            CatalogRule("other", [], negated=True),
+        ]
+        matcher = CatalogRuleMatcher(rules)
+
+        for tap_stream_id in ("tap_stream_id", "tap_stream", "other", "unknown"):
+            for breadcrumb in (
+                None,
+                [],
+                ["properties", "name"],
+                ["properties", "payload", "properties", "hash"],
+            ):
+                assert matcher.matching(
+                    tap_stream_id, breadcrumb
+                ) == CatalogRule.matching(rules, tap_stream_id, breadcrumb)
+
+
+class TestCatalogRulesExecutor:
+    @pytest.fixture
+    def catalog(self, request):
+        return json.loads(globals()[request.param])  # noqa: WPS421
+
+    @pytest.fixture
+    def schema_rules(self):
+        return [
+            SchemaRule(
+                "UniqueEntitiesName",
+                ["properties", "code"],
+                {"anyOf": [{"type": "string"}, {"type": "null"}]},
+            ),
+            SchemaRule(
+                "UniqueEntitiesName",
+                ["properties", "*_at"],
+                {"type": "string", "format": "date"},
+            ),
+            SchemaRule(
+                "Unique*",
+                ["properties", "payload"],
+                {"type": "object", "properties": {"hash": {"type": "string"}}},
+            ),
+        ]
+
+    @pytest.fixture
+    def metadata_rules(self):
+        return [
+            *select_metadata_rules(["!*.*", "UniqueEntitiesName.*", "*.payload.*"]),
+            *select_metadata_rules(["!UniqueEntitiesName.name"]),
+            MetadataRule("UniqueEntitiesName", [], "replication-key", "created_at"),
+            MetadataRule("*", ["properties", "created_at"], "is-replication-key", True),
+            *select_filter_metadata_rules(["Unique*", "!Other*"]),
+        ]
+
+    @pytest.mark.parametrize(
+        "catalog",
+        ["CATALOG", "LEGACY_CATALOG", "JSON_SCHEMA", "EMPTY_STREAM_SCHEMA"],
+        indirect=["catalog"],
+    )
+    def test_visit(self, catalog, schema_rules, metadata_rules):
+        expected = copy.deepcopy(catalog)
+        visit(expected, SchemaExecutor(copy.deepcopy(schema_rules)))
+        visit(expected, MetadataExecutor(metadata_rules))
+
+        executor = CatalogRulesExecutor(schema_rules, metadata_rules)
+        assert executor.visit(catalog) == expected
+
+    @pytest.mark.parametrize("catalog", ["CATALOG"], indirect=["catalog"])
+    @pytest.mark.parametrize("indent", [None, 2])
+    def test_streaming(self, catalog, schema_rules, metadata_rules, indent):
+        executor = CatalogRulesExecutor(schema_rules, metadata_rules)
+        catalog_file = io.StringIO(json.dumps({"version": 1, **catalog}))
+        updated_file = io.StringIO()
+
+        entries = (
+            (key, map(executor.stream_node, value) if key == "streams" else value)
+            for key, value in iter_catalog(catalog_file, chunk_size=16)
+        )
+        dump_catalog(entries, updated_file, indent=indent)
+
+        expected = CatalogRulesExecutor(
+            copy.deepcopy(schema_rules), metadata_rules
+        ).visit({"version": 1, **catalog})
+        assert updated_file.getvalue() == json.dumps(expected, indent=indent)
+
+    @pytest.mark.parametrize(
+        "catalog_json", ["", "[]", '{"streams": [}', '{"streams": []} {}']
+    )
+    def test_streaming_invalid(self, catalog_json):
+        with pytest.raises(ValueError):
+            dump_catalog(iter_catalog(io.StringIO(catalog_json)), io.StringIO())
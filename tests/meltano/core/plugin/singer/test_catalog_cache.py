@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from meltano.core.plugin.singer.catalog_cache import CatalogCache
+
+
+class TestCatalogCache:
+    @pytest.fixture
+    def subject(self, tmp_path):
+        return CatalogCache(tmp_path.joinpath("catalogs"), max_entries=2)
+
+    @pytest.fixture
+    def catalog_path(self, tmp_path):
+        path = tmp_path.joinpath("catalog.json")
+        path.write_text('{"streams": []}')
+        return path
+
+    def test_store_restore(self, subject, catalog_path, tmp_path):
+        restored_path = tmp_path.joinpath("restored.json")
+        assert not subject.restore("abc", restored_path)
+        assert not restored_path.exists()
+
+        subject.store("abc", catalog_path)
+        assert subject.restore("abc", restored_path)
+        assert restored_path.read_text() == '{"streams": []}'
+
+        # No temporary files are left behind
+        assert [path.name for path in subject.cache_dir.iterdir()] == ["abc.json"]
+
+    def test_evict_least_recently_used(self, subject, catalog_path, tmp_path):
+        for age, key in enumerate(("new", "old")):
+            entry_path = subject.store(key, catalog_path)
+            # Entries are used in the order of their access time
+            os.utime(
+                entry_path, (1000 - age, entry_path.stat().st_mtime)
+            )  # noqa: WPS432
+
+        # Restoring marks the entry as recently used
+        assert subject.restore("old", tmp_path.joinpath("restored.json"))
+
+        subject.store("newest", catalog_path)
+        assert {path.stem for path in subject.entries()} == {"old", "newest"}
+
+    def test_max_age(self, subject, catalog_path, tmp_path):
+        restored_path = tmp_path.joinpath("restored.json")
+        entry_path = subject.store("abc", catalog_path)
+        assert subject.has("abc")
+
+        # Discovered longer ago than the maximum age
+        discovered_at = entry_path.stat().st_mtime - subject.max_age - 1
+        os.utime(entry_path, (discovered_at, discovered_at))
+        assert not subject.has("abc")
+        assert not subject.restore("abc", restored_path)
+        assert not restored_path.exists()
+
+        subject.max_age = 0
+        assert subject.has("abc")
+        assert subject.restore("abc", restored_path)
+        # Using the entry doesn't change when it was discovered
+        assert entry_path.stat().st_mtime == discovered_at
+
+    def test_from_project(self, project, monkeypatch, tmp_path):
+        cache = CatalogCache.from_project(project)
+        assert cache.cache_dir == project.meltano_dir("cache", "catalogs")
+        assert cache.max_entries == 50
+        assert cache.max_age == 604800
+
+        monkeypatch.setenv("MELTANO_CATALOG_CACHE_DIR", str(tmp_path))
+        monkeypatch.setenv("MELTANO_CATALOG_CACHE_MAX_ENTRIES", "3")
+        monkeypatch.setenv("MELTANO_CATALOG_CACHE_MAX_AGE", "0")
+        cache = CatalogCache.from_project(project)
+        assert cache.cache_dir == tmp_path
+        assert cache.max_entries == 3
+        assert cache.max_age == 0
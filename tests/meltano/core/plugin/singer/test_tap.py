@@ -201,7 +201,9 @@ class TestSingerTap:
         async with invoker.prepared(session):
             with mock.patch.object(
                 SingerTap, "run_discovery", side_effect=mock_discovery
-            ) as mocked_run_discovery:
+            ) as mocked_run_discovery, mock.patch.object(
+                SingerTap, "discovery_cache_key", return_value=None
+            ):
                 await subject.discover_catalog(invoker)
 
                 assert mocked_run_discovery.called
@@ -236,6 +238,61 @@ class TestSingerTap:
                 assert json.loads(catalog_path.read_text()) == {"discovered": True}
                 assert not catalog_cache_key_path.exists()
 
+    @pytest.mark.asyncio
+    async def test_discover_catalog_persistent_cache(  # noqa: WPS213
+        self, project, session, plugin_invoker_factory, subject, monkeypatch, tmp_path
+    ):
+        monkeypatch.setenv("MELTANO_CATALOG_CACHE_DIR", str(tmp_path))
+        invoker = plugin_invoker_factory(subject)
+
+        catalog_path = invoker.files["catalog"]
+
+        def mock_discovery(*args, **kwargs):
+            future = asyncio.Future()
+            future.set_result(catalog_path.open("w").write('{"discovered": true}'))
+            return future
+
+        async with invoker.prepared(session):
+            with mock.patch.object(
+                SingerTap, "run_discovery", side_effect=mock_discovery
+            ) as mocked_run_discovery:
+                await subject.discover_catalog(invoker)
+
+                mocked_run_discovery.assert_called_once()
+                key = subject.discovery_cache_key(invoker)
+                assert json.loads(tmp_path.joinpath(f"{key}.json").read_text()) == {
+                    "discovered": True
+                }
+
+                # Without a run directory catalog, the cached catalog is used
+                mocked_run_discovery.reset_mock()
+                catalog_path.unlink()
+                await subject.discover_catalog(invoker)
+
+                mocked_run_discovery.assert_not_called()
+                assert json.loads(catalog_path.read_text()) == {"discovered": True}
+
+        config_override = invoker.settings_service.config_override
+
+        # Rules don't affect the key, discovery-relevant config does
+        monkeypatch.setitem(
+            config_override, "_metadata", {"*": {"replication-method": "FULL_TABLE"}}
+        )
+        async with invoker.prepared(session):
+            assert subject.discovery_cache_key(invoker) == key
+
+        monkeypatch.setitem(config_override, "test", "changed")
+        async with invoker.prepared(session):
+            assert subject.discovery_cache_key(invoker) != key
+
+            with mock.patch.object(
+                SingerTap, "run_discovery", side_effect=mock_discovery
+            ) as mocked_run_discovery:
+                await subject.discover_catalog(invoker)
+                mocked_run_discovery.assert_called_once()
+
+        assert len(list(tmp_path.glob("*.json"))) == 2
+
     @pytest.mark.asyncio
     async def test_discover_catalog_custom(
         self, project, session, plugin_invoker_factory, subject, monkeypatch
@@ -274,9 +331,9 @@ class TestSingerTap:
 
             assert catalog["rules"] == list(rules)
 
-        def mock_metadata_executor(rules):
+        def mock_rules_executor(schema_rules, metadata_rules):
             def visit(catalog):
-                for rule in rules:
+                for rule in metadata_rules:
                     catalog["rules"].append(
                         [rule.tap_stream_id, rule.breadcrumb, rule.key, rule.value]
                     )
@@ -284,8 +341,8 @@ class TestSingerTap:
             return mock.Mock(visit=visit)
 
         with mock.patch(
-            "meltano.core.plugin.singer.tap.MetadataExecutor",
-            side_effect=mock_metadata_executor,
+            "meltano.core.plugin.singer.tap.CatalogRulesExecutor",
+            side_effect=mock_rules_executor,
         ):
             reset_catalog()
 
@@ -356,9 +413,18 @@ class TestSingerTap:
 
             assert catalog["rules"] == list(rules)
 
-        def mock_metadata_executor(rules):
+        def mock_rules_executor(schema_rules, metadata_rules):
             def visit(catalog):
-                for rule in rules:
+                for schema_rule in schema_rules:
+                    catalog["rules"].append(
+                        [
+                            schema_rule.tap_stream_id,
+                            schema_rule.breadcrumb,
+                            schema_rule.payload,
+                        ]
+                    )
+
+                for rule in metadata_rules:
                     rule_list = [
                         rule.tap_stream_id,
                         rule.breadcrumb,
@@ -371,21 +437,9 @@ class TestSingerTap:
 
             return mock.Mock(visit=visit)
 
-        def mock_schema_executor(rules):
-            def visit(catalog):
-                for rule in rules:
-                    catalog["rules"].append(
-                        [rule.tap_stream_id, rule.breadcrumb, rule.payload]
-                    )
-
-            return mock.Mock(visit=visit)
-
         with mock.patch(
-            "meltano.core.plugin.singer.tap.MetadataExecutor",
-            side_effect=mock_metadata_executor,
-        ), mock.patch(
-            "meltano.core.plugin.singer.tap.SchemaExecutor",
-            side_effect=mock_schema_executor,
+            "meltano.core.plugin.singer.tap.CatalogRulesExecutor",
+            side_effect=mock_rules_executor,
         ):
             reset_catalog()
 
@@ -502,9 +556,13 @@ class TestSingerTap:
             assert cache_key is None
 
     @pytest.mark.asyncio
+    @pytest.mark.parametrize("streaming", [False, True], ids=["load", "streaming"])
     async def test_apply_catalog_rules_select_filter(  # noqa: WPS217, WPS213
-        self, session, plugin_invoker_factory, subject, monkeypatch
+        self, session, plugin_invoker_factory, subject, monkeypatch, streaming
     ):
+        if streaming:
+            monkeypatch.setattr(SingerTap, "STREAMING_CATALOG_SIZE", 0)
+
         invoker = plugin_invoker_factory(subject)
 
         stream_data = {
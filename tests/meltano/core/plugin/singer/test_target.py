@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import mock
 import pytest
 
 from meltano.core.job import Job, Payload
 from meltano.core.plugin import PluginType
+from meltano.core.plugin.singer.target import BookmarkWriter
 from meltano.core.project_plugins_service import PluginAlreadyAddedException
+from meltano.core.state_service import SINGER_STATE_KEY
 
 
 class TestSingerTarget:
@@ -95,3 +98,117 @@ class TestSingerTarget:
                 invoker.output_handlers.get(invoker.StdioSource.STDOUT)[0].payload_flag
                 is Payload.INCOMPLETE_STATE
             )
+
+
+class TestBookmarkWriter:
+    @pytest.fixture
+    def target(self, project_add_service):
+        try:
+            return project_add_service.add(PluginType.LOADERS, "target-mock")
+        except PluginAlreadyAddedException as err:
+            return err.plugin
+
+    @pytest.fixture
+    def job(self, session):
+        job = Job(job_name="pytest_test_runner")
+        job.start()
+        job.save(session)
+        return job
+
+    def test_writes_every_message_by_default(self, job, session):
+        state_service = mock.Mock()
+        writer = BookmarkWriter(job, session, state_service=state_service)
+
+        writer.writeline('{"bookmark": 1}\n')
+        writer.writeline('{"bookmark": 2}\n')
+
+        assert state_service.add_state.call_count == 2
+        assert job.payload[SINGER_STATE_KEY] == {"bookmark": 2}
+
+    def test_flush_messages(self, job, session):
+        state_service = mock.Mock()
+        writer = BookmarkWriter(
+            job, session, state_service=state_service, flush_messages=3
+        )
+
+        for bookmark in range(1, 8):
+            writer.writeline(f'{{"bookmark": {bookmark}}}\n')
+
+        # Only the latest state of each batch is persisted
+        assert state_service.add_state.call_count == 2
+        assert job.payload[SINGER_STATE_KEY] == {"bookmark": 6}
+
+        writer.flush()
+        assert state_service.add_state.call_count == 3
+        assert job.payload[SINGER_STATE_KEY] == {"bookmark": 7}
+
+        # Nothing left to persist
+        writer.flush()
+        assert state_service.add_state.call_count == 3
+
+    def test_flush_interval(self, job, session):
+        state_service = mock.Mock()
+        writer = BookmarkWriter(
+            job, session, state_service=state_service, flush_interval=60
+        )
+
+        with mock.patch("meltano.core.plugin.singer.target.time.monotonic") as clock:
+            clock.return_value = writer._last_flush + 1
+            writer.writeline('{"bookmark": 1}\n')
+            writer.writeline('{"bookmark": 2}\n')
+            assert state_service.add_state.call_count == 0
+
+            clock.return_value = writer._last_flush + 61
+            writer.writeline('{"bookmark": 3}\n')
+            assert state_service.add_state.call_count == 1
+            assert job.payload[SINGER_STATE_KEY] == {"bookmark": 3}
+
+    @pytest.mark.asyncio
+    async def test_flush_on_cleanup(
+        self, job, session, plugin_invoker_factory, elt_context_builder, target
+    ):
+        elt_context = (
+            elt_context_builder.with_session(session)
+            .with_loader(target.name)
+            .with_job(job)
+            .context()
+        )
+        invoker = plugin_invoker_factory(target, context=elt_context)
+        state_service = mock.Mock()
+
+        async with invoker.prepared(session):
+            target.setup_bookmark_writer(invoker)
+            writer = invoker.output_handlers[invoker.StdioSource.STDOUT][0]
+            writer.state_service = state_service
+            writer.flush_messages = 100
+            writer.writeline('{"bookmark": 1}\n')
+            assert state_service.add_state.call_count == 0
+
+        assert state_service.add_state.call_count == 1
+        assert job.payload[SINGER_STATE_KEY] == {"bookmark": 1}
+
+    @pytest.mark.asyncio
+    async def test_flush_on_failed_cleanup(
+        self, job, session, plugin_invoker_factory, elt_context_builder, target
+    ):
+        elt_context = (
+            elt_context_builder.with_session(session)
+            .with_loader(target.name)
+            .with_job(job)
+            .context()
+        )
+        invoker = plugin_invoker_factory(target, context=elt_context)
+        state_service = mock.Mock()
+
+        with pytest.raises(FileNotFoundError):
+            async with invoker.prepared(session):
+                target.setup_bookmark_writer(invoker)
+                writer = invoker.output_handlers[invoker.StdioSource.STDOUT][0]
+                writer.state_service = state_service
+                writer.flush_messages = 100
+                writer.writeline('{"bookmark": 1}\n')
+                # Makes the cleanup hook deleting the config file fail
+                invoker.files["config"].unlink()
+
+        assert state_service.add_state.call_count == 1
+        assert job.payload[SINGER_STATE_KEY] == {"bookmark": 1}
@@ -551,6 +551,57 @@ class TestProjectPlugin:
         assert "_nested.custom" in settings_by_name
         assert settings_by_name["_nested.custom"].kind == SettingKind.BOOLEAN
 
+    def test_settings_cache(self, inherited_tap):
+        tap = inherited_tap.parent
+
+        settings = inherited_tap.all_settings
+        assert inherited_tap.all_settings == settings
+        assert inherited_tap.all_settings is not settings
+
+        # Changes to the config of the parent are inherited
+        tap.config["cached"] = "from_meltano_yml"
+        settings_by_name = {s.name: s for s in inherited_tap.all_settings}
+        assert "cached" in settings_by_name
+        assert settings_by_name["cached"].kind is None
+
+        tap.config["cached"] = True
+        settings_by_name = {s.name: s for s in inherited_tap.all_settings}
+        assert settings_by_name["cached"].kind == SettingKind.BOOLEAN
+
+        del tap.config["cached"]  # noqa: WPS420
+        assert "cached" not in {s.name for s in inherited_tap.all_settings}
+
+        # As are changes to its own extras
+        inherited_tap.extras["cached"] = "from_meltano_yml"
+        assert "_cached" in {s.name for s in inherited_tap.extra_settings}
+        del inherited_tap.extras["cached"]  # noqa: WPS420
+
+        # Setting a new parent drops the cached settings
+        tap.config["cached"] = "from_meltano_yml"
+        assert "cached" in {s.name for s in inherited_tap.all_settings}
+        inherited_tap.parent = tap.parent
+        assert "cached" not in {s.name for s in inherited_tap.all_settings}
+        inherited_tap.parent = tap
+        del tap.config["cached"]  # noqa: WPS420
+
+        # Replacing the settings drops the cached settings, even at the same length
+        own_settings = inherited_tap.settings
+        inherited_tap.settings = [SettingDefinition(name="cached")]
+        assert "cached" in {s.name for s in inherited_tap.all_settings}
+        inherited_tap.settings = [SettingDefinition(name="other")]
+        settings_by_name = {s.name: s for s in inherited_tap.all_settings}
+        assert "other" in settings_by_name
+        assert "cached" not in settings_by_name
+        inherited_tap.settings = own_settings
+
+        # As does setting the config along with the extras
+        config_with_extras = inherited_tap.config_with_extras
+        inherited_tap.config_with_extras = {"cached": True, "_cached": True}
+        assert "cached" in {s.name for s in inherited_tap.all_settings}
+        assert "_cached" in {s.name for s in inherited_tap.extra_settings}
+        inherited_tap.config_with_extras = config_with_extras
+        assert "cached" not in {s.name for s in inherited_tap.all_settings}
+
     def test_requirements(self, transformer: ProjectPlugin):
         """Validate the plugin requirements."""
         assert transformer.all_requires
@@ -558,6 +558,28 @@ class TestPluginSettingsService:
             key: value for key, value in config.items() if key in yml_config
         }
 
+    def test_snapshot(self, session, subject, monkeypatch):
+        monkeypatch.setenv("VAR", "hello")
+        monkeypatch.setattr(
+            subject.plugin, "config", {"var": "$VAR", "_extra": "$TAP_MOCK_VAR"}
+        )
+
+        with subject.snapshot():
+            assert subject.as_dict(session=session)["_extra"] == "hello"
+
+            # The environment is only resolved once
+            monkeypatch.setenv("VAR", "world")
+            assert subject.get("var", session=session) == "hello"
+            assert subject.as_dict(session=session)["_extra"] == "hello"
+
+            # Changing a setting invalidates the snapshot
+            subject.set("test", "value", session=session)
+            assert subject.get("var", session=session) == "world"
+            assert subject.as_dict(session=session)["_extra"] == "world"
+
+        monkeypatch.setenv("VAR", "again")
+        assert subject.as_dict(session=session)["_extra"] == "again"
+
     @pytest.mark.order(3)
     def test_nested_keys(self, session, subject, project, tap):
         def set_config(path, value):
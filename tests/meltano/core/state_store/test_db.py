@@ -69,3 +69,43 @@ class TestDBStateStoreManager:
 
     def test_get_state_ids(self, subject: DBStateStoreManager, state_ids_with_jobs):
         assert set(subject.get_state_ids()) == set(state_ids_with_jobs.keys())
+
+    def test_get_many(
+        self, subject: DBStateStoreManager, state_ids_with_expected_states
+    ):
+        expected = dict(state_ids_with_expected_states)
+        states = subject.get_many([*expected, "missing"])
+        assert states.pop("missing") is None
+        assert {
+            state_id: json.loads(state.json_merged())
+            for state_id, state in states.items()
+        } == expected
+
+    def test_set_many(self, subject: DBStateStoreManager):
+        subject.set_many(
+            [
+                JobState(
+                    state_id="bulk_a",
+                    completed_state={"singer_state": {"complete": 1}},
+                ),
+                JobState(
+                    state_id="bulk_b", partial_state={"singer_state": {"partial": 1}}
+                ),
+                JobState(
+                    state_id="bulk_a", partial_state={"singer_state": {"partial": 1}}
+                ),
+            ]
+        )
+        assert subject.get("bulk_a") == JobState(
+            state_id="bulk_a",
+            partial_state={"singer_state": {"partial": 1}},
+            completed_state={"singer_state": {"complete": 1}},
+        )
+        assert subject.get("bulk_b") == JobState(
+            state_id="bulk_b", partial_state={"singer_state": {"partial": 1}}
+        )
+
+    def test_clear_many(self, subject: DBStateStoreManager, state_ids_with_jobs):
+        state_ids = list(state_ids_with_jobs)
+        subject.clear_many(state_ids[:2])
+        assert set(subject.get_state_ids()) == set(state_ids[2:])
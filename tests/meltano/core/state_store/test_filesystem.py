@@ -9,15 +9,24 @@ import string
 from base64 import b64encode
 from collections.abc import Iterator
 from contextlib import contextmanager
+from io import BytesIO
 from pathlib import Path
 from unittest.mock import MagicMock, PropertyMock, patch
 
 import pytest
-from azure.core.exceptions import ResourceNotFoundError
+from azure.core import MatchConditions
+from azure.core.exceptions import (
+    ResourceExistsError,
+    ResourceModifiedError,
+    ResourceNotFoundError,
+)
 from azure.storage.blob._models import BlobProperties
 from boto3 import client
+from botocore.awsrequest import AWSResponse
+from botocore.response import StreamingBody
 from botocore.stub import Stubber
 from dateutil.tz import tzutc
+from google.api_core.exceptions import PreconditionFailed
 from google.cloud.storage import Blob, Bucket
 
 from meltano.core.job_state import JobState
@@ -28,6 +37,8 @@ from meltano.core.state_store import (
     S3StateStoreManager,
     WindowsFilesystemStateStoreManager,
 )
+from meltano.core.state_store.filesystem import LockInfo
+from meltano.core.state_store.s3 import register_conditional_headers
 
 
 def on_windows() -> bool:
@@ -92,7 +103,11 @@ class TestLocalFilesystemStateStoreManager:
     def test_get_writer(self, subject: LocalFilesystemStateStoreManager, state_path):
         filepath = os.path.join(state_path, "get_writer")
         with subject.get_writer(path=filepath) as writer:
-            assert writer.name == filepath
+            writer.write("written")
+            # Writes are atomic, nothing is visible until the writer is closed
+            assert not os.path.exists(filepath)
+        with open(filepath) as written:
+            assert written.read() == "written"
 
     def test_get_state_path(
         self, subject: LocalFilesystemStateStoreManager, state_path
@@ -110,6 +125,99 @@ class TestLocalFilesystemStateStoreManager:
         dir_path = os.path.join(state_path, encode_if_on_windows("acquire_lock"))
         with subject.acquire_lock("acquire_lock"):
             assert os.path.exists(os.path.join(dir_path, "lock"))
+        assert not os.path.exists(os.path.join(dir_path, "lock"))
+
+    def test_create_lock(self, subject: LocalFilesystemStateStoreManager, state_path):
+        subject.create_state_id_dir_if_not_exists("create_lock")
+        lock_path = subject.get_lock_path("create_lock")
+        assert subject.create_lock(lock_path, "1") == "1"
+        assert subject.create_lock(lock_path, "2") is None
+        with open(lock_path) as lock_file:
+            assert lock_file.read() == "1"
+
+    def test_acquire_lock_waits(
+        self, subject: LocalFilesystemStateStoreManager, state_path
+    ):
+        subject.create_state_id_dir_if_not_exists("acquire_lock")
+        lock_path = subject.get_lock_path("acquire_lock")
+        subject.create_lock(lock_path, str(datetime.datetime.utcnow().timestamp()))
+
+        # Release the lock held by another "process" after three retries
+        with patch("meltano.core.state_store.filesystem.sleep") as mock_sleep:
+            mock_sleep.side_effect = lambda _: (
+                mock_sleep.call_count == 3 and os.remove(lock_path)
+            )
+            with subject.acquire_lock("acquire_lock", retry_seconds=1):
+                assert os.path.exists(lock_path)
+
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        assert len(delays) == 3
+        # Exponential backoff with jitter
+        assert 0.5 <= delays[0] <= 1
+        assert 1 <= delays[1] <= 2
+        assert 2 <= delays[2] <= 4
+
+    def test_acquire_lock_breaks_expired_lock(
+        self, subject: LocalFilesystemStateStoreManager, state_path
+    ):
+        subject.create_state_id_dir_if_not_exists("acquire_lock")
+        lock_path = subject.get_lock_path("acquire_lock")
+        expired = datetime.datetime.utcnow() - datetime.timedelta(
+            seconds=subject.lock_timeout_seconds + 1
+        )
+        subject.create_lock(lock_path, str(expired.timestamp()))
+
+        with patch("meltano.core.state_store.filesystem.sleep") as mock_sleep:
+            with subject.acquire_lock("acquire_lock"):
+                with open(lock_path) as lock_file:
+                    locked_at, token = lock_file.read().split("\n")
+                assert float(locked_at) > expired.timestamp()
+                assert token
+        mock_sleep.assert_not_called()
+
+    def test_acquire_lock_keeps_next_holder_lock(
+        self, subject: LocalFilesystemStateStoreManager, state_path
+    ):
+        subject.create_state_id_dir_if_not_exists("acquire_lock")
+        lock_path = subject.get_lock_path("acquire_lock")
+
+        with subject.acquire_lock("acquire_lock"):
+            # The lock expired, and was broken and taken by another process
+            expired = subject.read_lock(lock_path)
+            assert subject.break_lock(lock_path, expired.version)
+            assert subject.create_lock(lock_path, "next holder")
+
+        with open(lock_path) as lock_file:
+            assert lock_file.read() == "next holder"
+
+    def test_break_lock(self, subject: LocalFilesystemStateStoreManager, state_path):
+        subject.create_state_id_dir_if_not_exists("break_lock")
+        lock_path = subject.get_lock_path("break_lock")
+        subject.create_lock(lock_path, "1")
+        expired = subject.read_lock(lock_path)
+
+        # Another waiter broke the expired lock, and took it
+        assert subject.break_lock(lock_path, expired.version)
+        subject.create_lock(lock_path, "2")
+        assert not subject.break_lock(lock_path, expired.version)
+        with open(lock_path) as lock_file:
+            assert lock_file.read() == "2"
+
+    def test_is_locked_empty_lock(
+        self, subject: LocalFilesystemStateStoreManager, state_path
+    ):
+        subject.create_state_id_dir_if_not_exists("empty_lock")
+        lock_path = subject.get_lock_path("empty_lock")
+        # Left behind by a process killed before it wrote the timestamp
+        Path(lock_path).touch()
+        assert subject.is_locked("empty_lock")
+
+        modified_at = datetime.datetime.now().timestamp() - (
+            subject.lock_timeout_seconds + 1
+        )
+        os.utime(lock_path, (modified_at, modified_at))
+        assert not subject.is_locked("empty_lock")
+        assert not os.path.exists(lock_path)
 
     def test_get_state_ids(self, subject: LocalFilesystemStateStoreManager, state_path):
         dev_ids = [f"dev:{letter}-to-{letter}" for letter in string.ascii_lowercase]
@@ -202,6 +310,27 @@ class TestLocalFilesystemStateStoreManager:
             subject.clear(state_id)
             assert not os.path.exists(os.path.dirname(filepath))
 
+    def test_bulk_operations(
+        self,
+        subject: LocalFilesystemStateStoreManager,
+        state_path,
+        state_ids_with_expected_states,
+    ):
+        states = [
+            JobState.from_json(state_id, json.dumps({"completed": expected_state}))
+            for (state_id, expected_state) in state_ids_with_expected_states
+        ]
+        state_ids = [state.state_id for state in states]
+        subject.set_many(states)
+
+        assert subject.get_many([*state_ids, "missing"]) == {
+            **{state.state_id: state for state in states},
+            "missing": None,
+        }
+
+        subject.clear_many(state_ids)
+        assert not set(subject.get_state_ids())
+
 
 class TestAZStorageStateStoreManager:
     @pytest.fixture(scope="function")
@@ -270,6 +399,45 @@ class TestAZStorageStateStoreManager:
         subject.delete("some_path")
         mock_blob_client.delete_blob.assert_called_once()
 
+    def test_create_lock(self, subject, mock_client):
+        mock_blob_client = MagicMock()
+        subject.client.get_blob_client.return_value = mock_blob_client
+        mock_blob_client.upload_blob.return_value = {"etag": '"etag"'}
+        assert subject.create_lock("state/some_id/lock", "1") == '"etag"'
+        mock_blob_client.upload_blob.assert_called_once_with("1", overwrite=False)
+
+        mock_blob_client.upload_blob.side_effect = ResourceExistsError("exists")
+        assert subject.create_lock("state/some_id/lock", "1") is None
+
+    def test_read_lock(self, subject, mock_client):
+        mock_blob_client = MagicMock()
+        subject.client.get_blob_client.return_value = mock_blob_client
+        downloader = mock_blob_client.download_blob.return_value
+        downloader.readall.return_value = b"1"
+        downloader.properties.etag = '"etag"'
+        downloader.properties.last_modified = datetime.datetime(
+            2022, 1, 1, tzinfo=tzutc()
+        )
+        assert subject.read_lock("state/some_id/lock") == LockInfo(
+            content="1",
+            version='"etag"',
+            modified_at=datetime.datetime(2022, 1, 1),
+        )
+
+        mock_blob_client.download_blob.side_effect = ResourceNotFoundError("missing")
+        assert subject.read_lock("state/some_id/lock") is None
+
+    def test_break_lock(self, subject, mock_client):
+        mock_blob_client = MagicMock()
+        subject.client.get_blob_client.return_value = mock_blob_client
+        assert subject.break_lock("state/some_id/lock", '"etag"')
+        mock_blob_client.delete_blob.assert_called_once_with(
+            etag='"etag"', match_condition=MatchConditions.IfNotModified
+        )
+
+        mock_blob_client.delete_blob.side_effect = ResourceModifiedError("modified")
+        assert not subject.break_lock("state/some_id/lock", '"etag"')
+
     def test_get_state_ids(self, subject, mock_client):
         mock_container_client = MagicMock()
         mock_container_client.list_blobs.return_value = (
@@ -281,16 +449,35 @@ class TestAZStorageStateStoreManager:
             name_starts_with="state/"
         )
 
+    def test_get_state_ids_pattern(self, subject, mock_client):
+        mock_container_client = MagicMock()
+        mock_container_client.list_blobs.return_value = (
+            BlobProperties(name=f"state/{env}:tap-to-target/state.json")
+            for env in ("dev", "prod")
+        )
+        subject.client.get_container_client.return_value = mock_container_client
+        assert list(subject.get_state_ids("dev:*")) == ["dev:tap-to-target"]
+        mock_container_client.list_blobs.assert_called_once_with(
+            name_starts_with="state/dev:"
+        )
+
+
+class RawResponse(BytesIO):
+    def stream(self, **kwargs):
+        yield self.read()
+
 
 class TestS3StateStoreManager:
     @contextmanager
     def stubber(self) -> Iterator[Stubber]:
+        s3_client = client("s3")
+        register_conditional_headers(s3_client)
         with patch(
             "meltano.core.state_store.S3StateStoreManager.client",
             new_callable=PropertyMock,
         ) as mock_client:
-            mock_client.return_value = client("s3")
-            with Stubber(mock_client.return_value) as stubber:
+            mock_client.return_value = s3_client
+            with Stubber(s3_client) as stubber:
                 yield stubber
 
     @pytest.fixture
@@ -377,6 +564,94 @@ class TestS3StateStoreManager:
             )
             subject.delete("/state/test_delete")
 
+    def test_create_lock(self, subject: S3StateStoreManager):
+        expected_params = {
+            "Bucket": subject.bucket,
+            "Key": "state/some_id/lock",
+            "Body": b"1",
+        }
+        with self.stubber() as stubber:
+            stubber.add_response(
+                "put_object", {"ETag": '"etag"'}, expected_params=expected_params
+            )
+            stubber.add_client_error(
+                "put_object",
+                service_error_code="PreconditionFailed",
+                http_status_code=412,
+                expected_params=expected_params,
+            )
+            assert subject.create_lock("state/some_id/lock", "1") == '"etag"'
+            assert subject.create_lock("state/some_id/lock", "1") is None
+
+    def test_read_lock(self, subject: S3StateStoreManager):
+        expected_params = {"Bucket": subject.bucket, "Key": "state/some_id/lock"}
+        with self.stubber() as stubber:
+            stubber.add_response(
+                "get_object",
+                {
+                    "Body": StreamingBody(BytesIO(b"1"), 1),
+                    "ETag": '"etag"',
+                    "LastModified": datetime.datetime(2022, 1, 1, tzinfo=tzutc()),
+                },
+                expected_params=expected_params,
+            )
+            stubber.add_client_error(
+                "get_object",
+                service_error_code="NoSuchKey",
+                http_status_code=404,
+                expected_params=expected_params,
+            )
+            assert subject.read_lock("state/some_id/lock") == LockInfo(
+                content="1",
+                version='"etag"',
+                modified_at=datetime.datetime(2022, 1, 1),
+            )
+            assert subject.read_lock("state/some_id/lock") is None
+
+    def test_break_lock(self, subject: S3StateStoreManager):
+        expected_params = {
+            "Bucket": subject.bucket,
+            "Key": "state/some_id/lock",
+        }
+        with self.stubber() as stubber:
+            stubber.add_response("delete_object", {}, expected_params=expected_params)
+            stubber.add_client_error(
+                "delete_object",
+                service_error_code="PreconditionFailed",
+                http_status_code=412,
+                expected_params=expected_params,
+            )
+            assert subject.break_lock("state/some_id/lock", '"etag"')
+            assert not subject.break_lock("state/some_id/lock", '"etag"')
+
+    def test_conditional_headers(self, subject: S3StateStoreManager):
+        s3_client = client(
+            "s3",
+            region_name="us-east-1",
+            aws_access_key_id="test_access_key_id",
+            aws_secret_access_key="test_secret_access_key",
+        )
+        register_conditional_headers(s3_client)
+        requests = []
+
+        def send(request, **kwargs):  # noqa: WPS430
+            requests.append(request)
+            return AWSResponse(request.url, 200, {"ETag": '"etag"'}, RawResponse(b""))
+
+        s3_client.meta.events.register("before-send.s3", send)
+        with patch(
+            "meltano.core.state_store.S3StateStoreManager.client",
+            new_callable=PropertyMock,
+            return_value=s3_client,
+        ):
+            assert subject.create_lock("state/some_id/lock", "1") == '"etag"'
+            assert subject.break_lock("state/some_id/lock", '"etag"')
+
+        assert requests[0].method == "PUT"
+        assert requests[0].headers["If-None-Match"] == b"*"
+        assert requests[1].method == "DELETE"
+        assert requests[1].headers["If-Match"] == b'"etag"'
+
     def test_get_state_ids(self, subject: S3StateStoreManager):
         response = {
             "ResponseMetadata": {
@@ -438,10 +713,18 @@ class TestS3StateStoreManager:
             stubber.add_response(
                 "list_objects_v2",
                 response,
-                expected_params={"Bucket": subject.bucket, "Prefix": subject.prefix},
+                expected_params={"Bucket": subject.bucket, "Prefix": "state/"},
             )
             assert set(subject.get_state_ids()) == {"state_id_1", "state_id_2"}
 
+        with self.stubber() as stubber:
+            stubber.add_response(
+                "list_objects_v2",
+                response,
+                expected_params={"Bucket": subject.bucket, "Prefix": "state/state_"},
+            )
+            assert set(subject.get_state_ids("state_*2")) == {"state_id_2"}
+
 
 class TestGCSStateStoreManager:
     @pytest.fixture(scope="function")
@@ -506,10 +789,70 @@ class TestGCSStateStoreManager:
         subject.delete("some_path")
         mock_blob.delete.assert_called_once()
 
+    def test_create_lock(self, subject: GCSStateStoreManager, mock_client):
+        mock_blob = MagicMock()
+        mock_bucket = MagicMock()
+        mock_bucket.blob.return_value = mock_blob
+        subject.client.bucket.return_value = mock_bucket
+        mock_blob.generation = 42
+        assert subject.create_lock("state/some_id/lock", "1") == 42
+        mock_blob.upload_from_string.assert_called_once_with("1", if_generation_match=0)
+
+        mock_blob.upload_from_string.side_effect = PreconditionFailed("exists")
+        assert subject.create_lock("state/some_id/lock", "1") is None
+
+    def test_read_lock(self, subject: GCSStateStoreManager, mock_client):
+        mock_blob = MagicMock()
+        mock_blob.generation = 42
+        mock_blob.updated = datetime.datetime(2022, 1, 1, tzinfo=tzutc())
+        mock_blob.download_as_bytes.return_value = b"1"
+        mock_bucket = MagicMock()
+        mock_bucket.get_blob.return_value = mock_blob
+        subject.client.bucket.return_value = mock_bucket
+        assert subject.read_lock("state/some_id/lock") == LockInfo(
+            content="1",
+            version=42,
+            modified_at=datetime.datetime(2022, 1, 1),
+        )
+        mock_blob.download_as_bytes.assert_called_once_with(if_generation_match=42)
+
+        # Replaced between reading its metadata and its contents
+        mock_blob.download_as_bytes.side_effect = PreconditionFailed("modified")
+        assert subject.read_lock("state/some_id/lock") is None
+
+        mock_bucket.get_blob.return_value = None
+        assert subject.read_lock("state/some_id/lock") is None
+
+    def test_break_lock(self, subject: GCSStateStoreManager, mock_client):
+        mock_blob = MagicMock()
+        mock_bucket = MagicMock()
+        mock_bucket.blob.return_value = mock_blob
+        subject.client.bucket.return_value = mock_bucket
+        assert subject.break_lock("state/some_id/lock", 42)
+        mock_blob.delete.assert_called_once_with(if_generation_match=42)
+
+        mock_blob.delete.side_effect = PreconditionFailed("modified")
+        assert not subject.break_lock("state/some_id/lock", 42)
+
     def test_get_state_ids(self, subject: GCSStateStoreManager, mock_client):
         subject.client.list_blobs.return_value = (
             Blob(bucket=Bucket("meltano"), name=f"state/state_id_{i}/state.json")
             for i in range(10)
         )
         assert set(subject.get_state_ids()) == {f"state_id_{i}" for i in range(10)}
-        subject.client.list_blobs.assert_called_once_with(bucket_or_name="meltano")
+        subject.client.list_blobs.assert_called_once_with(
+            bucket_or_name="meltano", prefix="state/"
+        )
+
+    def test_get_state_ids_pattern(self, subject: GCSStateStoreManager, mock_client):
+        subject.client.list_blobs.return_value = (
+            Blob(bucket=Bucket("meltano"), name=f"state/state_id_{i}/{filename}")
+            for i in range(10, 20)
+            for filename in ("state.json", "lock")
+        )
+        assert set(subject.get_state_ids("state_id_1?")) == {
+            f"state_id_{i}" for i in range(10, 20)
+        }
+        subject.client.list_blobs.assert_called_once_with(
+            bucket_or_name="meltano", prefix="state/state_id_1"
+        )
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy.pool import NullPool, QueuePool
+
+from meltano.core.db import engine_options
+from meltano.core.project_settings_service import ProjectSettingsService
+
+
+class TestEngineOptions:
+    @pytest.fixture
+    def settings(self, project):
+        return ProjectSettingsService(project)
+
+    def test_server_database(self, settings):
+        options = engine_options("postgresql://meltano@localhost/meltano", settings)
+
+        assert options == {
+            "poolclass": QueuePool,
+            "pool_size": 5,
+            "pool_pre_ping": True,
+            "pool_recycle": 3600,
+        }
+
+    def test_sqlite(self, settings):
+        options = engine_options("sqlite:///.meltano/meltano.db", settings)
+
+        assert options == {"poolclass": NullPool}
+
+    def test_pooling_disabled(self, settings, monkeypatch):
+        monkeypatch.setenv("MELTANO_DATABASE_POOL_SIZE", "0")
+        options = engine_options("postgresql://meltano@localhost/meltano", settings)
+
+        assert options == {"poolclass": NullPool}
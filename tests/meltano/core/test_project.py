@@ -122,6 +122,27 @@ class TestProject:
         for key, val in unpacked_items:
             assert meltano.extras[key] == val
 
+    def test_meltano_cache(self, project: Project):
+        meltano = project.meltano
+        assert project.meltano is meltano
+
+        # Updates through the project are picked up
+        with project.meltano_update() as meltano_update:
+            meltano_update.extras["cached"] = "first"
+        assert project.meltano is not meltano
+        assert project.meltano.extras["cached"] == "first"
+
+        # So are in-place edits that keep the size of the file
+        meltano = project.meltano
+        contents = project.meltanofile.read_text()
+        project.meltanofile.write_text(contents.replace("first", "other"))
+        assert project.meltano is not meltano
+        assert project.meltano.extras["cached"] == "other"
+
+        meltano = project.meltano
+        project.clear_cache()
+        assert project.meltano is not meltano
+
     def test_preserve_comments(self, project: Project):
         original_contents = project.meltanofile.read_text()
 
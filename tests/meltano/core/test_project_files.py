@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import copy
 import datetime
 import json
 import platform
@@ -38,10 +39,19 @@ def cd_temp_dir():
         ({"a": 1}, [{"a": 2}], {"a": 2}),
         ({"a": 1}, [{"a": 2, "b": 2}], {"a": 2, "b": 2}),
         ({"a": [1, 2, 3]}, [{"a": [3, 4, 5]}], {"a": [1, 2, 3, 3, 4, 5]}),
+        (
+            {"a": [1, 2], "b": {"c": [3]}},
+            [{"a": [3]}, {"b": {"c": [4]}}],
+            {"a": [1, 2, 3], "b": {"c": [3, 4]}},
+        ),
     ],
 )
 def test_deep_merge(parent, children, expected):
+    original_parent = copy.deepcopy(parent)
     assert deep_merge(parent, children) == expected
+    # Merging leaves the parent untouched, so it can be merged again
+    assert deep_merge(parent, children) == expected
+    assert parent == original_parent
 
 
 class TestProjectFiles:
@@ -180,3 +180,28 @@ class TestProjectPluginsService:
         assert subject.find_plugins_by_mapping_name("mock-mapping-0") == [mapper]
         with pytest.raises(PluginNotFoundError):
             subject.find_plugins_by_mapping_name("non-existent-mapping")
+
+    def test_registry(self, subject, tap, mapper):
+        subject._use_cache = True  # Disabled by defaults in testing
+
+        registry = subject.registry
+        assert subject.registry is registry
+        assert subject.find_plugin(tap.name, PluginType.EXTRACTORS) is (
+            registry.by_ref[(PluginType.EXTRACTORS, tap.name)]
+        )
+
+        # Mappings share the parent of their mapper
+        mappings = [
+            *subject.find_plugins_by_mapping_name("mock-mapping-0"),
+            *subject.find_plugins_by_mapping_name("mock-mapping-1"),
+        ]
+        assert mappings[0] is not mappings[1]
+        assert mappings[0].parent is mappings[1].parent
+
+        # Updating the plugins invalidates the registry
+        tap.config["test"] = 42
+        outdated = subject.update_plugin(tap)
+        assert subject.registry is not registry
+        assert subject.get_plugin(tap).config["test"] == 42  # noqa: WPS432
+
+        subject.update_plugin(outdated)
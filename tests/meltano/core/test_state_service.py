@@ -5,6 +5,8 @@ import platform
 
 import pytest
 
+from meltano.core.job import JobFinder
+from meltano.core.job_state import JobState
 from meltano.core.state_service import InvalidJobStateError
 from meltano.core.utils import merge
 
@@ -86,3 +88,36 @@ class TestStateService:
             state_service.move_state(state_id_src, state_id_dst)
             assert not state_service.get_state(state_id_src)
             assert state_service.get_state(state_id_dst) == state_src
+
+    def test_compact_state(
+        self, job_history_session, state_ids_with_jobs, state_service
+    ):
+        state_ids = state_service.compactable_state_ids()
+        assert state_ids == sorted(
+            state_id for state_id, jobs in state_ids_with_jobs.items() if len(jobs) > 1
+        )
+        assert state_service.compactable_state_ids("*multiple-incompletes*") == [
+            state_id for state_id in state_ids if "multiple-incompletes" in state_id
+        ]
+        # Glob-style patterns, where "_" and "%" aren't wildcards
+        state_id = state_ids[0]
+        assert state_service.compactable_state_ids(f"?{state_id[1:]}") == [state_id]
+        assert not state_service.compactable_state_ids(f"%{state_id[1:]}")
+        assert not state_service.compactable_state_ids(f"_{state_id[1:]}")
+
+        states = state_service.get_states(state_ids_with_jobs)
+        pruned = state_service.compact_states(state_ids_with_jobs)
+
+        for state_id, jobs in state_ids_with_jobs.items():
+            assert pruned[state_id] == (len(jobs) if len(jobs) > 1 else 0)
+            assert state_service.get_state(state_id) == states[state_id]
+
+            # The state history holds a single run with the current state
+            finder = JobFinder(state_id)
+            assert finder.with_payload(job_history_session).count() == 1
+            job_state = JobState.from_job_history(job_history_session, state_id)
+            assert json.loads(job_state.json_merged()) == states[state_id]
+
+        # Compacting again doesn't change anything
+        assert not state_service.compactable_state_ids()
+        assert not any(state_service.compact_states(state_ids).values())
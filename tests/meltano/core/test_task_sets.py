@@ -23,6 +23,40 @@ class TestTaskSets:
             ["tap2", "target2"],
         ]
 
+    def test_stages(self):
+        tset = TaskSets(
+            name="test",
+            tasks=[
+                "tap target",
+                {"parallel": ["tap2 target", ["tap3 target", "some:cmd"]]},
+                ["other:cmd"],
+            ],
+        )
+        assert tset.has_parallel_groups
+        assert tset.stages == [
+            [["tap", "target"]],
+            [["tap2", "target"], ["tap3", "target", "some:cmd"]],
+            [["other:cmd"]],
+        ]
+        assert tset.flat_args_per_set == [
+            ["tap", "target"],
+            ["tap2", "target"],
+            ["tap3", "target", "some:cmd"],
+            ["other:cmd"],
+        ]
+        assert tset.flat_args == [
+            "tap",
+            "target",
+            "tap2",
+            "target",
+            "tap3",
+            "target",
+            "some:cmd",
+            "other:cmd",
+        ]
+
+        assert not TaskSets(name="test", tasks=["tap target"]).has_parallel_groups
+
     def test_tasks_from_yaml_str(self):
 
         cases = [
@@ -53,6 +87,17 @@ class TestTaskSets:
                     tasks=[["tap target", "tap2 target2"], "cmd1"],
                 ),
             ),
+            (
+                "parallel-group",
+                "[{parallel: [tap target, [tap2 target2, cmd1]]}, cmd2]",
+                TaskSets(
+                    name="parallel-group",
+                    tasks=[
+                        {"parallel": ["tap target", ["tap2 target2", "cmd1"]]},
+                        "cmd2",
+                    ],
+                ),
+            ),
         ]
 
         for name, task_str, expected in cases:
@@ -64,6 +109,8 @@ class TestTaskSets:
             ("bad-yaml", "['tap target'"),
             ("too-many-levels", "[[['tap target']]]"),
             ("non-string-list", "['tap target', 5"),
+            ("unknown-group", "[{sequential: [tap target]}]"),
+            ("nested-group", "[{parallel: [{parallel: [tap target]}]}]"),
         ]
 
         for name, task_str in obvious_edge_cases:
@@ -1,8 +1,16 @@
 from __future__ import annotations
 
-import pytest  # noqa: F401
+import pytest
 
-from meltano.core.utils import expand_env_vars, flatten, nest, pop_at_path, set_at_path
+from meltano.core.utils import (
+    EnvironmentVariableNotSetError,
+    compile_env_var_template,
+    expand_env_vars,
+    flatten,
+    nest,
+    pop_at_path,
+    set_at_path,
+)
 
 
 def test_nest():
@@ -111,3 +119,47 @@ def test_expand_env_vars_nested():
     }
 
     assert expand_env_vars(input_dict, env) == expected_output
+
+
+def test_expand_env_vars_references():
+    env = {"ENV_VAR": "substituted", "EMPTY_VAR": ""}
+
+    # The entire value is a reference
+    assert expand_env_vars("$ENV_VAR", env) == "substituted"
+    assert expand_env_vars("${MISSING_VAR}", env) is None
+
+    # Missing references in a longer value are replaced by an empty string
+    assert expand_env_vars("$ENV_VAR-${MISSING_VAR}-$5", env) == "substituted--$5"
+
+    with pytest.raises(EnvironmentVariableNotSetError):
+        expand_env_vars("${MISSING_VAR}_suffix", env, raise_if_missing=True)
+
+    with pytest.raises(EnvironmentVariableNotSetError):
+        expand_env_vars("$EMPTY_VAR", env, raise_if_missing=True)
+
+
+def test_compile_env_var_template():
+    template = compile_env_var_template("${ENV_VAR_1}:$ENV_VAR_2/path")
+    assert template is compile_env_var_template("${ENV_VAR_1}:$ENV_VAR_2/path")
+    assert template.variables == ["ENV_VAR_1", "ENV_VAR_2"]
+    assert template.literals == ["", ":", "/path"]
+    assert not template.is_reference
+
+    assert compile_env_var_template("${ENV_VAR_1}").is_reference
+    assert not compile_env_var_template("no references").variables
+
+
+def test_env_var_template_memoized_expansion():
+    template = compile_env_var_template("${MEMO_VAR_1}:$MEMO_VAR_2/path")
+    env = {"MEMO_VAR_1": "a", "MEMO_VAR_2": "b"}
+    expanded = template.expand(env)
+    assert expanded == "a:b/path"
+    assert template.expand(dict(env)) is expanded
+
+    # Expanded again once a referenced env var changes
+    assert template.expand({**env, "MEMO_VAR_2": "c"}) == "a:c/path"
+    assert template.expand(env) == "a:b/path"
+
+    # Unset env vars are still raised on, after a memoized expansion
+    with pytest.raises(EnvironmentVariableNotSetError):
+        template.expand({"MEMO_VAR_1": "a"}, raise_if_missing=True)
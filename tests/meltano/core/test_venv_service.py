@@ -1,15 +1,28 @@
 from __future__ import annotations
 
+import asyncio
 import os
 import platform
 import re
 import subprocess
+import sys
+from pathlib import Path
 
 import mock
 import pytest
 
 from meltano.core.project import Project
-from meltano.core.venv_service import PLATFORM_SPECS, VenvService, VirtualEnv
+from meltano.core.venv_service import (
+    PLATFORM_SPECS,
+    VenvService,
+    VenvTemplate,
+    VirtualEnv,
+    WheelCache,
+    _supports_symlinks,
+    exec_async,
+    pip_versions,
+    venv_lock,
+)
 
 
 class TestVenvService:
@@ -121,6 +134,193 @@ class TestVenvService:
         assert subject.requires_clean_install(["example==0.1.0"])
         assert subject.requires_clean_install(["example", "another-package"])
 
+    @pytest.mark.asyncio
+    async def test_shared_install(self, project, subject: VenvService, monkeypatch):
+        if platform.system() == "Windows":
+            pytest.xfail(
+                "Doesn't pass on windows, this is currently being tracked here https://github.com/meltano/meltano/issues/3444"
+            )
+
+        monkeypatch.setenv("MELTANO_VENV_SHARED", "true")
+        other = VenvService(project, "namespace", "other")
+        await asyncio.gather(
+            subject.install(["example"], clean=True),
+            other.install(["example"], clean=True),
+        )
+
+        # both plugins link to the same venv, outside of their own directory
+        assert subject.venv_dir.is_symlink()
+        assert other.venv_dir.is_symlink()
+        assert subject.venv.root == other.venv.root
+        assert subject.venv.root.parent.parent == project.meltano_dir("venvs")
+        run = subprocess.run(
+            [subject.venv_dir.joinpath("bin/python"), "-m", "pip", "list"],
+            check=True,
+            capture_output=True,
+        )
+        assert re.search(r"example\s+0\.1\.0", str(run.stdout))
+        assert not subject.requires_clean_install(["example"])
+
+        # cleaning a plugin's venv leaves the shared one alone
+        shared_root = subject.venv.root
+        subject.clean()
+        assert not subject.venv_dir.exists()
+        assert shared_root.exists()
+
+        # without sharing, plugins get their own venv again
+        monkeypatch.delenv("MELTANO_VENV_SHARED")
+        await other.install(["example"])
+        assert not other.venv_dir.is_symlink()
+        assert other.venv.root == other.venv_dir.resolve()
+        assert shared_root.exists()
+
+    @pytest.mark.asyncio
+    async def test_wheel_cache(
+        self, project, subject: VenvService, monkeypatch, tmp_path
+    ):
+        if platform.system() == "Windows":
+            pytest.xfail(
+                "Doesn't pass on windows, this is currently being tracked here https://github.com/meltano/meltano/issues/3444"
+            )
+
+        monkeypatch.setenv("MELTANO_VENV_WHEEL_CACHE", "true")
+        monkeypatch.setenv("MELTANO_VENV_WHEEL_CACHE_DIR", str(tmp_path))
+        await subject.install(["example"], clean=True)
+
+        wheel_cache = WheelCache(tmp_path)
+        lock_path = wheel_cache.lock_path(["example"])
+        assert "example==0.1.0" in lock_path.read_text().splitlines()
+        assert "example-0.1.0-py3-none-any.whl" in {
+            wheel.name for wheel in wheel_cache.wheels_dir.iterdir()
+        }
+
+        # installing again only uses the cache
+        with mock.patch.object(VenvService, "upgrade_pip") as upgrade_pip:
+            await subject.install(["example"], clean=True)
+        upgrade_pip.assert_not_called()
+        run = subprocess.run(
+            [subject.python_path, "-m", "pip", "list"],
+            check=True,
+            capture_output=True,
+        )
+        assert re.search(r"example\s+0\.1\.0", str(run.stdout))
+
+    def test_wheel_cache_lock_path(self, tmp_path):
+        wheel_cache = WheelCache(tmp_path)
+        lock_path = wheel_cache.lock_path(["example"])
+
+        # Locks of other Python versions or platforms are never used
+        with mock.patch("sysconfig.get_platform", return_value="macosx-11.0-arm64"):
+            assert wheel_cache.lock_path(["example"]) != lock_path
+        with mock.patch("sys.version_info", (3, 6, 0, "final", 0)):
+            assert wheel_cache.lock_path(["example"]) != lock_path
+            assert wheel_cache.interpreter_tag.startswith("py3.6-")
+
+    @pytest.mark.asyncio
+    async def test_template_install(self, project, subject: VenvService, monkeypatch):
+        if platform.system() == "Windows":
+            pytest.xfail(
+                "Doesn't pass on windows, this is currently being tracked here https://github.com/meltano/meltano/issues/3444"
+            )
+
+        monkeypatch.setenv("MELTANO_VENV_TEMPLATE", "true")
+        with mock.patch(
+            "meltano.core.venv_service.exec_async", wraps=exec_async
+        ) as exec_mock:
+            await subject.install(["example"], clean=True)
+
+        template = VenvTemplate.from_project(project)
+        assert template.is_fresh()
+        assert pip_versions(subject.venv.site_packages_dir) == pip_versions(
+            template.venv.site_packages_dir
+        )
+        assert set(pip_versions(subject.venv.site_packages_dir)) == {
+            "pip",
+            "setuptools",
+            "wheel",
+        }
+
+        # pip is only upgraded in the template
+        upgrades = [
+            call.args[0]
+            for call in exec_mock.call_args_list
+            if "--upgrade" in call.args
+        ]
+        assert upgrades == [str(template.venv_service.python_path)]
+
+        # pip scripts use the interpreter of the venv
+        with open(subject.exec_path("pip")) as pip_script:
+            assert pip_script.readline().strip() == f"#!{subject.python_path}"
+
+        run = subprocess.run(
+            [subject.python_path, "-m", "pip", "list"],
+            check=True,
+            capture_output=True,
+        )
+        assert re.search(r"example\s+0\.1\.0", str(run.stdout))
+
+
+def test_supports_symlinks(tmp_path):
+    directory = tmp_path / "venvs"
+    assert _supports_symlinks(directory) == (platform.system() != "Windows")
+    assert not any(directory.iterdir())
+
+    with mock.patch.object(Path, "symlink_to", side_effect=OSError):
+        assert not _supports_symlinks(directory)
+
+
+class TestVenvLock:
+    @pytest.mark.asyncio
+    async def test_tasks_take_turns(self, tmp_path):
+        events = []
+
+        async def locked(name):
+            async with venv_lock(tmp_path / "venv"):
+                events.append(f"{name} locked")
+                await asyncio.sleep(0.01)
+                events.append(f"{name} released")
+
+        await asyncio.gather(locked("a"), locked("b"), locked("c"))
+        assert events == [
+            "a locked",
+            "a released",
+            "b locked",
+            "b released",
+            "c locked",
+            "c released",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_other_processes(self, tmp_path):
+        root = tmp_path / "venv"
+        holder = subprocess.Popen(
+            [
+                sys.executable,
+                "-c",
+                "import sys, fasteners\n"
+                f"with fasteners.InterProcessLock({str(root)!r} + '.lock'):\n"
+                "    print('locked', flush=True)\n"
+                "    sys.stdin.read()\n",
+            ],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        try:
+            assert holder.stdout.readline().strip() == "locked"
+
+            async def locked():
+                async with venv_lock(root):
+                    return True
+
+            task = asyncio.ensure_future(locked())
+            await asyncio.sleep(0.2)
+            assert not task.done()
+        finally:
+            holder.communicate("")
+
+        assert await asyncio.wait_for(task, timeout=5)
+
 
 class TestVirtualEnv:
     @pytest.mark.parametrize("system", ["Linux", "Darwin", "Windows"])
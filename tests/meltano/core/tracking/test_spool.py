@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import json
+import os
+
+from meltano.core.tracking.spool import TelemetrySpool, _process_identity
+
+
+def event_ids(payloads):
+    return [payload["eid"] for payload in payloads]
+
+
+class TestTelemetrySpool:
+    def test_claim(self, tmp_path):
+        spool = TelemetrySpool(tmp_path, "https://collector.example.com")
+        assert not spool.pending
+        assert spool.claim() == ([], [])
+
+        spool.append([{"e": "ue", "eid": "1"}])
+        spool.append([{"e": "ue", "eid": "2"}, {"e": "ue", "eid": "3"}])
+        assert spool.pending
+
+        claims, payloads = spool.claim()
+        assert event_ids(payloads) == ["1", "2", "3"]
+        assert not spool.pending
+        assert spool.claim() == ([], [])
+
+        # Claimed events stay on disk until they are sent
+        assert all(claim.exists() for claim in claims)
+        spool.release(claims)
+        assert not any(claim.exists() for claim in claims)
+        assert not spool.pending
+
+    def test_release_unsent(self, tmp_path):
+        spool = TelemetrySpool(tmp_path, "https://collector.example.com")
+        spool.append([{"eid": "1"}, {"eid": "2"}, {"eid": "3"}])
+
+        claims, payloads = spool.claim()
+        spool.append([{"eid": "4"}])
+        spool.release(claims, payloads[1:])
+        assert not any(claim.exists() for claim in claims)
+
+        claims, payloads = spool.claim()
+        assert event_ids(payloads) == ["2", "3", "4"]
+
+    def test_max_events(self, tmp_path):
+        spool = TelemetrySpool(tmp_path, "https://collector.example.com", max_events=2)
+        spool.append([{"eid": str(idx)} for idx in range(5)])
+
+        _, payloads = spool.claim()
+        assert event_ids(payloads) == ["3", "4"]
+
+    def test_orphaned_claims(self, tmp_path):
+        spool = TelemetrySpool(tmp_path, "https://collector.example.com")
+        spool.append([{"eid": "2"}])
+
+        # Claimed by a process that exited without sending the events
+        orphaned = tmp_path / f"{spool.name}.999999999-1.abc{spool.claim_suffix}"
+        orphaned.write_text(f'{json.dumps({"eid": "1"})}\n{{"eid": "trunc')
+        assert spool.pending
+
+        claims, payloads = spool.claim()
+        assert event_ids(payloads) == ["1", "2"]
+        assert not orphaned.exists()
+        spool.release(claims)
+
+    def test_reused_pid_claims(self, tmp_path):
+        spool = TelemetrySpool(tmp_path, "https://collector.example.com")
+        identity = _process_identity()
+        assert identity.startswith(f"{os.getpid()}-")
+
+        # Claimed by this process, while it's sending the events
+        live = tmp_path / f"{spool.name}.{identity}.abc{spool.claim_suffix}"
+        live.write_text(f'{json.dumps({"eid": "1"})}\n')
+        # Claimed by an exited process that had the same PID
+        reused = tmp_path / f"{spool.name}.{os.getpid()}-1.def{spool.claim_suffix}"
+        reused.write_text(f'{json.dumps({"eid": "2"})}\n')
+        assert spool.pending
+
+        claims, payloads = spool.claim()
+        assert event_ids(payloads) == ["2"]
+        assert live.exists()
+        assert not reused.exists()
+        spool.release(claims)
+        assert not spool.pending
@@ -3,12 +3,15 @@ from __future__ import annotations
 import json
 import logging
 import os
+import socket
 import subprocess
+import sys
 import uuid
 from contextlib import contextmanager, suppress
 from http import server as server_lib
-from threading import Thread
-from time import sleep
+from textwrap import dedent
+from threading import Event, Thread
+from time import monotonic, sleep
 from typing import TYPE_CHECKING, Any
 
 import mock
@@ -21,6 +24,7 @@ from meltano.core.tracking.contexts.cli import CliEvent
 from meltano.core.tracking.contexts.environment import EnvironmentContext
 from meltano.core.tracking.contexts.exception import ExceptionContext
 from meltano.core.tracking.contexts.project import ProjectContext
+from meltano.core.tracking.spool import SpoolEmitter, TelemetrySpool
 from meltano.core.tracking.tracker import TelemetrySettings, Tracker
 from meltano.core.utils import hash_sha256
 
@@ -377,12 +381,101 @@ class TestTracker:
         tracker.snowplow_tracker.emitters[0].on_failure = emitter_failure_callback
 
         tracker.track_command_event(CliEvent.started)
+        tracker.flush()
 
         server.shutdown()
         server_thread.join()
 
         assert timeout_occured is timeout_should_occur
 
+    def test_events_are_spooled(self, project: Project, monkeypatch):
+        monkeypatch.setenv(
+            "MELTANO_SNOWPLOW_COLLECTOR_ENDPOINTS", '["https://spool.example.com"]'
+        )
+        tracker = Tracker(project)
+        spool = tracker.snowplow_tracker.emitters[0].spool
+
+        with mock.patch.object(SpoolEmitter, "http_get", return_value=False) as get:
+            tracker.track_command_event(CliEvent.started)
+            get.assert_not_called()
+            assert spool.pending
+
+            # Events that couldn't be sent are kept for the next invocation
+            tracker.flush()
+            assert get.call_count == 1
+            assert spool.pending
+
+        with mock.patch.object(SpoolEmitter, "http_get", return_value=True) as get:
+            Tracker(project).flush()
+            assert get.call_count == 1
+            assert not spool.pending
+
+    def test_flush_timeout(self, project: Project, monkeypatch):
+        monkeypatch.setenv(
+            "MELTANO_SNOWPLOW_COLLECTOR_ENDPOINTS", '["https://flush.example.com"]'
+        )
+        tracker = Tracker(project)
+        tracker.track_command_event(CliEvent.started)
+
+        collector_reached = Event()
+
+        def blackholed_get(_):
+            collector_reached.wait(5)
+            return False
+
+        with mock.patch.object(SpoolEmitter, "http_get", side_effect=blackholed_get):
+            start = monotonic()
+            tracker.flush(0.1)
+            assert monotonic() - start < 1
+            collector_reached.set()
+            tracker.flush()
+
+        assert tracker.snowplow_tracker.emitters[0].spool.pending
+
+    def test_exit_while_sending(self, project: Project):
+        # Accepts connections into its backlog, but never responds
+        collector = socket.socket()
+        collector.bind(("localhost", 0))
+        collector.listen()
+        endpoint = f"http://localhost:{collector.getsockname()[1]}"
+
+        script = dedent(
+            """
+            from meltano.core.project import Project
+            from meltano.core.tracking import CliEvent
+            from meltano.core.tracking.tracker import Tracker
+
+            tracker = Tracker(Project.find())
+            tracker.track_command_event(CliEvent.started)
+            tracker.flush(0.2)
+            """
+        )
+        env = {
+            **os.environ,
+            "MELTANO_SNOWPLOW_COLLECTOR_ENDPOINTS": f'["{endpoint}"]',
+            "MELTANO_SEND_ANONYMOUS_USAGE_STATS": "true",
+            "MELTANO_SNOWPLOW_FLUSH_TIMEOUT_MS": "200",
+        }
+        try:
+            # The process exits before the collector responds
+            subprocess.run(
+                (sys.executable, "-c", script),
+                cwd=project.root,
+                env=env,
+                check=True,
+                timeout=60,
+            )
+        finally:
+            collector.close()
+
+        spool = TelemetrySpool(
+            project.meltano_dir("telemetry", make_dirs=False), endpoint
+        )
+        assert spool.pending
+        claims, payloads = spool.claim()
+        spool.release(claims)
+        assert len(payloads) >= 2  # The command event, and the exit event
+
     def test_project_context_send_anonymous_usage_stats_source(
         self, project: Project, monkeypatch
     ):